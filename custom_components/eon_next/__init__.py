@@ -7,13 +7,16 @@ import logging
 import os
 from typing import Any
 
-from homeassistant.components.http import StaticPathConfig
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
 
-from .backfill import EonNextBackfillManager
+from .backfill_status import (
+    DisabledBackfill,
+    async_remove_backfill_state,
+    backfill_enabled,
+)
 from .const import (
     CARDS_URL,
     CONF_EMAIL,
@@ -28,11 +31,17 @@ from .const import (
     INTEGRATION_VERSION,
     PLATFORMS,
 )
-from .coordinator import EonNextCoordinator
-from .cost_tracker import EonNextCostTrackerManager
+from .coordinator import EonNextCoordinator, async_remove_coordinator_stores
+from .cost_tracker import (
+    EonNextCostTrackerManager,
+    async_remove_cost_tracker_stores,
+)
 from .eonnext import EonNext, EonNextAuthError
 from .models import EonNextConfigEntry, EonNextRuntimeData
+from .registry import async_get_registry
 from .services import async_register_services
+from .token_refresh import EonNextTokenRefresher
+from .topology import EonNextTopologyCache, async_remove_topology
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -128,6 +137,8 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     # Serve the compiled card JS bundle (always, so the URL is resolvable)
     cards_path = os.path.join(os.path.dirname(__file__), "frontend", "cards.js")
     if os.path.isfile(cards_path):
+        from homeassistant.components.http import StaticPathConfig  # noqa: E402
+
         await hass.http.async_register_static_paths(
             [StaticPathConfig(CARDS_URL, cards_path, cache_headers=False)]
         )
@@ -242,7 +253,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: EonNextConfigEntry) -> b
     # and the owned aiohttp session is always closed - otherwise an auth blip
     # or malformed payload escapes as a bare "Error" and leaks a session per
     # setup retry ("Unclosed client session").
+    topology = EonNextTopologyCache(hass, entry, api)
     try:
+        # Seed accounts/meters/devices from the last run so login skips the
+        # per-account discovery queries; revalidated after setup below.
+        if await topology.async_restore():
+            _LOGGER.debug("Restored account topology from cache")
+
         # Try stored refresh token first to avoid a redundant password login.
         stored_refresh_token = entry.data.get(CONF_REFRESH_TOKEN)
         if stored_refresh_token:
@@ -262,14 +279,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: EonNextConfigEntry) -> b
             if not authenticated:
                 raise ConfigEntryAuthFailed("Failed to authenticate with Eon Next")
 
-        coordinator = EonNextCoordinator(hass, api, DEFAULT_UPDATE_INTERVAL_MINUTES)
-        backfill = EonNextBackfillManager(hass, entry, api, coordinator)
+        await topology.async_save()
+
+        coordinator = EonNextCoordinator(
+            hass, api, DEFAULT_UPDATE_INTERVAL_MINUTES, entry_id=entry.entry_id
+        )
+        if backfill_enabled(entry):
+            # Only loaded (with its persisted progress) when switched on;
+            # toggling the option reloads the entry.
+            from .backfill import EonNextBackfillManager
+
+            backfill = EonNextBackfillManager(hass, entry, api, coordinator)
+            await backfill.async_prime()
+        else:
+            backfill = DisabledBackfill(hass, entry, api)
+            await backfill.async_prime()
         cost_trackers = EonNextCostTrackerManager(hass, entry.entry_id, coordinator)
-        await backfill.async_prime()
         await cost_trackers.async_initialize()
 
-        await coordinator.async_config_entry_first_refresh()
-        await backfill.async_start()
+        # With a snapshot of the last good data, entities publish it straight
+        # away and the (slow) live refresh runs in the background after the
+        # platforms are set up; otherwise block on it as before.
+        await coordinator.async_load_tariff_timeline()
+        snapshot_restored = await coordinator.async_restore_snapshot()
+        if snapshot_restored:
+            _LOGGER.debug("Restored coordinator data from snapshot")
+        else:
+            await coordinator.async_config_entry_first_refresh()
+        if not isinstance(backfill, DisabledBackfill):
+            await backfill.async_start()
     except (ConfigEntryAuthFailed, ConfigEntryNotReady):
         # Already classified (e.g. by the coordinator's first refresh); close
         # the owned session and propagate unchanged.
@@ -297,6 +335,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: EonNextConfigEntry) -> b
         options=dict(entry.options),
     )
 
+    entry.async_on_unload(async_get_registry(hass).async_add_entry(entry))
+
     await _async_migrate_unique_ids(hass, entry)
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -304,6 +344,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: EonNextConfigEntry) -> b
 
     await _async_reconcile_frontend(hass)
 
+    if snapshot_restored:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            "eon_next_coordinator_refresh",
+        )
+
+    topology.async_start_revalidation()
+    EonNextTokenRefresher(hass, entry, api).async_start()
+
     return True
 
 
@@ -313,9 +363,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: EonNextConfigEntry) ->
     if unload_ok:
         await entry.runtime_data.cost_trackers.async_shutdown()
         await entry.runtime_data.backfill.async_stop()
+        await entry.runtime_data.coordinator.async_flush_stores()
         await entry.runtime_data.api.async_close()
 
         # Reconcile frontend, excluding the entry being unloaded
         await _async_reconcile_frontend(hass, exclude_entry_id=entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: EonNextConfigEntry) -> None:
+    """Delete everything an Eon Next config entry persisted."""
+    await async_remove_cost_tracker_stores(hass, entry.entry_id)
+    await async_remove_coordinator_stores(hass, entry.entry_id)
+    await async_remove_topology(hass, entry)
+    await async_remove_backfill_state(hass, entry)
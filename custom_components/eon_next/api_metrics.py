@@ -0,0 +1,217 @@
+"""Per-operation request metrics for the API client.
+
+Every HTTP attempt ``EonNext`` makes is timed under its operation (the
+GraphQL operation name, or ``consumption`` for the REST endpoint) and its
+outcome: the HTTP status, or ``error``/``timeout``/``cancelled`` when no
+response arrived.  Latencies go into fixed-bucket histograms, so recording
+is a bisect and a few additions and memory stays constant however long the
+entry runs.  Bytes sent (request bodies) and received (the response bytes
+actually read: a whole GraphQL reply, the streamed chunks of a consumption
+page) and the number of requests in flight are kept per operation, and token
+refreshes are timed separately.  Attempts the client's retry loop makes after
+a transient failure are timed in their own histogram, so an operation's
+request count and latency describe first attempts only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+# Upper bounds of the latency buckets, in seconds; a last bucket holds the rest.
+LATENCY_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Counts of observations per latency bucket, with their sum and maximum."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Return the upper bound of the bucket holding quantile *q*.
+
+        Observations past the last bound report the maximum seen.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank and bucket:
+                if index == len(LATENCY_BUCKETS):
+                    return self.maximum
+                return min(LATENCY_BUCKETS[index], self.maximum)
+        return self.maximum
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for index, bucket in enumerate(other.buckets):
+            self.buckets[index] += bucket
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary, in milliseconds."""
+
+        def _ms(seconds: float | None) -> float | None:
+            return None if seconds is None else round(seconds * 1000, 1)
+
+        labels = [f"le_{bound * 1000:g}ms" for bound in LATENCY_BUCKETS] + ["inf"]
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.total / self.count) if self.count else None,
+            "p50_ms": _ms(self.quantile(0.5)),
+            "p95_ms": _ms(self.quantile(0.95)),
+            "max_ms": _ms(self.maximum) if self.count else None,
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+@dataclass(slots=True)
+class RequestRecord:
+    """Outcome of one request, filled in while it runs."""
+
+    status: str | None = None
+    bytes_in: int = 0
+    finished: float | None = None
+
+    def finish(self, status: int | str) -> None:
+        """Record the outcome and stop the clock (e.g. before a token refresh)."""
+        self.status = str(status)
+        self.finished = time.perf_counter()
+
+
+@dataclass(slots=True)
+class OperationMetrics:
+    """Metrics for one operation."""
+
+    latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+    retries: LatencyHistogram = field(default_factory=LatencyHistogram)
+    bytes_in: int = 0
+    bytes_out: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        overall = LatencyHistogram()
+        for histogram in self.latency.values():
+            overall.merge(histogram)
+        return {
+            "requests": overall.count,
+            "retries": self.retries.count,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "latency": overall.as_dict(),
+            "by_status": {
+                status: histogram.as_dict()
+                for status, histogram in sorted(self.latency.items())
+            },
+            "retry_latency": self.retries.as_dict(),
+        }
+
+
+class ApiMetrics:
+    """Registry of request metrics, one entry per operation."""
+
+    def __init__(self) -> None:
+        self._operations: dict[str, OperationMetrics] = {}
+        self.auth_refresh = LatencyHistogram()
+
+    @contextmanager
+    def request(
+        self, operation: str, bytes_out: int = 0, *, retry: bool = False
+    ) -> Iterator[RequestRecord]:
+        """Time one request to *operation*; the caller fills in the record.
+
+        A record left without a status is counted as ``error`` (or
+        ``timeout``/``cancelled``) if the block raised, else ``unknown``.
+        A *retry* is timed with the operation's retries instead.
+        """
+        metrics = self._operations.get(operation)
+        if metrics is None:
+            metrics = self._operations[operation] = OperationMetrics()
+        metrics.in_flight += 1
+        metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+        metrics.bytes_out += bytes_out
+        record = RequestRecord()
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as err:
+            if record.status is None:
+                record.finish(_failure_label(err))
+            raise
+        finally:
+            metrics.in_flight -= 1
+            metrics.bytes_in += record.bytes_in
+            elapsed = (record.finished or time.perf_counter()) - started
+            if retry:
+                metrics.retries.observe(elapsed)
+            else:
+                status = record.status or "unknown"
+                histogram = metrics.latency.get(status)
+                if histogram is None:
+                    histogram = metrics.latency[status] = LatencyHistogram()
+                histogram.observe(elapsed)
+
+    @contextmanager
+    def time_auth_refresh(self) -> Iterator[None]:
+        """Time a token refresh (or the password login standing in for one)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.auth_refresh.observe(time.perf_counter() - started)
+
+    def total(self) -> LatencyHistogram:
+        """Return every first attempt's latency in one histogram."""
+        overall = LatencyHistogram()
+        for metrics in self._operations.values():
+            for histogram in metrics.latency.values():
+                overall.merge(histogram)
+        return overall
+
+    def total_retries(self) -> LatencyHistogram:
+        """Return every retry attempt's latency in one histogram."""
+        overall = LatencyHistogram()
+        for metrics in self._operations.values():
+            overall.merge(metrics.retries)
+        return overall
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of every metric."""
+        return {
+            "requests": self.total().as_dict(),
+            "retries": self.total_retries().as_dict(),
+            "operations": {
+                operation: metrics.as_dict()
+                for operation, metrics in sorted(self._operations.items())
+            },
+            "auth_refresh": self.auth_refresh.as_dict(),
+        }
+
+
+def _failure_label(err: BaseException) -> str:
+    if isinstance(err, asyncio.CancelledError):
+        return "cancelled"
+    if isinstance(err, TimeoutError):
+        return "timeout"
+    return "error"
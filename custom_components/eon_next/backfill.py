@@ -6,74 +6,42 @@ import asyncio
 from collections.abc import Callable
 from datetime import date, timedelta
 import logging
-from typing import Any, TypedDict
+from typing import Any
 
 from homeassistant.core import callback
-from homeassistant.helpers.recorder import get_instance
-from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
+from .backfill_status import (
+    BackfillState,
+    BackfillStatus,
+    async_load_backfill_state,
+    backfill_enabled,
+    backfill_lookback_days,
+    backfill_store,
+    build_status,
+    eligible_meters,
+)
 from .const import (
     CONF_BACKFILL_CHUNK_DAYS,
     CONF_BACKFILL_DELAY_SECONDS,
-    CONF_BACKFILL_ENABLED,
-    CONF_BACKFILL_LOOKBACK_DAYS,
     CONF_BACKFILL_REBUILD_STATISTICS,
     CONF_BACKFILL_REQUESTS_PER_RUN,
     CONF_BACKFILL_RUN_INTERVAL_MINUTES,
     DEFAULT_BACKFILL_CHUNK_DAYS,
     DEFAULT_BACKFILL_DELAY_SECONDS,
-    DEFAULT_BACKFILL_ENABLED,
-    DEFAULT_BACKFILL_LOOKBACK_DAYS,
     DEFAULT_BACKFILL_REBUILD_STATISTICS,
     DEFAULT_BACKFILL_REQUESTS_PER_RUN,
     DEFAULT_BACKFILL_RUN_INTERVAL_MINUTES,
-    DOMAIN,
 )
-from .eonnext import (
-    EonNextApiError,
-    EonNextAuthError,
-    METER_TYPE_ELECTRIC,
-    METER_TYPE_GAS,
+from .eonnext import EonNextApiError, EonNextAuthError
+from .statistics import (
+    async_import_historical_statistics,
+    cost_statistic_id_for_meter,
+    statistic_id_for_meter,
 )
-from .statistics import async_import_historical_statistics, statistic_id_for_meter
 
 _LOGGER = logging.getLogger(__name__)
 
-_STORE_VERSION = 1
-
-
-class MeterBackfillState(TypedDict):
-    """Backfill state for one meter."""
-
-    next_start: str
-    done: bool
-
-
-class BackfillState(TypedDict):
-    """Persisted backfill state."""
-
-    initialized: bool
-    rebuild_done: bool
-    lookback_days: int
-    meters: dict[str, MeterBackfillState]
-
-
-class BackfillStatus(TypedDict):
-    """Runtime status snapshot for historical backfill."""
-
-    state: str
-    enabled: bool
-    initialized: bool
-    rebuild_done: bool
-    lookback_days: int
-    total_meters: int
-    completed_meters: int
-    pending_meters: int
-    next_start_date: str | None
-    meters_progress: dict[str, dict[str, Any]]
-
-
 class EonNextBackfillManager:
     """Manage slow, resumable historical statistics backfill."""
 
@@ -82,9 +50,7 @@ class EonNextBackfillManager:
         self.entry = entry
         self.api = api
         self.coordinator = coordinator
-        self._store: Store[BackfillState] = Store(
-            hass, _STORE_VERSION, f"{DOMAIN}_{entry.entry_id}_backfill"
-        )
+        self._store = backfill_store(hass, entry)
         self._state: BackfillState | None = None
         self._task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
@@ -95,9 +61,15 @@ class EonNextBackfillManager:
         await self._ensure_state_loaded()
 
     async def async_start(self) -> None:
-        """Start background backfill loop."""
+        """Start background backfill loop.
+
+        Nothing is started while backfill is disabled: toggling the option
+        reloads the entry, which calls this again.
+        """
         if self._task and not self._task.done():
             return
+        if not self._backfill_enabled():
+            return
         self._stop_event.clear()
         self._task = self.entry.async_create_background_task(
             self.hass,
@@ -139,17 +111,10 @@ class EonNextBackfillManager:
                 _LOGGER.debug("Backfill status listener failed", exc_info=True)
 
     def _backfill_enabled(self) -> bool:
-        return bool(
-            self.entry.options.get(CONF_BACKFILL_ENABLED, DEFAULT_BACKFILL_ENABLED)
-        )
+        return backfill_enabled(self.entry)
 
     def _backfill_lookback_days(self) -> int:
-        value = int(
-            self.entry.options.get(
-                CONF_BACKFILL_LOOKBACK_DAYS, DEFAULT_BACKFILL_LOOKBACK_DAYS
-            )
-        )
-        return max(1, value)
+        return backfill_lookback_days(self.entry)
 
     def _backfill_chunk_days(self) -> int:
         value = int(
@@ -193,13 +158,7 @@ class EonNextBackfillManager:
         if self._state is not None:
             return
 
-        loaded = await self._store.async_load()
-        self._state = {
-            "initialized": bool(loaded.get("initialized", False)) if loaded else False,
-            "rebuild_done": bool(loaded.get("rebuild_done", False)) if loaded else False,
-            "lookback_days": int(loaded.get("lookback_days", 0)) if loaded else 0,
-            "meters": dict(loaded.get("meters", {})) if loaded else {},
-        }
+        self._state = await async_load_backfill_state(self._store)
 
     async def _save_state(self) -> None:
         if self._state is None:
@@ -208,15 +167,7 @@ class EonNextBackfillManager:
         self._notify_listeners()
 
     def _eligible_meters(self) -> list[Any]:
-        meters: list[Any] = []
-        for account in self.api.accounts:
-            for meter in account.meters:
-                if meter.type not in (METER_TYPE_GAS, METER_TYPE_ELECTRIC):
-                    continue
-                if not meter.serial or not meter.supply_point_id:
-                    continue
-                meters.append(meter)
-        return meters
+        return eligible_meters(self.api)
 
     @staticmethod
     def _utc_boundary_iso(day: date) -> str:
@@ -249,88 +200,7 @@ class EonNextBackfillManager:
     @callback
     def get_status(self) -> BackfillStatus:
         """Return a status snapshot for diagnostics."""
-        enabled = self._backfill_enabled()
-        meters = self._eligible_meters()
-        total_meters = len(meters)
-
-        initialized = bool(self._state and self._state["initialized"])
-        rebuild_done = bool(self._state and self._state["rebuild_done"])
-        lookback_days = (
-            int(self._state["lookback_days"])
-            if self._state and self._state["lookback_days"] > 0
-            else self._backfill_lookback_days()
-        )
-
-        completed_meters = 0
-        pending_meters = total_meters
-        next_start_date: str | None = None
-        meters_progress: dict[str, dict[str, Any]] = {}
-
-        today = dt_util.now().date()
-
-        if self._state is not None:
-            meter_state = self._state["meters"]
-            completed_meters = sum(
-                1 for meter in meters if meter_state.get(meter.serial, {}).get("done", False)
-            )
-            pending_meters = max(total_meters - completed_meters, 0)
-            pending_dates = [
-                str(meter_state[meter.serial]["next_start"])
-                for meter in meters
-                if meter.serial in meter_state
-                and not meter_state[meter.serial].get("done", False)
-                and meter_state[meter.serial].get("next_start")
-            ]
-            if pending_dates:
-                next_start_date = min(pending_dates)
-
-            # Build per-meter progress details.
-            backfill_start = today - timedelta(days=lookback_days - 1)
-            for meter in meters:
-                ms = meter_state.get(meter.serial)
-                if ms is None:
-                    meters_progress[meter.serial] = {
-                        "done": False,
-                        "next_start": None,
-                        "days_completed": 0,
-                        "days_remaining": lookback_days,
-                    }
-                    continue
-                is_done = ms.get("done", False)
-                try:
-                    ns = date.fromisoformat(ms["next_start"])
-                except (ValueError, KeyError):
-                    ns = backfill_start
-                days_completed = max((ns - backfill_start).days, 0)
-                days_remaining = max(lookback_days - days_completed, 0)
-                meters_progress[meter.serial] = {
-                    "done": is_done,
-                    "next_start": ms.get("next_start"),
-                    "days_completed": days_completed,
-                    "days_remaining": days_remaining,
-                }
-
-        if not enabled:
-            state = "disabled"
-        elif initialized and pending_meters == 0:
-            state = "completed"
-        elif initialized:
-            state = "running"
-        else:
-            state = "initializing"
-
-        return {
-            "state": state,
-            "enabled": enabled,
-            "initialized": initialized,
-            "rebuild_done": rebuild_done,
-            "lookback_days": lookback_days,
-            "total_meters": total_meters,
-            "completed_meters": completed_meters,
-            "pending_meters": pending_meters,
-            "next_start_date": next_start_date,
-            "meters_progress": meters_progress,
-        }
+        return build_status(self.entry, self.api, self._state)
 
     async def _initialize_or_reset_progress(self, meters: list[Any]) -> None:
         if self._state is None:
@@ -345,6 +215,7 @@ class EonNextBackfillManager:
             self._state["initialized"] = True
             self._state["rebuild_done"] = False
             self._state["lookback_days"] = lookback_days
+            self._state["cost_backfilled"] = True
             self._state["meters"] = {
                 meter.serial: {"next_start": start.isoformat(), "done": False}
                 for meter in meters
@@ -365,6 +236,7 @@ class EonNextBackfillManager:
             # destroy already-imported history the user asked to keep.
             self._state["lookback_days"] = lookback_days
             self._state["rebuild_done"] = False
+            self._state["cost_backfilled"] = True
             for meter in meters:
                 self._state["meters"][meter.serial] = {
                     "next_start": start.isoformat(),
@@ -378,6 +250,24 @@ class EonNextBackfillManager:
             )
             return
 
+        if not self._state["cost_backfilled"]:
+            # Progress from before backfill priced the cost statistic: walk
+            # the stored window once more.  Re-importing consumption is safe
+            # (spliced hours overwrite, finer rows are kept), and it gives
+            # entries whose backfill already finished their cost history.
+            start = today - timedelta(days=stored_lookback - 1)
+            self._state["cost_backfilled"] = True
+            for meter in meters:
+                self._state["meters"][meter.serial] = {
+                    "next_start": start.isoformat(),
+                    "done": False,
+                }
+            await self._save_state()
+            _LOGGER.info(
+                "Repeating historical backfill from %s to add cost statistics", start
+            )
+            return
+
         changed = False
         if lookback_days < stored_lookback:
             # Record the smaller window (for status/UX) but keep progress and
@@ -413,8 +303,10 @@ class EonNextBackfillManager:
 
         statistic_ids = [
             statistic_id
+            for meter in meters
             for statistic_id in (
-                statistic_id_for_meter(meter.serial, meter.type) for meter in meters
+                statistic_id_for_meter(meter.serial, meter.type),
+                cost_statistic_id_for_meter(meter.serial, meter.type),
             )
             if statistic_id is not None
         ]
@@ -423,6 +315,8 @@ class EonNextBackfillManager:
             await self._save_state()
             return
 
+        from homeassistant.helpers.recorder import get_instance
+
         done = asyncio.Event()
         # The recorder calls ``on_done`` from the recorder thread; ``Event.set``
         # is not thread-safe, so hop back onto the event loop to wake the waiter
@@ -535,6 +429,9 @@ class EonNextBackfillManager:
                         meter.type,
                         consumption,
                         daily_granularity=True,
+                        rates=self.coordinator.statistics_rates(
+                            meter.serial, meter.supply_point_id, consumption
+                        ),
                     )
 
                 meter_state["next_start"] = (end_date + timedelta(days=1)).isoformat()
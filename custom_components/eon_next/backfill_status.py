@@ -0,0 +1,231 @@
+"""Backfill status shared by the backfill manager and its disabled stand-in.
+
+Historical backfill is off by default.  While it is, setup builds a
+``DisabledBackfill`` instead of the manager, so ``backfill.py`` is never
+imported; the stand-in only reads the persisted progress, so the status
+still reports how far an earlier run got.  Turning the option on reloads
+the entry.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import Any, TypedDict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_BACKFILL_ENABLED,
+    CONF_BACKFILL_LOOKBACK_DAYS,
+    DEFAULT_BACKFILL_ENABLED,
+    DEFAULT_BACKFILL_LOOKBACK_DAYS,
+    DOMAIN,
+)
+from .eonnext import METER_TYPE_ELECTRIC, METER_TYPE_GAS
+
+_STORE_VERSION = 1
+
+
+class MeterBackfillState(TypedDict):
+    """Backfill state for one meter."""
+
+    next_start: str
+    done: bool
+
+
+class BackfillState(TypedDict):
+    """Persisted backfill state."""
+
+    initialized: bool
+    rebuild_done: bool
+    lookback_days: int
+    meters: dict[str, MeterBackfillState]
+    # Progress recorded before backfill imported the cost statistic lacks
+    # this; such a run is repeated once to add the cost history.
+    cost_backfilled: bool
+
+
+class BackfillStatus(TypedDict):
+    """Runtime status snapshot for historical backfill."""
+
+    state: str
+    enabled: bool
+    initialized: bool
+    rebuild_done: bool
+    lookback_days: int
+    total_meters: int
+    completed_meters: int
+    pending_meters: int
+    next_start_date: str | None
+    meters_progress: dict[str, dict[str, Any]]
+
+
+def backfill_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[BackfillState]:
+    """Return the Store holding *entry*'s backfill progress."""
+    return Store(hass, _STORE_VERSION, f"{DOMAIN}_{entry.entry_id}_backfill")
+
+
+async def async_remove_backfill_state(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete *entry*'s persisted backfill progress."""
+    await backfill_store(hass, entry).async_remove()
+
+
+async def async_load_backfill_state(store: Store[BackfillState]) -> BackfillState:
+    """Load persisted progress, defaulting anything missing."""
+    loaded = await store.async_load()
+    return {
+        "initialized": bool(loaded.get("initialized", False)) if loaded else False,
+        "rebuild_done": bool(loaded.get("rebuild_done", False)) if loaded else False,
+        "lookback_days": int(loaded.get("lookback_days", 0)) if loaded else 0,
+        "meters": dict(loaded.get("meters", {})) if loaded else {},
+        "cost_backfilled": (
+            bool(loaded.get("cost_backfilled", False)) if loaded else False
+        ),
+    }
+
+
+def backfill_enabled(entry: ConfigEntry) -> bool:
+    """Return whether historical backfill is switched on for *entry*."""
+    return bool(entry.options.get(CONF_BACKFILL_ENABLED, DEFAULT_BACKFILL_ENABLED))
+
+
+def backfill_lookback_days(entry: ConfigEntry) -> int:
+    """Return the configured lookback, at least one day."""
+    value = int(
+        entry.options.get(CONF_BACKFILL_LOOKBACK_DAYS, DEFAULT_BACKFILL_LOOKBACK_DAYS)
+    )
+    return max(1, value)
+
+
+def eligible_meters(api: Any) -> list[Any]:
+    """Return the meters historical backfill covers."""
+    meters: list[Any] = []
+    for account in api.accounts:
+        for meter in account.meters:
+            if meter.type not in (METER_TYPE_GAS, METER_TYPE_ELECTRIC):
+                continue
+            if not meter.serial or not meter.supply_point_id:
+                continue
+            meters.append(meter)
+    return meters
+
+
+def build_status(
+    entry: ConfigEntry, api: Any, stored: BackfillState | None
+) -> BackfillStatus:
+    """Return a status snapshot from the persisted *stored* state, if loaded."""
+    enabled = backfill_enabled(entry)
+    meters = eligible_meters(api)
+    total_meters = len(meters)
+
+    initialized = bool(stored and stored["initialized"])
+    rebuild_done = bool(stored and stored["rebuild_done"])
+    lookback_days = (
+        int(stored["lookback_days"])
+        if stored and stored["lookback_days"] > 0
+        else backfill_lookback_days(entry)
+    )
+
+    completed_meters = 0
+    pending_meters = total_meters
+    next_start_date: str | None = None
+    meters_progress: dict[str, dict[str, Any]] = {}
+
+    today = dt_util.now().date()
+
+    if stored is not None:
+        meter_state = stored["meters"]
+        completed_meters = sum(
+            1 for meter in meters if meter_state.get(meter.serial, {}).get("done", False)
+        )
+        pending_meters = max(total_meters - completed_meters, 0)
+        pending_dates = [
+            str(meter_state[meter.serial]["next_start"])
+            for meter in meters
+            if meter.serial in meter_state
+            and not meter_state[meter.serial].get("done", False)
+            and meter_state[meter.serial].get("next_start")
+        ]
+        if pending_dates:
+            next_start_date = min(pending_dates)
+
+        # Build per-meter progress details.
+        backfill_start = today - timedelta(days=lookback_days - 1)
+        for meter in meters:
+            ms = meter_state.get(meter.serial)
+            if ms is None:
+                meters_progress[meter.serial] = {
+                    "done": False,
+                    "next_start": None,
+                    "days_completed": 0,
+                    "days_remaining": lookback_days,
+                }
+                continue
+            is_done = ms.get("done", False)
+            try:
+                ns = date.fromisoformat(ms["next_start"])
+            except (ValueError, KeyError):
+                ns = backfill_start
+            days_completed = max((ns - backfill_start).days, 0)
+            days_remaining = max(lookback_days - days_completed, 0)
+            meters_progress[meter.serial] = {
+                "done": is_done,
+                "next_start": ms.get("next_start"),
+                "days_completed": days_completed,
+                "days_remaining": days_remaining,
+            }
+
+    if not enabled:
+        state = "disabled"
+    elif initialized and pending_meters == 0:
+        state = "completed"
+    elif initialized:
+        state = "running"
+    else:
+        state = "initializing"
+
+    return {
+        "state": state,
+        "enabled": enabled,
+        "initialized": initialized,
+        "rebuild_done": rebuild_done,
+        "lookback_days": lookback_days,
+        "total_meters": total_meters,
+        "completed_meters": completed_meters,
+        "pending_meters": pending_meters,
+        "next_start_date": next_start_date,
+        "meters_progress": meters_progress,
+    }
+
+
+class DisabledBackfill:
+    """Status-only stand-in for the backfill manager while backfill is off."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api: Any) -> None:
+        self.entry = entry
+        self.api = api
+        self._store = backfill_store(hass, entry)
+        self._state: BackfillState | None = None
+
+    async def async_prime(self) -> None:
+        """Load the progress an earlier run persisted, for the status."""
+        self._state = await async_load_backfill_state(self._store)
+
+    async def async_stop(self) -> None:
+        """Nothing runs while disabled."""
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Status never changes while disabled; return a no-op remover."""
+        return lambda: None
+
+    @callback
+    def get_status(self) -> BackfillStatus:
+        """Return a status snapshot for diagnostics."""
+        return build_status(self.entry, self.api, self._state)
@@ -9,6 +9,8 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .coordinator import EonNextCoordinator
+from .meter_snapshot import MeterSnapshot
 from .models import EonNextConfigEntry
 from .tariff_entity import TariffBoundaryRefreshMixin
 from .tariff_helpers import get_off_peak_metadata, is_off_peak
@@ -31,7 +33,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class EonNextBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
+class EonNextBinarySensorBase(CoordinatorEntity[EonNextCoordinator], BinarySensorEntity):
     """Base class for Eon Next binary sensors."""
 
     def __init__(self, coordinator, data_key: str):
@@ -39,10 +41,24 @@ class EonNextBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
         self._data_key = data_key
 
     @property
-    def _meter_data(self) -> dict[str, Any] | None:
-        if self.coordinator.data and self._data_key in self.coordinator.data:
-            return self.coordinator.data[self._data_key]
-        return None
+    def _meter(self) -> MeterSnapshot | None:
+        if not self.coordinator.data:
+            return None
+        data = self.coordinator.data.get(self._data_key)
+        return data if isinstance(data, MeterSnapshot) else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Skip the state write (and its recorder row) when this entity's
+        # coordinator row is unchanged.
+        if self.coordinator.data_changed(self._data_key):
+            super()._handle_coordinator_update()
+
+    @property
+    def assumed_state(self) -> bool:
+        # Values restored from the on-disk snapshot are stale until the
+        # first live refresh replaces them.
+        return self.coordinator.data_restored
 
 
 class OffPeakBinarySensor(TariffBoundaryRefreshMixin, EonNextBinarySensorBase):
@@ -63,13 +79,13 @@ class OffPeakBinarySensor(TariffBoundaryRefreshMixin, EonNextBinarySensorBase):
     def _recompute_tariff_state(self) -> None:
         # Compute once per write instead of scanning the schedule three times
         # (available/is_on/icon) - which could also disagree across a boundary.
-        data = self._meter_data
-        self._is_tou = bool(data.get("tariff_is_tou", False)) if data else False
-        self._off_peak = is_off_peak(data) if data else None
+        meter = self._meter
+        self._is_tou = meter.tariff.is_tou if meter else False
+        self._off_peak = is_off_peak(meter) if meter else None
 
     @property
     def available(self) -> bool:
-        if not super().available or self._meter_data is None:
+        if not super().available or self._meter is None:
             return False
         return self._is_tou and self._off_peak is not None
 
@@ -83,11 +99,11 @@ class OffPeakBinarySensor(TariffBoundaryRefreshMixin, EonNextBinarySensorBase):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        data = self._meter_data
-        if not data:
+        meter = self._meter
+        if not meter:
             return {}
-        attrs = get_off_peak_metadata(data)
-        tariff_code = data.get("tariff_code")
+        attrs = get_off_peak_metadata(meter)
+        tariff_code = meter.tariff.code
         if tariff_code:
             attrs["tariff_code"] = tariff_code
         return attrs
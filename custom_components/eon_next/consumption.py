@@ -0,0 +1,249 @@
+"""Compact consumption series decoded straight from the REST response stream.
+
+Consumption pages used to be read with ``response.json()``: the whole body
+buffered as text, then a dict per half-hour or day held for as long as the
+page was (the coordinator's refresh, the backfill chunk, the 304 cache).
+Pages are now decoded item by item as the body arrives, so only one item is
+ever buffered, and each item is folded into column storage: a float array
+for the readings plus the two interval timestamps.
+
+``ConsumptionSeries`` is a read-only ``Sequence`` whose items are
+``ConsumptionInterval`` rows that are also ``Mapping``\\ s over the API's keys
+(``interval_start``, ``interval_end``, ``consumption``), so the aggregation,
+statistics and cost helpers keep their key-based view.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import math
+from array import array
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, overload
+
+# Body bytes read per step; bounds the decode buffer together with the size
+# of a single ``results`` item.
+CHUNK_SIZE = 16 * 1024
+
+_KEYS = ("consumption", "interval_start", "interval_end")
+_WHITESPACE = " \t\r\n"
+# Characters that can continue a number: after a chunk ending "0." or "1e",
+# raw_decode stops at the "." or "e" and returns the truncated prefix.
+_NUMBER_CONTINUATION = frozenset(".eE+-0123456789")
+_DECODER = json.JSONDecoder()
+
+
+@dataclass(slots=True, frozen=True)
+class ConsumptionInterval(Mapping[str, Any]):
+    """One consumption reading (kWh, or m³ for some gas meters)."""
+
+    consumption: float | None
+    interval_start: str | None
+    interval_end: str | None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+
+class ConsumptionSeries(Sequence[ConsumptionInterval]):
+    """Consumption readings stored column-wise."""
+
+    __slots__ = ("_consumption", "_starts", "_ends")
+
+    def __init__(self) -> None:
+        # NaN marks a missing reading; the column stays a plain C double array.
+        self._consumption = array("d")
+        self._starts: list[str | None] = []
+        self._ends: list[str | None] = []
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Mapping[str, Any]]) -> ConsumptionSeries:
+        """Build a series from decoded ``results`` items."""
+        series = cls()
+        for entry in entries:
+            series.append(entry)
+        return series
+
+    def append(self, entry: Mapping[str, Any]) -> None:
+        """Add one decoded ``results`` item."""
+        self._consumption.append(_as_float(entry.get("consumption")))
+        self._starts.append(_as_str(entry.get("interval_start")))
+        self._ends.append(_as_str(entry.get("interval_end")))
+
+    @property
+    def values(self) -> array:
+        """The readings column (NaN for a missing reading); do not mutate."""
+        return self._consumption
+
+    @property
+    def starts(self) -> Sequence[str | None]:
+        """The ``interval_start`` column; do not mutate."""
+        return self._starts
+
+    @overload
+    def __getitem__(self, index: int) -> ConsumptionInterval: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[ConsumptionInterval]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> ConsumptionInterval | Sequence[ConsumptionInterval]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return ConsumptionInterval(
+            _from_float(self._consumption[index]),
+            self._starts[index],
+            self._ends[index],
+        )
+
+    def __iter__(self) -> Iterator[ConsumptionInterval]:
+        for value, start, end in zip(
+            self._consumption, self._starts, self._ends, strict=True
+        ):
+            yield ConsumptionInterval(_from_float(value), start, end)
+
+    def __len__(self) -> int:
+        return len(self._consumption)
+
+    def __repr__(self) -> str:
+        return f"ConsumptionSeries(<{len(self)} intervals>)"
+
+
+def _as_float(value: Any) -> float:
+    if value is None or isinstance(value, bool):
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _from_float(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _as_str(value: Any) -> str | None:
+    return None if value is None else str(value)
+
+
+class _JsonStream:
+    """Decode JSON tokens and values from an async stream of byte chunks.
+
+    Only the undecoded tail of the body is kept, so memory is bounded by the
+    chunk size plus the largest single value read with :meth:`value`.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> bool:
+        """Append the next chunk to the buffer; return False at end of body."""
+        if self._eof:
+            return False
+        try:
+            chunk = await anext(self._chunks)
+        except StopAsyncIteration:
+            self._eof = True
+            text = self._utf8.decode(b"", final=True)
+        else:
+            text = self._utf8.decode(chunk)
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        return bool(text) or not self._eof
+
+    async def peek(self) -> str:
+        """Return the next non-whitespace character, or ``""`` at the end."""
+        while True:
+            buf = self._buf
+            while self._pos < len(buf) and buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buf):
+                return buf[self._pos]
+            if not await self._fill():
+                return ""
+
+    async def expect(self, char: str) -> None:
+        """Consume *char* (after any whitespace)."""
+        found = await self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON body, found {found!r}")
+        self._pos += 1
+
+    async def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not await self._fill():
+                    raise
+                continue
+            # A number ending at the buffer end may continue in the next chunk
+            # ("12" of "123"), as may one cut inside its fraction or exponent
+            # ("0." of "0.125", "1e" of "1e-3").
+            if (
+                end == len(self._buf) or self._buf[end] in _NUMBER_CONTINUATION
+            ) and await self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+async def async_decode_consumption_page(
+    chunks: AsyncIterator[bytes],
+) -> dict[str, Any]:
+    """Decode a consumption page, streaming ``results`` into a series.
+
+    Top-level keys other than ``results`` (``count``, ``next``, ...) are
+    decoded as usual.  Raises ``ValueError`` for a body that is not a JSON
+    object.
+    """
+    stream = _JsonStream(chunks)
+    page: dict[str, Any] = {}
+    await stream.expect("{")
+    if await stream.peek() == "}":
+        return page
+    while True:
+        key = await stream.value()
+        if not isinstance(key, str):
+            raise ValueError("Expected a string key in JSON object")
+        await stream.expect(":")
+        if key == "results" and await stream.peek() == "[":
+            page[key] = await _decode_series(stream)
+        else:
+            page[key] = await stream.value()
+        if await stream.peek() == "}":
+            return page
+        await stream.expect(",")
+
+
+async def _decode_series(stream: _JsonStream) -> ConsumptionSeries:
+    series = ConsumptionSeries()
+    await stream.expect("[")
+    if await stream.peek() == "]":
+        await stream.expect("]")
+        return series
+    while True:
+        item = await stream.value()
+        if isinstance(item, dict):
+            series.append(item)
+        if await stream.peek() == "]":
+            await stream.expect("]")
+            return series
+        await stream.expect(",")
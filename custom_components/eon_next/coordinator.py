@@ -3,25 +3,72 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
+from .const import DOMAIN
+from .cost_engine import (
+    RateTimeline,
+    compile_agreement_timeline,
+    compile_consumption_timeline,
+    price_consumption,
+)
 from .eonnext import (
     EonNext,
     EonNextApiError,
     EonNextAuthError,
+    EonNextCircuitOpenError,
     GasMeter,
+    METER_TYPE_ELECTRIC,
     METER_TYPE_GAS,
 )
+from .meter_snapshot import (
+    NO_TARIFF,
+    NO_USAGE,
+    CostSnapshot,
+    MeterSnapshot,
+    TariffSnapshot,
+    UsageSnapshot,
+    merge_missing,
+    share,
+)
+from .polling import AdaptivePollScheduler
 from .statistics import async_import_consumption_statistics
-from .tariff_helpers import cost_consumption_entries, get_current_rate
+from .tariff_helpers import get_current_rate
+from .tariff_timeline import TariffTimeline
 
 _LOGGER = logging.getLogger(__name__)
 
+_SNAPSHOT_STORE_VERSION = 1
+_SNAPSHOT_SAVE_DELAY_SECONDS = 60
+_TARIFF_TIMELINE_STORE_VERSION = 1
+
+
+def _snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, _SNAPSHOT_STORE_VERSION, f"{DOMAIN}_{entry_id}_coordinator")
+
+
+def _tariff_timeline_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, Any]]:
+    return Store(
+        hass, _TARIFF_TIMELINE_STORE_VERSION, f"{DOMAIN}_{entry_id}_tariff_timeline"
+    )
+
+
+async def async_remove_coordinator_stores(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the data snapshot and tariff timeline persisted for an entry."""
+    await _snapshot_store(hass, entry_id).async_remove()
+    await _tariff_timeline_store(hass, entry_id).async_remove()
+
 
 def ev_data_key(device_id: str) -> str:
     """Create a stable coordinator key for EV devices."""
@@ -31,20 +78,182 @@ def ev_data_key(device_id: str) -> str:
 class EonNextCoordinator(DataUpdateCoordinator):
     """Coordinator to manage fetching Eon Next data."""
 
-    def __init__(self, hass, api: EonNext, update_interval_minutes: int = 30):
+    def __init__(
+        self,
+        hass,
+        api: EonNext,
+        update_interval_minutes: int = 30,
+        *,
+        entry_id: str | None = None,
+    ):
+        base_interval = timedelta(minutes=update_interval_minutes)
         super().__init__(
             hass,
             _LOGGER,
             name="Eon Next",
-            update_interval=timedelta(minutes=update_interval_minutes),
+            update_interval=base_interval,
         )
         self.api = api
         self._cost_warning_logged: set[str] = set()
+        # Re-targets ``update_interval`` after every refresh; see polling.py.
+        self.poll_scheduler = AdaptivePollScheduler(base_interval)
+        # Last good ``data`` is persisted per entry (when one is given) so a
+        # restart can publish state before the first live refresh finishes.
+        self._snapshot_store: Store[dict[str, Any]] | None = (
+            _snapshot_store(hass, entry_id) if entry_id is not None else None
+        )
+        # Every tariff agreement seen per meter point, for costing past days
+        # at the rates that applied then.
+        self.tariff_timeline = TariffTimeline()
+        self._tariff_timeline_store: Store[dict[str, Any]] | None = (
+            _tariff_timeline_store(hass, entry_id) if entry_id is not None else None
+        )
+        # True while ``data`` is the restored snapshot rather than a live
+        # refresh; entities surface it as ``assumed_state``.
+        self.data_restored = False
+        self.snapshot_saved_at: str | None = None
+        # Data keys whose row changed in the last update, so entities can
+        # skip redundant state writes.  ``None`` means "assume everything
+        # changed" (first or restored data, a failed or recovering refresh,
+        # externally pushed data).
+        self.changed_keys: frozenset[str] | None = None
+
+    async def async_restore_snapshot(self) -> bool:
+        """Seed ``data`` from the persisted snapshot; return whether it did."""
+        if self._snapshot_store is None:
+            return False
+        stored = await self._snapshot_store.async_load()
+        if not isinstance(stored, dict) or not isinstance(stored.get("data"), dict):
+            return False
+        self.poll_scheduler.restore(stored.get("polling"))
+        data: dict[str, Mapping[str, Any]] = {}
+        for key, row in stored["data"].items():
+            if not isinstance(row, dict):
+                continue
+            if row.get("type") in (METER_TYPE_ELECTRIC, METER_TYPE_GAS) and row.get(
+                "serial"
+            ):
+                data[key] = MeterSnapshot.from_mapping(row)
+            else:
+                data[key] = row
+        if not data:
+            return False
+        self.data = data
+        self.data_restored = True
+        self.snapshot_saved_at = stored.get("saved_at")
+        return True
+
+    async def async_load_tariff_timeline(self) -> None:
+        """Load the persisted tariff agreement timeline."""
+        if self._tariff_timeline_store is None:
+            return
+        stored = await self._tariff_timeline_store.async_load()
+        if isinstance(stored, dict):
+            self.tariff_timeline = TariffTimeline.from_dict(stored.get("points"))
+
+    def statistics_rates(
+        self,
+        meter_serial: str,
+        supply_point_id: str | None,
+        consumption: list[dict[str, Any]],
+    ) -> RateTimeline | None:
+        """Compile the rates that price *consumption* into the cost statistic.
+
+        Spans no known agreement covers fall back to the meter's current
+        tariff.  Used by the historical backfill.
+        """
+        row = self.data.get(meter_serial) if self.data else None
+        return compile_consumption_timeline(
+            self.tariff_timeline,
+            supply_point_id,
+            consumption,
+            row if isinstance(row, MeterSnapshot) else {},
+        )
+
+    def _update_tariff_timeline(
+        self, account_tariffs: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        """Fold the agreements of each meter point into the timeline."""
+        changed = False
+        for supply_point_id, tariff_data in account_tariffs.items():
+            agreements = tariff_data.get("agreements") or [tariff_data]
+            changed |= self.tariff_timeline.update(
+                supply_point_id,
+                (self._tariff_snapshot(agreement) for agreement in agreements),
+            )
+        if changed and self._tariff_timeline_store is not None:
+            self._tariff_timeline_store.async_delay_save(
+                lambda: {"points": self.tariff_timeline.as_dict()},
+                _SNAPSHOT_SAVE_DELAY_SECONDS,
+            )
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the compact, persistable form of the current ``data``."""
+        return {
+            "saved_at": self.snapshot_saved_at,
+            # Meter snapshots persist in their flat-key mapping form.
+            "data": {key: dict(row) for key, row in (self.data or {}).items()},
+            "polling": self.poll_scheduler.as_dict(),
+        }
+
+    def data_changed(self, key: str) -> bool:
+        """Return whether the row for *key* changed in the last update."""
+        return self.changed_keys is None or key in self.changed_keys
 
-    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+    @staticmethod
+    def _changed_keys(
+        previous: Mapping[str, Mapping[str, Any]],
+        current: Mapping[str, Mapping[str, Any]],
+    ) -> frozenset[str]:
+        """Return keys added, removed or changed between two data dicts.
+
+        Unchanged meter rows are usually the very same object (see
+        ``share``), so the identity check settles most keys without a
+        field-by-field comparison.
+        """
+        return frozenset(
+            key
+            for key in previous.keys() | current.keys()
+            if (old := previous.get(key)) is not (new := current.get(key))
+            and old != new
+        )
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Mapping[str, Any]]) -> None:
+        """Publish externally supplied data; every entity re-evaluates."""
+        self.changed_keys = None
+        super().async_set_updated_data(data)
+
+    def _schedule_snapshot_save(self) -> None:
+        """Persist the latest ``data`` on a debounce."""
+        if self._snapshot_store is None:
+            return
+        self.snapshot_saved_at = dt_util.utcnow().isoformat()
+        self._snapshot_store.async_delay_save(
+            self._snapshot, _SNAPSHOT_SAVE_DELAY_SECONDS
+        )
+
+    async def async_flush_stores(self) -> None:
+        """Write debounced saves now, so none lands after the entry unloads.
+
+        A delayed write still pending when the entry is removed would
+        recreate the Store that ``async_remove_entry`` just deleted.
+        """
+        if self._snapshot_store is not None:
+            await self._snapshot_store.async_save(self._snapshot())
+        if self._tariff_timeline_store is not None:
+            await self._tariff_timeline_store.async_save(
+                {"points": self.tariff_timeline.as_dict()}
+            )
+
+    async def _async_update_data(self) -> dict[str, Mapping[str, Any]]:
         """Fetch data from the Eon Next API."""
-        data: dict[str, dict[str, Any]] = {}
+        # Stays ``None`` if this refresh raises, so the availability change
+        # reaches every entity.
+        self.changed_keys = None
+        data: dict[str, Mapping[str, Any]] = {}
         errors: list[str] = []
+        new_readings = False
         balances = await self._fetch_account_balances()
         # Only stamp a fresh timestamp when balances were actually fetched;
         # re-publishing a stale balance with "now" misrepresents its freshness.
@@ -66,48 +275,23 @@ class EonNextCoordinator(DataUpdateCoordinator):
             }
 
             account_tariffs = await self._fetch_tariff_data(account)
+            if account_tariffs:
+                self._update_tariff_timeline(account_tariffs)
 
             for meter in account.meters:
                 meter_key = meter.serial
+                prev_row = self.data.get(meter_key) if self.data else None
+                previous = prev_row if isinstance(prev_row, MeterSnapshot) else None
                 try:
                     await meter._update()
 
-                    meter_data: dict[str, Any] = {
-                        "type": meter.type,
-                        "serial": meter.serial,
-                        "meter_id": meter.meter_id,
-                        "supply_point_id": meter.supply_point_id,
-                        "latest_reading": meter.latest_reading,
-                        "latest_reading_date": meter.latest_reading_date,
-                        # Defaults for cost/tariff fields - overwritten below
-                        # when the respective API calls succeed.
-                        "daily_consumption": None,
-                        "daily_consumption_last_reset": None,
-                        "standing_charge": None,
-                        "previous_day_cost": None,
-                        "previous_day_consumption": None,
-                        "previous_day_consumption_entry_count": 0,
-                        "previous_day_consumption_data_complete": False,
-                        "previous_day_consumption_last_reset": None,
-                        "cost_period": None,
-                        "unit_rate": None,
-                        "tariff_name": None,
-                        "tariff_code": None,
-                        "tariff_type": None,
-                        "tariff_unit_rate": None,
-                        "tariff_standing_charge": None,
-                        "tariff_valid_from": None,
-                        "tariff_valid_to": None,
-                        "tariff_rates_schedule": None,
-                        "tariff_is_tou": False,
-                    }
-
+                    latest_reading_kwh = None
                     if (
                         meter.type == METER_TYPE_GAS
                         and isinstance(meter, GasMeter)
                         and meter.latest_reading is not None
                     ):
-                        meter_data["latest_reading_kwh"] = meter.get_latest_reading_kwh(
+                        latest_reading_kwh = meter.get_latest_reading_kwh(
                             meter.latest_reading
                         )
 
@@ -115,201 +299,122 @@ class EonNextCoordinator(DataUpdateCoordinator):
                         await self._fetch_consumption(meter)
                     )
                     if consumption is not None:
-                        meter_data["consumption"] = consumption
+                        if (
+                            consumption_granularity == "half_hour"
+                            and self.poll_scheduler.record(
+                                meter.serial, consumption, dt_util.utcnow()
+                            )
+                        ):
+                            new_readings = True
                         daily = self._aggregate_daily_consumption(consumption)
-                        meter_data["daily_consumption"] = daily["total"]
-                        meter_data["daily_consumption_last_reset"] = daily[
-                            "last_reset"
-                        ]
                         yesterday = self._aggregate_yesterday_consumption_details(
                             consumption
                         )
-                        meter_data["previous_day_consumption"] = yesterday["total"]
-                        meter_data["previous_day_consumption_entry_count"] = yesterday[
-                            "entry_count"
-                        ]
-                        meter_data["previous_day_consumption_data_complete"] = (
-                            yesterday["entry_count"] >= 44
-                        )
-                        meter_data["previous_day_consumption_last_reset"] = (
-                            self._yesterday_midnight_iso()
+                        usage = UsageSnapshot(
+                            daily_consumption=daily["total"],
+                            daily_consumption_last_reset=daily["last_reset"],
+                            previous_day_consumption=yesterday["total"],
+                            previous_day_consumption_entry_count=yesterday[
+                                "entry_count"
+                            ],
+                            previous_day_consumption_data_complete=(
+                                yesterday["entry_count"] >= 44
+                            ),
+                            previous_day_consumption_last_reset=(
+                                self._yesterday_midnight_iso()
+                            ),
                         )
+                    elif previous is not None:
+                        # Keep yesterday's figures; today's would be stale.
+                        usage = previous.usage.previous_day_only()
+                    else:
+                        usage = NO_USAGE
 
-                        # Only half-hourly data is imported into external
-                        # statistics.  Daily-granularity fallback covers today
-                        # as one partial midnight bucket; importing it would be
-                        # double-counted once half-hourly hours arrive (and the
-                        # historical backfill owns complete past days).  Live
-                        # imports always run now - the historical backfill
-                        # recomputes sums instead of suspending them.
-                        if consumption_granularity == "half_hour":
-                            try:
-                                await async_import_consumption_statistics(
-                                    self.hass,
-                                    meter.serial,
-                                    meter.type,
-                                    consumption,
-                                )
-                            except Exception as err:  # pylint: disable=broad-except
-                                _LOGGER.debug(
-                                    "Statistics import failed for meter %s: %s",
-                                    meter.serial,
-                                    err,
-                                )
-
-                    tariff = (
+                    tariff_data = (
                         account_tariffs.get(meter.supply_point_id)
                         if account_tariffs
                         else None
                     )
-                    if tariff:
-                        meter_data["tariff_name"] = tariff.get("tariff_name")
-                        meter_data["tariff_code"] = tariff.get("tariff_code")
-                        meter_data["tariff_type"] = tariff.get("tariff_type")
-                        meter_data["tariff_unit_rate"] = self._pence_to_pounds(
-                            tariff.get("unit_rate")
-                        )
-                        meter_data["tariff_standing_charge"] = self._pence_to_pounds(
-                            tariff.get("standing_charge")
-                        )
-                        meter_data["tariff_valid_from"] = tariff.get("valid_from")
-                        meter_data["tariff_valid_to"] = tariff.get("valid_to")
-                        meter_data["tariff_rates_schedule"] = tariff.get(
-                            "unit_rates_schedule"
-                        )
-                        meter_data["tariff_is_tou"] = tariff.get(
-                            "tariff_is_tou", False
+                    if tariff_data:
+                        tariff = self._tariff_snapshot(tariff_data)
+                    elif previous is not None and previous.tariff.name is not None:
+                        # Retain previous tariff values on transient failures.
+                        tariff = previous.tariff
+                        _LOGGER.debug(
+                            "No new tariff data for meter %s; "
+                            "retaining previous values",
+                            meter.serial,
                         )
                     else:
-                        # Retain previous tariff values on transient failures.
-                        prev = self.data.get(meter_key, {}) if self.data else {}
-                        if prev.get("tariff_name") is not None:
-                            for key in (
-                                "tariff_name",
-                                "tariff_code",
-                                "tariff_type",
-                                "tariff_unit_rate",
-                                "tariff_standing_charge",
-                                "tariff_valid_from",
-                                "tariff_valid_to",
-                                "tariff_rates_schedule",
-                                "tariff_is_tou",
-                            ):
-                                meter_data[key] = prev.get(key)
-                            _LOGGER.debug(
-                                "No new tariff data for meter %s; "
-                                "retaining previous values",
-                                meter.serial,
-                            )
-                        else:
-                            _LOGGER.warning(
-                                "No tariff data available for meter %s "
-                                "(supply point %s) - tariff sensor will show "
-                                "as unknown until data arrives from the API",
-                                meter.serial,
-                                meter.supply_point_id,
-                            )
+                        tariff = NO_TARIFF
+                        _LOGGER.warning(
+                            "No tariff data available for meter %s "
+                            "(supply point %s) - tariff sensor will show "
+                            "as unknown until data arrives from the API",
+                            meter.serial,
+                            meter.supply_point_id,
+                        )
 
-                    # Fall back to tariff-derived values for cost fields
-                    # that the defunct daily-costs endpoint can no longer
-                    # provide.  For time-of-use tariffs this resolves the
-                    # rate for the *current* half-hour window rather than the
-                    # schedule mean, so the "Current Unit Rate" sensor and the
-                    # Energy Dashboard price the right rate.
-                    if meter_data.get("unit_rate") is None:
-                        current_rate = get_current_rate(meter_data)
-                        if current_rate is not None:
-                            meter_data["unit_rate"] = current_rate.rate
-                    if (
-                        meter_data.get("standing_charge") is None
-                        and meter_data.get("tariff_standing_charge") is not None
-                    ):
-                        meter_data["standing_charge"] = meter_data[
-                            "tariff_standing_charge"
-                        ]
-
-                    # Compute previous-day cost from consumption + tariff
-                    # data when the cost endpoint cannot provide it.  Each
-                    # half-hour is priced against its own rate window, so
-                    # time-of-use tariffs (where overnight usage dominates by
-                    # design) are costed correctly instead of at a flat mean.
-                    # Require at least 44 half-hourly entries to avoid
-                    # under-reporting from incomplete data.
-                    _sc = meter_data.get("standing_charge")
+                    snapshot = MeterSnapshot(
+                        type=meter.type,
+                        serial=meter.serial,
+                        meter_id=meter.meter_id,
+                        supply_point_id=meter.supply_point_id,
+                        latest_reading=meter.latest_reading,
+                        latest_reading_date=meter.latest_reading_date,
+                        latest_reading_kwh=latest_reading_kwh,
+                        usage=share(usage, previous.usage if previous else None),
+                        tariff=share(tariff, previous.tariff if previous else None),
+                    )
+                    cost = self._derive_cost(snapshot, consumption, previous)
+                    if cost is not snapshot.cost:
+                        snapshot = replace(snapshot, cost=cost)
+                    data[meter_key] = share(snapshot, previous)
+
+                    # Only half-hourly data is imported into external
+                    # statistics.  Daily-granularity fallback covers today
+                    # as one partial midnight bucket; importing it would be
+                    # double-counted once half-hourly hours arrive (and the
+                    # historical backfill owns complete past days).  Live
+                    # imports always run now - the historical backfill
+                    # recomputes sums instead of suspending them.  This runs
+                    # once the tariff is resolved so the cost statistic is
+                    # priced in the same pass.
                     if (
-                        meter_data.get("previous_day_cost") is None
-                        and consumption is not None
-                        and _sc is not None
+                        consumption is not None
+                        and consumption_granularity == "half_hour"
                     ):
-                        yesterday_entries = self._yesterday_entries(consumption)
-                        if len(yesterday_entries) >= 44:
-                            energy_cost = cost_consumption_entries(
-                                meter_data, yesterday_entries
+                        try:
+                            await async_import_consumption_statistics(
+                                self.hass,
+                                meter.serial,
+                                meter.type,
+                                consumption,
+                                compile_consumption_timeline(
+                                    self.tariff_timeline,
+                                    meter.supply_point_id,
+                                    consumption,
+                                    snapshot,
+                                ),
                             )
-                            if energy_cost is not None:
-                                meter_data["previous_day_cost"] = round(
-                                    energy_cost + float(_sc),
-                                    4,
-                                )
-                                yesterday = (
-                                    dt_util.now().date() - timedelta(days=1)
-                                )
-                                meter_data["cost_period"] = yesterday.isoformat()
-
-                    # Final fallback: retain previous cost values for any
-                    # fields still None to avoid flipping sensors to
-                    # "unknown" on transient failures.  Cost fields are all
-                    # derived from tariff + consumption above (there is no
-                    # dedicated cost endpoint), so this always runs.
-                    prev = self.data.get(meter_key, {}) if self.data else {}
-                    _cost_keys = (
-                        "standing_charge",
-                        "previous_day_cost",
-                        "cost_period",
-                        "unit_rate",
-                    )
-                    retained = False
-                    for k in _cost_keys:
-                        if meter_data.get(k) is None and prev.get(k) is not None:
-                            meter_data[k] = prev[k]
-                            retained = True
-                    if retained:
-                        _LOGGER.debug(
-                            "No new cost data for meter %s; "
-                            "retaining previous values for unfilled fields",
-                            meter.serial,
-                        )
-                    elif not any(
-                        meter_data.get(k) is not None for k in _cost_keys
-                    ):
-                        if meter.serial not in self._cost_warning_logged:
+                        except Exception as err:  # pylint: disable=broad-except
                             _LOGGER.debug(
-                                "No cost data available for meter %s - "
-                                "standing charge, previous day cost, and "
-                                "unit rate sensors will show as unknown "
-                                "until a cost data source becomes available",
+                                "Statistics import failed for meter %s: %s",
                                 meter.serial,
+                                err,
                             )
-                            self._cost_warning_logged.add(meter.serial)
-
-                    if consumption is None:
-                        prev = self.data.get(meter_key, {}) if self.data else {}
-                        for k in (
-                            "previous_day_consumption",
-                            "previous_day_consumption_entry_count",
-                            "previous_day_consumption_data_complete",
-                            "previous_day_consumption_last_reset",
-                        ):
-                            if prev.get(k) is not None:
-                                meter_data[k] = prev.get(k)
-
-                    data[meter_key] = meter_data
 
                 except EonNextAuthError as err:
                     _LOGGER.error("Authentication failed during update: %s", err)
                     raise ConfigEntryAuthFailed(
                         f"Authentication failed during update: {err}"
                     ) from err
+                except EonNextCircuitOpenError as err:
+                    # The outage was already reported when the circuit opened.
+                    _LOGGER.debug("Serving retained data for meter %s: %s", meter.serial, err)
+                    errors.append(str(err))
+                    if self.data and meter_key in self.data:
+                        data[meter_key] = self.data[meter_key]
                 except EonNextApiError as err:
                     _LOGGER.warning("API error updating meter %s: %s", meter.serial, err)
                     errors.append(str(err))
@@ -361,8 +466,101 @@ class EonNextCoordinator(DataUpdateCoordinator):
         if not data and errors:
             raise UpdateFailed(f"Failed to fetch any data: {'; '.join(errors)}")
 
+        self.update_interval = self.poll_scheduler.next_interval(
+            dt_util.utcnow(),
+            new_data=new_readings,
+            # EV schedules change independently of meter readings.
+            allow_backoff=not any(
+                account.ev_chargers for account in self.api.accounts
+            ),
+        )
+        _LOGGER.debug(
+            "Next refresh in %s (new readings: %s)", self.update_interval, new_readings
+        )
+
+        if self.data is not None and self.last_update_success and not self.data_restored:
+            self.changed_keys = self._changed_keys(self.data, data)
+        self.data_restored = False
+        # The delayed write reads ``self.data`` when it fires, by which point
+        # the coordinator has stored this result.
+        self._schedule_snapshot_save()
         return data
 
+    def _derive_cost(
+        self,
+        snapshot: MeterSnapshot,
+        consumption: list[dict[str, Any]] | None,
+        previous: MeterSnapshot | None,
+    ) -> CostSnapshot:
+        """Derive cost figures from the tariff and consumption on *snapshot*.
+
+        There is no dedicated cost endpoint, so every figure comes from the
+        tariff and consumption data; fields that cannot be derived this time
+        are retained from *previous* so sensors do not flip to "unknown" on
+        transient failures.
+        """
+        # For time-of-use tariffs this resolves the rate for the *current*
+        # half-hour window rather than the schedule mean, so the "Current
+        # Unit Rate" sensor and the Energy Dashboard price the right rate.
+        current_rate = get_current_rate(snapshot)
+        unit_rate = current_rate.rate if current_rate is not None else None
+        standing_charge = snapshot.tariff.standing_charge
+
+        # Each half-hour of yesterday is priced against its own rate window,
+        # so time-of-use tariffs (where overnight usage dominates by design)
+        # are costed correctly instead of at a flat mean - and against the
+        # agreement in force yesterday, should the tariff have changed since.
+        # Require at least 44 half-hourly entries to avoid under-reporting
+        # from incomplete data.
+        previous_day_cost: float | None = None
+        cost_period: str | None = None
+        if consumption is not None and standing_charge is not None:
+            yesterday_entries = self._yesterday_entries(consumption)
+            if len(yesterday_entries) >= 44:
+                yesterday = dt_util.now().date() - timedelta(days=1)
+                day_start = dt_util.start_of_local_day(yesterday)
+                timeline = compile_agreement_timeline(
+                    self.tariff_timeline,
+                    snapshot.supply_point_id,
+                    day_start,
+                    dt_util.start_of_local_day(yesterday + timedelta(days=1)),
+                    snapshot,
+                )
+                day_cost = price_consumption(snapshot, yesterday_entries, timeline)
+                if day_cost.priced:
+                    standing = timeline.standing_charge_at(day_start)
+                    previous_day_cost = round(
+                        day_cost.energy_cost
+                        + (standing if standing is not None else float(standing_charge)),
+                        4,
+                    )
+                    cost_period = yesterday.isoformat()
+
+        cost = CostSnapshot(
+            standing_charge=standing_charge,
+            previous_day_cost=previous_day_cost,
+            cost_period=cost_period,
+            unit_rate=unit_rate,
+        )
+        previous_cost = previous.cost if previous is not None else None
+        merged = merge_missing(cost, previous_cost)
+        if merged is not cost:
+            _LOGGER.debug(
+                "No new cost data for meter %s; "
+                "retaining previous values for unfilled fields",
+                snapshot.serial,
+            )
+        elif cost.is_empty and snapshot.serial not in self._cost_warning_logged:
+            _LOGGER.debug(
+                "No cost data available for meter %s - "
+                "standing charge, previous day cost, and "
+                "unit rate sensors will show as unknown "
+                "until a cost data source becomes available",
+                snapshot.serial,
+            )
+            self._cost_warning_logged.add(snapshot.serial)
+        return share(merged, previous_cost)
+
     async def _fetch_tariff_data(self, account) -> dict[str, dict[str, Any]] | None:
         """Fetch tariff agreement data for all meter points on an account."""
         try:
@@ -371,6 +569,11 @@ class EonNextCoordinator(DataUpdateCoordinator):
             raise ConfigEntryAuthFailed(
                 f"Authentication failed fetching tariffs: {err}"
             ) from err
+        except EonNextCircuitOpenError as err:
+            _LOGGER.debug(
+                "Tariff data skipped for account %s: %s", account.account_number, err
+            )
+            return None
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.warning(
                 "Tariff data unavailable for account %s: %s",
@@ -387,6 +590,9 @@ class EonNextCoordinator(DataUpdateCoordinator):
             raise ConfigEntryAuthFailed(
                 f"Authentication failed fetching account balances: {err}"
             ) from err
+        except EonNextCircuitOpenError as err:
+            _LOGGER.debug("Account balance refresh skipped: %s", err)
+            return None
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.warning("Account balance refresh failed: %s", err)
             return None
@@ -450,6 +656,21 @@ class EonNextCoordinator(DataUpdateCoordinator):
 
         return None, None
 
+    @classmethod
+    def _tariff_snapshot(cls, tariff_data: Mapping[str, Any]) -> TariffSnapshot:
+        """Build a tariff snapshot from one parsed agreement (pence values)."""
+        return TariffSnapshot(
+            name=tariff_data.get("tariff_name"),
+            code=tariff_data.get("tariff_code"),
+            type=tariff_data.get("tariff_type"),
+            unit_rate=cls._pence_to_pounds(tariff_data.get("unit_rate")),
+            standing_charge=cls._pence_to_pounds(tariff_data.get("standing_charge")),
+            valid_from=tariff_data.get("valid_from"),
+            valid_to=tariff_data.get("valid_to"),
+            rates_schedule=tariff_data.get("unit_rates_schedule"),
+            is_tou=tariff_data.get("tariff_is_tou", False),
+        )
+
     @staticmethod
     def _pence_to_pounds(value: Any) -> float | None:
         """Convert a pence value to pounds, returning None on failure."""
@@ -0,0 +1,474 @@
+"""Bulk pricing of consumption ranges against a compiled rate timeline.
+
+:func:`~.tariff_helpers.rate_for_timestamp` resolves one instant at a time:
+it scans the rate schedule for a covering window and falls back to the
+tariff pattern by local time of day.  Pricing a year of half-hourly history
+that way is a long pure-Python loop with a schedule scan per interval.
+
+Here the tariff is instead *compiled* once per range into a step function
+(ascending breakpoints, each with the rate in effect until the next one),
+using the same resolution rules - per agreement when a historical range spans
+several (see ``tariff_timeline``) - and the consumption is priced in one pass:
+each interval's rate is a binary search of its start into the breakpoints,
+and per-day totals are binned by local-midnight boundaries.  The pass is
+vectorised with NumPy when it is installed and falls back to ``array`` +
+``bisect`` otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .consumption import ConsumptionSeries
+from .rate_schedule import (
+    distinct_rates_pence,
+    parse_dt,
+    pence_to_pounds,
+    schedule_has_time_windows,
+    time_in_off_peak_windows,
+)
+from .tariff_patterns import get_tariff_pattern
+from .tariff_timeline import TariffTimeline, agreement_meter_data
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover - NumPy is optional; see _bin_python
+    _np = None
+
+_NAN = math.nan
+
+
+@dataclass(slots=True, frozen=True)
+class RateTimeline:
+    """Unit rates (GBP/kWh) as a step function over UTC epoch seconds.
+
+    ``rates[i]`` applies from ``breaks[i]`` until ``breaks[i + 1]``; the
+    first rate also covers instants before ``breaks[0]`` and the last one
+    everything after the last break.  NaN marks a span without a rate.
+    Standing charges (GBP/day) are a step function of the same form.
+    """
+
+    breaks: array
+    rates: array
+    standing_breaks: array
+    standing_charges: array
+
+    def rate_at(self, when: datetime) -> float | None:
+        """Return the rate in effect at *when*."""
+        return _step(self.breaks, self.rates, when.timestamp())
+
+    def standing_charge_at(self, when: datetime) -> float | None:
+        """Return the standing charge in effect at *when*."""
+        return _step(self.standing_breaks, self.standing_charges, when.timestamp())
+
+    def uniform_rate(self, start: datetime, end: datetime) -> float | None:
+        """Return the rate in effect throughout ``[start, end)``.
+
+        None if the rate changes within the interval (a daily bucket on a
+        time-of-use tariff, which cannot be priced without knowing when in
+        the day the energy was used) or if any part has no rate.
+        """
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        rate = _step(self.breaks, self.rates, start_ts)
+        if rate is None:
+            return None
+        index = bisect_right(self.breaks, start_ts)
+        while index < len(self.breaks) and self.breaks[index] < end_ts:
+            if self.rates[index] != rate:
+                return None
+            index += 1
+        return rate
+
+
+def _step(breaks: array, values: array, timestamp: float) -> float | None:
+    value = values[max(0, bisect_right(breaks, timestamp) - 1)]
+    return None if math.isnan(value) else value
+
+
+@dataclass(slots=True, frozen=True)
+class DailyCost:
+    """Consumption and cost of one local calendar day."""
+
+    day: date
+    consumption_kwh: float
+    energy_cost: float
+    standing_charge: float
+
+    @property
+    def total(self) -> float:
+        """Energy cost plus standing charge."""
+        return round(self.energy_cost + self.standing_charge, 4)
+
+
+@dataclass(slots=True, frozen=True)
+class ConsumptionCost:
+    """Per-day cost of a consumption range."""
+
+    days: list[DailyCost]
+    # False when no interval could be priced (no rate data at all).
+    priced: bool
+
+    @property
+    def energy_cost(self) -> float:
+        """Total energy cost (GBP), excluding standing charges."""
+        return round(math.fsum(day.energy_cost for day in self.days), 4)
+
+    @property
+    def standing_charge(self) -> float:
+        """Total standing charges (GBP) over the range's days."""
+        return round(math.fsum(day.standing_charge for day in self.days), 4)
+
+
+def compile_rate_timeline(
+    meter_data: Mapping[str, Any], start: datetime, end: datetime
+) -> RateTimeline:
+    """Compile *meter_data*'s tariff into a timeline covering ``[start, end)``.
+
+    Resolution matches :func:`~.tariff_helpers.rate_for_timestamp`: a
+    schedule window covering the instant, else the tariff pattern by local
+    time of day, else the flat unit rate.  Schedule windows are assumed not
+    to overlap, as the API returns them.
+    """
+    standing = _as_float(meter_data.get("tariff_standing_charge"), _NAN)
+    standing_breaks = array("d", [start.timestamp()])
+    standing_charges = array("d", [standing])
+    unit_rate = _as_float(meter_data.get("tariff_unit_rate"))
+    if unit_rate is None or not meter_data.get("tariff_is_tou", False):
+        return RateTimeline(
+            array("d", [start.timestamp()]),
+            array("d", [_NAN if unit_rate is None else unit_rate]),
+            standing_breaks,
+            standing_charges,
+        )
+
+    schedule: list[dict[str, Any]] = meter_data.get("tariff_rates_schedule") or []
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    points: set[float] = {start_ts}
+
+    # Schedule windows, sorted by start for a bisect lookup per breakpoint.
+    windows: list[tuple[float, float, float | None]] = []
+    if schedule and schedule_has_time_windows(schedule):
+        for entry in schedule:
+            valid_from = parse_dt(entry.get("validFrom"))
+            valid_to = parse_dt(entry.get("validTo"))
+            if valid_from is None or valid_to is None:
+                continue
+            value = _as_float(entry.get("value"))
+            windows.append(
+                (
+                    valid_from.timestamp(),
+                    valid_to.timestamp(),
+                    None if value is None else pence_to_pounds(value),
+                )
+            )
+        windows.sort(key=lambda window: window[0])
+        for window_start, window_end, _ in windows:
+            points.update((window_start, window_end))
+    window_starts = [window[0] for window in windows]
+
+    # Pattern fallback: two rates switching at fixed local times of day.
+    pattern_rates: tuple[float, float] | None = None
+    off_peak_windows: list[Any] = []
+    distinct = distinct_rates_pence(schedule) if schedule else []
+    if len(distinct) >= 2:
+        pattern = get_tariff_pattern(meter_data.get("tariff_code"))
+        if pattern and pattern.windows:
+            pattern_rates = (
+                pence_to_pounds(distinct[0]),
+                pence_to_pounds(distinct[-1]),
+            )
+            off_peak_windows = pattern.windows
+            switch_times = {
+                boundary
+                for window in off_peak_windows
+                if window.name == "off_peak"
+                for boundary in (window.start_time, window.end_time)
+            }
+            tz = dt_util.get_default_time_zone()
+            day = dt_util.as_local(start).date() - timedelta(days=1)
+            last_day = dt_util.as_local(end).date() + timedelta(days=1)
+            while day <= last_day:
+                for switch in switch_times:
+                    points.add(datetime.combine(day, switch, tzinfo=tz).timestamp())
+                day += timedelta(days=1)
+
+    def _rate(point: float) -> float:
+        index = bisect_right(window_starts, point) - 1
+        if index >= 0:
+            _, window_end, rate = windows[index]
+            if point < window_end and rate is not None:
+                return rate
+        if pattern_rates is not None:
+            local_time = dt_util.as_local(dt_util.utc_from_timestamp(point)).time()
+            if time_in_off_peak_windows(local_time, off_peak_windows):
+                return pattern_rates[0]
+            return pattern_rates[1]
+        return unit_rate
+
+    breaks = array("d")
+    rates = array("d")
+    for point in sorted(p for p in points if p == start_ts or start_ts < p < end_ts):
+        rate = _rate(point)
+        if rates and rates[-1] == rate:
+            continue
+        breaks.append(point)
+        rates.append(rate)
+    return RateTimeline(breaks, rates, standing_breaks, standing_charges)
+
+
+def compile_agreement_timeline(
+    agreements: TariffTimeline,
+    supply_point_id: str | None,
+    start: datetime,
+    end: datetime,
+    fallback: Mapping[str, Any],
+) -> RateTimeline:
+    """Compile the tariffs in force over ``[start, end)`` into one timeline.
+
+    Each stretch is compiled from the agreement that covered it in
+    *agreements*; stretches no known agreement covers use *fallback* (the
+    meter's current tariff), as does a field an older agreement lacks.
+    """
+    segments: list[tuple[datetime, datetime, Mapping[str, Any]]] = []
+    cursor = start
+    spans = agreements.spans(supply_point_id, start, end) if supply_point_id else ()
+    for span_start, span_end, agreement in spans:
+        if cursor < span_start:
+            segments.append((cursor, span_start, fallback))
+        meter_data = {
+            key: value
+            for key, value in agreement_meter_data(agreement).items()
+            if value is not None
+        }
+        segments.append((span_start, span_end, {**fallback, **meter_data}))
+        cursor = span_end
+    if cursor < end or not segments:
+        segments.append((cursor, end, fallback))
+
+    breaks = array("d")
+    rates = array("d")
+    standing_breaks = array("d")
+    standing_charges = array("d")
+    for segment_start, segment_end, meter_data in segments:
+        part = compile_rate_timeline(meter_data, segment_start, segment_end)
+        _extend_steps(breaks, rates, part.breaks, part.rates)
+        _extend_steps(
+            standing_breaks,
+            standing_charges,
+            part.standing_breaks,
+            part.standing_charges,
+        )
+    return RateTimeline(breaks, rates, standing_breaks, standing_charges)
+
+
+def compile_consumption_timeline(
+    agreements: TariffTimeline,
+    supply_point_id: str | None,
+    entries: Iterable[Mapping[str, Any]],
+    fallback: Mapping[str, Any],
+) -> RateTimeline | None:
+    """Compile the tariffs in force over the span of *entries*.
+
+    The span runs to a day past the last interval start, so daily buckets
+    are covered too.  None when no entry is usable.
+    """
+    span = _span(*_columns(entries))
+    if span is None:
+        return None
+    first, last = span
+    return compile_agreement_timeline(
+        agreements,
+        supply_point_id,
+        dt_util.utc_from_timestamp(first),
+        dt_util.utc_from_timestamp(last) + timedelta(days=1),
+        fallback,
+    )
+
+
+def _extend_steps(
+    breaks: array, values: array, more_breaks: array, more_values: array
+) -> None:
+    """Append a later step function, merging equal neighbouring steps."""
+    for point, value in zip(more_breaks, more_values):
+        if values and (
+            values[-1] == value or (math.isnan(values[-1]) and math.isnan(value))
+        ):
+            continue
+        breaks.append(point)
+        values.append(value)
+
+
+def price_consumption(
+    meter_data: Mapping[str, Any],
+    entries: Iterable[Mapping[str, Any]],
+    timeline: RateTimeline | None = None,
+) -> ConsumptionCost:
+    """Price consumption intervals and total them per local day.
+
+    *entries* carry ``interval_start`` and ``consumption`` (kWh); a
+    :class:`~.consumption.ConsumptionSeries` is read column-wise without
+    building a row per interval.  Every local day from the first to the last
+    interval is reported, each with one day's standing charge.  Intervals
+    without a parseable start or reading, or without a rate, are skipped.
+    *timeline* defaults to one compiled over the entries' own span.
+    """
+    starts, kwh = _columns(entries)
+    span = _span(starts, kwh)
+    if span is None:
+        return ConsumptionCost(days=[], priced=False)
+    first, last = span
+    if timeline is None:
+        timeline = compile_rate_timeline(
+            meter_data,
+            dt_util.utc_from_timestamp(first),
+            dt_util.utc_from_timestamp(last) + timedelta(minutes=30),
+        )
+
+    first_day = dt_util.as_local(dt_util.utc_from_timestamp(first)).date()
+    last_day = dt_util.as_local(dt_util.utc_from_timestamp(last)).date()
+    day_count = (last_day - first_day).days + 1
+    # Local midnight of every day in range, plus the end of the last day.
+    bounds = array(
+        "d",
+        (
+            dt_util.start_of_local_day(first_day + timedelta(days=offset)).timestamp()
+            for offset in range(day_count + 1)
+        ),
+    )
+
+    if _np is not None:
+        consumption, energy, priced = _bin_numpy(timeline, bounds, starts, kwh)
+    else:
+        consumption, energy, priced = _bin_python(timeline, bounds, starts, kwh)
+
+    standing = [
+        _step(timeline.standing_breaks, timeline.standing_charges, bounds[offset])
+        for offset in range(day_count)
+    ]
+    return ConsumptionCost(
+        days=[
+            DailyCost(
+                day=first_day + timedelta(days=offset),
+                consumption_kwh=round(consumption[offset], 6),
+                energy_cost=round(energy[offset], 4),
+                standing_charge=standing[offset] or 0.0,
+            )
+            for offset in range(day_count)
+        ],
+        priced=priced,
+    )
+
+
+def _span(starts: array, kwh: array) -> tuple[float, float] | None:
+    """Return the first and last usable interval start, if any."""
+    if _np is not None:
+        start_col = _np.frombuffer(starts, dtype=_np.float64)
+        usable = start_col[
+            ~(_np.isnan(start_col) | _np.isnan(_np.frombuffer(kwh, dtype=_np.float64)))
+        ]
+        if not usable.size:
+            return None
+        return float(usable.min()), float(usable.max())
+    usable = [s for s, k in zip(starts, kwh) if not (math.isnan(s) or math.isnan(k))]
+    if not usable:
+        return None
+    return min(usable), max(usable)
+
+
+def _bin_numpy(
+    timeline: RateTimeline, bounds: array, starts: array, kwh: array
+) -> tuple[list[float], list[float], bool]:
+    assert _np is not None
+    start_col = _np.frombuffer(starts, dtype=_np.float64)
+    kwh_col = _np.frombuffer(kwh, dtype=_np.float64)
+    valid = ~(_np.isnan(start_col) | _np.isnan(kwh_col))
+    start_col = start_col[valid]
+    kwh_col = kwh_col[valid]
+
+    breaks = _np.frombuffer(timeline.breaks, dtype=_np.float64)
+    rates = _np.frombuffer(timeline.rates, dtype=_np.float64)
+    rate_idx = _np.maximum(_np.searchsorted(breaks, start_col, side="right") - 1, 0)
+    interval_rates = rates[rate_idx]
+    priced = ~_np.isnan(interval_rates)
+
+    day_bounds = _np.frombuffer(bounds, dtype=_np.float64)
+    day_count = len(bounds) - 1
+    day_idx = _np.clip(
+        _np.searchsorted(day_bounds, start_col, side="right") - 1, 0, day_count - 1
+    )
+    consumption = _np.bincount(day_idx, weights=kwh_col, minlength=day_count)
+    energy = _np.bincount(
+        day_idx[priced],
+        weights=kwh_col[priced] * interval_rates[priced],
+        minlength=day_count,
+    )
+    return consumption.tolist(), energy.tolist(), bool(priced.any())
+
+
+def _bin_python(
+    timeline: RateTimeline, bounds: array, starts: array, kwh: array
+) -> tuple[list[float], list[float], bool]:
+    day_count = len(bounds) - 1
+    consumption = [0.0] * day_count
+    energy = [0.0] * day_count
+    priced = False
+    breaks = timeline.breaks
+    rates = timeline.rates
+    for start, value in zip(starts, kwh):
+        if math.isnan(start) or math.isnan(value):
+            continue
+        day = min(max(bisect_right(bounds, start) - 1, 0), day_count - 1)
+        consumption[day] += value
+        rate = rates[max(bisect_right(breaks, start) - 1, 0)]
+        if not math.isnan(rate):
+            energy[day] += value * rate
+            priced = True
+    return consumption, energy, priced
+
+
+def _columns(entries: Iterable[Mapping[str, Any]]) -> tuple[array, array]:
+    """Return ``(start epoch seconds, kWh)`` columns, NaN where unusable."""
+    if isinstance(entries, ConsumptionSeries):
+        kwh = entries.values
+        start_values: Iterable[Any] = entries.starts
+    else:
+        rows = list(entries)
+        kwh = array("d", (_as_float(row.get("consumption"), _NAN) for row in rows))
+        start_values = [row.get("interval_start") for row in rows]
+    starts = array("d", (_epoch(value) for value in start_values))
+    return starts, kwh
+
+
+def _epoch(value: Any) -> float:
+    if value is None:
+        return _NAN
+    text = str(value)
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        parsed = parse_dt(text)
+        if parsed is None:
+            return _NAN
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return parsed.timestamp()
+
+
+def _as_float(value: Any, default: Any = None) -> Any:
+    if value is None or isinstance(value, bool):
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
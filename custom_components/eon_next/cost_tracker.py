@@ -1,9 +1,31 @@
-"""Cost tracker storage and runtime logic."""
+"""Cost tracker storage and runtime logic.
+
+Tracked power and energy sensors can update every second.  State changes are
+integrated synchronously in the event callback into a per-tracker ledger of
+rate windows (start, end, rate): each energy delta is split across the
+windows its interval spans, so a sample straddling a time-of-use boundary is
+priced at both rates, and the tariff is only resolved when a sample reaches a
+window the ledger does not hold yet.  Ledger energy is priced into the daily
+totals and announced to listeners on a short flush interval, and windows are
+dropped once they have closed.
+
+Storage is sharded: tracker configuration lives in one document that is only
+written on structural changes (add, remove, enable/disable), and each
+tracker's running totals live in a Store of their own, so a debounced save
+rewrites only the trackers that actually changed.
+
+Closed days are folded into compact per-tracker rollups (see
+``cost_tracker_history``) at the daily rollover.  The rollups live in a third
+Store per tracker, written once a day, and are imported as daily external
+statistics so per-appliance history needs no recorder state rows.
+"""
 
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
 import logging
 from typing import Any, Callable
 
@@ -12,6 +34,7 @@ from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.event import (
     async_track_state_change_event,
     async_track_time_change,
+    async_track_time_interval,
 )
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -19,16 +42,36 @@ from homeassistant.util import slugify
 
 from .const import DOMAIN
 from .coordinator import EonNextCoordinator
-from .tariff_helpers import get_current_rate
+from .cost_tracker_history import CostTrackerHistory
+from .statistics import async_import_cost_tracker_statistics
+from .tariff_helpers import rate_window_for_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
 _STORE_VERSION = 1
 _STORE_KEY_SUFFIX = "cost_trackers"
+_STATE_STORE_KEY_SUFFIX = "cost_tracker"
+_HISTORY_STORE_KEY_SUFFIX = "cost_tracker_history"
+
+# Running totals, persisted per tracker; older releases kept them inline in
+# the configuration document, which is still read as a fallback.
+_STATE_FIELDS = (
+    "today_consumption_kwh",
+    "today_cost",
+    "last_reset",
+    "last_energy_value",
+    "last_energy_unit",
+)
 
 # Debounce window for persisting tracker state on high-frequency updates.
 _SAVE_DELAY_SECONDS = 15
 
+# Buffered energy is priced and published at most this often per tracker.
+FLUSH_INTERVAL = timedelta(seconds=30)
+# Longest interval a single delta is spread over (e.g. an energy sensor that
+# was silent for days); anything earlier is attributed to this span.
+_MAX_SPLIT_SPAN = timedelta(hours=24)
+
 VALID_POWER_UNITS = {"W", "kW"}
 VALID_ENERGY_UNITS = {"Wh", "kWh"}
 
@@ -55,6 +98,16 @@ class CostTrackerState:
     last_energy_unit: str | None = None
 
 
+@dataclass(slots=True)
+class LedgerWindow:
+    """One rate window of a tracker's ledger and its not-yet-priced energy."""
+
+    start: datetime
+    end: datetime
+    rate: float | None
+    kwh: float = 0.0
+
+
 @dataclass(slots=True)
 class CostTrackerRuntime:
     """Combined config/state and runtime listeners for one tracker."""
@@ -62,6 +115,37 @@ class CostTrackerRuntime:
     config: CostTrackerConfig
     state: CostTrackerState
     unsubscribe_state: Callable[[], None] | None = None
+    ledger: list[LedgerWindow] = field(default_factory=list)
+    history: CostTrackerHistory = field(default_factory=CostTrackerHistory)
+    # A closed day was recorded but not yet persisted/imported.
+    history_pending: bool = False
+
+
+def _tracker_store(
+    hass: HomeAssistant, entry_id: str, suffix: str
+) -> Store[dict[str, Any]]:
+    return Store(hass, _STORE_VERSION, f"{DOMAIN}_{entry_id}_{suffix}")
+
+
+async def async_remove_cost_tracker_stores(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete an entry's tracker configuration and every tracker's Stores."""
+    config_store = _tracker_store(hass, entry_id, _STORE_KEY_SUFFIX)
+    stored = await config_store.async_load() or {}
+    items = stored.get("trackers")
+    tracker_ids = {
+        str(item.get("id") or "").strip()
+        for item in (items if isinstance(items, list) else [])
+        if isinstance(item, dict)
+    }
+    tracker_ids.discard("")
+    await asyncio.gather(
+        *(
+            _tracker_store(hass, entry_id, f"{suffix}_{tracker_id}").async_remove()
+            for tracker_id in tracker_ids
+            for suffix in (_STATE_STORE_KEY_SUFFIX, _HISTORY_STORE_KEY_SUFFIX)
+        )
+    )
+    await config_store.async_remove()
 
 
 class EonNextCostTrackerManager:
@@ -76,17 +160,17 @@ class EonNextCostTrackerManager:
         self.hass = hass
         self.entry_id = entry_id
         self.coordinator = coordinator
-        self._store: Store[dict[str, Any]] = Store(
-            hass,
-            _STORE_VERSION,
-            f"{DOMAIN}_{entry_id}_{_STORE_KEY_SUFFIX}",
-        )
+        self._store = _tracker_store(hass, entry_id, _STORE_KEY_SUFFIX)
+        self._state_stores: dict[str, Store[dict[str, Any]]] = {}
+        self._history_stores: dict[str, Store[dict[str, Any]]] = {}
+        # Trackers with a delayed state write pending.
+        self._dirty: set[str] = set()
         self._trackers: dict[str, CostTrackerRuntime] = {}
         self._list_listeners: list[Callable[[str], None]] = []
         self._state_listeners: dict[str, list[Callable[[], None]]] = {}
         self._remove_listeners: list[Callable[[str], None]] = []
         self._unsub_midnight: Callable[[], None] | None = None
-        self._pending_tasks: set[asyncio.Task[Any]] = set()
+        self._unsub_flush: Callable[[], None] | None = None
         self._shutdown = False
 
     async def async_initialize(self) -> None:
@@ -96,6 +180,7 @@ class EonNextCostTrackerManager:
         if not isinstance(items, list):
             items = []
 
+        configs: list[tuple[CostTrackerConfig, dict[str, Any]]] = []
         for item in items:
             if not isinstance(item, dict):
                 continue
@@ -113,26 +198,61 @@ class EonNextCostTrackerManager:
                 meter_serial=meter_serial,
                 enabled=bool(item.get("enabled", True)),
             )
+            configs.append((config, item))
+
+        states = await asyncio.gather(
+            *(self._state_store(config.id).async_load() for config, _ in configs)
+        )
+        histories = await asyncio.gather(
+            *(self._history_store(config.id).async_load() for config, _ in configs)
+        )
+        migrated = False
+        for (config, item), stored_state, history in zip(
+            configs, states, histories, strict=True
+        ):
+            if not isinstance(stored_state, dict):
+                stored_state = item
+                migrated = migrated or any(key in item for key in _STATE_FIELDS)
             state = CostTrackerState(
-                today_consumption_kwh=float(item.get("today_consumption_kwh") or 0.0),
-                today_cost=float(item.get("today_cost") or 0.0),
-                last_reset=item.get("last_reset"),
-                last_energy_value=item.get("last_energy_value"),
-                last_energy_unit=item.get("last_energy_unit"),
+                today_consumption_kwh=float(
+                    stored_state.get("today_consumption_kwh") or 0.0
+                ),
+                today_cost=float(stored_state.get("today_cost") or 0.0),
+                last_reset=stored_state.get("last_reset"),
+                last_energy_value=stored_state.get("last_energy_value"),
+                last_energy_unit=stored_state.get("last_energy_unit"),
+            )
+            runtime = CostTrackerRuntime(
+                config=config,
+                state=state,
+                history=CostTrackerHistory.from_dict(history),
             )
-            runtime = CostTrackerRuntime(config=config, state=state)
-            self._ensure_last_reset(runtime)
-            self._rollover_if_new_day(runtime)
             self._trackers[config.id] = runtime
+            self._ensure_last_reset(runtime)
+            if self._rollover_if_new_day(runtime):
+                # Persist the reset too, or the next start closes the same
+                # day again (idle trackers never save otherwise).
+                self._delay_save(config.id)
+
+        if migrated:
+            # Move inline totals into the per-tracker stores.
+            await asyncio.gather(
+                *(self._save_state(tracker_id) for tracker_id in self._trackers)
+            )
+            await self._save()
 
-        for tracker_id in list(self._trackers):
+        for tracker_id, runtime in self._trackers.items():
             self._attach_state_listener(tracker_id)
+            self._publish_history(runtime)
 
         # Deterministic midnight rollover so trackers whose source entity stops
         # updating don't keep yesterday's cost (and a stale last_reset) forever.
         self._unsub_midnight = async_track_time_change(
             self.hass, self._async_handle_midnight, hour=0, minute=0, second=0
         )
+        self._unsub_flush = async_track_time_interval(
+            self.hass, self._async_handle_flush_interval, FLUSH_INTERVAL
+        )
 
     async def async_shutdown(self) -> None:
         """Clean up listeners and persist current state."""
@@ -140,25 +260,39 @@ class EonNextCostTrackerManager:
         if self._unsub_midnight is not None:
             self._unsub_midnight()
             self._unsub_midnight = None
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
         for runtime in self._trackers.values():
             if runtime.unsubscribe_state:
                 runtime.unsubscribe_state()
                 runtime.unsubscribe_state = None
-        for task in list(self._pending_tasks):
-            task.cancel()
-        self._pending_tasks.clear()
-        await self._save()
+            self._flush(runtime)
+        # Write pending delayed saves now rather than after the entry is gone.
+        await asyncio.gather(
+            *(self._save_state(tracker_id) for tracker_id in list(self._dirty))
+        )
 
     @callback
     def _async_handle_midnight(self, _now: Any) -> None:
         """Roll trackers into the new day, even without a source-state event."""
-        rolled = False
         for tracker_id, runtime in self._trackers.items():
+            # Price what was buffered before midnight into the old day.
+            self._flush(runtime)
             if self._rollover_if_new_day(runtime):
-                rolled = True
+                self._delay_save(tracker_id)
                 self._notify_state_listeners(tracker_id)
-        if rolled:
-            self._delay_save()
+            self._publish_history(runtime)
+
+    @callback
+    def _async_handle_flush_interval(self, _now: Any) -> None:
+        """Price buffered energy and publish trackers that accrued any."""
+        for tracker_id, runtime in self._trackers.items():
+            if self._flush(runtime):
+                self._delay_save(tracker_id)
+                self._notify_state_listeners(tracker_id)
+            # Days closed by a state change since the last interval.
+            self._publish_history(runtime)
 
     def list_tracker_ids(self) -> list[str]:
         """Return all configured tracker ids."""
@@ -178,6 +312,11 @@ class EonNextCostTrackerManager:
         runtime = self._trackers.get(tracker_id)
         return runtime.state if runtime else None
 
+    def get_history(self, tracker_id: str) -> CostTrackerHistory | None:
+        """Return the daily/monthly rollups of closed days by id."""
+        runtime = self._trackers.get(tracker_id)
+        return runtime.history if runtime else None
+
     @callback
     def async_add_list_listener(self, listener: Callable[[str], None]) -> Callable[[], None]:
         """Listen for new trackers being added."""
@@ -241,6 +380,7 @@ class EonNextCostTrackerManager:
         self._trackers[tracker_id] = runtime
         self._attach_state_listener(tracker_id)
         await self._save()
+        await self._save_state(tracker_id)
 
         for listener in list(self._list_listeners):
             listener(tracker_id)
@@ -252,12 +392,13 @@ class EonNextCostTrackerManager:
         runtime = self._trackers.get(tracker_id)
         if runtime is None:
             return
+        runtime.ledger.clear()
         runtime.state.today_consumption_kwh = 0.0
         runtime.state.today_cost = 0.0
         runtime.state.last_energy_value = None
         runtime.state.last_energy_unit = None
         runtime.state.last_reset = self._today_midnight_iso()
-        await self._save()
+        await self._save_state(tracker_id)
         self._notify_state_listeners(tracker_id)
 
     async def async_set_enabled(self, tracker_id: str, enabled: bool) -> None:
@@ -265,6 +406,9 @@ class EonNextCostTrackerManager:
         runtime = self._trackers.get(tracker_id)
         if runtime is None:
             return
+        # Energy buffered while enabled is still billed.
+        if self._flush(runtime):
+            self._delay_save(tracker_id)
         runtime.config.enabled = enabled
         await self._save()
         self._notify_state_listeners(tracker_id)
@@ -279,6 +423,11 @@ class EonNextCostTrackerManager:
             runtime.unsubscribe_state = None
         self._state_listeners.pop(tracker_id, None)
         await self._save()
+        self._dirty.discard(tracker_id)
+        await self._state_store(tracker_id).async_remove()
+        await self._history_store(tracker_id).async_remove()
+        self._state_stores.pop(tracker_id, None)
+        self._history_stores.pop(tracker_id, None)
 
         # Remove the sensor entity and its registry entry so trackers don't
         # accumulate as orphans in the entity registry forever.
@@ -300,33 +449,25 @@ class EonNextCostTrackerManager:
             return
         if runtime.unsubscribe_state:
             runtime.unsubscribe_state()
+        # A partial of a @callback runs inline in the event loop; no task
+        # per state change.
         runtime.unsubscribe_state = async_track_state_change_event(
             self.hass,
             [runtime.config.tracked_entity_id],
-            lambda event: self._schedule_state_change(tracker_id, event),
+            partial(self._handle_state_change, tracker_id),
         )
 
     @callback
-    def _schedule_state_change(self, tracker_id: str, event: Event[Any]) -> None:
-        """Run the async handler as a tracked task (cancelled on shutdown)."""
-        if self._shutdown:
-            return
-        task = self.hass.async_create_task(
-            self._async_handle_state_change(tracker_id, event)
-        )
-        self._pending_tasks.add(task)
-        task.add_done_callback(self._pending_tasks.discard)
-
-    async def _async_handle_state_change(
-        self,
-        tracker_id: str,
-        event: Event[Any],
-    ) -> None:
+    def _handle_state_change(self, tracker_id: str, event: Event[Any]) -> None:
+        """Integrate one source-state change into the tracker's buffer."""
         runtime = self._trackers.get(tracker_id)
         if runtime is None or self._shutdown:
             return
 
         self._ensure_last_reset(runtime)
+        if self._is_new_day(runtime):
+            # Energy buffered before midnight belongs to the old day.
+            self._flush(runtime)
         self._rollover_if_new_day(runtime)
 
         new_state: State | None = event.data.get("new_state")
@@ -342,22 +483,73 @@ class EonNextCostTrackerManager:
         if not runtime.config.enabled or delta_kwh <= 0:
             return
 
-        rate = self._current_rate(runtime.config.meter_serial)
-        if rate is None:
+        # The delta was used over the interval since the previous state.
+        end = dt_util.as_utc(new_state.last_updated)
+        start = dt_util.as_utc(old_state.last_updated) if old_state else end
+        self._accrue(runtime, delta_kwh, max(start, end - _MAX_SPLIT_SPAN), end)
+
+    def _accrue(
+        self,
+        runtime: CostTrackerRuntime,
+        kwh: float,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """Spread *kwh* evenly over ``[start, end)`` across the ledger windows."""
+        span = (end - start).total_seconds()
+        if span <= 0:
+            window = self._ledger_window(runtime, end)
+            if window.rate is not None:
+                window.kwh += kwh
+            return
+        cursor = start
+        while cursor < end:
+            window = self._ledger_window(runtime, cursor)
+            segment_end = min(window.end, end)
+            if window.rate is not None:
+                window.kwh += kwh * (segment_end - cursor).total_seconds() / span
+            cursor = segment_end
+
+    def _ledger_window(self, runtime: CostTrackerRuntime, when: datetime) -> LedgerWindow:
+        """Return the ledger window containing *when*, resolving a new one."""
+        for window in reversed(runtime.ledger):
+            if window.start <= when < window.end:
+                return window
+        window = self._resolve_window(runtime.config.meter_serial, when)
+        if window.rate is None:
+            # Not kept, so the rate is looked up again once tariff data loads.
             _LOGGER.debug(
                 "Skipping cost update for tracker %s due to missing tariff rate",
-                tracker_id,
+                runtime.config.id,
             )
-            return
+        else:
+            runtime.ledger.append(window)
+        return window
+
+    def _flush(self, runtime: CostTrackerRuntime) -> bool:
+        """Price ledger energy into the daily totals; True if any was added.
 
+        Windows that have closed are dropped afterwards.
+        """
+        if not runtime.ledger:
+            return False
+        now = dt_util.utcnow()
+        added_kwh = 0.0
+        added_cost = 0.0
+        for window in runtime.ledger:
+            if window.kwh > 0 and window.rate is not None:
+                added_kwh += window.kwh
+                added_cost += window.kwh * window.rate
+            window.kwh = 0.0
+        runtime.ledger[:] = [w for w in runtime.ledger if w.end > now]
+        if added_kwh <= 0:
+            return False
         runtime.state.today_consumption_kwh = round(
-            runtime.state.today_consumption_kwh + delta_kwh,
+            runtime.state.today_consumption_kwh + added_kwh,
             6,
         )
-        runtime.state.today_cost = round(runtime.state.today_cost + (delta_kwh * rate), 4)
-        # Debounced: this fires on every tracked-entity state change.
-        self._delay_save()
-        self._notify_state_listeners(tracker_id)
+        runtime.state.today_cost = round(runtime.state.today_cost + added_cost, 4)
+        return True
 
     def _delta_kwh(
         self,
@@ -408,22 +600,36 @@ class EonNextCostTrackerManager:
         return 0.0
 
     def _current_rate(self, meter_serial: str) -> float | None:
+        return self._resolve_window(meter_serial, dt_util.utcnow()).rate
+
+    def _resolve_window(self, meter_serial: str, when: datetime) -> LedgerWindow:
         meter_data = self.coordinator.data.get(meter_serial) if self.coordinator.data else None
         if not meter_data:
-            return None
-        # Resolve the rate for the current half-hour window at event time so
-        # time-of-use trackers (e.g. overnight EV charging) accrue at the
-        # correct rate instead of a flat/average rate.  Fall back to the
-        # coordinator's published unit_rate if no tariff data is available.
-        rate_info = get_current_rate(meter_data)
-        value = rate_info.rate if rate_info is not None else meter_data.get("unit_rate")
+            start, end, _ = rate_window_for_timestamp({}, when)
+            return LedgerWindow(start, end, None)
+        # Resolve the rate window the energy was used in so time-of-use
+        # trackers (e.g. overnight EV charging) accrue at the correct rate
+        # instead of a flat/average rate.  Fall back to the coordinator's
+        # published unit_rate if no tariff data is available.
+        start, end, value = rate_window_for_timestamp(meter_data, when)
+        if value is None:
+            value = meter_data.get("unit_rate")
         parsed = self._parse_float(value)
-        return parsed if parsed is not None and parsed >= 0 else None
+        rate = parsed if parsed is not None and parsed >= 0 else None
+        return LedgerWindow(start, end, rate)
 
     def _notify_state_listeners(self, tracker_id: str) -> None:
         for listener in list(self._state_listeners.get(tracker_id, [])):
             listener()
 
+    @staticmethod
+    def _is_new_day(runtime: CostTrackerRuntime) -> bool:
+        last_reset = dt_util.parse_datetime(runtime.state.last_reset or "")
+        return (
+            last_reset is not None
+            and dt_util.as_local(last_reset).date() != dt_util.now().date()
+        )
+
     def _rollover_if_new_day(self, runtime: CostTrackerRuntime) -> bool:
         """Reset daily totals when the day has changed. Returns True if rolled.
 
@@ -431,13 +637,24 @@ class EonNextCostTrackerManager:
         clearing it would discard the delta spanning midnight (up to an hour of
         consumption for slow-updating energy sensors).  Keeping it attributes
         that spanning delta to the new day instead of dropping it.
+
+        A day the history already holds is not recorded again: the history
+        and the reset totals live in separate Stores, so a restart between
+        the two writes would otherwise close the same day twice.
         """
         last_reset = dt_util.parse_datetime(runtime.state.last_reset or "")
         if last_reset is None:
             runtime.state.last_reset = self._today_midnight_iso()
             return False
-        if dt_util.as_local(last_reset).date() == dt_util.now().date():
+        day = dt_util.as_local(last_reset).date()
+        if day == dt_util.now().date():
             return False
+        last_recorded = runtime.history.last_day
+        if last_recorded is None or day > last_recorded:
+            runtime.history.record(
+                day, runtime.state.today_consumption_kwh, runtime.state.today_cost
+            )
+            runtime.history_pending = True
         runtime.state.today_consumption_kwh = 0.0
         runtime.state.today_cost = 0.0
         runtime.state.last_reset = self._today_midnight_iso()
@@ -470,7 +687,7 @@ class EonNextCostTrackerManager:
             return None
 
     def _snapshot(self) -> dict[str, Any]:
-        """Build the serializable storage payload for all trackers."""
+        """Build the serializable configuration payload for all trackers."""
         trackers: list[dict[str, Any]] = []
         for runtime in self._trackers.values():
             trackers.append(
@@ -480,26 +697,95 @@ class EonNextCostTrackerManager:
                     "tracked_entity_id": runtime.config.tracked_entity_id,
                     "meter_serial": runtime.config.meter_serial,
                     "enabled": runtime.config.enabled,
-                    "today_consumption_kwh": runtime.state.today_consumption_kwh,
-                    "today_cost": runtime.state.today_cost,
-                    "last_reset": runtime.state.last_reset,
-                    "last_energy_value": runtime.state.last_energy_value,
-                    "last_energy_unit": runtime.state.last_energy_unit,
                 }
             )
         return {"trackers": trackers}
 
+    def _state_snapshot(self, tracker_id: str) -> dict[str, Any]:
+        """Build the serializable running totals of one tracker."""
+        self._dirty.discard(tracker_id)
+        runtime = self._trackers.get(tracker_id)
+        if runtime is None:
+            return {}
+        state = runtime.state
+        return {
+            "today_consumption_kwh": state.today_consumption_kwh,
+            "today_cost": state.today_cost,
+            "last_reset": state.last_reset,
+            "last_energy_value": state.last_energy_value,
+            "last_energy_unit": state.last_energy_unit,
+        }
+
+    def _state_store(self, tracker_id: str) -> Store[dict[str, Any]]:
+        store = self._state_stores.get(tracker_id)
+        if store is None:
+            store = self._state_stores[tracker_id] = _tracker_store(
+                self.hass, self.entry_id, f"{_STATE_STORE_KEY_SUFFIX}_{tracker_id}"
+            )
+        return store
+
+    def _history_store(self, tracker_id: str) -> Store[dict[str, Any]]:
+        store = self._history_stores.get(tracker_id)
+        if store is None:
+            store = self._history_stores[tracker_id] = _tracker_store(
+                self.hass, self.entry_id, f"{_HISTORY_STORE_KEY_SUFFIX}_{tracker_id}"
+            )
+        return store
+
+    @callback
+    def _publish_history(self, runtime: CostTrackerRuntime) -> None:
+        """Persist and import a tracker's rollups once a day was recorded."""
+        if not runtime.history_pending:
+            return
+        runtime.history_pending = False
+        tracker_id = runtime.config.id
+        self.hass.async_create_background_task(
+            self._async_publish_history(tracker_id),
+            f"{DOMAIN}_cost_tracker_history_{tracker_id}",
+        )
+
+    async def _async_publish_history(self, tracker_id: str) -> None:
+        runtime = self._trackers.get(tracker_id)
+        if runtime is None:
+            return
+        history = runtime.history
+        await self._history_store(tracker_id).async_save(history.as_dict())
+        if "recorder" not in self.hass.config.components:
+            return
+        try:
+            await async_import_cost_tracker_statistics(
+                self.hass,
+                runtime.config.meter_serial,
+                tracker_id,
+                runtime.config.name,
+                history.days(),
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug(
+                "Statistics import failed for cost tracker %s: %s", tracker_id, err
+            )
+
     async def _save(self) -> None:
-        """Persist immediately (for structural changes and shutdown)."""
+        """Persist the tracker configuration (structural changes only)."""
         await self._store.async_save(self._snapshot())
 
+    async def _save_state(self, tracker_id: str) -> None:
+        """Persist one tracker's running totals immediately."""
+        await self._state_store(tracker_id).async_save(
+            self._state_snapshot(tracker_id)
+        )
+
     @callback
-    def _delay_save(self) -> None:
-        """Persist on a debounce.
+    def _delay_save(self, tracker_id: str) -> None:
+        """Persist one tracker's running totals on a debounce.
 
         Tracked energy/power entities can update every few seconds; writing
         storage on every update would be an I/O storm and wear flash/SD cards.
-        ``async_delay_save`` coalesces bursts into one write, and a pending
-        delayed write is flushed by the immediate ``_save`` in async_shutdown.
+        ``async_delay_save`` coalesces bursts into one write per tracker, and
+        only trackers that changed are written; pending writes are flushed
+        immediately in async_shutdown.
         """
-        self._store.async_delay_save(self._snapshot, _SAVE_DELAY_SECONDS)
+        self._dirty.add(tracker_id)
+        self._state_store(tracker_id).async_delay_save(
+            partial(self._state_snapshot, tracker_id), _SAVE_DELAY_SECONDS
+        )
@@ -0,0 +1,138 @@
+"""Compact daily and monthly rollups of a cost tracker's totals.
+
+A tracker's ``today_*`` totals used to be discarded at the daily rollover,
+so per-appliance history could only be mined from recorder state rows.  Each
+closed day is now folded into a fixed-size pair of float arrays (one slot per
+day, the most recent ``HISTORY_DAYS``) and into per-month aggregates, which
+are persisted with the tracker's running totals.  Weekly rollups are derived
+from the daily arrays on demand.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from datetime import date, timedelta
+from typing import Any
+
+# Daily slots kept per tracker: a full year plus the day it started.
+HISTORY_DAYS = 366
+# Monthly aggregates kept per tracker (ten years).
+HISTORY_MONTHS = 120
+
+
+class CostTrackerHistory:
+    """Daily totals of the last ``HISTORY_DAYS`` days plus monthly totals."""
+
+    __slots__ = ("first_day", "kwh", "cost", "months")
+
+    def __init__(self) -> None:
+        # ``kwh[i]`` / ``cost[i]`` hold the totals of ``first_day + i`` days.
+        self.first_day: date | None = None
+        self.kwh = array("d")
+        self.cost = array("d")
+        # "YYYY-MM" -> [kwh, cost], in insertion (chronological) order.
+        self.months: dict[str, list[float]] = {}
+
+    @property
+    def last_day(self) -> date | None:
+        """Return the most recent day held, if any."""
+        if self.first_day is None or not self.kwh:
+            return None
+        return self.first_day + timedelta(days=len(self.kwh) - 1)
+
+    def record(self, day: date, kwh: float, cost: float) -> None:
+        """Add one day's totals, dropping days that fall out of the window."""
+        month = self.months.setdefault(day.strftime("%Y-%m"), [0.0, 0.0])
+        month[0] = round(month[0] + kwh, 6)
+        month[1] = round(month[1] + cost, 4)
+        if len(self.months) > HISTORY_MONTHS:
+            for key in sorted(self.months)[: len(self.months) - HISTORY_MONTHS]:
+                del self.months[key]
+
+        if self.first_day is None:
+            self.first_day = day
+        # Slide the window so *day* is its last slot at most.
+        window_start = day - timedelta(days=HISTORY_DAYS - 1)
+        if window_start > self.first_day:
+            drop = (window_start - self.first_day).days
+            del self.kwh[:drop]
+            del self.cost[:drop]
+            self.first_day = window_start
+        index = (day - self.first_day).days
+        if index < 0:
+            # Older than the daily window; only the month keeps it.
+            return
+        if index >= len(self.kwh):
+            padding = index + 1 - len(self.kwh)
+            self.kwh.extend([0.0] * padding)
+            self.cost.extend([0.0] * padding)
+        self.kwh[index] = round(self.kwh[index] + kwh, 6)
+        self.cost[index] = round(self.cost[index] + cost, 4)
+
+    def days(self, since: date | None = None) -> Iterator[tuple[date, float, float]]:
+        """Yield ``(day, kwh, cost)`` oldest first, from *since* if given."""
+        if self.first_day is None:
+            return
+        start = 0
+        if since is not None:
+            start = max(0, (since - self.first_day).days)
+        for index in range(start, len(self.kwh)):
+            yield (
+                self.first_day + timedelta(days=index),
+                self.kwh[index],
+                self.cost[index],
+            )
+
+    def weeks(self, since: date | None = None) -> list[tuple[date, float, float]]:
+        """Return ``(monday, kwh, cost)`` per ISO week covered by the days.
+
+        *since* is moved back to its Monday so the first week is whole.
+        """
+        if since is not None:
+            since -= timedelta(days=since.weekday())
+        weeks: dict[date, list[float]] = {}
+        for day, kwh, cost in self.days(since):
+            totals = weeks.setdefault(day - timedelta(days=day.weekday()), [0.0, 0.0])
+            totals[0] += kwh
+            totals[1] += cost
+        return [
+            (monday, round(kwh, 6), round(cost, 4))
+            for monday, (kwh, cost) in weeks.items()
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the JSON-serializable form stored with the tracker state."""
+        return {
+            "first_day": self.first_day.isoformat() if self.first_day else None,
+            "kwh": list(self.kwh),
+            "cost": list(self.cost),
+            "months": {key: list(value) for key, value in self.months.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> CostTrackerHistory:
+        """Rebuild history from :meth:`as_dict` output; tolerant of bad data."""
+        history = cls()
+        if not isinstance(data, dict):
+            return history
+        try:
+            first_day = date.fromisoformat(str(data.get("first_day") or ""))
+            kwh = array("d", (float(v) for v in data.get("kwh") or []))
+            cost = array("d", (float(v) for v in data.get("cost") or []))
+        except (TypeError, ValueError):
+            first_day, kwh, cost = None, array("d"), array("d")
+        if first_day is not None and len(kwh) == len(cost):
+            history.first_day = first_day
+            history.kwh = kwh[-HISTORY_DAYS:]
+            history.cost = cost[-HISTORY_DAYS:]
+            history.first_day += timedelta(days=len(kwh) - len(history.kwh))
+        months = data.get("months")
+        if isinstance(months, dict):
+            for key in sorted(months)[-HISTORY_MONTHS:]:
+                value = months[key]
+                try:
+                    history.months[str(key)] = [float(value[0]), float(value[1])]
+                except (TypeError, ValueError, IndexError):
+                    continue
+        return history
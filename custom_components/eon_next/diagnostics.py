@@ -0,0 +1,57 @@
+"""Diagnostics support for the Eon Next integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_EMAIL, CONF_PASSWORD, CONF_REFRESH_TOKEN
+from .models import EonNextConfigEntry
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, CONF_REFRESH_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: EonNextConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Covers the API client's request metrics (latency per operation and
+    status, bytes, in-flight counts, token refresh time) alongside its
+    retry, circuit breaker and cache counters, so slow refreshes can be
+    traced to the requests behind them.
+    """
+    runtime_data = entry.runtime_data
+    api = runtime_data.api
+    coordinator = runtime_data.coordinator
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "topology": {
+            "accounts": len(api.accounts),
+            "meters": sum(len(account.meters) for account in api.accounts),
+            "ev_chargers": sum(len(account.ev_chargers) for account in api.accounts),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval_seconds": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "data_restored": coordinator.data_restored,
+        },
+        "api": {
+            "requests": api.request_metrics,
+            "retries": api.retry_stats,
+            "circuit_breakers": api.circuit_breaker_stats,
+            "response_cache": api.response_cache_stats,
+            "single_flight": api.single_flight_stats,
+            "token_refresh_due_in": api.token_refresh_due_in(),
+        },
+        "backfill": runtime_data.backfill.get_status(),
+    }
@@ -4,17 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import json
 import logging
-from collections.abc import Callable
+import random
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
 from dataclasses import dataclass
-from typing import Any
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
 
 import aiohttp
 
+from .api_metrics import ApiMetrics, RequestRecord
 from .const import API_BASE_URL
+from .consumption import CHUNK_SIZE, async_decode_consumption_page
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 METER_TYPE_GAS = "gas"
 METER_TYPE_ELECTRIC = "electricity"
 METER_TYPE_UNKNOWN = "unknown"
@@ -113,11 +122,42 @@ query getAccountAgreements($accountNumber: String!) {
 """
 
 
+# Read-only GraphQL operations whose payloads change rarely enough to serve
+# from memory between coordinator refreshes.  Callers re-derive everything
+# date-dependent (e.g. the active agreement) on each use, so a cached
+# agreements payload still resolves the right tariff after midnight.
+_GRAPHQL_CACHE_TTL_SECONDS: dict[str, float] = {
+    "getAccountAgreements": 60 * 60,
+    "getAccountMeterSelector": 12 * 60 * 60,
+    "getAccountDevices": 6 * 60 * 60,
+}
+_RESPONSE_CACHE_MAX_ENTRIES = 64
+
+# ETag/Last-Modified validators kept per consumption query so a repeat
+# request can be answered with a 304 instead of the full page.
+_CONSUMPTION_VALIDATOR_TTL_SECONDS = 24 * 60 * 60
+_CONSUMPTION_VALIDATOR_MAX_ENTRIES = 128
+
+# Consecutive failed reads (each counted once, after its retries) that open
+# an endpoint family's circuit, and how long it then fails fast before letting one probe through.
+# The reset is shorter than the coordinator interval, so each refresh during
+# an outage costs one probe per family rather than the full request sequence.
+_CIRCUIT_FAILURE_THRESHOLD = 3
+_CIRCUIT_RESET_SECONDS = 5 * 60
+
+CIRCUIT_GRAPHQL = "graphql"
+CIRCUIT_CONSUMPTION = "consumption"
+
 # Treat the access token as expired this many seconds before its real
 # expiry, so a token is proactively refreshed rather than sent moments
 # before it lapses (or being rejected under mild server clock skew).
 _TOKEN_EXPIRY_MARGIN_SECONDS = 60
 
+# The integration refreshes the access token in the background this long
+# before it expires, well ahead of the margin above, so no API call ever has
+# to pay for the refresh round-trip itself.
+TOKEN_REFRESH_LEAD_SECONDS = 5 * 60
+
 
 def _iso_date(value: Any) -> datetime.date | None:
     """Parse the calendar-date portion of an ISO date/datetime string."""
@@ -137,6 +177,197 @@ class EonNextApiError(Exception):
     """Raised when an API call fails."""
 
 
+class EonNextTransientError(EonNextApiError):
+    """Raised for failures worth retrying (connection errors, 5xx, 429)."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return a ``Retry-After`` header (seconds or HTTP date) in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def _transient_status(status: int) -> bool:
+    return status >= 500 or status == 429
+
+
+async def _counted_chunks(
+    chunks: AsyncIterator[bytes], record: RequestRecord
+) -> AsyncIterator[bytes]:
+    """Pass *chunks* through, adding their size to the record's ``bytes_in``."""
+    async for chunk in chunks:
+        record.bytes_in += len(chunk)
+        yield chunk
+
+
+@dataclass(slots=True, frozen=True)
+class RetryPolicy:
+    """How idempotent reads are retried after transient failures.
+
+    Waits use exponential back-off with full jitter (a uniform draw between
+    zero and the capped exponential step), never less than a server's
+    ``Retry-After``.  ``deadline_seconds`` bounds one call end to end,
+    attempts included; a retry that would overrun it is not started.
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 1.0
+    max_delay_seconds: float = 30.0
+    deadline_seconds: float = 90.0
+
+    def delay(self, attempt: int, retry_after: float | None) -> float | None:
+        """Return the wait before retry number *attempt*, or ``None`` to stop."""
+        if retry_after is not None and retry_after > self.max_delay_seconds:
+            return None
+        step = min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1))
+        delay = random.uniform(0, step)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+@dataclass(slots=True)
+class RetryStats:
+    """Counters for one endpoint family's retries."""
+
+    # Extra attempts made after a transient failure.
+    retries: int = 0
+    # Calls that failed at least once and then succeeded.
+    recovered: int = 0
+    # Calls that still failed when attempts or the deadline ran out.
+    exhausted: int = 0
+
+
+class EonNextCircuitOpenError(EonNextApiError):
+    """Raised, without a request, while an endpoint family is failing."""
+
+
+class _CircuitBreaker:
+    """Closed/open/half-open breaker for one endpoint family.
+
+    Opens after ``failure_threshold`` consecutive failures.  While open,
+    calls are rejected until ``reset_seconds`` have passed; then a single
+    probe call is let through (half-open) and its outcome closes or
+    re-opens the circuit.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Return ``closed``, ``open`` or ``half_open``."""
+        if self._opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self._opened_at >= self._reset_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Raise ``EonNextCircuitOpenError`` unless a request may be sent."""
+        if self._opened_at is None:
+            return
+        if self._probing or time.monotonic() - self._opened_at < self._reset_seconds:
+            self.rejected += 1
+            raise EonNextCircuitOpenError(
+                f"E.ON Next {self.name} API unavailable; skipping request"
+            )
+        self._probing = True
+
+    def release_probe(self) -> None:
+        """Let another probe through after an inconclusive (cancelled) one."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            _LOGGER.info("E.ON Next %s API recovered", self.name)
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        was_open = self._opened_at is not None
+        self._probing = False
+        if was_open or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+            if not was_open:
+                self.trips += 1
+                _LOGGER.warning(
+                    "E.ON Next %s API failing; pausing requests for %ss",
+                    self.name,
+                    int(self._reset_seconds),
+                )
+
+
+class _ResponseCache:
+    """Size-bounded LRU mapping of keys to values with per-entry expiry."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the live value for *key*, or ``None`` if absent/expired."""
+        item = self._entries.get(key)
+        if item is not None and item[0] <= time.monotonic():
+            del self._entries[key]
+            item = None
+        if item is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        """Store *value*, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@dataclass(slots=True)
+class SingleFlightStats:
+    """Counters for one coalesced operation."""
+
+    # Calls that started a request.
+    requests: int = 0
+    # Calls that joined a request already in flight.
+    shared: int = 0
+
+
 @dataclass(slots=True)
 class SmartChargingDevice:
     """Smart charging device metadata."""
@@ -154,6 +385,26 @@ class EonNext:
         self._session: aiohttp.ClientSession | None = None
         self._auth_lock = asyncio.Lock()
         self._on_token_update: Callable[[str], None] | None = None
+        self._inflight: dict[tuple[str, Hashable], asyncio.Task[Any]] = {}
+        self._single_flight_stats: dict[str, SingleFlightStats] = {}
+        self._response_cache = _ResponseCache(_RESPONSE_CACHE_MAX_ENTRIES)
+        self._consumption_validators = _ResponseCache(
+            _CONSUMPTION_VALIDATOR_MAX_ENTRIES
+        )
+        self._consumption_not_modified = 0
+        self.retry_policy = RetryPolicy()
+        self._retry_stats = {
+            family: RetryStats() for family in (CIRCUIT_GRAPHQL, CIRCUIT_CONSUMPTION)
+        }
+        self._metrics = ApiMetrics()
+        # Indirection so tests can skip the real waits.
+        self._sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep
+        self._circuits = {
+            family: _CircuitBreaker(
+                family, _CIRCUIT_FAILURE_THRESHOLD, _CIRCUIT_RESET_SECONDS
+            )
+            for family in (CIRCUIT_GRAPHQL, CIRCUIT_CONSUMPTION)
+        }
         self.__reset_authentication()
         self.__reset_accounts()
 
@@ -196,6 +447,8 @@ class EonNext:
         return int(datetime.datetime.now().timestamp())
 
     def __reset_authentication(self):
+        # Cached responses belong to the session that fetched them.
+        self._invalidate_response_cache()
         self.auth = {
             "issued": None,
             "token": {"token": None, "expires": None},
@@ -256,16 +509,22 @@ class EonNext:
         return True
 
     async def __auth_token(self) -> str:
+        # Fast path: a valid token needs no lock, so concurrent calls never
+        # queue behind a refresh that another caller does not need.
+        if self.__auth_token_is_valid():
+            return self.auth["token"]["token"]
+
         async with self._auth_lock:
             if not self.__auth_token_is_valid():
-                if self.__refresh_token_is_valid():
-                    await self.__login_with_refresh_token()
-                else:
-                    await self.login_with_username_and_password(
-                        self.username,
-                        self.password,
-                        initialise=False,
-                    )
+                with self._metrics.time_auth_refresh():
+                    if self.__refresh_token_is_valid():
+                        await self.__login_with_refresh_token()
+                    else:
+                        await self.login_with_username_and_password(
+                            self.username,
+                            self.password,
+                            initialise=False,
+                        )
 
             if not self.__auth_token_is_valid():
                 raise EonNextAuthError("Unable to authenticate")
@@ -285,9 +544,49 @@ class EonNext:
             # Drop the cached access token so the refresh cannot short-circuit.
             self.auth["token"]["token"] = None
             self.auth["token"]["expires"] = None
-            if self.__refresh_token_is_valid():
-                await self.__login_with_refresh_token()
-            else:
+            with self._metrics.time_auth_refresh():
+                if self.__refresh_token_is_valid():
+                    await self.__login_with_refresh_token()
+                else:
+                    await self.login_with_username_and_password(
+                        self.username,
+                        self.password,
+                        initialise=False,
+                    )
+            return self.__auth_token_is_valid()
+
+    def token_refresh_due_in(self) -> float | None:
+        """Return seconds until the access token should be refreshed.
+
+        Returns ``None`` when there is no access token to keep fresh, and
+        ``0`` once the refresh is due.
+        """
+        if self.auth["token"]["token"] is None:
+            return None
+        token_expires = self.auth["token"]["expires"]
+        if token_expires is None or not isinstance(token_expires, int | float):
+            return None
+        due = token_expires - TOKEN_REFRESH_LEAD_SECONDS - self.__current_timestamp()
+        return max(float(due), 0.0)
+
+    async def async_refresh_token(self) -> bool:
+        """Renew the access token ahead of expiry, off the request path.
+
+        Unlike :meth:`_force_token_refresh` the current token is kept until
+        its replacement arrives, so requests issued meanwhile still take the
+        lock-free path in ``__auth_token``.  Returns ``True`` if a valid token
+        is held afterwards.
+        """
+        async with self._auth_lock:
+            due_in = self.token_refresh_due_in()
+            if due_in is not None and due_in > 0:
+                # Another caller already refreshed while we waited.
+                return True
+            refreshed = (
+                self.__refresh_token_is_valid()
+                and await self.__login_with_refresh_token()
+            )
+            if not refreshed:
                 await self.login_with_username_and_password(
                     self.username,
                     self.password,
@@ -295,6 +594,183 @@ class EonNext:
                 )
             return self.__auth_token_is_valid()
 
+    async def _single_flight(
+        self,
+        operation: str,
+        key: Hashable,
+        factory: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Share one in-flight request between identical concurrent calls.
+
+        The first caller for ``(operation, key)`` starts ``factory()`` as a
+        task; callers arriving before it finishes await the same task and
+        receive the same result or exception.  The task is shielded, so one
+        cancelled caller does not cancel the request for the others.  Shared
+        results must be treated as read-only.
+        """
+        stats = self._single_flight_stats.setdefault(operation, SingleFlightStats())
+        flight_key = (operation, key)
+        task = self._inflight.get(flight_key)
+        if task is not None:
+            stats.shared += 1
+        else:
+            stats.requests += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[flight_key] = task
+
+            def _done(finished: asyncio.Task[Any]) -> None:
+                if self._inflight.get(flight_key) is finished:
+                    del self._inflight[flight_key]
+                # Mark the outcome retrieved even if every caller was
+                # cancelled, so asyncio does not log it as never retrieved.
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _guarded(
+        self,
+        family: str,
+        factory: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Run ``factory()`` through *family*'s circuit breaker.
+
+        Only transport errors, timeouts and transient statuses (5xx, 429;
+        ``EonNextTransientError``) count as failures.  Any other response the
+        server actually produced - auth rejections, a 404 for an unknown
+        meter, a malformed body - counts as success: the endpoint is up.
+        """
+        breaker = self._circuits[family]
+        breaker.before_call()
+        try:
+            result = await factory()
+        except (EonNextTransientError, TimeoutError):
+            breaker.record_failure()
+            raise
+        except (EonNextApiError, EonNextAuthError):
+            breaker.record_success()
+            raise
+        except asyncio.CancelledError:
+            # Not a verdict on the endpoint; free the probe slot.
+            breaker.release_probe()
+            raise
+        breaker.record_success()
+        return result
+
+    async def _with_retries(
+        self,
+        family: str,
+        factory: Callable[[bool], Awaitable[_T]],
+    ) -> _T:
+        """Run an idempotent read through the breaker, retrying transient errors.
+
+        The breaker sees the read once, however many attempts it took: a
+        blip that retries recover from is a success, and only a read whose
+        retries ran out counts as one failure.  An open circuit is not
+        retried: the breaker already decided the endpoint is down.
+        ``factory`` is told whether it is making a retry attempt, so request
+        metrics can count it against its operation.
+        """
+        return await self._guarded(family, lambda: self._retrying(family, factory))
+
+    async def _retrying(
+        self,
+        family: str,
+        factory: Callable[[bool], Awaitable[_T]],
+    ) -> _T:
+        """Run ``factory()``, retrying transient errors per ``retry_policy``."""
+        policy = self.retry_policy
+        stats = self._retry_stats[family]
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = await factory(attempt > 1)
+            except (EonNextTransientError, TimeoutError) as err:
+                retry_after = getattr(err, "retry_after", None)
+                delay = (
+                    policy.delay(attempt, retry_after)
+                    if attempt < policy.max_attempts
+                    else None
+                )
+                if (
+                    delay is None
+                    or time.monotonic() - started + delay > policy.deadline_seconds
+                ):
+                    stats.exhausted += 1
+                    raise
+                stats.retries += 1
+                _LOGGER.debug(
+                    "Retrying %s request in %.1fs after attempt %s failed: %s",
+                    family,
+                    delay,
+                    attempt,
+                    err,
+                )
+                await self._sleep(delay)
+                continue
+            if attempt > 1:
+                stats.recovered += 1
+            return result
+
+    @property
+    def retry_stats(self) -> dict[str, dict[str, int]]:
+        """Per-family retry/recovered/exhausted counters."""
+        return {
+            family: {
+                "retries": stats.retries,
+                "recovered": stats.recovered,
+                "exhausted": stats.exhausted,
+            }
+            for family, stats in self._retry_stats.items()
+        }
+
+    def circuit_open(self, family: str) -> bool:
+        """Return whether *family* is currently rejecting requests."""
+        return self._circuits[family].state == "open"
+
+    @property
+    def circuit_breaker_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-family breaker state and trip/rejection counters."""
+        return {
+            family: {
+                "state": breaker.state,
+                "trips": breaker.trips,
+                "rejected": breaker.rejected,
+            }
+            for family, breaker in self._circuits.items()
+        }
+
+    def _invalidate_response_cache(self) -> None:
+        """Drop cached GraphQL responses and consumption validators."""
+        self._response_cache.clear()
+        self._consumption_validators.clear()
+
+    @property
+    def response_cache_stats(self) -> dict[str, int]:
+        """Hit/miss counters for the GraphQL cache and REST revalidation."""
+        return {
+            "hits": self._response_cache.hits,
+            "misses": self._response_cache.misses,
+            "entries": len(self._response_cache),
+            "consumption_not_modified": self._consumption_not_modified,
+        }
+
+    @property
+    def request_metrics(self) -> dict[str, Any]:
+        """Latency histograms, bytes and in-flight counts per operation."""
+        return self._metrics.as_dict()
+
+    @property
+    def single_flight_stats(self) -> dict[str, dict[str, int]]:
+        """Per-operation request/shared counters for coalesced calls."""
+        return {
+            operation: {"requests": stats.requests, "shared": stats.shared}
+            for operation, stats in self._single_flight_stats.items()
+        }
+
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
@@ -317,6 +793,40 @@ class EonNext:
         if variables is None:
             variables = {}
 
+        cache_ttl = _GRAPHQL_CACHE_TTL_SECONDS.get(operation) if authenticated else None
+        cache_key: tuple[str, str] | None = None
+        if cache_ttl is not None:
+            cache_key = (operation, json.dumps(variables, sort_keys=True))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if authenticated:
+            # Every authenticated operation is a read-only query.
+            result = await self._with_retries(
+                CIRCUIT_GRAPHQL,
+                lambda retry: self.__graphql_request(
+                    operation, query, variables, True, retry=retry
+                ),
+            )
+        else:
+            # Login/token refresh runs inside guarded calls (a half-open
+            # probe must be able to refresh its token) and at setup, which
+            # has its own transient-failure handling.
+            result = await self.__graphql_request(operation, query, variables, False)
+        if cache_key is not None and cache_ttl is not None and not result.get("errors"):
+            self._response_cache.set(cache_key, result, cache_ttl)
+        return result
+
+    async def __graphql_request(
+        self,
+        operation: str,
+        query: str,
+        variables: dict,
+        authenticated: bool,
+        *,
+        retry: bool = False,
+    ) -> dict:
         # Authenticated calls get one transparent refresh-and-retry on a 401/403
         # (or auth-shaped GraphQL error) before escalating to re-auth.
         attempted_refresh = False
@@ -325,64 +835,83 @@ class EonNext:
             if authenticated:
                 headers["authorization"] = f"JWT {await self.__auth_token()}"
 
+            payload = {"operationName": operation, "variables": variables, "query": query}
             session = await self._get_session()
-            try:
-                async with session.post(
-                    f"{API_BASE_URL}/graphql/",
-                    json={"operationName": operation, "variables": variables, "query": query},
-                    headers=headers,
-                ) as response:
-                    if authenticated and response.status in (401, 403):
-                        if not attempted_refresh:
-                            attempted_refresh = True
-                            if await self._force_token_refresh():
-                                continue
-                        raise EonNextAuthError("Authentication rejected by API")
-
-                    try:
-                        result = await response.json(content_type=None)
-                    except aiohttp.ContentTypeError as err:
-                        text = await response.text()
-                        _LOGGER.debug(
-                            "Non-JSON response for %s (status %s): %s",
-                            operation,
-                            response.status,
-                            text[:500],
-                        )
-                        raise EonNextApiError("Invalid API response") from err
-
-                    # A CDN/proxy error page can be valid JSON that is a list or
-                    # null rather than the expected object; treat anything else
-                    # as a transport error instead of letting ``.get`` raise
-                    # ``AttributeError`` outside the client's error taxonomy.
-                    if not isinstance(result, dict):
-                        _LOGGER.debug(
-                            "Unexpected non-object GraphQL body for %s (status %s)",
-                            operation,
-                            response.status,
-                        )
-                        raise EonNextApiError("Invalid API response")
-
-                    if self._has_auth_error(result.get("errors")):
-                        if authenticated and not attempted_refresh:
-                            attempted_refresh = True
-                            if await self._force_token_refresh():
-                                continue
-                        raise EonNextAuthError("Authentication failed")
-
-                    errors = result.get("errors")
-                    if errors and isinstance(errors, list):
-                        _LOGGER.warning(
-                            "GraphQL errors in %s response: %s",
-                            operation,
-                            [e.get("message", str(e)) for e in errors if isinstance(e, dict)],
-                        )
-
-                    return result
-
-            except aiohttp.ClientError as err:
-                _LOGGER.error("GraphQL request failed for %s: %s", operation, err)
-                raise EonNextApiError(f"API request failed: {err}") from err
+            with self._metrics.request(
+                operation, len(json.dumps(payload).encode()), retry=retry
+            ) as call:
+                try:
+                    async with session.post(
+                        f"{API_BASE_URL}/graphql/",
+                        json=payload,
+                        headers=headers,
+                    ) as response:
+                        call.status = str(response.status)
+                        if authenticated and response.status in (401, 403):
+                            if not attempted_refresh:
+                                attempted_refresh = True
+                                # Time the request, not the refresh.
+                                call.finish(response.status)
+                                if await self._force_token_refresh():
+                                    continue
+                            raise EonNextAuthError("Authentication rejected by API")
+
+                        # Server-side failures count against the circuit breaker
+                        # whatever body (often a CDN error page) comes with them.
+                        if _transient_status(response.status):
+                            raise EonNextTransientError(
+                                f"GraphQL endpoint returned status {response.status}",
+                                _parse_retry_after(response.headers.get("Retry-After")),
+                            )
+
+                        body = await response.read()
+                        call.bytes_in = len(body)
+                        try:
+                            result = json.loads(body)
+                        except ValueError as err:
+                            _LOGGER.debug(
+                                "Non-JSON response for %s (status %s): %s",
+                                operation,
+                                response.status,
+                                body[:500].decode(errors="replace"),
+                            )
+                            raise EonNextApiError("Invalid API response") from err
+
+                        # A CDN/proxy error page can be valid JSON that is a list or
+                        # null rather than the expected object; treat anything else
+                        # as a transport error instead of letting ``.get`` raise
+                        # ``AttributeError`` outside the client's error taxonomy.
+                        if not isinstance(result, dict):
+                            _LOGGER.debug(
+                                "Unexpected non-object GraphQL body for %s (status %s)",
+                                operation,
+                                response.status,
+                            )
+                            raise EonNextApiError("Invalid API response")
+
+                        if self._has_auth_error(result.get("errors")):
+                            if authenticated and not attempted_refresh:
+                                attempted_refresh = True
+                                call.finish(response.status)
+                                if await self._force_token_refresh():
+                                    continue
+                            raise EonNextAuthError("Authentication failed")
+
+                        errors = result.get("errors")
+                        if errors and isinstance(errors, list):
+                            _LOGGER.warning(
+                                "GraphQL errors in %s response: %s",
+                                operation,
+                                [e.get("message", str(e)) for e in errors if isinstance(e, dict)],
+                            )
+
+                        return result
+
+                except aiohttp.ClientError as err:
+                    # Callers log the final outcome; this attempt may be retried.
+                    _LOGGER.debug("GraphQL request failed for %s: %s", operation, err)
+                    call.finish("error")
+                    raise EonNextTransientError(f"API request failed: {err}") from err
 
     async def login_with_username_and_password(
         self,
@@ -417,6 +946,8 @@ class EonNext:
         if self._json_contains_key_chain(result, ["data", "obtainKrakenToken", "token"]):
             self.__store_authentication(result["data"]["obtainKrakenToken"])
             if initialise:
+                # A fresh login may be a different user or account set.
+                self._invalidate_response_cache()
                 await self.__init_accounts()
             return True
 
@@ -462,6 +993,7 @@ class EonNext:
         if self._json_contains_key_chain(result, ["data", "obtainKrakenToken", "token"]):
             self.__store_authentication(result["data"]["obtainKrakenToken"])
             if initialise:
+                self._invalidate_response_cache()
                 await self.__init_accounts()
             return True
 
@@ -494,6 +1026,7 @@ class EonNext:
         return found
 
     async def __init_accounts(self):
+        # Already populated - e.g. seeded from the persisted topology cache.
         if len(self.accounts) != 0:
             return
 
@@ -505,6 +1038,23 @@ class EonNext:
             await account._load_ev_chargers()
             self.accounts.append(account)
 
+    async def async_discover_accounts(self) -> list[EnergyAccount]:
+        """Fetch the current account/meter/device topology from the API.
+
+        Unlike the login-time discovery this neither mutates ``accounts`` nor
+        swallows device-list failures, so a transient error cannot be
+        mistaken for the EV chargers having been removed.
+        """
+        accounts: list[EnergyAccount] = []
+        for info in await self.__get_account_info():
+            account = EnergyAccount(
+                self, info["number"], balance=info.get("balance")
+            )
+            await account._load_meters()
+            await account._load_ev_chargers(strict=True)
+            accounts.append(account)
+        return accounts
+
     async def async_get_account_balances(self) -> dict[str, Any]:
         """Return latest account balances keyed by account number."""
         balances: dict[str, Any] = {}
@@ -514,6 +1064,14 @@ class EonNext:
                 continue
             balances[account_number] = info.get("balance")
 
+        if self.accounts and set(balances) != {
+            account.account_number for account in self.accounts
+        }:
+            # Accounts were added or removed upstream: cached topology,
+            # agreements and devices no longer describe this login.
+            _LOGGER.debug("Account set changed; dropping cached API responses")
+            self._invalidate_response_cache()
+
         for account in self.accounts:
             if account.account_number in balances:
                 account.balance = balances[account.account_number]
@@ -547,41 +1105,107 @@ class EonNext:
         if period_to:
             params["period_to"] = period_to
 
+        # The panel, cards and a coordinator refresh can ask for the same
+        # meter and window at once; let them share a single GET.
+        request_key = (url, tuple(sorted(params.items())))
+        return await self._single_flight(
+            "consumption",
+            request_key,
+            lambda: self._with_retries(
+                CIRCUIT_CONSUMPTION,
+                lambda retry: self.__fetch_consumption(
+                    url, params, serial, request_key, retry=retry
+                ),
+            ),
+        )
+
+    async def __fetch_consumption(
+        self,
+        url: str,
+        params: dict[str, str],
+        serial: str,
+        request_key: Hashable,
+        *,
+        retry: bool = False,
+    ) -> dict | None:
+        # (etag, last_modified, body) from the last 200 for this exact query.
+        validators: tuple[str | None, str | None, dict | None] | None = (
+            self._consumption_validators.get(request_key)
+        )
+
         # One transparent refresh-and-retry on a 401/403 before escalating.
         attempted_refresh = False
         while True:
             token = await self.__auth_token()
             headers = {"Authorization": f"JWT {token}"}
+            if validators is not None:
+                etag, last_modified, _ = validators
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
 
             session = await self._get_session()
-            try:
-                async with session.get(url, params=params, headers=headers) as response:
-                    if response.status in (401, 403):
-                        if not attempted_refresh:
-                            attempted_refresh = True
-                            if await self._force_token_refresh():
-                                continue
-                        raise EonNextAuthError("Authentication rejected by API")
-
-                    if response.status == 200:
-                        data = await response.json()
-                        if "results" in data:
-                            return data
-                        # 200 with no results key: genuine "no data for this
-                        # period" - distinct from a transport error below.
-                        return None
-
-                    # Non-200 is a transport/server error, not "no data".  Raise
-                    # so callers (backfill, coordinator) can retry the same
-                    # period instead of silently advancing past a permanent hole.
-                    raise EonNextApiError(
-                        f"REST consumption endpoint returned status {response.status}"
-                    )
-            except aiohttp.ClientError as err:
-                _LOGGER.debug("REST consumption request failed for %s: %s", serial, err)
-                raise EonNextApiError(
-                    f"REST consumption request failed for {serial}: {err}"
-                ) from err
+            with self._metrics.request("consumption", retry=retry) as call:
+                try:
+                    async with session.get(url, params=params, headers=headers) as response:
+                        call.status = str(response.status)
+                        if response.status in (401, 403):
+                            if not attempted_refresh:
+                                attempted_refresh = True
+                                call.finish(response.status)
+                                if await self._force_token_refresh():
+                                    continue
+                            raise EonNextAuthError("Authentication rejected by API")
+
+                        if response.status == 304 and validators is not None:
+                            self._consumption_not_modified += 1
+                            return validators[2]
+
+                        if response.status == 200:
+                            # Decoded as the body arrives; ``results`` becomes a
+                            # compact ConsumptionSeries.
+                            try:
+                                data = await async_decode_consumption_page(
+                                    _counted_chunks(
+                                        response.content.iter_chunked(CHUNK_SIZE), call
+                                    )
+                                )
+                            except ValueError as err:
+                                raise EonNextApiError(
+                                    f"Malformed REST consumption response for {serial}"
+                                ) from err
+                            # 200 with no results key: genuine "no data for this
+                            # period" - distinct from a transport error below.
+                            result = data if "results" in data else None
+                            etag = response.headers.get("ETag")
+                            last_modified = response.headers.get("Last-Modified")
+                            if etag or last_modified:
+                                self._consumption_validators.set(
+                                    request_key,
+                                    (etag, last_modified, result),
+                                    _CONSUMPTION_VALIDATOR_TTL_SECONDS,
+                                )
+                            return result
+
+                        # Non-200 is a transport/server error, not "no data".  Raise
+                        # so callers (backfill, coordinator) can retry the same
+                        # period instead of silently advancing past a permanent hole.
+                        message = (
+                            f"REST consumption endpoint returned status {response.status}"
+                        )
+                        if _transient_status(response.status):
+                            raise EonNextTransientError(
+                                message,
+                                _parse_retry_after(response.headers.get("Retry-After")),
+                            )
+                        raise EonNextApiError(message)
+                except aiohttp.ClientError as err:
+                    _LOGGER.debug("REST consumption request failed for %s: %s", serial, err)
+                    call.finish("error")
+                    raise EonNextTransientError(
+                        f"REST consumption request failed for {serial}: {err}"
+                    ) from err
 
     async def async_get_smart_charging_schedule(
         self,
@@ -591,10 +1215,14 @@ class EonNext:
         if not device_id:
             return None
 
-        result = await self._graphql_post(
+        result = await self._single_flight(
             "getSmartChargingSchedule",
-            GET_SMART_CHARGING_SCHEDULE_QUERY,
-            {"deviceId": device_id},
+            device_id,
+            lambda: self._graphql_post(
+                "getSmartChargingSchedule",
+                GET_SMART_CHARGING_SCHEDULE_QUERY,
+                {"deviceId": device_id},
+            ),
         )
         if not self._json_contains_key_chain(result, ["data", "flexPlannedDispatches"]):
             return None
@@ -613,7 +1241,9 @@ class EonNext:
         Returns a dict keyed by supply point ID (MPAN/MPRN) with the
         currently active tariff details for each meter point.  Agreements
         are filtered so only the one whose validity window contains today
-        is returned per meter point.
+        is returned per meter point; every agreement the API lists for the
+        point (past ones included) is attached under ``agreements`` in the
+        same shape, for the historical tariff timeline.
 
         Tariff values (unit rate, standing charge) are returned as-is from
         the API - callers should interpret them as pence/kWh or pence/day.
@@ -644,6 +1274,9 @@ class EonNext:
                     elec_point.get("agreements", []), today
                 )
                 if active:
+                    active["agreements"] = self._parse_agreements(
+                        elec_point.get("agreements", [])
+                    )
                     tariffs[mpan] = active
 
             for gas_point in prop.get("gasMeterPoints", []):
@@ -654,6 +1287,9 @@ class EonNext:
                     gas_point.get("agreements", []), today
                 )
                 if active:
+                    active["agreements"] = self._parse_agreements(
+                        gas_point.get("agreements", [])
+                    )
                     tariffs[mprn] = active
 
         return tariffs or None
@@ -695,62 +1331,87 @@ class EonNext:
             if valid_to_date is not None and valid_to_date < today:
                 continue
 
-            tariff = agreement.get("tariff")
-            if not isinstance(tariff, dict):
+            parsed = EonNext._parse_agreement(agreement)
+            if parsed is not None:
+                return parsed
+
+        return None
+
+    @staticmethod
+    def _parse_agreements(agreements: Any) -> list[dict[str, Any]]:
+        """Parse every agreement with a known start date, in API order."""
+        if not isinstance(agreements, list):
+            return []
+        parsed: list[dict[str, Any]] = []
+        for agreement in agreements:
+            if not isinstance(agreement, dict):
+                continue
+            if _iso_date(agreement.get("validFrom") or "") is None:
                 continue
+            result = EonNext._parse_agreement(agreement)
+            if result is not None:
+                parsed.append(result)
+        return parsed
 
-            unit_rate = tariff.get("unitRate")
-            unit_rates_schedule: list[dict[str, Any]] | None = None
-            tariff_is_tou = False
-
-            if unit_rate is None:
-                # HalfHourlyTariff stores rates in unitRates list
-                unit_rates = tariff.get("unitRates")
-                if isinstance(unit_rates, list) and unit_rates:
-                    float_values: list[float] = []
-                    schedule_entries: list[dict[str, Any]] = []
-                    for r in unit_rates:
-                        if not isinstance(r, dict):
-                            continue
-                        val = r.get("value")
-                        if val is None:
-                            continue
-                        try:
-                            float_values.append(float(val))
-                        except (TypeError, ValueError):
-                            continue
-                        schedule_entries.append({
-                            "value": float(val),
-                            "validFrom": r.get("validFrom"),
-                            "validTo": r.get("validTo"),
-                        })
-                    if float_values:
-                        unit_rate = sum(float_values) / len(float_values)
-                    if schedule_entries:
-                        unit_rates_schedule = schedule_entries
-
-            # Detect time-of-use: HalfHourlyTariff typename or multiple
-            # distinct rate values in the schedule.
-            typename = tariff.get("__typename") or ""
-            if typename == "HalfHourlyTariff":
-                tariff_is_tou = True
-            elif unit_rates_schedule:
-                distinct = {e["value"] for e in unit_rates_schedule}
-                tariff_is_tou = len(distinct) > 1
-
-            return {
-                "tariff_name": tariff.get("displayName") or tariff.get("fullName"),
-                "tariff_code": tariff.get("tariffCode"),
-                "tariff_type": typename,
-                "unit_rate": unit_rate,
-                "standing_charge": tariff.get("standingCharge"),
-                "valid_from": valid_from,
-                "valid_to": valid_to,
-                "unit_rates_schedule": unit_rates_schedule,
-                "tariff_is_tou": tariff_is_tou,
-            }
+    @staticmethod
+    def _parse_agreement(agreement: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the tariff details of one agreement, or None without one."""
+        valid_from = agreement.get("validFrom") or ""
+        valid_to = agreement.get("validTo") or ""
+        tariff = agreement.get("tariff")
+        if not isinstance(tariff, dict):
+            return None
 
-        return None
+        unit_rate = tariff.get("unitRate")
+        unit_rates_schedule: list[dict[str, Any]] | None = None
+        tariff_is_tou = False
+
+        if unit_rate is None:
+            # HalfHourlyTariff stores rates in unitRates list
+            unit_rates = tariff.get("unitRates")
+            if isinstance(unit_rates, list) and unit_rates:
+                float_values: list[float] = []
+                schedule_entries: list[dict[str, Any]] = []
+                for r in unit_rates:
+                    if not isinstance(r, dict):
+                        continue
+                    val = r.get("value")
+                    if val is None:
+                        continue
+                    try:
+                        float_values.append(float(val))
+                    except (TypeError, ValueError):
+                        continue
+                    schedule_entries.append({
+                        "value": float(val),
+                        "validFrom": r.get("validFrom"),
+                        "validTo": r.get("validTo"),
+                    })
+                if float_values:
+                    unit_rate = sum(float_values) / len(float_values)
+                if schedule_entries:
+                    unit_rates_schedule = schedule_entries
+
+        # Detect time-of-use: HalfHourlyTariff typename or multiple
+        # distinct rate values in the schedule.
+        typename = tariff.get("__typename") or ""
+        if typename == "HalfHourlyTariff":
+            tariff_is_tou = True
+        elif unit_rates_schedule:
+            distinct = {e["value"] for e in unit_rates_schedule}
+            tariff_is_tou = len(distinct) > 1
+
+        return {
+            "tariff_name": tariff.get("displayName") or tariff.get("fullName"),
+            "tariff_code": tariff.get("tariffCode"),
+            "tariff_type": typename,
+            "unit_rate": unit_rate,
+            "standing_charge": tariff.get("standingCharge"),
+            "valid_from": valid_from,
+            "valid_to": valid_to,
+            "unit_rates_schedule": unit_rates_schedule,
+            "tariff_is_tou": tariff_is_tou,
+        }
 
 
 class EnergyAccount:
@@ -847,8 +1508,12 @@ class EnergyAccount:
             )
         return is_inactive
 
-    async def _load_ev_chargers(self):
-        """Load SmartFlex EV devices if available for the account."""
+    async def _load_ev_chargers(self, strict: bool = False):
+        """Load SmartFlex EV devices if available for the account.
+
+        Failures leave the list empty unless *strict*, in which case they
+        propagate.
+        """
         self.ev_chargers = []
         try:
             result = await self.api._graphql_post(
@@ -857,6 +1522,8 @@ class EnergyAccount:
                 {"accountNumber": self.account_number},
             )
         except (EonNextApiError, EonNextAuthError) as err:
+            if strict:
+                raise
             _LOGGER.debug("Unable to load EV devices for %s: %s", self.account_number, err)
             return
 
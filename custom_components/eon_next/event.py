@@ -9,6 +9,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .meter_snapshot import MeterSnapshot
 from .models import EonNextConfigEntry
 from .tariff_helpers import build_day_rates
 
@@ -38,14 +39,15 @@ class EonNextEventBase(CoordinatorEntity, EventEntity):
         self._data_key = data_key
 
     @property
-    def _meter_data(self) -> dict[str, Any] | None:
-        if self.coordinator.data and self._data_key in self.coordinator.data:
-            return self.coordinator.data[self._data_key]
-        return None
+    def _meter(self) -> MeterSnapshot | None:
+        if not self.coordinator.data:
+            return None
+        data = self.coordinator.data.get(self._data_key)
+        return data if isinstance(data, MeterSnapshot) else None
 
     @property
     def available(self) -> bool:
-        return super().available and self._meter_data is not None
+        return super().available and self._meter is not None
 
 
 class CurrentDayRatesEvent(EonNextEventBase):
@@ -56,6 +58,10 @@ class CurrentDayRatesEvent(EonNextEventBase):
     """
 
     _attr_event_types = ["rates_updated"]
+    # Up to 48+ windows per day on agile-style tariffs.  The rates stay in
+    # the event payload and live state; ``eon_next/tariff_details`` serves
+    # them on demand.
+    _unrecorded_attributes = frozenset({"rates"})
 
     def __init__(self, coordinator, meter):
         super().__init__(coordinator, meter.serial)
@@ -73,16 +79,16 @@ class CurrentDayRatesEvent(EonNextEventBase):
         rate windows carry today's dates, so a midnight rollover still changes
         the output and fires exactly once.
         """
-        data = self._meter_data
-        new_rates = build_day_rates(data) if data is not None else []
-        new_code = data.get("tariff_code") if data is not None else None
+        meter = self._meter
+        new_rates = build_day_rates(meter) if meter is not None else []
+        new_code = meter.tariff.code if meter is not None else None
 
         if new_rates == self._rates and new_code == self._tariff_code:
             return
 
         self._rates = new_rates
         self._tariff_code = new_code
-        if data is not None:
+        if meter is not None:
             self._trigger_event(
                 "rates_updated",
                 {"rates": self._rates, "tariff_code": self._tariff_code},
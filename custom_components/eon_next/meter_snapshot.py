@@ -0,0 +1,200 @@
+"""Typed per-meter coordinator data.
+
+Each refresh used to build a ~30-key dict per meter and copy long key lists
+to retain tariff/cost/usage values across transient failures.  Meter rows
+are now frozen, slotted dataclasses split into tariff, cost and usage parts:
+unchanged parts are shared with the previous refresh instead of rebuilt,
+and "retain previous on failure" is a field-level merge.
+
+``MeterSnapshot`` is also a read-only ``Mapping`` over the historical flat
+keys (``tariff_name``, ``unit_rate``, ...), so the tariff helpers, WebSocket
+API, registry and persisted coordinator snapshot keep their key-based view.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, fields, replace
+from datetime import date
+from functools import cache
+from operator import attrgetter
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True, frozen=True)
+class TariffSnapshot:
+    """Active tariff agreement for a meter point."""
+
+    name: str | None = None
+    code: str | None = None
+    type: str | None = None
+    unit_rate: float | None = None
+    standing_charge: float | None = None
+    valid_from: str | None = None
+    valid_to: str | None = None
+    rates_schedule: list[dict[str, Any]] | None = None
+    is_tou: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class CostSnapshot:
+    """Cost figures derived from the tariff and consumption."""
+
+    standing_charge: float | None = None
+    previous_day_cost: float | None = None
+    cost_period: str | None = None
+    unit_rate: float | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True when no cost figure is known."""
+        return (
+            self.standing_charge is None
+            and self.previous_day_cost is None
+            and self.cost_period is None
+            and self.unit_rate is None
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class UsageSnapshot:
+    """Consumption aggregates for today and yesterday."""
+
+    daily_consumption: float | None = None
+    daily_consumption_last_reset: str | None = None
+    previous_day_consumption: float | None = None
+    previous_day_consumption_entry_count: int = 0
+    previous_day_consumption_data_complete: bool = False
+    previous_day_consumption_last_reset: str | None = None
+
+    def previous_day_only(self) -> UsageSnapshot:
+        """Return the yesterday figures without today's (which go stale)."""
+        if self.daily_consumption is None and self.daily_consumption_last_reset is None:
+            return self
+        return replace(self, daily_consumption=None, daily_consumption_last_reset=None)
+
+
+NO_TARIFF = TariffSnapshot()
+NO_COST = CostSnapshot()
+NO_USAGE = UsageSnapshot()
+
+
+def _getters() -> dict[str, Callable[[MeterSnapshot], Any]]:
+    getters: dict[str, Callable[[MeterSnapshot], Any]] = {
+        name: attrgetter(name)
+        for name in (
+            "type",
+            "serial",
+            "meter_id",
+            "supply_point_id",
+            "latest_reading",
+            "latest_reading_date",
+            "latest_reading_kwh",
+        )
+    }
+    getters.update(
+        {f.name: attrgetter(f"usage.{f.name}") for f in fields(UsageSnapshot)}
+    )
+    getters.update({f.name: attrgetter(f"cost.{f.name}") for f in fields(CostSnapshot)})
+    getters.update(
+        {f"tariff_{f.name}": attrgetter(f"tariff.{f.name}") for f in fields(TariffSnapshot)}
+    )
+    return getters
+
+
+@dataclass(slots=True, frozen=True)
+class MeterSnapshot(Mapping[str, Any]):
+    """Coordinator data for one meter."""
+
+    type: str
+    serial: str
+    meter_id: str | None = None
+    supply_point_id: str | None = None
+    latest_reading: float | None = None
+    latest_reading_date: date | None = None
+    latest_reading_kwh: float | None = None
+    usage: UsageSnapshot = NO_USAGE
+    tariff: TariffSnapshot = NO_TARIFF
+    cost: CostSnapshot = NO_COST
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            getter = _FLAT_GETTERS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return getter(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FLAT_GETTERS)
+
+    def __len__(self) -> int:
+        return len(_FLAT_GETTERS)
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> MeterSnapshot:
+        """Build a snapshot from the flat key form (e.g. persisted data)."""
+        return cls(
+            type=data["type"],
+            serial=data["serial"],
+            meter_id=data.get("meter_id"),
+            supply_point_id=data.get("supply_point_id"),
+            latest_reading=data.get("latest_reading"),
+            latest_reading_date=_as_date(data.get("latest_reading_date")),
+            latest_reading_kwh=data.get("latest_reading_kwh"),
+            usage=_from_flat(UsageSnapshot, data, "", NO_USAGE),
+            tariff=_from_flat(TariffSnapshot, data, "tariff_", NO_TARIFF),
+            cost=_from_flat(CostSnapshot, data, "", NO_COST),
+        )
+
+
+_FLAT_GETTERS = _getters()
+
+
+def _as_date(value: Any) -> date | None:
+    """Return *value* as a date; persisted snapshots hold ISO strings."""
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _from_flat(cls: type[_T], data: Mapping[str, Any], prefix: str, empty: _T) -> _T:
+    values = {
+        name: data[prefix + name]
+        for name in _field_names(cls)
+        if data.get(prefix + name) is not None
+    }
+    return cls(**values) if values else empty
+
+
+def merge_missing(current: _T, previous: _T | None) -> _T:
+    """Return *current* with its ``None`` fields filled from *previous*.
+
+    Returns *current* itself when there is nothing to fill, so callers can
+    tell whether anything was retained with an identity check.
+    """
+    if previous is None or previous is current:
+        return current
+    changes = {
+        name: value
+        for name in _field_names(type(current))
+        if getattr(current, name) is None
+        and (value := getattr(previous, name)) is not None
+    }
+    return replace(current, **changes) if changes else current  # type: ignore[type-var]
+
+
+def share(current: _T, previous: _T | None) -> _T:
+    """Return *previous* when it equals *current*, so unchanged parts are shared."""
+    if previous is not None and previous == current:
+        return previous
+    return current
@@ -12,6 +12,7 @@ from .eonnext import EonNext
 
 if TYPE_CHECKING:
     from .backfill import EonNextBackfillManager
+    from .backfill_status import DisabledBackfill
     from .cost_tracker import EonNextCostTrackerManager
 
 
@@ -21,7 +22,8 @@ class EonNextRuntimeData:
 
     api: EonNext
     coordinator: EonNextCoordinator
-    backfill: EonNextBackfillManager
+    # The manager only while backfill is enabled; see backfill_status.py.
+    backfill: EonNextBackfillManager | DisabledBackfill
     cost_trackers: EonNextCostTrackerManager
     # Snapshot of the entry options at setup time, used by the update
     # listener to reload only when options actually change (not on
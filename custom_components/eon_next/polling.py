@@ -0,0 +1,214 @@
+"""Adaptive refresh interval for the coordinator.
+
+Smart-meter half-hourly readings reach the API in bursts, typically hours
+after the interval they describe, so a fixed 30-minute poll mostly fetches
+nothing new and can leave a fresh burst unused for up to a full interval.
+This scheduler learns each meter's publication delay from the newest
+``interval_end`` it has seen, polls more often around the next expected
+arrival, and backs off exponentially while refreshes bring nothing new.
+
+A burst can cover many slots at once (e.g. a whole day published each
+morning), so the slot after it may not be due for hours past its
+delay-based prediction.  Once that prediction is stale, the next arrival is
+projected from the observed gap between bursts instead; with no gap learned
+yet, the back-off is held at the base interval so a burst is never left
+waiting longer than a fixed poll would.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import math
+from statistics import median
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Delays kept per meter; roughly a day of bursts.
+_DELAY_HISTORY = 48
+_SLOT = timedelta(minutes=30)
+# Never poll more often than this, however close an expected arrival is.
+MIN_INTERVAL = timedelta(minutes=5)
+# Interval used while an expected arrival is due but has not shown up yet.
+ARRIVAL_POLL_INTERVAL = timedelta(minutes=10)
+# How long after the expected arrival to keep polling at the arrival rate.
+ARRIVAL_WINDOW = timedelta(hours=1)
+# Longest back-off, as a multiple of the configured base interval.
+MAX_BACKOFF_FACTOR = 4
+
+
+@dataclass(slots=True)
+class _MeterArrivals:
+    """What one meter's readings have looked like so far."""
+
+    latest_end: datetime | None = None
+    delays: deque[float] = field(default_factory=lambda: deque(maxlen=_DELAY_HISTORY))
+    # Estimated time the newest data arrived, and the gaps between arrivals.
+    last_arrival: datetime | None = None
+    gaps: deque[float] = field(default_factory=lambda: deque(maxlen=_DELAY_HISTORY))
+    # When this meter was last polled (not persisted).
+    last_poll: datetime | None = None
+
+
+class AdaptivePollScheduler:
+    """Pick the next coordinator refresh interval from observed arrivals."""
+
+    def __init__(self, base_interval: timedelta) -> None:
+        self.base_interval = base_interval
+        self._meters: dict[str, _MeterArrivals] = {}
+        self._misses = 0
+
+    @property
+    def misses(self) -> int:
+        """Consecutive refreshes that brought no new interval data."""
+        return self._misses
+
+    def record(
+        self, serial: str, entries: list[dict[str, Any]], now: datetime
+    ) -> bool:
+        """Note the readings fetched for *serial*; return whether any are new.
+
+        New data arrived at some point since the previous poll, so its
+        arrival is estimated as the midpoint between that poll and *now*
+        rather than charged the whole (possibly backed-off) poll interval.
+        The first observation only sets the baseline: when it arrived is
+        unknown, so it contributes no delay sample.
+        """
+        latest = _latest_interval_end(entries)
+        if latest is None:
+            return False
+        state = self._meters.setdefault(serial, _MeterArrivals())
+        previous_poll, state.last_poll = state.last_poll, now
+        if state.latest_end is not None and latest <= state.latest_end:
+            return False
+        if state.latest_end is not None:
+            arrival = now
+            if previous_poll is not None:
+                arrival = previous_poll + (now - previous_poll) / 2
+            state.delays.append((arrival - latest).total_seconds())
+            if state.last_arrival is not None:
+                state.gaps.append((arrival - state.last_arrival).total_seconds())
+            state.last_arrival = arrival
+        state.latest_end = latest
+        return True
+
+    def typical_delay(self, serial: str) -> timedelta | None:
+        """Return the median publication delay learned for *serial*."""
+        state = self._meters.get(serial)
+        if state is None or not state.delays:
+            return None
+        return timedelta(seconds=median(state.delays))
+
+    def expected_arrival(self, now: datetime | None = None) -> datetime | None:
+        """Return when the next slot of any meter is expected to appear.
+
+        Given *now*, a prediction more than ``ARRIVAL_WINDOW`` in the past is
+        rolled forward by the typical gap between arrivals, when one has
+        been learned.
+        """
+        expected: datetime | None = None
+        for serial, state in self._meters.items():
+            delay = self.typical_delay(serial)
+            if state.latest_end is None or delay is None:
+                continue
+            arrival = state.latest_end + _SLOT + delay
+            if (
+                now is not None
+                and now - arrival >= ARRIVAL_WINDOW
+                and state.last_arrival is not None
+                and state.gaps
+            ):
+                gap = max(timedelta(seconds=median(state.gaps)), _SLOT)
+                arrival = state.last_arrival + gap
+                overdue = now - ARRIVAL_WINDOW - arrival
+                if overdue >= timedelta(0):
+                    arrival += gap * (math.floor(overdue / gap) + 1)
+            if expected is None or arrival < expected:
+                expected = arrival
+        return expected
+
+    def next_interval(
+        self, now: datetime, *, new_data: bool, allow_backoff: bool = True
+    ) -> timedelta:
+        """Return the delay until the next refresh.
+
+        Passing ``allow_backoff=False`` caps the result at the base interval,
+        for data that changes independently of meter readings (e.g. EV charge
+        schedules).
+        """
+        self._misses = 0 if new_data else self._misses + 1
+        interval = self.base_interval
+        if allow_backoff:
+            interval = self.base_interval * min(2**self._misses, MAX_BACKOFF_FACTOR)
+
+        expected = self.expected_arrival(now)
+        if expected is not None:
+            until = expected - now
+            if until > timedelta(0):
+                interval = min(interval, until)
+            elif -until < ARRIVAL_WINDOW:
+                interval = min(interval, ARRIVAL_POLL_INTERVAL)
+            else:
+                # Stale, with no burst cadence to project it forward.
+                interval = min(interval, self.base_interval)
+        return max(interval, MIN_INTERVAL)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned state in a JSON-serialisable form."""
+        return {
+            serial: {
+                "latest_end": state.latest_end.isoformat(),
+                "delays": list(state.delays),
+                "last_arrival": (
+                    state.last_arrival.isoformat() if state.last_arrival else None
+                ),
+                "gaps": list(state.gaps),
+            }
+            for serial, state in self._meters.items()
+            if state.latest_end is not None
+        }
+
+    def restore(self, data: Any) -> None:
+        """Seed the learned state from :meth:`as_dict` output."""
+        if not isinstance(data, dict):
+            return
+        for serial, row in data.items():
+            if not isinstance(row, dict):
+                continue
+            latest = dt_util.parse_datetime(str(row.get("latest_end") or ""))
+            if latest is None:
+                continue
+            state = _MeterArrivals(
+                latest_end=latest,
+                last_arrival=dt_util.parse_datetime(str(row.get("last_arrival") or "")),
+            )
+            state.delays.extend(
+                float(delay)
+                for delay in row.get("delays") or ()
+                if isinstance(delay, (int, float))
+            )
+            state.gaps.extend(
+                float(gap)
+                for gap in row.get("gaps") or ()
+                if isinstance(gap, (int, float))
+            )
+            self._meters[str(serial)] = state
+
+
+def _latest_interval_end(entries: list[dict[str, Any]]) -> datetime | None:
+    latest: datetime | None = None
+    for entry in entries:
+        raw = entry.get("interval_end")
+        end = dt_util.parse_datetime(str(raw)) if raw else None
+        if end is None:
+            start = dt_util.parse_datetime(str(entry.get("interval_start") or ""))
+            if start is None:
+                continue
+            end = start + _SLOT
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=dt_util.UTC)
+        if latest is None or end > latest:
+            latest = end
+    return latest
@@ -0,0 +1,66 @@
+"""Primitives for reading an API rate schedule.
+
+Shared by the per-instant lookups in ``tariff_helpers`` and the bulk pricing
+in ``cost_engine``.  A schedule is the ``tariff_rates_schedule`` list of
+``{"value", "validFrom", "validTo"}`` entries, with values in pence.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .tariff_patterns import TariffRateWindow
+
+
+def parse_dt(value: Any) -> datetime | None:
+    """Parse a datetime string, ensuring timezone awareness."""
+    if not value or not isinstance(value, str):
+        return None
+    parsed = dt_util.parse_datetime(value)
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return parsed
+
+
+def pence_to_pounds(pence: float) -> float:
+    """Convert a rate in pence to GBP, rounded to four places."""
+    return round(pence / 100.0, 4)
+
+
+def schedule_has_time_windows(schedule: list[dict[str, Any]]) -> bool:
+    """Return whether any schedule entry carries a ``validFrom``."""
+    return any(parse_dt(e.get("validFrom")) is not None for e in schedule)
+
+
+def distinct_rates_pence(schedule: list[dict[str, Any]]) -> list[float]:
+    """Return the schedule's distinct parseable rates (pence), ascending."""
+    vals: set[float] = set()
+    for e in schedule:
+        v = e.get("value")
+        if v is not None:
+            try:
+                vals.add(float(v))
+            except (TypeError, ValueError):
+                pass
+    return sorted(vals)
+
+
+def time_in_off_peak_windows(
+    local_time: time,
+    windows: list[TariffRateWindow],
+) -> bool:
+    """Return whether *local_time* falls in one of the ``off_peak`` windows."""
+    for w in windows:
+        if w.name != "off_peak":
+            continue
+        if w.start_time <= w.end_time:
+            if w.start_time <= local_time < w.end_time:
+                return True
+        else:
+            # Wraps midnight
+            if local_time >= w.start_time or local_time < w.end_time:
+                return True
+    return False
@@ -0,0 +1,181 @@
+"""Domain-wide lookup index for meters and EV chargers.
+
+WebSocket handlers and services resolve a meter serial or EV device id to
+its owning config entry on every call.  Scanning every entry's accounts and
+coordinator data each time is O(entries x meters); this index keeps flat
+dicts instead, rebuilt per entry on setup, unload and each coordinator
+refresh.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import EonNextCoordinator
+from .models import EonNextConfigEntry
+
+_REGISTRY_KEY = f"{DOMAIN}_lookup_registry"
+
+
+@dataclass(slots=True, frozen=True)
+class MeterLocation:
+    """Where a meter serial lives and how to query it."""
+
+    entry: EonNextConfigEntry
+    coordinator: EonNextCoordinator
+    type: str | None
+    supply_point_id: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class _EvLocation:
+    entry_id: str
+    coordinator: EonNextCoordinator
+    data_key: str
+
+
+class EonNextLookupRegistry:
+    """Constant-time serial/device/entry lookups across config entries."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, EonNextConfigEntry] = {}
+        self._meters: dict[str, MeterLocation] = {}
+        self._ev_chargers: dict[str, _EvLocation] = {}
+        # entry_id -> every serial/device the entry sees (including ones
+        # indexed under an earlier entry), so re-indexing or removing one
+        # entry never has to walk the others.
+        self._entry_serials: dict[str, set[str]] = {}
+        self._entry_devices: dict[str, set[str]] = {}
+
+    @callback
+    def async_add_entry(self, entry: EonNextConfigEntry) -> CALLBACK_TYPE:
+        """Index *entry* now and after every refresh of its coordinator.
+
+        Returns a callback that stops listening and drops the entry.
+        """
+        self.async_index_entry(entry)
+        remove_listener = entry.runtime_data.coordinator.async_add_listener(
+            lambda: self.async_index_entry(entry)
+        )
+
+        @callback
+        def _remove() -> None:
+            remove_listener()
+            self.async_remove_entry(entry.entry_id)
+
+        return _remove
+
+    @callback
+    def async_index_entry(self, entry: EonNextConfigEntry) -> None:
+        """(Re)build the index rows owned by *entry*."""
+        self._drop_rows(entry.entry_id)
+        runtime_data = entry.runtime_data
+        coordinator = runtime_data.coordinator
+        self._entries[entry.entry_id] = entry
+
+        serials: set[str] = set()
+        devices: set[str] = set()
+
+        def _add_meter(serial: Any, meter_type: Any, supply_point_id: Any) -> None:
+            if not serial:
+                return
+            serials.add(serial)
+            if serial not in self._meters:
+                self._meters[serial] = MeterLocation(
+                    entry=entry,
+                    coordinator=coordinator,
+                    type=meter_type,
+                    supply_point_id=supply_point_id,
+                )
+
+        # Refreshed meter rows first, then the account topology so meters
+        # whose first update failed are still resolvable.
+        for key, data in (coordinator.data or {}).items():
+            data_type = data.get("type")
+            if data_type in ("electricity", "gas"):
+                _add_meter(
+                    data.get("serial"), data_type, data.get("supply_point_id")
+                )
+            elif data_type == "ev_charger":
+                device_id = data.get("device_id")
+                if not device_id:
+                    continue
+                devices.add(device_id)
+                if device_id not in self._ev_chargers:
+                    self._ev_chargers[device_id] = _EvLocation(
+                        entry_id=entry.entry_id, coordinator=coordinator, data_key=key
+                    )
+
+        for account in runtime_data.api.accounts:
+            for meter in account.meters:
+                _add_meter(
+                    meter.serial,
+                    getattr(meter, "type", None),
+                    getattr(meter, "supply_point_id", None),
+                )
+
+        self._entry_serials[entry.entry_id] = serials
+        self._entry_devices[entry.entry_id] = devices
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Forget *entry_id* and let remaining entries claim shared keys."""
+        if self._entries.pop(entry_id, None) is None:
+            return
+        released = self._drop_rows(entry_id)
+        self._entry_serials.pop(entry_id, None)
+        self._entry_devices.pop(entry_id, None)
+        if released:
+            # A serial or device seen by two accounts is indexed under the
+            # first entry only; hand it to a survivor.  Unload is rare, so a
+            # full pass here is fine.
+            for entry in list(self._entries.values()):
+                self.async_index_entry(entry)
+
+    def _drop_rows(self, entry_id: str) -> bool:
+        """Remove rows indexed under *entry_id*; return whether any existed."""
+        dropped = False
+        for serial in self._entry_serials.get(entry_id, ()):
+            location = self._meters.get(serial)
+            if location is not None and location.entry.entry_id == entry_id:
+                del self._meters[serial]
+                dropped = True
+        for device_id in self._entry_devices.get(entry_id, ()):
+            ev_location = self._ev_chargers.get(device_id)
+            if ev_location is not None and ev_location.entry_id == entry_id:
+                del self._ev_chargers[device_id]
+                dropped = True
+        return dropped
+
+    def entry(self, entry_id: str) -> EonNextConfigEntry | None:
+        """Return the loaded config entry with *entry_id*."""
+        return self._entries.get(entry_id)
+
+    def entry_has_meter(self, entry_id: str, serial: str) -> bool:
+        """Return whether config entry *entry_id* owns meter *serial*."""
+        return serial in self._entry_serials.get(entry_id, ())
+
+    def meter(self, serial: str) -> MeterLocation | None:
+        """Return the location of meter *serial*."""
+        return self._meters.get(serial)
+
+    def ev_charger(self, device_id: str) -> dict[str, Any] | None:
+        """Return the current coordinator data for EV *device_id*."""
+        location = self._ev_chargers.get(device_id)
+        if location is None or location.coordinator.data is None:
+            return None
+        return location.coordinator.data.get(location.data_key)
+
+
+@callback
+def async_get_registry(hass: HomeAssistant) -> EonNextLookupRegistry:
+    """Return the shared lookup registry, creating it on first use."""
+    registry: EonNextLookupRegistry | None = hass.data.get(_REGISTRY_KEY)
+    if registry is None:
+        registry = hass.data[_REGISTRY_KEY] = EonNextLookupRegistry()
+    return registry
+
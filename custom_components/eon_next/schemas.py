@@ -5,11 +5,19 @@ exchanged between the Python backend and the TypeScript frontend.
 
 Run ``python scripts/generate_ts_api.py`` after editing this file to
 regenerate ``frontend/src/api.generated.ts``.
+
+Responses are sent either row-wise (the default - one JSON object per list
+item) or, when the request carries ``format: "columnar"``, with every
+list-of-dataclass field transposed into one array per field name.  The
+generated TypeScript API requests the columnar form and decodes it back into
+the row interfaces, so components never see the difference.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
+from functools import cache
+from typing import Any, get_args, get_origin, get_type_hints
 
 
 # ---------------------------------------------------------------------------
@@ -103,6 +111,36 @@ class EvScheduleResponse:
     slots: list[EvScheduleSlot]
 
 
+@dataclass
+class TariffRateWindow:
+    """A single rate window in today's tariff schedule."""
+
+    start: str
+    end: str
+    rate: float
+    is_off_peak: bool
+
+
+@dataclass
+class TariffDetailsResponse:
+    """Response from ``eon_next/tariff_details``.
+
+    Accepts ``meter_serial`` (str) as a request parameter.  Carries the
+    agreement metadata and rate windows that entities keep out of the
+    recorder.
+    """
+
+    serial: str
+    tariff_name: str | None
+    tariff_code: str | None
+    tariff_type: str | None
+    unit_rate: float | None
+    standing_charge: float | None
+    valid_from: str | None
+    valid_to: str | None
+    rates: list[TariffRateWindow]
+
+
 @dataclass
 class BackfillMeterProgress:
     """Per-meter backfill progress."""
@@ -128,6 +166,49 @@ class BackfillStatusResponse:
     meters: list[BackfillMeterProgress]
 
 
+@dataclass
+class CostTrackerSummary:
+    """Identity and running totals of one cost tracker."""
+
+    entry_id: str
+    tracker_id: str
+    name: str
+    meter_serial: str
+    enabled: bool
+    today_consumption_kwh: float
+    today_cost: float
+
+
+@dataclass
+class CostTrackerPeriod:
+    """One cost tracker's totals for a closed day, ISO week or month.
+
+    ``period`` is the day (``YYYY-MM-DD``), the week's Monday, or the month
+    (``YYYY-MM``).
+    """
+
+    entry_id: str
+    tracker_id: str
+    period: str
+    consumption_kwh: float
+    cost: float
+
+
+@dataclass
+class CostTrackerHistoryResponse:
+    """Response from ``eon_next/cost_tracker_history``.
+
+    Accepts optional ``tracker_id`` (str) and ``days`` (int) request
+    parameters.  Served from the trackers' stored rollups, so one query
+    covers every tracker without reading recorder history.
+    """
+
+    trackers: list[CostTrackerSummary]
+    days: list[CostTrackerPeriod]
+    weeks: list[CostTrackerPeriod]
+    months: list[CostTrackerPeriod]
+
+
 # ---------------------------------------------------------------------------
 # Command registry - maps WS command type strings to response dataclasses
 # ---------------------------------------------------------------------------
@@ -145,4 +226,75 @@ WS_COMMANDS: dict[str, type] = {
 WS_EXTRA_RESPONSE_TYPES: list[type] = [
     ConsumptionHistoryResponse,
     EvScheduleResponse,
+    TariffDetailsResponse,
+    CostTrackerHistoryResponse,
 ]
+
+
+# ---------------------------------------------------------------------------
+# Wire encoding
+# ---------------------------------------------------------------------------
+
+WIRE_FORMAT_ROWS = "rows"
+WIRE_FORMAT_COLUMNAR = "columnar"
+WIRE_FORMATS: tuple[str, ...] = (WIRE_FORMAT_ROWS, WIRE_FORMAT_COLUMNAR)
+
+
+@cache
+def _field_plan(cls: type) -> tuple[tuple[str, type | None], ...]:
+    """Return ``(name, row_class)`` per field of *cls*.
+
+    ``row_class`` is the element dataclass for ``list[Dataclass]`` fields
+    (the ones that get transposed in columnar mode) and ``None`` otherwise.
+    Resolved once per class; ``dataclasses.asdict`` re-inspects fields and
+    deep-copies every value on each call.
+    """
+    hints = get_type_hints(cls)
+    plan: list[tuple[str, type | None]] = []
+    for field in fields(cls):
+        hint = hints[field.name]
+        row_class: type | None = None
+        if get_origin(hint) is list:
+            (inner,) = get_args(hint)
+            if isinstance(inner, type) and is_dataclass(inner):
+                row_class = inner
+        plan.append((field.name, row_class))
+    return tuple(plan)
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a non-list field value, recursing into nested dataclasses."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return encode_response(value)
+    return value
+
+
+def _encode_columns(row_class: type, rows: list[Any]) -> dict[str, list[Any]]:
+    """Transpose *rows* into one list per field of *row_class*.
+
+    Every field is present even when *rows* is empty, so decoders can rely
+    on the column set.
+    """
+    return {
+        name: [_encode_value(getattr(row, name)) for row in rows]
+        for name, _ in _field_plan(row_class)
+    }
+
+
+def encode_response(response: Any, *, columnar: bool = False) -> dict[str, Any]:
+    """Encode a response dataclass for ``connection.send_result``.
+
+    The row form is identical to ``dataclasses.asdict``.  With *columnar*,
+    top-level ``list[Dataclass]`` fields become ``{field: [values...]}``
+    objects, dropping the per-row repetition of key names.
+    """
+    encoded: dict[str, Any] = {}
+    for name, row_class in _field_plan(type(response)):
+        value = getattr(response, name)
+        if row_class is None:
+            encoded[name] = _encode_value(value)
+        elif columnar:
+            encoded[name] = _encode_columns(row_class, value)
+        else:
+            encoded[name] = [encode_response(row) for row in value]
+    return encoded
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
@@ -11,15 +12,21 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import EntityCategory, UnitOfEnergy, UnitOfVolume
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfTime,
+    UnitOfVolume,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .coordinator import ev_data_key
+from .coordinator import EonNextCoordinator, ev_data_key
 from .cost_tracker import EonNextCostTrackerManager
-from .eonnext import METER_TYPE_ELECTRIC, METER_TYPE_GAS, ElectricityMeter
+from .eonnext import METER_TYPE_ELECTRIC, METER_TYPE_GAS, ElectricityMeter, EonNext
+from .meter_snapshot import MeterSnapshot
 from .models import EonNextConfigEntry
 from .tariff_entity import TariffBoundaryRefreshMixin
 from .tariff_helpers import (
@@ -30,6 +37,11 @@ from .tariff_helpers import (
 )
 
 
+def _non_empty(**attrs: Any) -> dict[str, Any]:
+    """Drop attributes whose value is ``None`` or an empty string."""
+    return {key: val for key, val in attrs.items() if val is not None and val != ""}
+
+
 def _parse_timestamp(value: Any) -> datetime | None:
     """Parse an ISO8601 datetime string to datetime."""
     if not isinstance(value, str):
@@ -96,6 +108,8 @@ async def async_setup_entry(
             entities.append(NextChargeEndSlot2Sensor(coordinator, charger))
 
     entities.append(HistoricalBackfillStatusSensor(coordinator, backfill))
+    entities.append(ApiLatencySensor(coordinator, api, config_entry.entry_id))
+    entities.append(ApiRequestsSensor(coordinator, api, config_entry.entry_id))
 
     tracker_entity_ids = cost_trackers.list_tracker_ids()
     for tracker_id in tracker_entity_ids:
@@ -126,7 +140,7 @@ async def async_setup_entry(
     )
 
 
-class EonNextSensorBase(CoordinatorEntity, SensorEntity):
+class EonNextSensorBase(CoordinatorEntity[EonNextCoordinator], SensorEntity):
     """Base class for Eon Next sensors."""
 
     def __init__(self, coordinator, data_key: str):
@@ -134,15 +148,33 @@ class EonNextSensorBase(CoordinatorEntity, SensorEntity):
         self._data_key = data_key
 
     @property
-    def _meter_data(self) -> dict[str, Any] | None:
+    def _meter_data(self) -> Mapping[str, Any] | None:
         if self.coordinator.data and self._data_key in self.coordinator.data:
             return self.coordinator.data[self._data_key]
         return None
 
+    @property
+    def _meter(self) -> MeterSnapshot | None:
+        data = self._meter_data
+        return data if isinstance(data, MeterSnapshot) else None
+
     @property
     def available(self) -> bool:
         return super().available and self._meter_data is not None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Skip the state write (and its recorder row) when this entity's
+        # coordinator row is unchanged.
+        if self.coordinator.data_changed(self._data_key):
+            super()._handle_coordinator_update()
+
+    @property
+    def assumed_state(self) -> bool:
+        # Values restored from the on-disk snapshot are stale until the
+        # first live refresh replaces them.
+        return self.coordinator.data_restored
+
 
 class HistoricalBackfillStatusSensor(CoordinatorEntity, SensorEntity):
     """Diagnostic sensor exposing historical backfill status."""
@@ -193,6 +225,97 @@ class HistoricalBackfillStatusSensor(CoordinatorEntity, SensorEntity):
         return attrs
 
 
+class ApiLatencySensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor: 95th-percentile API request latency.
+
+    Disabled by default; the attributes break it down per operation.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # The per-operation breakdown changes on every refresh; keep it out of
+    # the recorder.
+    _unrecorded_attributes = frozenset({"operations"})
+
+    def __init__(self, coordinator, api: EonNext, entry_id: str):
+        super().__init__(coordinator)
+        self._api = api
+        self._attr_name = "API Latency"
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_unique_id = f"{entry_id}__api_latency"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._update_from_metrics()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_metrics()
+        super()._handle_coordinator_update()
+
+    def _update_from_metrics(self) -> None:
+        # One metrics snapshot per state write, shared by state and attributes.
+        metrics = self._api.request_metrics
+        self._attr_native_value = metrics["requests"]["p95_ms"]
+        self._attr_extra_state_attributes = {
+            "auth_refresh_p95_ms": metrics["auth_refresh"]["p95_ms"],
+            "operations": {
+                operation: {
+                    "requests": stats["requests"],
+                    "retries": stats["retries"],
+                    "p50_ms": stats["latency"]["p50_ms"],
+                    "p95_ms": stats["latency"]["p95_ms"],
+                    "bytes_in": stats["bytes_in"],
+                }
+                for operation, stats in metrics["operations"].items()
+            },
+        }
+
+
+class ApiRequestsSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor: API requests made since the entry was set up."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"retries_by_operation"})
+
+    def __init__(self, coordinator, api: EonNext, entry_id: str):
+        super().__init__(coordinator)
+        self._api = api
+        self._attr_name = "API Requests"
+        self._attr_icon = "mdi:swap-vertical"
+        self._attr_unique_id = f"{entry_id}__api_requests"
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._update_from_metrics()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_metrics()
+        super()._handle_coordinator_update()
+
+    def _update_from_metrics(self) -> None:
+        metrics = self._api.request_metrics
+        operations = metrics["operations"].values()
+        self._attr_native_value = metrics["requests"]["count"]
+        self._attr_extra_state_attributes = {
+            "in_flight": sum(stats["in_flight"] for stats in operations),
+            "bytes_in": sum(stats["bytes_in"] for stats in operations),
+            "bytes_out": sum(stats["bytes_out"] for stats in operations),
+            "retries": metrics["retries"]["count"],
+            "retries_by_operation": {
+                operation: stats["retries"]
+                for operation, stats in metrics["operations"].items()
+                if stats["retries"]
+            },
+        }
+
+
 class LatestReadingDateSensor(EonNextSensorBase):
     """Date of latest meter reading."""
 
@@ -205,8 +328,8 @@ class LatestReadingDateSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("latest_reading_date") if data else None
+        meter = self._meter
+        return meter.latest_reading_date if meter else None
 
 
 class LatestElectricKwhSensor(EonNextSensorBase):
@@ -226,8 +349,8 @@ class LatestElectricKwhSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("latest_reading") if data else None
+        meter = self._meter
+        return meter.latest_reading if meter else None
 
 
 class LatestGasKwhSensor(EonNextSensorBase):
@@ -245,8 +368,8 @@ class LatestGasKwhSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("latest_reading_kwh") if data else None
+        meter = self._meter
+        return meter.latest_reading_kwh if meter else None
 
 
 class LatestGasCubicMetersSensor(EonNextSensorBase):
@@ -264,8 +387,8 @@ class LatestGasCubicMetersSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("latest_reading") if data else None
+        meter = self._meter
+        return meter.latest_reading if meter else None
 
 
 class DailyConsumptionSensor(EonNextSensorBase):
@@ -282,10 +405,10 @@ class DailyConsumptionSensor(EonNextSensorBase):
 
     @property
     def last_reset(self) -> datetime | None:
-        data = self._meter_data
-        if not data:
+        meter = self._meter
+        if not meter:
             return None
-        raw = data.get("daily_consumption_last_reset")
+        raw = meter.usage.daily_consumption_last_reset
         if raw:
             parsed = dt_util.parse_datetime(str(raw))
             if parsed:
@@ -294,8 +417,8 @@ class DailyConsumptionSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("daily_consumption") if data else None
+        meter = self._meter
+        return meter.usage.daily_consumption if meter else None
 
 
 class StandingChargeSensor(EonNextSensorBase):
@@ -314,8 +437,8 @@ class StandingChargeSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("standing_charge") if data else None
+        meter = self._meter
+        return meter.cost.standing_charge if meter else None
 
 
 class PreviousDayCostSensor(EonNextSensorBase):
@@ -334,13 +457,13 @@ class PreviousDayCostSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("previous_day_cost") if data else None
+        meter = self._meter
+        return meter.cost.previous_day_cost if meter else None
 
     @property
     def extra_state_attributes(self):
-        data = self._meter_data or {}
-        period = data.get("cost_period")
+        meter = self._meter
+        period = meter.cost.cost_period if meter else None
         if period:
             return {"cost_period": period}
         return {}
@@ -362,15 +485,17 @@ class PreviousDayConsumptionSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("previous_day_consumption") if data else None
+        meter = self._meter
+        return meter.usage.previous_day_consumption if meter else None
 
     @property
     def extra_state_attributes(self):
-        data = self._meter_data or {}
+        meter = self._meter
+        if not meter:
+            return {"entry_count": 0, "data_complete": False}
         return {
-            "entry_count": data.get("previous_day_consumption_entry_count", 0),
-            "data_complete": data.get("previous_day_consumption_data_complete", False),
+            "entry_count": meter.usage.previous_day_consumption_entry_count,
+            "data_complete": meter.usage.previous_day_consumption_data_complete,
         }
 
 
@@ -390,21 +515,35 @@ class CurrentUnitRateSensor(TariffBoundaryRefreshMixin, EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        if not data:
+        meter = self._meter
+        if not meter:
             return None
         # Resolve the current half-hour window live so the value is correct at
         # the boundary (the boundary mixin writes state there), not only at the
         # 30-minute coordinator poll.  Falls back to the coordinator snapshot.
-        info = get_current_rate(data)
+        info = get_current_rate(meter)
         if info is not None:
             return info.rate
-        return data.get("unit_rate")
+        return meter.cost.unit_rate
 
 
 class CurrentTariffSensor(EonNextSensorBase):
     """Current active tariff name for a meter point."""
 
+    # Agreement metadata only changes on a tariff switch; the tariff name
+    # (the state) is enough history, and ``eon_next/tariff_details`` serves
+    # the rest.
+    _unrecorded_attributes = frozenset(
+        {
+            "tariff_code",
+            "tariff_type",
+            "tariff_unit_rate",
+            "tariff_standing_charge",
+            "tariff_valid_from",
+            "tariff_valid_to",
+        }
+    )
+
     def __init__(self, coordinator, meter):
         super().__init__(coordinator, meter.serial)
         self._attr_name = f"{meter.serial} Current Tariff"
@@ -413,25 +552,23 @@ class CurrentTariffSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("tariff_name") if data else None
+        meter = self._meter
+        return meter.tariff.name if meter else None
 
     @property
     def extra_state_attributes(self):
-        data = self._meter_data or {}
-        attrs: dict[str, Any] = {}
-        for key in (
-            "tariff_code",
-            "tariff_type",
-            "tariff_unit_rate",
-            "tariff_standing_charge",
-            "tariff_valid_from",
-            "tariff_valid_to",
-        ):
-            val = data.get(key)
-            if val is not None and val != "":
-                attrs[key] = val
-        return attrs
+        meter = self._meter
+        if not meter:
+            return {}
+        tariff = meter.tariff
+        return _non_empty(
+            tariff_code=tariff.code,
+            tariff_type=tariff.type,
+            tariff_unit_rate=tariff.unit_rate,
+            tariff_standing_charge=tariff.standing_charge,
+            tariff_valid_from=tariff.valid_from,
+            tariff_valid_to=tariff.valid_to,
+        )
 
 
 class AccountBalanceSensor(EonNextSensorBase):
@@ -463,6 +600,10 @@ class AccountBalanceSensor(EonNextSensorBase):
 class SmartChargingScheduleSensor(EonNextSensorBase):
     """Smart charging schedule status."""
 
+    # The slot list is re-published on every refresh; keep it live for
+    # automations and ``eon_next/ev_schedule`` but out of recorder history.
+    _unrecorded_attributes = frozenset({"schedule"})
+
     def __init__(self, coordinator, charger):
         super().__init__(coordinator, ev_data_key(charger.device_id))
         self._attr_name = f"{charger.serial} Smart Charging Schedule"
@@ -575,14 +716,14 @@ class PreviousUnitRateSensor(TariffBoundaryRefreshMixin, EonNextSensorBase):
 
     @callback
     def _recompute_tariff_state(self) -> None:
-        data = self._meter_data
-        self._rate_info = get_previous_rate(data) if data else None
+        meter = self._meter
+        self._rate_info = get_previous_rate(meter) if meter else None
 
     def _get_rate_info(self) -> RateInfo | None:
         if self._rate_info is not None:
             return self._rate_info
-        data = self._meter_data
-        return get_previous_rate(data) if data else None
+        meter = self._meter
+        return get_previous_rate(meter) if meter else None
 
     @property
     def native_value(self):
@@ -591,8 +732,8 @@ class PreviousUnitRateSensor(TariffBoundaryRefreshMixin, EonNextSensorBase):
 
     @property
     def extra_state_attributes(self):
-        data = self._meter_data
-        if not data:
+        meter = self._meter
+        if not meter:
             return {}
         info = self._get_rate_info()
         if not info:
@@ -602,7 +743,7 @@ class PreviousUnitRateSensor(TariffBoundaryRefreshMixin, EonNextSensorBase):
             attrs["valid_from"] = info.valid_from
         if info.valid_to is not None:
             attrs["valid_to"] = info.valid_to
-        tariff_code = data.get("tariff_code")
+        tariff_code = meter.tariff.code
         if tariff_code:
             attrs["tariff_code"] = tariff_code
         return attrs
@@ -625,14 +766,14 @@ class NextUnitRateSensor(TariffBoundaryRefreshMixin, EonNextSensorBase):
 
     @callback
     def _recompute_tariff_state(self) -> None:
-        data = self._meter_data
-        self._rate_info = get_next_rate(data) if data else None
+        meter = self._meter
+        self._rate_info = get_next_rate(meter) if meter else None
 
     def _get_rate_info(self) -> RateInfo | None:
         if self._rate_info is not None:
             return self._rate_info
-        data = self._meter_data
-        return get_next_rate(data) if data else None
+        meter = self._meter
+        return get_next_rate(meter) if meter else None
 
     @property
     def native_value(self):
@@ -641,8 +782,8 @@ class NextUnitRateSensor(TariffBoundaryRefreshMixin, EonNextSensorBase):
 
     @property
     def extra_state_attributes(self):
-        data = self._meter_data
-        if not data:
+        meter = self._meter
+        if not meter:
             return {}
         info = self._get_rate_info()
         if not info:
@@ -652,7 +793,7 @@ class NextUnitRateSensor(TariffBoundaryRefreshMixin, EonNextSensorBase):
             attrs["valid_from"] = info.valid_from
         if info.valid_to is not None:
             attrs["valid_to"] = info.valid_to
-        tariff_code = data.get("tariff_code")
+        tariff_code = meter.tariff.code
         if tariff_code:
             attrs["tariff_code"] = tariff_code
         return attrs
@@ -674,23 +815,21 @@ class ExportUnitRateSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("unit_rate") if data else None
+        meter = self._meter
+        return meter.cost.unit_rate if meter else None
 
     @property
     def extra_state_attributes(self):
-        data = self._meter_data or {}
-        attrs: dict[str, Any] = {}
-        for key in (
-            "tariff_code",
-            "tariff_name",
-            "tariff_valid_from",
-            "tariff_valid_to",
-        ):
-            val = data.get(key)
-            if val is not None and val != "":
-                attrs[key] = val
-        return attrs
+        meter = self._meter
+        if not meter:
+            return {}
+        tariff = meter.tariff
+        return _non_empty(
+            tariff_code=tariff.code,
+            tariff_name=tariff.name,
+            tariff_valid_from=tariff.valid_from,
+            tariff_valid_to=tariff.valid_to,
+        )
 
 
 class ExportDailyConsumptionSensor(EonNextSensorBase):
@@ -707,10 +846,10 @@ class ExportDailyConsumptionSensor(EonNextSensorBase):
 
     @property
     def last_reset(self) -> datetime | None:
-        data = self._meter_data
-        if not data:
+        meter = self._meter
+        if not meter:
             return None
-        raw = data.get("daily_consumption_last_reset")
+        raw = meter.usage.daily_consumption_last_reset
         if raw:
             parsed = dt_util.parse_datetime(str(raw))
             if parsed:
@@ -719,8 +858,8 @@ class ExportDailyConsumptionSensor(EonNextSensorBase):
 
     @property
     def native_value(self):
-        data = self._meter_data
-        return data.get("daily_consumption") if data else None
+        meter = self._meter
+        return meter.usage.daily_consumption if meter else None
 
 
 class CostTrackerSensor(SensorEntity):
@@ -16,6 +16,7 @@ from homeassistant.helpers.target import (
 from .const import DOMAIN
 from .cost_tracker import VALID_ENERGY_UNITS, VALID_POWER_UNITS
 from .models import EonNextConfigEntry
+from .registry import async_get_registry
 
 SERVICE_ADD_COST_TRACKER = "add_cost_tracker"
 SERVICE_RESET_COST_TRACKER = "reset_cost_tracker"
@@ -26,22 +27,6 @@ _VALID_TRACKED_UNITS = VALID_POWER_UNITS | VALID_ENERGY_UNITS
 _VALID_TRACKED_DEVICE_CLASSES = {"power", "energy"}
 
 
-def _loaded_entries(hass: HomeAssistant) -> list[EonNextConfigEntry]:
-    return [
-        entry
-        for entry in hass.config_entries.async_entries(DOMAIN)
-        if getattr(entry, "runtime_data", None) is not None
-    ]
-
-
-def _entry_has_meter(entry: EonNextConfigEntry, meter_serial: str) -> bool:
-    return any(
-        meter.serial == meter_serial
-        for account in entry.runtime_data.api.accounts
-        for meter in account.meters
-    )
-
-
 def _tracker_target_for_entity(
     hass: HomeAssistant,
     entity_id: str,
@@ -51,22 +36,16 @@ def _tracker_target_for_entity(
     registry_entry = registry.async_get(entity_id)
     if registry_entry is None:
         return None
+    config_entry_id = registry_entry.config_entry_id
     unique_id = registry_entry.unique_id or ""
-    if not unique_id.startswith("cost_tracker__"):
+    if config_entry_id is None or not unique_id.startswith("cost_tracker__"):
         return None
     tracker_suffix = unique_id.removeprefix("cost_tracker__")
-    current_prefix = f"{registry_entry.config_entry_id}__"
+    current_prefix = f"{config_entry_id}__"
     if not tracker_suffix.startswith(current_prefix):
         return None
     tracker_id = tracker_suffix.removeprefix(current_prefix)
-    entry = next(
-        (
-            loaded
-            for loaded in _loaded_entries(hass)
-            if loaded.entry_id == registry_entry.config_entry_id
-        ),
-        None,
-    )
+    entry = async_get_registry(hass).entry(config_entry_id)
     if entry is None:
         return None
     return (entry, tracker_id)
@@ -135,23 +114,20 @@ async def async_register_services(hass: HomeAssistant) -> None:
                 f"sensor (unit one of {sorted(_VALID_TRACKED_UNITS)})"
             )
 
-        entries = _loaded_entries(hass)
+        registry = async_get_registry(hass)
         entry: EonNextConfigEntry | None
         if requested_entry_id:
-            entry = next(
-                (loaded for loaded in entries if loaded.entry_id == requested_entry_id),
-                None,
-            )
-            if entry is not None and not _entry_has_meter(entry, meter_serial):
+            entry = registry.entry(requested_entry_id)
+            if entry is not None and not registry.entry_has_meter(
+                requested_entry_id, meter_serial
+            ):
                 raise ServiceValidationError(
                     f"Config entry {requested_entry_id!r} has no meter "
                     f"{meter_serial!r}"
                 )
         else:
-            entry = next(
-                (loaded for loaded in entries if _entry_has_meter(loaded, meter_serial)),
-                None,
-            )
+            location = registry.meter(meter_serial)
+            entry = location.entry if location is not None else None
         if entry is None:
             raise ServiceValidationError(
                 f"Unable to resolve config entry for meter_serial={meter_serial!r} "
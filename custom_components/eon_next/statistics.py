@@ -2,7 +2,10 @@
 
 Imports half-hourly (or daily) consumption data as external statistics
 with correct timestamps so the Energy Dashboard attributes consumption
-to the right period - even when data arrives late.
+to the right period - even when data arrives late.  Alongside each meter's
+consumption statistic a cost statistic is built in the same pass, every
+interval priced at the rate in force for it, so the dashboard need not
+recompute cost from a price entity (which misprices time-of-use history).
 """
 
 from __future__ import annotations
@@ -10,7 +13,8 @@ from __future__ import annotations
 import logging
 import re
 from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from homeassistant.const import UnitOfEnergy
@@ -18,6 +22,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .cost_engine import RateTimeline
 from .eonnext import METER_TYPE_ELECTRIC, METER_TYPE_GAS
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,8 +52,7 @@ def _hour_start(dt: datetime) -> datetime:
     return dt.replace(minute=0, second=0, microsecond=0)
 
 
-def statistic_id_for_meter(meter_serial: str, meter_type: str) -> str | None:
-    """Build statistic_id for a supported meter."""
+def _meter_statistic_id(meter_serial: str, meter_type: str, kind: str) -> str | None:
     sanitized_serial = _sanitize_id(meter_serial)
     if meter_type == METER_TYPE_GAS:
         fuel = "gas"
@@ -56,14 +60,52 @@ def statistic_id_for_meter(meter_serial: str, meter_type: str) -> str | None:
         fuel = "electricity"
     else:
         return None
-    return f"{DOMAIN}:{fuel}_{sanitized_serial}_consumption"
+    return f"{DOMAIN}:{fuel}_{sanitized_serial}_{kind}"
+
+
+def statistic_id_for_meter(meter_serial: str, meter_type: str) -> str | None:
+    """Build statistic_id for a supported meter."""
+    return _meter_statistic_id(meter_serial, meter_type, "consumption")
+
+
+def cost_statistic_id_for_meter(meter_serial: str, meter_type: str) -> str | None:
+    """Build the cost statistic_id for a supported meter."""
+    return _meter_statistic_id(meter_serial, meter_type, "cost")
+
+
+def statistic_ids_for_cost_tracker(
+    meter_serial: str, tracker_id: str
+) -> tuple[str, str]:
+    """Build the (consumption, cost) statistic_ids of a cost tracker."""
+    base = (
+        f"{DOMAIN}:cost_tracker_{_sanitize_id(meter_serial)}"
+        f"_{_sanitize_id(tracker_id)}"
+    )
+    return f"{base}_consumption", f"{base}_cost"
 
 
 def _group_consumption_by_hour(
     entries: list[dict[str, Any]],
 ) -> dict[datetime, float]:
     """Aggregate consumption entries into hourly UTC buckets."""
+    return _group_by_hour(entries)[0]
+
+
+def _group_by_hour(
+    entries: Iterable[Mapping[str, Any]],
+    rates: RateTimeline | None = None,
+) -> tuple[dict[datetime, float], dict[datetime, float]]:
+    """Aggregate entries into hourly UTC consumption and cost buckets.
+
+    Each entry is priced at the rate in force over its own interval.  An
+    interval the rate changes within (a daily bucket on a time-of-use
+    tariff) adds no cost: priced at the day's mean rate it would overstate
+    mostly off-peak use, so the cost statistic is left with a gap instead.
+    Entries without a rate add no cost; the cost buckets are empty without
+    *rates*.
+    """
     hourly: dict[datetime, float] = defaultdict(float)
+    hourly_cost: dict[datetime, float] = defaultdict(float)
 
     for entry in entries:
         interval_start = entry.get("interval_start")
@@ -89,9 +131,25 @@ def _group_consumption_by_hour(
         else:
             parsed = dt_util.as_utc(parsed)
 
-        hourly[_hour_start(parsed)] += val
+        hour = _hour_start(parsed)
+        hourly[hour] += val
+
+        if rates is not None:
+            interval_end = entry.get("interval_end")
+            ended = (
+                dt_util.parse_datetime(str(interval_end)) if interval_end else None
+            )
+            if ended is not None and ended.tzinfo is None:
+                ended = ended.replace(tzinfo=timezone.utc)
+            rate = (
+                rates.uniform_rate(parsed, ended)
+                if ended is not None
+                else rates.rate_at(parsed)
+            )
+            if rate is not None:
+                hourly_cost[hour] += val * rate
 
-    return dict(hourly)
+    return dict(hourly), dict(hourly_cost)
 
 
 async def _get_last_stat(
@@ -177,7 +235,71 @@ def _build_statistic_metadata(
         "unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
         "unit_class": "energy",
     }
+    _set_no_mean(metadata_dict)
+    return metadata_dict
+
+
+def _build_cost_statistic_metadata(
+    meter_serial: str, meter_type: str, statistic_id: str
+) -> dict[str, Any]:
+    """Build the StatisticMetaData kwargs for a meter's cost stat."""
+    fuel = "gas" if meter_type == METER_TYPE_GAS else "electricity"
+    metadata_dict: dict[str, Any] = {
+        "has_sum": True,
+        "name": f"{meter_serial} {fuel.title()} Cost",
+        "source": DOMAIN,
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "GBP",
+        "unit_class": None,
+    }
+    _set_no_mean(metadata_dict)
+    return metadata_dict
+
+
+def _meter_series(
+    meter_serial: str,
+    meter_type: str,
+    entries: Iterable[Mapping[str, Any]],
+    rates: RateTimeline | None,
+) -> list[tuple[dict[str, Any], dict[datetime, float], int]]:
+    """Bucket *entries* once into ``(metadata, hourly, precision)`` per stat.
+
+    The cost statistic is included only when *rates* priced something.
+    Empty for an unknown meter type or when there is nothing to import.
+    """
+    statistic_id = statistic_id_for_meter(meter_serial, meter_type)
+    cost_id = cost_statistic_id_for_meter(meter_serial, meter_type)
+    if statistic_id is None or cost_id is None:
+        _LOGGER.warning(
+            "Unknown meter type '%s' for serial %s; skipping statistics import",
+            meter_type,
+            meter_serial,
+        )
+        return []
+
+    hourly, hourly_cost = _group_by_hour(entries, rates)
+    if not hourly:
+        return []
+    series = [
+        (
+            _build_statistic_metadata(meter_serial, meter_type, statistic_id),
+            hourly,
+            3,
+        )
+    ]
+    if hourly_cost:
+        series.append(
+            (
+                _build_cost_statistic_metadata(meter_serial, meter_type, cost_id),
+                hourly_cost,
+                4,
+            )
+        )
+    return series
 
+
+def _set_no_mean(metadata_dict: dict[str, Any]) -> None:
+    """Mark a sum-only statistic as having no mean."""
     # Use mean_type (modern HA) with has_mean fallback (older HA).
     try:
         from homeassistant.components.recorder.models import StatisticMeanType
@@ -186,20 +308,21 @@ def _build_statistic_metadata(
     except ImportError:
         metadata_dict["has_mean"] = False
 
-    return metadata_dict
-
 
 async def async_import_consumption_statistics(
     hass: HomeAssistant,
     meter_serial: str,
     meter_type: str,
-    consumption_entries: list[dict[str, Any]],
+    consumption_entries: Iterable[Mapping[str, Any]],
+    rates: RateTimeline | None = None,
 ) -> None:
     """Import consumption data as external statistics with correct timestamps.
 
     Aggregates half-hourly (or daily) entries into hourly buckets, retrieves
     the last known cumulative sum, and calls ``async_add_external_statistics``
     so the Energy Dashboard shows consumption in the correct time period.
+    With *rates*, the matching cost statistic is bucketed in the same pass
+    and imported alongside it.
 
     This is the *append-only* live path: it only writes hours newer than the
     latest existing statistic.  Historical backfill uses
@@ -214,62 +337,49 @@ async def async_import_consumption_statistics(
         async_add_external_statistics,
     )
 
-    hourly = _group_consumption_by_hour(consumption_entries)
-    if not hourly:
-        return
-
-    statistic_id = statistic_id_for_meter(meter_serial, meter_type)
-    if statistic_id is None:
-        _LOGGER.warning(
-            "Unknown meter type '%s' for serial %s; skipping statistics import",
-            meter_type,
-            meter_serial,
-        )
-        return
+    for metadata_dict, hourly, precision in _meter_series(
+        meter_serial, meter_type, consumption_entries, rates
+    ):
+        statistic_id = metadata_dict["statistic_id"]
+        sorted_hours = sorted(hourly.keys())
+        try:
+            last_start, last_sum = await _get_last_stat(
+                hass, statistic_id, sorted_hours[0]
+            )
+        except StatisticsLookupError as err:
+            # Skip this cycle entirely rather than import with a guessed base.
+            _LOGGER.warning(
+                "Skipping statistics import for %s: %s", statistic_id, err
+            )
+            continue
 
-    metadata_dict = _build_statistic_metadata(meter_serial, meter_type, statistic_id)
+        statistics: list[StatisticData] = []
+        cumulative_sum = last_sum
+        for hour in sorted_hours:
+            if last_start is not None and hour <= last_start:
+                continue
 
-    sorted_hours = sorted(hourly.keys())
-    if not sorted_hours:
-        return
-    try:
-        last_start, last_sum = await _get_last_stat(
-            hass, statistic_id, sorted_hours[0]
-        )
-    except StatisticsLookupError as err:
-        # Skip this cycle entirely rather than import with a guessed base.
-        _LOGGER.warning(
-            "Skipping statistics import for %s: %s", statistic_id, err
-        )
-        return
+            value = round(hourly[hour], precision)
+            cumulative_sum = round(cumulative_sum + value, precision)
+            statistics.append(
+                StatisticData(
+                    start=hour,
+                    state=cumulative_sum,
+                    sum=cumulative_sum,
+                )
+            )
 
-    statistics: list[StatisticData] = []
-    cumulative_sum = last_sum
-    for hour in sorted_hours:
-        if last_start is not None and hour <= last_start:
+        if not statistics:
             continue
 
-        kwh = round(hourly[hour], 3)
-        cumulative_sum = round(cumulative_sum + kwh, 3)
-        statistics.append(
-            StatisticData(
-                start=hour,
-                state=cumulative_sum,
-                sum=cumulative_sum,
-            )
+        async_add_external_statistics(
+            hass, StatisticMetaData(**metadata_dict), statistics
+        )
+        _LOGGER.debug(
+            "Imported %d hourly statistics for %s",
+            len(statistics),
+            statistic_id,
         )
-
-    if not statistics:
-        return
-
-    async_add_external_statistics(
-        hass, StatisticMetaData(**metadata_dict), statistics
-    )
-    _LOGGER.debug(
-        "Imported %d hourly statistics for %s",
-        len(statistics),
-        statistic_id,
-    )
 
 
 def _merge_and_recompute_series(
@@ -278,6 +388,7 @@ def _merge_and_recompute_series(
     new_hourly: dict[datetime, float],
     *,
     daily_granularity: bool = False,
+    precision: int = 3,
 ) -> list[tuple[datetime, float]]:
     """Splice new hours into an existing series and recompute cumulative sums.
 
@@ -296,13 +407,15 @@ def _merge_and_recompute_series(
     only overwrite one of that day's ~24 hours and leave the rest - inflating
     the day by ~2x.  So a daily bucket is skipped for any day already covered by
     more than one existing row; the finer rows are more accurate and preserved.
+
+    Values are rounded to ``precision`` decimals (4 for the cost series).
     """
     per_hour: dict[datetime, float] = {}
 
     # Reconstruct each existing hour's own consumption from the sum deltas.
     prev_sum = baseline_sum
     for hour, cumulative in existing:
-        per_hour[hour] = round(cumulative - prev_sum, 3)
+        per_hour[hour] = round(cumulative - prev_sum, precision)
         prev_sum = cumulative
 
     effective_new = dict(new_hourly)
@@ -318,13 +431,13 @@ def _merge_and_recompute_series(
 
     # New (backfilled) values are authoritative for their hour.
     for hour, kwh in effective_new.items():
-        per_hour[hour] = round(kwh, 3)
+        per_hour[hour] = round(kwh, precision)
 
     # Re-accumulate from the baseline across the merged, ordered hours.
     result: list[tuple[datetime, float]] = []
     running = baseline_sum
     for hour in sorted(per_hour):
-        running = round(running + per_hour[hour], 3)
+        running = round(running + per_hour[hour], precision)
         result.append((hour, running))
     return result
 
@@ -391,9 +504,10 @@ async def async_import_historical_statistics(
     hass: HomeAssistant,
     meter_serial: str,
     meter_type: str,
-    consumption_entries: list[dict[str, Any]],
+    consumption_entries: Iterable[Mapping[str, Any]],
     *,
     daily_granularity: bool = False,
+    rates: RateTimeline | None = None,
 ) -> None:
     """Import *historical* consumption without suspending live imports.
 
@@ -405,7 +519,8 @@ async def async_import_historical_statistics(
 
     Set ``daily_granularity`` when ``consumption_entries`` are daily buckets so
     a day the coordinator already imported at half-hourly resolution is not
-    double-counted (see :func:`_merge_and_recompute_series`).
+    double-counted (see :func:`_merge_and_recompute_series`).  With *rates*,
+    the cost statistic is spliced and rebased the same way.
     """
     from homeassistant.helpers.recorder import get_instance
     from homeassistant.components.recorder.models import (
@@ -416,57 +531,134 @@ async def async_import_historical_statistics(
         async_add_external_statistics,
     )
 
-    hourly = _group_consumption_by_hour(consumption_entries)
-    if not hourly:
-        return
+    end = _hour_start(dt_util.utcnow()) + timedelta(hours=1)
+    for metadata_dict, hourly, precision in _meter_series(
+        meter_serial, meter_type, consumption_entries, rates
+    ):
+        statistic_id = metadata_dict["statistic_id"]
+        chunk_min = min(hourly)
 
-    statistic_id = statistic_id_for_meter(meter_serial, meter_type)
-    if statistic_id is None:
-        _LOGGER.warning(
-            "Unknown meter type '%s' for serial %s; skipping statistics import",
-            meter_type,
-            meter_serial,
+        try:
+            baseline_sum, existing = await _fetch_baseline_and_existing(
+                hass, statistic_id, chunk_min, end
+            )
+        except StatisticsLookupError as err:
+            _LOGGER.warning(
+                "Skipping historical statistics import for %s: %s",
+                statistic_id,
+                err,
+            )
+            continue
+
+        series = _merge_and_recompute_series(
+            baseline_sum,
+            existing,
+            hourly,
+            daily_granularity=daily_granularity,
+            precision=precision,
         )
-        return
+        if not series:
+            continue
 
-    chunk_min = min(hourly)
-    end = _hour_start(dt_util.utcnow()) + timedelta(hours=1)
+        statistics = [
+            StatisticData(start=hour, state=cumulative, sum=cumulative)
+            for hour, cumulative in series
+        ]
 
-    try:
-        baseline_sum, existing = await _fetch_baseline_and_existing(
-            hass, statistic_id, chunk_min, end
+        async_add_external_statistics(
+            hass, StatisticMetaData(**metadata_dict), statistics
         )
-    except StatisticsLookupError as err:
-        _LOGGER.warning(
-            "Skipping historical statistics import for %s: %s", statistic_id, err
+        # Make this write durable before returning.  The recompute-forward
+        # design reads existing rows back to rebase later sums, so a same-cycle
+        # consecutive chunk (requests_per_run > 1 with delay_seconds = 0) must
+        # not read a stale baseline and emit a regressive, non-monotonic sum.
+        # ``async_add_external_statistics`` only queues the write; block until
+        # the recorder has applied it so the next read - and any reader - sees
+        # a committed series.
+        await get_instance(hass).async_block_till_done()
+        _LOGGER.debug(
+            "Backfilled %d hourly statistics for %s (rewrote from %s)",
+            len(statistics),
+            statistic_id,
+            chunk_min.isoformat(),
         )
-        return
 
-    series = _merge_and_recompute_series(
-        baseline_sum, existing, hourly, daily_granularity=daily_granularity
+
+async def async_import_cost_tracker_statistics(
+    hass: HomeAssistant,
+    meter_serial: str,
+    tracker_id: str,
+    name: str,
+    days: Iterable[tuple[date, float, float]],
+) -> None:
+    """Import a cost tracker's closed days as daily external statistics.
+
+    *days* are ``(day, kwh, cost)`` rollups, oldest first.  Each day becomes
+    one row starting at local midnight in both the consumption and the cost
+    statistic.  Like the live meter import this only appends days newer than
+    the latest existing row, so re-importing the whole rollup is cheap.
+    """
+    from homeassistant.components.recorder.models import (
+        StatisticData,
+        StatisticMetaData,
+    )
+    from homeassistant.components.recorder.statistics import (
+        async_add_external_statistics,
     )
-    if not series:
-        return
 
-    metadata_dict = _build_statistic_metadata(meter_serial, meter_type, statistic_id)
-    statistics = [
-        StatisticData(start=hour, state=cumulative, sum=cumulative)
-        for hour, cumulative in series
+    rows = [
+        (_hour_start(dt_util.as_utc(dt_util.start_of_local_day(day))), kwh, cost)
+        for day, kwh, cost in days
     ]
+    if not rows:
+        return
 
-    async_add_external_statistics(
-        hass, StatisticMetaData(**metadata_dict), statistics
-    )
-    # Make this write durable before returning.  The recompute-forward design
-    # reads existing rows back to rebase later sums, so a same-cycle consecutive
-    # chunk (requests_per_run > 1 with delay_seconds = 0) must not read a stale
-    # baseline and emit a regressive, non-monotonic sum.  ``async_add_external_
-    # statistics`` only queues the write; block until the recorder has applied
-    # it so the next read - and any reader - sees a committed series.
-    await get_instance(hass).async_block_till_done()
-    _LOGGER.debug(
-        "Backfilled %d hourly statistics for %s (rewrote from %s)",
-        len(statistics),
-        statistic_id,
-        chunk_min.isoformat(),
+    consumption_id, cost_id = statistic_ids_for_cost_tracker(
+        meter_serial, tracker_id
     )
+    for statistic_id, values, unit, unit_class, suffix, precision in (
+        (
+            consumption_id,
+            [kwh for _, kwh, _ in rows],
+            UnitOfEnergy.KILO_WATT_HOUR,
+            "energy",
+            "Consumption",
+            3,
+        ),
+        (cost_id, [cost for _, _, cost in rows], "GBP", None, "Cost", 4),
+    ):
+        try:
+            last_start, last_sum = await _get_last_stat(hass, statistic_id, rows[0][0])
+        except StatisticsLookupError as err:
+            _LOGGER.warning(
+                "Skipping statistics import for %s: %s", statistic_id, err
+            )
+            continue
+
+        statistics: list[StatisticData] = []
+        cumulative_sum = last_sum
+        for (start, _, _), value in zip(rows, values, strict=True):
+            if last_start is not None and start <= last_start:
+                continue
+            cumulative_sum = round(cumulative_sum + value, precision)
+            statistics.append(
+                StatisticData(start=start, state=cumulative_sum, sum=cumulative_sum)
+            )
+        if not statistics:
+            continue
+
+        metadata_dict: dict[str, Any] = {
+            "has_sum": True,
+            "name": f"{name} {suffix}",
+            "source": DOMAIN,
+            "statistic_id": statistic_id,
+            "unit_of_measurement": unit,
+            "unit_class": unit_class,
+        }
+        _set_no_mean(metadata_dict)
+        async_add_external_statistics(
+            hass, StatisticMetaData(**metadata_dict), statistics
+        )
+        _LOGGER.debug(
+            "Imported %d daily statistics for %s", len(statistics), statistic_id
+        )
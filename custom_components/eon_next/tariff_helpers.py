@@ -8,12 +8,21 @@ Provides rate lookup and off-peak detection from two data sources:
 from __future__ import annotations
 
 import datetime as dt_mod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta, tzinfo
 from typing import Any
 
 from homeassistant.util import dt as dt_util
 
+from .cost_engine import price_consumption
+from .rate_schedule import (
+    distinct_rates_pence,
+    parse_dt,
+    pence_to_pounds,
+    schedule_has_time_windows,
+    time_in_off_peak_windows,
+)
 from .tariff_patterns import TariffRateWindow, get_tariff_pattern
 
 
@@ -30,48 +39,18 @@ class RateInfo:
 # ── Internal helpers ───────────────────────────────────────────
 
 
-def _parse_dt(value: Any) -> datetime | None:
-    """Parse a datetime string, ensuring timezone awareness."""
-    if not value or not isinstance(value, str):
-        return None
-    parsed = dt_util.parse_datetime(value)
-    if parsed is not None and parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=dt_util.UTC)
-    return parsed
-
-
-def _pence_to_pounds(pence: float) -> float:
-    return round(pence / 100.0, 4)
-
-
-def _schedule_has_time_windows(schedule: list[dict[str, Any]]) -> bool:
-    return any(_parse_dt(e.get("validFrom")) is not None for e in schedule)
-
-
 def _find_current_window(
     schedule: list[dict[str, Any]],
     now_utc: datetime,
 ) -> dict[str, Any] | None:
     for entry in schedule:
-        vf = _parse_dt(entry.get("validFrom"))
-        vt = _parse_dt(entry.get("validTo"))
+        vf = parse_dt(entry.get("validFrom"))
+        vt = parse_dt(entry.get("validTo"))
         if vf is not None and vt is not None and vf <= now_utc < vt:
             return entry
     return None
 
 
-def _distinct_rates_pence(schedule: list[dict[str, Any]]) -> list[float]:
-    vals: set[float] = set()
-    for e in schedule:
-        v = e.get("value")
-        if v is not None:
-            try:
-                vals.add(float(v))
-            except (TypeError, ValueError):
-                pass
-    return sorted(vals)
-
-
 def _all_rates_pence(schedule: list[dict[str, Any]]) -> list[float]:
     """Return every parseable rate value (pence), keeping duplicates."""
     vals: list[float] = []
@@ -125,23 +104,6 @@ def _is_off_peak_rate(
     return current_pence <= ordered[idx] + _RATE_MATCH_TOLERANCE_PENCE
 
 
-def _time_in_off_peak_windows(
-    local_time: time,
-    windows: list[TariffRateWindow],
-) -> bool:
-    for w in windows:
-        if w.name != "off_peak":
-            continue
-        if w.start_time <= w.end_time:
-            if w.start_time <= local_time < w.end_time:
-                return True
-        else:
-            # Wraps midnight
-            if local_time >= w.start_time or local_time < w.end_time:
-                return True
-    return False
-
-
 def _next_transition_dt(
     now_local: datetime,
     windows: list[TariffRateWindow],
@@ -182,7 +144,7 @@ def _local_day_bounds(
 # ── Public API ─────────────────────────────────────────────────
 
 
-def get_previous_rate(meter_data: dict[str, Any]) -> RateInfo | None:
+def get_previous_rate(meter_data: Mapping[str, Any]) -> RateInfo | None:
     """Get the most recent rate that differs from the current rate.
 
     Returns the current rate for flat-rate tariffs, None when no data.
@@ -200,7 +162,7 @@ def get_previous_rate(meter_data: dict[str, Any]) -> RateInfo | None:
     now_utc = dt_util.utcnow()
 
     # Strategy 1: API schedule with time windows
-    if schedule and _schedule_has_time_windows(schedule):
+    if schedule and schedule_has_time_windows(schedule):
         current = _find_current_window(schedule, now_utc)
         if current is not None:
             try:
@@ -210,7 +172,7 @@ def get_previous_rate(meter_data: dict[str, Any]) -> RateInfo | None:
             if current_pence is not None:
                 candidates = []
                 for e in schedule:
-                    vt = _parse_dt(e.get("validTo"))
+                    vt = parse_dt(e.get("validTo"))
                     if vt is None or vt > now_utc:
                         continue
                     try:
@@ -228,7 +190,7 @@ def get_previous_rate(meter_data: dict[str, Any]) -> RateInfo | None:
                         prev_val = None
                     if prev_val is not None:
                         return RateInfo(
-                            rate=_pence_to_pounds(prev_val),
+                            rate=pence_to_pounds(prev_val),
                             valid_from=prev.get("validFrom"),
                             valid_to=prev.get("validTo"),
                             is_off_peak=bool(_is_off_peak_rate(prev_val, schedule)),
@@ -236,30 +198,30 @@ def get_previous_rate(meter_data: dict[str, Any]) -> RateInfo | None:
 
     # Strategy 2: Pattern fallback with schedule rate values
     if schedule:
-        distinct = _distinct_rates_pence(schedule)
+        distinct = distinct_rates_pence(schedule)
         if len(distinct) >= 2:
             pattern = get_tariff_pattern(tariff_code)
             if pattern and pattern.windows:
                 now_local = dt_util.now().time()
-                in_off_peak = _time_in_off_peak_windows(
+                in_off_peak = time_in_off_peak_windows(
                     now_local, pattern.windows
                 )
                 # Currently off-peak -> previous was peak (highest rate)
                 # Currently peak -> previous was off-peak (lowest rate)
                 if in_off_peak:
                     return RateInfo(
-                        rate=_pence_to_pounds(distinct[-1]),
+                        rate=pence_to_pounds(distinct[-1]),
                         is_off_peak=False,
                     )
                 return RateInfo(
-                    rate=_pence_to_pounds(distinct[0]),
+                    rate=pence_to_pounds(distinct[0]),
                     is_off_peak=True,
                 )
 
     return RateInfo(rate=float(unit_rate))
 
 
-def get_next_rate(meter_data: dict[str, Any]) -> RateInfo | None:
+def get_next_rate(meter_data: Mapping[str, Any]) -> RateInfo | None:
     """Get the next upcoming rate that differs from the current rate.
 
     Returns the current rate for flat-rate tariffs, None when no data.
@@ -277,7 +239,7 @@ def get_next_rate(meter_data: dict[str, Any]) -> RateInfo | None:
     now_utc = dt_util.utcnow()
 
     # Strategy 1: API schedule with time windows
-    if schedule and _schedule_has_time_windows(schedule):
+    if schedule and schedule_has_time_windows(schedule):
         current = _find_current_window(schedule, now_utc)
         if current is not None:
             try:
@@ -287,7 +249,7 @@ def get_next_rate(meter_data: dict[str, Any]) -> RateInfo | None:
             if current_pence is not None:
                 candidates = []
                 for e in schedule:
-                    vf = _parse_dt(e.get("validFrom"))
+                    vf = parse_dt(e.get("validFrom"))
                     if vf is None or vf <= now_utc:
                         continue
                     try:
@@ -305,7 +267,7 @@ def get_next_rate(meter_data: dict[str, Any]) -> RateInfo | None:
                         nxt_val = None
                     if nxt_val is not None:
                         return RateInfo(
-                            rate=_pence_to_pounds(nxt_val),
+                            rate=pence_to_pounds(nxt_val),
                             valid_from=nxt.get("validFrom"),
                             valid_to=nxt.get("validTo"),
                             is_off_peak=bool(_is_off_peak_rate(nxt_val, schedule)),
@@ -313,28 +275,28 @@ def get_next_rate(meter_data: dict[str, Any]) -> RateInfo | None:
 
     # Strategy 2: Pattern fallback
     if schedule:
-        distinct = _distinct_rates_pence(schedule)
+        distinct = distinct_rates_pence(schedule)
         if len(distinct) >= 2:
             pattern = get_tariff_pattern(tariff_code)
             if pattern and pattern.windows:
                 now_local = dt_util.now().time()
-                in_off_peak = _time_in_off_peak_windows(
+                in_off_peak = time_in_off_peak_windows(
                     now_local, pattern.windows
                 )
                 if in_off_peak:
                     return RateInfo(
-                        rate=_pence_to_pounds(distinct[-1]),
+                        rate=pence_to_pounds(distinct[-1]),
                         is_off_peak=False,
                     )
                 return RateInfo(
-                    rate=_pence_to_pounds(distinct[0]),
+                    rate=pence_to_pounds(distinct[0]),
                     is_off_peak=True,
                 )
 
     return RateInfo(rate=float(unit_rate))
 
 
-def get_current_rate(meter_data: dict[str, Any]) -> RateInfo | None:
+def get_current_rate(meter_data: Mapping[str, Any]) -> RateInfo | None:
     """Get the unit rate (GBP/kWh) applicable right now.
 
     For flat tariffs this is the single rate.  For time-of-use tariffs it
@@ -356,7 +318,7 @@ def get_current_rate(meter_data: dict[str, Any]) -> RateInfo | None:
     now_utc = dt_util.utcnow()
 
     # Strategy 1: API schedule with time windows.
-    if schedule and _schedule_has_time_windows(schedule):
+    if schedule and schedule_has_time_windows(schedule):
         current = _find_current_window(schedule, now_utc)
         if current is not None:
             try:
@@ -365,7 +327,7 @@ def get_current_rate(meter_data: dict[str, Any]) -> RateInfo | None:
                 cur_pence = None
             if cur_pence is not None:
                 return RateInfo(
-                    rate=_pence_to_pounds(cur_pence),
+                    rate=pence_to_pounds(cur_pence),
                     valid_from=current.get("validFrom"),
                     valid_to=current.get("validTo"),
                     is_off_peak=bool(_is_off_peak_rate(cur_pence, schedule)),
@@ -373,19 +335,19 @@ def get_current_rate(meter_data: dict[str, Any]) -> RateInfo | None:
 
     # Strategy 2: pattern fallback with schedule rate values.
     if schedule:
-        distinct = _distinct_rates_pence(schedule)
+        distinct = distinct_rates_pence(schedule)
         if len(distinct) >= 2:
             pattern = get_tariff_pattern(tariff_code)
             if pattern and pattern.windows:
-                in_off_peak = _time_in_off_peak_windows(
+                in_off_peak = time_in_off_peak_windows(
                     dt_util.now().time(), pattern.windows
                 )
                 if in_off_peak:
                     return RateInfo(
-                        rate=_pence_to_pounds(distinct[0]), is_off_peak=True
+                        rate=pence_to_pounds(distinct[0]), is_off_peak=True
                     )
                 return RateInfo(
-                    rate=_pence_to_pounds(distinct[-1]), is_off_peak=False
+                    rate=pence_to_pounds(distinct[-1]), is_off_peak=False
                 )
 
     # Last resort: the schedule mean.
@@ -393,7 +355,7 @@ def get_current_rate(meter_data: dict[str, Any]) -> RateInfo | None:
 
 
 def rate_for_timestamp(
-    meter_data: dict[str, Any], when_utc: datetime
+    meter_data: Mapping[str, Any], when_utc: datetime
 ) -> float | None:
     """Return the unit rate (GBP/kWh) applicable at *when_utc*.
 
@@ -413,31 +375,56 @@ def rate_for_timestamp(
     tariff_code = meter_data.get("tariff_code")
 
     # Strategy 1: a schedule window that actually covers this instant.
-    if schedule and _schedule_has_time_windows(schedule):
+    if schedule and schedule_has_time_windows(schedule):
         window = _find_current_window(schedule, when_utc)
         if window is not None:
             try:
-                return _pence_to_pounds(float(window["value"]))
+                return pence_to_pounds(float(window["value"]))
             except (TypeError, ValueError, KeyError):
                 pass
 
     # Strategy 2: pattern by time-of-day (the schedule rarely spans past days).
     if schedule:
-        distinct = _distinct_rates_pence(schedule)
+        distinct = distinct_rates_pence(schedule)
         if len(distinct) >= 2:
             pattern = get_tariff_pattern(tariff_code)
             if pattern and pattern.windows:
                 local_time = dt_util.as_local(when_utc).time()
-                if _time_in_off_peak_windows(local_time, pattern.windows):
-                    return _pence_to_pounds(distinct[0])
-                return _pence_to_pounds(distinct[-1])
+                if time_in_off_peak_windows(local_time, pattern.windows):
+                    return pence_to_pounds(distinct[0])
+                return pence_to_pounds(distinct[-1])
 
     # Last resort: the schedule mean.
     return float(unit_rate)
 
 
+def rate_window_for_timestamp(
+    meter_data: Mapping[str, Any], when_utc: datetime
+) -> tuple[datetime, datetime, float | None]:
+    """Return ``(start, end, rate)`` of the rate window containing *when_utc*.
+
+    The window is the API schedule entry covering the instant when there is
+    one, otherwise the half-hour slot: pattern-derived and flat rates only
+    change on half-hour boundaries.  ``rate`` is as :func:`rate_for_timestamp`.
+    """
+    when_utc = dt_util.as_utc(when_utc)
+    rate = rate_for_timestamp(meter_data, when_utc)
+    schedule = meter_data.get("tariff_rates_schedule") or []
+    if meter_data.get("tariff_is_tou", False) and schedule:
+        window = _find_current_window(schedule, when_utc)
+        if window is not None:
+            start = parse_dt(window.get("validFrom"))
+            end = parse_dt(window.get("validTo"))
+            if start is not None and end is not None:
+                return dt_util.as_utc(start), dt_util.as_utc(end), rate
+    slot_start = when_utc.replace(
+        minute=when_utc.minute - when_utc.minute % 30, second=0, microsecond=0
+    )
+    return slot_start, slot_start + timedelta(minutes=30), rate
+
+
 def cost_consumption_entries(
-    meter_data: dict[str, Any],
+    meter_data: Mapping[str, Any],
     entries: list[dict[str, Any]],
 ) -> float | None:
     """Cost half-hourly consumption entries per applicable rate window.
@@ -446,32 +433,14 @@ def cost_consumption_entries(
     the rate in effect at its own interval - correct for time-of-use tariffs
     where a flat/average rate materially misprices overnight-heavy usage.
     Returns the total energy cost in GBP (excluding standing charge), or
-    ``None`` when nothing could be priced.
+    ``None`` when nothing could be priced.  Priced in one pass by the bulk
+    cost engine (see ``cost_engine``).
     """
-    total = 0.0
-    priced_any = False
-    for entry in entries:
-        interval_start = entry.get("interval_start")
-        consumption = entry.get("consumption")
-        if interval_start is None or consumption is None:
-            continue
-        when = _parse_dt(str(interval_start))
-        if when is None:
-            continue
-        try:
-            kwh = float(consumption)
-        except (TypeError, ValueError):
-            continue
-        rate = rate_for_timestamp(meter_data, dt_util.as_utc(when))
-        if rate is None:
-            continue
-        total += kwh * rate
-        priced_any = True
-
-    return round(total, 4) if priced_any else None
+    cost = price_consumption(meter_data, entries)
+    return cost.energy_cost if cost.priced else None
 
 
-def is_off_peak(meter_data: dict[str, Any]) -> bool | None:
+def is_off_peak(meter_data: Mapping[str, Any]) -> bool | None:
     """Determine whether the current time falls in an off-peak period.
 
     Returns True/False for ToU tariffs, None when flat-rate or unknown.
@@ -484,7 +453,7 @@ def is_off_peak(meter_data: dict[str, Any]) -> bool | None:
     tariff_code = meter_data.get("tariff_code")
 
     # API schedule with time windows
-    if schedule and _schedule_has_time_windows(schedule):
+    if schedule and schedule_has_time_windows(schedule):
         now_utc = dt_util.utcnow()
         current = _find_current_window(schedule, now_utc)
         if current is not None:
@@ -498,13 +467,13 @@ def is_off_peak(meter_data: dict[str, Any]) -> bool | None:
     pattern = get_tariff_pattern(tariff_code)
     if pattern and pattern.windows:
         now_local = dt_util.now().time()
-        return _time_in_off_peak_windows(now_local, pattern.windows)
+        return time_in_off_peak_windows(now_local, pattern.windows)
 
     return None
 
 
 def get_off_peak_metadata(
-    meter_data: dict[str, Any],
+    meter_data: Mapping[str, Any],
 ) -> dict[str, Any]:
     """Return off-peak metadata: current_rate_name and next_transition."""
     result: dict[str, Any] = {}
@@ -517,7 +486,7 @@ def get_off_peak_metadata(
     tariff_code = meter_data.get("tariff_code")
 
     # API schedule with time windows
-    if schedule and _schedule_has_time_windows(schedule):
+    if schedule and schedule_has_time_windows(schedule):
         now_utc = dt_util.utcnow()
         current = _find_current_window(schedule, now_utc)
         if current is not None:
@@ -537,7 +506,7 @@ def get_off_peak_metadata(
     pattern = get_tariff_pattern(tariff_code)
     if pattern and pattern.windows:
         now_local = dt_util.now()
-        in_off_peak = _time_in_off_peak_windows(now_local.time(), pattern.windows)
+        in_off_peak = time_in_off_peak_windows(now_local.time(), pattern.windows)
         result["current_rate_name"] = "off_peak" if in_off_peak else "peak"
 
         next_dt = _next_transition_dt(now_local, pattern.windows)
@@ -547,7 +516,7 @@ def get_off_peak_metadata(
     return result
 
 
-def build_day_rates(meter_data: dict[str, Any]) -> list[dict[str, Any]]:
+def build_day_rates(meter_data: Mapping[str, Any]) -> list[dict[str, Any]]:
     """Build today's rate schedule.
 
     Returns a list of ``{start, end, rate, is_off_peak}`` dicts with
@@ -577,15 +546,15 @@ def build_day_rates(meter_data: dict[str, Any]) -> list[dict[str, Any]]:
         ]
 
     # API schedule with time windows - filter to today
-    if schedule and _schedule_has_time_windows(schedule):
+    if schedule and schedule_has_time_windows(schedule):
         day_start, day_end = _local_day_bounds(today, now.tzinfo)
         day_start_utc = dt_util.as_utc(day_start)
         day_end_utc = dt_util.as_utc(day_end)
 
         rates: list[dict[str, Any]] = []
         for entry in schedule:
-            vf = _parse_dt(entry.get("validFrom"))
-            vt = _parse_dt(entry.get("validTo"))
+            vf = parse_dt(entry.get("validFrom"))
+            vt = parse_dt(entry.get("validTo"))
             if vf is None or vt is None:
                 continue
             if vt <= day_start_utc or vf >= day_end_utc:
@@ -600,7 +569,7 @@ def build_day_rates(meter_data: dict[str, Any]) -> list[dict[str, Any]]:
                 {
                     "start": start_local.isoformat(),
                     "end": end_local.isoformat(),
-                    "rate": _pence_to_pounds(val),
+                    "rate": pence_to_pounds(val),
                     "is_off_peak": bool(_is_off_peak_rate(val, schedule)),
                 }
             )
@@ -611,10 +580,10 @@ def build_day_rates(meter_data: dict[str, Any]) -> list[dict[str, Any]]:
     # Pattern fallback - construct windows from known tariff structure
     pattern = get_tariff_pattern(tariff_code)
     if pattern and pattern.windows and schedule:
-        distinct = _distinct_rates_pence(schedule)
+        distinct = distinct_rates_pence(schedule)
         if len(distinct) >= 2:
-            off_peak_rate = _pence_to_pounds(distinct[0])
-            peak_rate = _pence_to_pounds(distinct[-1])
+            off_peak_rate = pence_to_pounds(distinct[0])
+            peak_rate = pence_to_pounds(distinct[-1])
             return _build_pattern_day_windows(
                 today, now.tzinfo, pattern.windows, off_peak_rate, peak_rate
             )
@@ -0,0 +1,164 @@
+"""Historical tariff agreements per meter point, indexed by start time.
+
+``async_get_tariff_data`` resolves only the agreement active today, so a past
+day used to be costed at today's rates.  The agreements the API lists for a
+meter point (past ones included) are folded into this timeline on every
+refresh, persisted with the entry, and kept even once the API stops
+returning them.  Each point's agreements are held sorted by start with a
+parallel array of start timestamps, so the agreement in force at an instant
+is a binary search away.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .meter_snapshot import TariffSnapshot
+
+
+def agreement_meter_data(agreement: TariffSnapshot) -> dict[str, Any]:
+    """Return *agreement* under the flat ``tariff_*`` meter-data keys.
+
+    This is the shape the rate helpers and the cost engine read.
+    """
+    return {f"tariff_{f.name}": getattr(agreement, f.name) for f in fields(agreement)}
+
+
+def _timestamp(value: str | None) -> float | None:
+    parsed = dt_util.parse_datetime(value) if value else None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return parsed.timestamp()
+
+
+@dataclass(slots=True)
+class _PointAgreements:
+    """One meter point's agreements, sorted by start."""
+
+    agreements: list[TariffSnapshot] = field(default_factory=list)
+    starts: array = field(default_factory=lambda: array("d"))
+    ends: array = field(default_factory=lambda: array("d"))
+
+
+class TariffTimeline:
+    """Every known tariff agreement per supply point (MPAN/MPRN)."""
+
+    def __init__(self) -> None:
+        self._points: dict[str, _PointAgreements] = {}
+
+    def update(self, supply_point_id: str, agreements: Iterable[TariffSnapshot]) -> bool:
+        """Merge *agreements* into the point's timeline; True if it changed.
+
+        Agreements are keyed by their start: a fresh copy of a known
+        agreement replaces it, and agreements missing from *agreements* are
+        kept.  Agreements without a parseable start are ignored.
+        """
+        point = self._points.get(supply_point_id)
+        merged: dict[float, TariffSnapshot] = {}
+        if point is not None:
+            merged.update(zip(point.starts, point.agreements))
+        for agreement in agreements:
+            start = _timestamp(agreement.valid_from)
+            if start is not None:
+                merged[start] = agreement
+        ordered = [merged[start] for start in sorted(merged)]
+        if point is not None and ordered == point.agreements:
+            return False
+        if not ordered:
+            return False
+        self._points[supply_point_id] = _build_point(ordered)
+        return True
+
+    def agreement_at(self, supply_point_id: str, when: datetime) -> TariffSnapshot | None:
+        """Return the agreement in force at *when*, in O(log n)."""
+        point = self._points.get(supply_point_id)
+        if point is None:
+            return None
+        timestamp = when.timestamp()
+        index = bisect_right(point.starts, timestamp) - 1
+        if index < 0 or timestamp >= point.ends[index]:
+            return None
+        return point.agreements[index]
+
+    def spans(
+        self, supply_point_id: str, start: datetime, end: datetime
+    ) -> Iterator[tuple[datetime, datetime, TariffSnapshot]]:
+        """Yield ``(from, to, agreement)`` for agreements overlapping the range.
+
+        ``from``/``to`` are clipped to ``[start, end)``; spans are in time
+        order and gaps without an agreement are skipped.
+        """
+        point = self._points.get(supply_point_id)
+        if point is None:
+            return
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        index = max(0, bisect_right(point.starts, start_ts) - 1)
+        while index < len(point.agreements) and point.starts[index] < end_ts:
+            span_start = max(point.starts[index], start_ts)
+            span_end = min(point.ends[index], end_ts)
+            if span_start < span_end:
+                yield (
+                    dt_util.utc_from_timestamp(span_start),
+                    dt_util.utc_from_timestamp(span_end),
+                    point.agreements[index],
+                )
+            index += 1
+
+    def agreements(self, supply_point_id: str) -> list[TariffSnapshot]:
+        """Return the point's agreements, oldest first."""
+        point = self._points.get(supply_point_id)
+        return list(point.agreements) if point else []
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the JSON-serializable form for persistence."""
+        return {
+            supply_point_id: [asdict(agreement) for agreement in point.agreements]
+            for supply_point_id, point in self._points.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> TariffTimeline:
+        """Rebuild a timeline from :meth:`as_dict` output."""
+        timeline = cls()
+        if not isinstance(data, Mapping):
+            return timeline
+        names = {f.name for f in fields(TariffSnapshot)}
+        for supply_point_id, rows in data.items():
+            if not isinstance(rows, list):
+                continue
+            timeline.update(
+                str(supply_point_id),
+                (
+                    TariffSnapshot(**{k: v for k, v in row.items() if k in names})
+                    for row in rows
+                    if isinstance(row, dict)
+                ),
+            )
+        return timeline
+
+
+def _build_point(agreements: list[TariffSnapshot]) -> _PointAgreements:
+    point = _PointAgreements(agreements=agreements)
+    for index, agreement in enumerate(agreements):
+        start = _timestamp(agreement.valid_from)
+        assert start is not None
+        end = _timestamp(agreement.valid_to)
+        if index + 1 < len(agreements):
+            # An open-ended (or overlapping) agreement ends where the next
+            # one starts.
+            next_start = _timestamp(agreements[index + 1].valid_from)
+            assert next_start is not None
+            end = next_start if end is None else min(end, next_start)
+        point.starts.append(start)
+        point.ends.append(float("inf") if end is None else end)
+    return point
@@ -0,0 +1,105 @@
+"""Background renewal of the Kraken access token.
+
+``EonNext`` refreshes an expired access token lazily, so whichever request
+happens to find it expired pays the ``refreshToken`` round-trip while every
+concurrent request waits on the auth lock.  This scheduler renews the token
+shortly before it expires instead, keeping coordinator refreshes and the
+backfill on the lock-free path.  The lazy refresh stays as the fallback when
+a background renewal is missed or fails.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .eonnext import EonNext, EonNextAuthError
+from .models import EonNextConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay before trying again after a failed renewal.  The token is renewed
+# minutes before the request path would need to, so a retry still lands
+# ahead of expiry.
+_RETRY_SECONDS = 60
+# How often to look again while no access token is held (e.g. after the
+# refresh token was rejected); the next request logs in through the lazy
+# path and the scheduler picks the new token up from here.
+_IDLE_RECHECK_SECONDS = 5 * 60
+
+
+class EonNextTokenRefresher:
+    """Renew one config entry's access token ahead of its expiry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: EonNextConfigEntry,
+        api: EonNext,
+    ) -> None:
+        self.hass = hass
+        self.entry = entry
+        self.api = api
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first renewal; stopped when the entry unloads."""
+        self.entry.async_on_unload(self.async_stop)
+        self._schedule(self._next_delay())
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the pending renewal, if any."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    def _next_delay(self, *, failed: bool = False) -> float:
+        due_in = self.api.token_refresh_due_in()
+        if due_in is None:
+            return _IDLE_RECHECK_SECONDS
+        if failed:
+            # The token is left as it was, so it is still (over)due.
+            return max(due_in, _RETRY_SECONDS)
+        return due_in
+
+    @callback
+    def _schedule(self, delay: float) -> None:
+        self.async_stop()
+        self._unsub = async_call_later(self.hass, delay, self._fire)
+
+    @callback
+    def _fire(self, _now: datetime) -> None:
+        self._unsub = None
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_refresh(),
+            "eon_next_token_refresh",
+        )
+
+    async def _async_refresh(self) -> None:
+        due_in = self.api.token_refresh_due_in()
+        if due_in is None or due_in > 0:
+            # No token to renew, or the request path already renewed it.
+            self._schedule(self._next_delay())
+            return
+
+        try:
+            refreshed = await self.api.async_refresh_token()
+        except EonNextAuthError as err:
+            _LOGGER.debug("Background token refresh rejected: %s", err)
+            refreshed = False
+        except Exception as err:  # pylint: disable=broad-except
+            # Transient (API down, circuit open); the lazy path still covers
+            # requests made before the retry succeeds.
+            _LOGGER.debug("Background token refresh failed: %s", err)
+            refreshed = False
+
+        if refreshed:
+            _LOGGER.debug("Refreshed E.ON Next access token ahead of expiry")
+        self._schedule(self._next_delay(failed=not refreshed))
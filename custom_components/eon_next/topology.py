@@ -0,0 +1,216 @@
+"""Persistent cache of the account/meter/device topology.
+
+Discovering the topology takes one ``headerGetLoggedInUser`` query plus a
+meter-selector and a device query per account, all before the first
+coordinator refresh can start.  The result is persisted per config entry so
+later setups seed ``api.accounts`` from disk (the login-time discovery is
+skipped when accounts are already present) and revalidate in the background,
+reloading the entry only when something actually changed.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, TypedDict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .eonnext import (
+    METER_TYPE_ELECTRIC,
+    METER_TYPE_GAS,
+    ElectricityMeter,
+    EnergyAccount,
+    EonNext,
+    GasMeter,
+    SmartChargingDevice,
+)
+from .models import EonNextConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORE_VERSION = 1
+
+
+class MeterTopology(TypedDict):
+    """Persisted identity of one meter."""
+
+    type: str
+    meter_id: str
+    serial: str
+    supply_point_id: str
+    is_export: bool
+
+
+class EvChargerTopology(TypedDict):
+    """Persisted identity of one SmartFlex device."""
+
+    device_id: str
+    serial: str
+
+
+class AccountTopology(TypedDict):
+    """Persisted identity of one account and what hangs off it."""
+
+    account_number: str
+    meters: list[MeterTopology]
+    ev_chargers: list[EvChargerTopology]
+
+
+class TopologyData(TypedDict):
+    """Top-level store payload."""
+
+    accounts: list[AccountTopology]
+
+
+def serialize_topology(accounts: list[Any]) -> TopologyData:
+    """Return the persistable identity of *accounts*."""
+    return {
+        "accounts": [
+            {
+                "account_number": str(getattr(account, "account_number", "") or ""),
+                "meters": [
+                    {
+                        "type": str(meter.type),
+                        "meter_id": str(meter.meter_id),
+                        "serial": str(meter.serial),
+                        "supply_point_id": str(meter.supply_point_id or ""),
+                        "is_export": bool(getattr(meter, "is_export", False)),
+                    }
+                    for meter in account.meters
+                ],
+                "ev_chargers": [
+                    {"device_id": str(charger.device_id), "serial": str(charger.serial)}
+                    for charger in account.ev_chargers
+                ],
+            }
+            for account in accounts
+        ]
+    }
+
+
+def restore_topology(api: EonNext, data: TopologyData) -> list[EnergyAccount]:
+    """Rebuild live account/meter objects for *api* from persisted *data*."""
+    accounts: list[EnergyAccount] = []
+    for account_data in data["accounts"]:
+        account = EnergyAccount(api, account_data["account_number"])
+        for meter_data in account_data["meters"]:
+            if meter_data["type"] == METER_TYPE_ELECTRIC:
+                account.meters.append(
+                    ElectricityMeter(
+                        account,
+                        meter_data["meter_id"],
+                        meter_data["serial"],
+                        meter_data["supply_point_id"],
+                        is_export=meter_data["is_export"],
+                    )
+                )
+            elif meter_data["type"] == METER_TYPE_GAS:
+                account.meters.append(
+                    GasMeter(
+                        account,
+                        meter_data["meter_id"],
+                        meter_data["serial"],
+                        meter_data["supply_point_id"],
+                    )
+                )
+        account.ev_chargers = [
+            SmartChargingDevice(device_id=ev["device_id"], serial=ev["serial"])
+            for ev in account_data["ev_chargers"]
+        ]
+        accounts.append(account)
+    return accounts
+
+
+def _is_valid(data: Any) -> bool:
+    """Return True when *data* has the shape ``restore_topology`` expects."""
+    try:
+        return bool(data["accounts"]) and all(
+            isinstance(account["account_number"], str)
+            and all(
+                isinstance(meter["serial"], str) and "is_export" in meter
+                for meter in account["meters"]
+            )
+            and all("device_id" in ev for ev in account["ev_chargers"])
+            for account in data["accounts"]
+        )
+    except (KeyError, TypeError):
+        return False
+
+
+def _topology_store(
+    hass: HomeAssistant, entry: EonNextConfigEntry
+) -> Store[TopologyData]:
+    return Store(hass, _STORE_VERSION, f"{DOMAIN}_{entry.entry_id}_topology")
+
+
+async def async_remove_topology(hass: HomeAssistant, entry: EonNextConfigEntry) -> None:
+    """Delete the topology persisted for *entry*."""
+    await _topology_store(hass, entry).async_remove()
+
+
+class EonNextTopologyCache:
+    """Load, persist and revalidate one config entry's topology."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: EonNextConfigEntry,
+        api: EonNext,
+    ) -> None:
+        self.hass = hass
+        self.entry = entry
+        self.api = api
+        self._store = _topology_store(hass, entry)
+        self._data: TopologyData | None = None
+        self.restored = False
+
+    async def async_restore(self) -> bool:
+        """Seed ``api.accounts`` from the store; return whether it did."""
+        loaded = await self._store.async_load()
+        if loaded is None:
+            return False
+        if not _is_valid(loaded):
+            _LOGGER.debug("Ignoring malformed topology cache for %s", self.entry.title)
+            return False
+        self._data = loaded
+        self.api.accounts = restore_topology(self.api, loaded)
+        self.restored = True
+        return True
+
+    async def async_save(self) -> None:
+        """Persist the topology ``api`` is currently using."""
+        data = serialize_topology(self.api.accounts)
+        if data == self._data:
+            return
+        self._data = data
+        await self._store.async_save(data)
+
+    def async_start_revalidation(self) -> None:
+        """Re-discover the topology in the background (restored setups only)."""
+        if not self.restored:
+            return
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_revalidate(),
+            "eon_next_topology_revalidate",
+        )
+
+    async def _async_revalidate(self) -> None:
+        try:
+            fresh = serialize_topology(await self.api.async_discover_accounts())
+        except Exception as err:  # pylint: disable=broad-except
+            # Keep serving the cached topology; the next setup retries.
+            _LOGGER.debug("Topology revalidation failed: %s", err)
+            return
+
+        if not fresh["accounts"] or fresh == self._data:
+            return
+
+        _LOGGER.info(
+            "E.ON Next account topology changed; reloading %s", self.entry.title
+        )
+        self._data = fresh
+        await self._store.async_save(fresh)
+        self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
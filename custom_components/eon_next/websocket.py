@@ -5,7 +5,6 @@ Shared by both the sidebar panel and standalone Lovelace cards.
 
 from __future__ import annotations
 
-import dataclasses
 import logging
 from datetime import date, timedelta
 from typing import Any
@@ -17,21 +16,34 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, INTEGRATION_VERSION
+from .consumption import ConsumptionSeries
+from .cost_tracker_history import HISTORY_DAYS
 from .eonnext import EonNextAuthError
 from .models import EonNextConfigEntry
+from .registry import async_get_registry
 from .schemas import (
+    WIRE_FORMAT_COLUMNAR,
+    WIRE_FORMAT_ROWS,
+    WIRE_FORMATS,
     BackfillMeterProgress,
     BackfillStatusResponse,
     ConsumptionHistoryEntry,
     ConsumptionHistoryResponse,
+    CostTrackerHistoryResponse,
+    CostTrackerPeriod,
+    CostTrackerSummary,
     DashboardSummary,
     EvChargerSummary,
     EvScheduleResponse,
     EvScheduleSlot,
     MeterSummary,
+    TariffDetailsResponse,
+    TariffRateWindow,
     VersionResponse,
+    encode_response,
 )
 from .statistics import statistic_id_for_meter
+from .tariff_helpers import build_day_rates
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,13 +60,35 @@ def _utc_boundary_iso(day: date) -> str:
     )
 
 
+# Every command accepts an optional ``format``; see ``schemas`` for the
+# columnar encoding the generated frontend API requests.
+_FORMAT_FIELD = {
+    vol.Optional("format", default=WIRE_FORMAT_ROWS): vol.In(WIRE_FORMATS),
+}
+
 WS_CONSUMPTION_HISTORY_SCHEMA = {
     vol.Required("type"): "eon_next/consumption_history",
     vol.Required("meter_serial"): str,
     vol.Optional("days", default=7): vol.All(int, vol.Range(min=1, max=365)),
+    **_FORMAT_FIELD,
 }
 
 
+def _send_response(
+    connection: websocket_api.ActiveConnection,  # pyright: ignore[reportPrivateImportUsage]
+    msg: dict[str, Any],
+    response: Any,
+) -> None:
+    """Send *response* encoded in the wire format the caller asked for."""
+    connection.send_result(
+        msg["id"],
+        encode_response(
+            response,
+            columnar=msg.get("format") == WIRE_FORMAT_COLUMNAR,
+        ),
+    )
+
+
 def async_setup_websocket(hass: HomeAssistant) -> None:
     """Register all EON Next WebSocket commands.
 
@@ -66,11 +100,13 @@ def async_setup_websocket(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_dashboard_summary)
     websocket_api.async_register_command(hass, ws_consumption_history)
     websocket_api.async_register_command(hass, ws_ev_schedule)
+    websocket_api.async_register_command(hass, ws_tariff_details)
     websocket_api.async_register_command(hass, ws_backfill_status)
+    websocket_api.async_register_command(hass, ws_cost_tracker_history)
 
 
 @websocket_api.websocket_command(  # pyright: ignore[reportPrivateImportUsage]
-    {vol.Required("type"): "eon_next/version"}
+    {vol.Required("type"): "eon_next/version", **_FORMAT_FIELD}
 )
 @callback
 def ws_version(
@@ -79,14 +115,11 @@ def ws_version(
     msg: dict[str, Any],
 ) -> None:
     """Return the integration version."""
-    connection.send_result(
-        msg["id"],
-        dataclasses.asdict(VersionResponse(version=INTEGRATION_VERSION)),
-    )
+    _send_response(connection, msg, VersionResponse(version=INTEGRATION_VERSION))
 
 
 @websocket_api.websocket_command(  # pyright: ignore[reportPrivateImportUsage]
-    {vol.Required("type"): "eon_next/dashboard_summary"}
+    {vol.Required("type"): "eon_next/dashboard_summary", **_FORMAT_FIELD}
 )
 @callback
 def ws_dashboard_summary(
@@ -145,40 +178,11 @@ def ws_dashboard_summary(
                     )
                 )
 
-    connection.send_result(
-        msg["id"],
-        dataclasses.asdict(DashboardSummary(meters=meters, ev_chargers=ev_chargers)),
+    _send_response(
+        connection, msg, DashboardSummary(meters=meters, ev_chargers=ev_chargers)
     )
 
 
-def _find_meter_info(
-    hass: HomeAssistant, meter_serial: str
-) -> dict[str, Any] | None:
-    """Look up meter metadata from coordinator data.
-
-    Returns a dict with ``type``, ``supply_point_id``, and the owning
-    ``api`` client, or ``None`` if the meter is not found.
-    """
-    entries: list[EonNextConfigEntry] = (
-        hass.config_entries.async_entries(DOMAIN)  # type: ignore[assignment]
-    )
-    for entry in entries:
-        runtime_data = getattr(entry, "runtime_data", None)
-        if runtime_data is None:
-            continue
-        coordinator = runtime_data.coordinator
-        if coordinator.data is None:
-            continue
-        for data in coordinator.data.values():
-            if data.get("serial") == meter_serial:
-                return {
-                    "type": data.get("type"),
-                    "supply_point_id": data.get("supply_point_id"),
-                    "api": coordinator.api,
-                }
-    return None
-
-
 @websocket_api.websocket_command(  # pyright: ignore[reportPrivateImportUsage]
     WS_CONSUMPTION_HISTORY_SCHEMA
 )
@@ -196,33 +200,27 @@ async def ws_consumption_history(
     meter_serial: str = msg["meter_serial"]
     days: int = msg["days"]
 
-    meter_info = _find_meter_info(hass, meter_serial)
-    if meter_info is None:
-        connection.send_result(
-            msg["id"],
-            dataclasses.asdict(ConsumptionHistoryResponse(entries=[])),
-        )
+    meter = async_get_registry(hass).meter(meter_serial)
+    if meter is None or meter.type is None:
+        _send_response(connection, msg, ConsumptionHistoryResponse(entries=[]))
         return
 
-    meter_type: str = meter_info["type"]
+    meter_type = meter.type
 
     entries = await _entries_from_statistics(hass, meter_serial, meter_type, days)
 
     if not entries:
         entries = await _entries_from_rest(
-            meter_info["api"],
+            meter.coordinator.api,
             meter_type,
-            meter_info["supply_point_id"],
+            meter.supply_point_id,
             meter_serial,
             days,
         )
 
     entries = _gap_fill(entries, days)
 
-    connection.send_result(
-        msg["id"],
-        dataclasses.asdict(ConsumptionHistoryResponse(entries=entries)),
-    )
+    _send_response(connection, msg, ConsumptionHistoryResponse(entries=entries))
 
 
 def _gap_fill(
@@ -337,8 +335,9 @@ async def _entries_from_rest(
             period_from=period_from,
             period_to=period_to,
         )
-        if result and isinstance(result.get("results"), list):
-            for item in result["results"]:
+        results = result.get("results") if result else None
+        if isinstance(results, (list, ConsumptionSeries)):
+            for item in results:
                 consumption = item.get("consumption")
                 interval = item.get("interval_start")
                 if consumption is None or interval is None:
@@ -376,6 +375,7 @@ async def _entries_from_rest(
     {
         vol.Required("type"): "eon_next/ev_schedule",
         vol.Required("device_id"): str,
+        **_FORMAT_FIELD,
     }
 )
 @callback
@@ -387,64 +387,113 @@ def ws_ev_schedule(
     """Return EV charge schedule for a specific device."""
     device_id: str = msg["device_id"]
 
-    entries: list[EonNextConfigEntry] = (
-        hass.config_entries.async_entries(DOMAIN)  # type: ignore[assignment]
+    data = async_get_registry(hass).ev_charger(device_id)
+    if data is not None:
+        slots = [
+            EvScheduleSlot(
+                start=slot.get("start", ""),
+                end=slot.get("end", ""),
+            )
+            for slot in data.get("schedule", [])
+            if isinstance(slot, dict)
+        ]
+
+        status = "scheduled" if slots else "idle"
+        _send_response(
+            connection,
+            msg,
+            EvScheduleResponse(
+                device_id=device_id,
+                serial=data.get("serial"),
+                status=status,
+                slots=slots,
+            ),
+        )
+        return
+
+    # Device not found - return empty response
+    _send_response(
+        connection,
+        msg,
+        EvScheduleResponse(
+            device_id=device_id,
+            serial=None,
+            status="unknown",
+            slots=[],
+        ),
     )
 
-    for entry in entries:
-        runtime_data = getattr(entry, "runtime_data", None)
-        if runtime_data is None:
-            continue
-        coordinator = runtime_data.coordinator
-        if coordinator.data is None:
-            continue
 
-        for data in coordinator.data.values():
-            if data.get("type") != "ev_charger":
-                continue
-            if data.get("device_id") != device_id:
-                continue
+@websocket_api.websocket_command(  # pyright: ignore[reportPrivateImportUsage]
+    {
+        vol.Required("type"): "eon_next/tariff_details",
+        vol.Required("meter_serial"): str,
+        **_FORMAT_FIELD,
+    }
+)
+@callback
+def ws_tariff_details(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,  # pyright: ignore[reportPrivateImportUsage]
+    msg: dict[str, Any],
+) -> None:
+    """Return tariff agreement details and today's rates for a meter.
 
-            schedule = data.get("schedule", [])
-            slots = [
-                EvScheduleSlot(
-                    start=slot.get("start", ""),
-                    end=slot.get("end", ""),
-                )
-                for slot in schedule
-                if isinstance(slot, dict)
-            ]
-
-            status = "scheduled" if slots else "idle"
-            connection.send_result(
-                msg["id"],
-                dataclasses.asdict(
-                    EvScheduleResponse(
-                        device_id=device_id,
-                        serial=data.get("serial"),
-                        status=status,
-                        slots=slots,
-                    )
-                ),
-            )
-            return
+    These are the bulky attributes the tariff/rates entities exclude from
+    recorder history; the live values are served from coordinator data here.
+    """
+    meter_serial: str = msg["meter_serial"]
 
-    # Device not found - return empty response
-    connection.send_result(
-        msg["id"],
-        dataclasses.asdict(
-            EvScheduleResponse(
-                device_id=device_id,
-                serial=None,
-                status="unknown",
-                slots=[],
-            )
+    data: Any = None
+    meter = async_get_registry(hass).meter(meter_serial)
+    if meter is not None and meter.coordinator.data:
+        data = meter.coordinator.data.get(meter_serial)
+
+    if data is None:
+        _send_response(
+            connection,
+            msg,
+            TariffDetailsResponse(
+                serial=meter_serial,
+                tariff_name=None,
+                tariff_code=None,
+                tariff_type=None,
+                unit_rate=None,
+                standing_charge=None,
+                valid_from=None,
+                valid_to=None,
+                rates=[],
+            ),
+        )
+        return
+
+    _send_response(
+        connection,
+        msg,
+        TariffDetailsResponse(
+            serial=meter_serial,
+            tariff_name=data.get("tariff_name"),
+            tariff_code=data.get("tariff_code"),
+            tariff_type=data.get("tariff_type"),
+            unit_rate=data.get("tariff_unit_rate"),
+            standing_charge=data.get("tariff_standing_charge"),
+            valid_from=data.get("tariff_valid_from"),
+            valid_to=data.get("tariff_valid_to"),
+            rates=[
+                TariffRateWindow(
+                    start=window["start"],
+                    end=window["end"],
+                    rate=window["rate"],
+                    is_off_peak=window["is_off_peak"],
+                )
+                for window in build_day_rates(data)
+            ],
         ),
     )
 
 
 @websocket_api.websocket_command(  # pyright: ignore[reportPrivateImportUsage]
-    {vol.Required("type"): "eon_next/backfill_status"}
+    {vol.Required("type"): "eon_next/backfill_status", **_FORMAT_FIELD}
 )
 @callback
 def ws_backfill_status(
@@ -505,18 +554,90 @@ def ws_backfill_status(
 
     meter_progress.sort(key=lambda meter: meter.serial)
 
-    connection.send_result(
-        msg["id"],
-        dataclasses.asdict(
-            BackfillStatusResponse(
-                state=state,
-                enabled=enabled,
-                total_meters=total_meters,
-                completed_meters=completed_meters,
-                pending_meters=pending_meters,
-                lookback_days=lookback_days,
-                next_start_date=next_start_date,
-                meters=meter_progress,
-            )
+    _send_response(
+        connection,
+        msg,
+        BackfillStatusResponse(
+            state=state,
+            enabled=enabled,
+            total_meters=total_meters,
+            completed_meters=completed_meters,
+            pending_meters=pending_meters,
+            lookback_days=lookback_days,
+            next_start_date=next_start_date,
+            meters=meter_progress,
+        ),
+    )
+
+
+@websocket_api.websocket_command(  # pyright: ignore[reportPrivateImportUsage]
+    {
+        vol.Required("type"): "eon_next/cost_tracker_history",
+        vol.Optional("tracker_id"): str,
+        vol.Optional("days", default=30): vol.All(
+            int, vol.Range(min=1, max=HISTORY_DAYS)
         ),
+        **_FORMAT_FIELD,
+    }
+)
+@callback
+def ws_cost_tracker_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,  # pyright: ignore[reportPrivateImportUsage]
+    msg: dict[str, Any],
+) -> None:
+    """Return daily, weekly and monthly cost tracker totals.
+
+    Covers every tracker (or only ``tracker_id``) across all config entries
+    from their in-memory rollups.  Daily rows span the last ``days`` closed
+    days and weekly rows the whole ISO weeks containing them; monthly rows
+    cover all retained months.
+    """
+    tracker_filter: str | None = msg.get("tracker_id")
+    since = dt_util.now().date() - timedelta(days=msg["days"])
+    entries: list[EonNextConfigEntry] = (
+        hass.config_entries.async_entries(DOMAIN)  # type: ignore[assignment]
     )
+
+    response = CostTrackerHistoryResponse(trackers=[], days=[], weeks=[], months=[])
+    for entry in entries:
+        runtime_data = getattr(entry, "runtime_data", None)
+        if runtime_data is None:
+            continue
+        manager = runtime_data.cost_trackers
+        for tracker_id in manager.list_tracker_ids():
+            if tracker_filter is not None and tracker_id != tracker_filter:
+                continue
+            config = manager.get_config(tracker_id)
+            state = manager.get_state(tracker_id)
+            history = manager.get_history(tracker_id)
+            if config is None or state is None or history is None:
+                continue
+
+            response.trackers.append(
+                CostTrackerSummary(
+                    entry_id=entry.entry_id,
+                    tracker_id=tracker_id,
+                    name=config.name,
+                    meter_serial=config.meter_serial,
+                    enabled=config.enabled,
+                    today_consumption_kwh=state.today_consumption_kwh,
+                    today_cost=state.today_cost,
+                )
+            )
+            response.days.extend(
+                CostTrackerPeriod(entry.entry_id, tracker_id, day.isoformat(), kwh, cost)
+                for day, kwh, cost in history.days(since)
+            )
+            response.weeks.extend(
+                CostTrackerPeriod(
+                    entry.entry_id, tracker_id, monday.isoformat(), kwh, cost
+                )
+                for monday, kwh, cost in history.weeks(since)
+            )
+            response.months.extend(
+                CostTrackerPeriod(entry.entry_id, tracker_id, month, kwh, cost)
+                for month, (kwh, cost) in history.months.items()
+            )
+
+    _send_response(connection, msg, response)
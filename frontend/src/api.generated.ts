@@ -79,6 +79,171 @@ export interface EvScheduleResponse {
   slots: EvScheduleSlot[]
 }
 
+export interface TariffRateWindow {
+  start: string
+  end: string
+  rate: number
+  is_off_peak: boolean
+}
+
+export interface TariffDetailsResponse {
+  serial: string
+  tariff_name: string | null
+  tariff_code: string | null
+  tariff_type: string | null
+  unit_rate: number | null
+  standing_charge: number | null
+  valid_from: string | null
+  valid_to: string | null
+  rates: TariffRateWindow[]
+}
+
+export interface CostTrackerSummary {
+  entry_id: string
+  tracker_id: string
+  name: string
+  meter_serial: string
+  enabled: boolean
+  today_consumption_kwh: number
+  today_cost: number
+}
+
+export interface CostTrackerPeriod {
+  entry_id: string
+  tracker_id: string
+  period: string
+  consumption_kwh: number
+  cost: number
+}
+
+export interface CostTrackerHistoryResponse {
+  trackers: CostTrackerSummary[]
+  days: CostTrackerPeriod[]
+  weeks: CostTrackerPeriod[]
+  months: CostTrackerPeriod[]
+}
+
+// --- Columnar wire format ---
+
+export const WIRE_FORMAT_COLUMNAR = 'columnar' as const
+
+/** One array per field of `T`; row `i` is the `i`-th element of each. */
+export type Columns<T> = { [K in keyof T]: T[K][] }
+
+export function fromColumns<T>(columns: Columns<T>): T[] {
+  const keys = Object.keys(columns) as (keyof T)[]
+  const length = keys.length > 0 ? columns[keys[0]].length : 0
+  const rows: T[] = new Array(length)
+  for (let i = 0; i < length; i++) {
+    const row = {} as T
+    for (const key of keys) row[key] = columns[key][i]
+    rows[i] = row
+  }
+  return rows
+}
+
+export interface DashboardSummaryColumnar {
+  meters: Columns<MeterSummary>
+  ev_chargers: Columns<EvChargerSummary>
+}
+
+export function decodeDashboardSummary(wire: DashboardSummaryColumnar): DashboardSummary {
+  return {
+    ...wire,
+    meters: fromColumns(wire.meters),
+    ev_chargers: fromColumns(wire.ev_chargers)
+  }
+}
+
+export interface BackfillStatusResponseColumnar {
+  state: string
+  enabled: boolean
+  total_meters: number
+  completed_meters: number
+  pending_meters: number
+  lookback_days: number
+  next_start_date: string | null
+  meters: Columns<BackfillMeterProgress>
+}
+
+export function decodeBackfillStatusResponse(
+  wire: BackfillStatusResponseColumnar
+): BackfillStatusResponse {
+  return {
+    ...wire,
+    meters: fromColumns(wire.meters)
+  }
+}
+
+export interface ConsumptionHistoryResponseColumnar {
+  entries: Columns<ConsumptionHistoryEntry>
+}
+
+export function decodeConsumptionHistoryResponse(
+  wire: ConsumptionHistoryResponseColumnar
+): ConsumptionHistoryResponse {
+  return {
+    ...wire,
+    entries: fromColumns(wire.entries)
+  }
+}
+
+export interface EvScheduleResponseColumnar {
+  device_id: string | null
+  serial: string | null
+  status: string
+  slots: Columns<EvScheduleSlot>
+}
+
+export function decodeEvScheduleResponse(
+  wire: EvScheduleResponseColumnar
+): EvScheduleResponse {
+  return {
+    ...wire,
+    slots: fromColumns(wire.slots)
+  }
+}
+
+export interface TariffDetailsResponseColumnar {
+  serial: string
+  tariff_name: string | null
+  tariff_code: string | null
+  tariff_type: string | null
+  unit_rate: number | null
+  standing_charge: number | null
+  valid_from: string | null
+  valid_to: string | null
+  rates: Columns<TariffRateWindow>
+}
+
+export function decodeTariffDetailsResponse(
+  wire: TariffDetailsResponseColumnar
+): TariffDetailsResponse {
+  return {
+    ...wire,
+    rates: fromColumns(wire.rates)
+  }
+}
+
+export interface CostTrackerHistoryResponseColumnar {
+  trackers: Columns<CostTrackerSummary>
+  days: Columns<CostTrackerPeriod>
+  weeks: Columns<CostTrackerPeriod>
+  months: Columns<CostTrackerPeriod>
+}
+
+export function decodeCostTrackerHistoryResponse(
+  wire: CostTrackerHistoryResponseColumnar
+): CostTrackerHistoryResponse {
+  return {
+    ...wire,
+    trackers: fromColumns(wire.trackers),
+    days: fromColumns(wire.days),
+    weeks: fromColumns(wire.weeks),
+    months: fromColumns(wire.months)
+  }
+}
+
 // --- WebSocket command constants ---
 
 export const WS_VERSION = 'eon_next/version' as const
@@ -94,11 +259,19 @@ export async function getVersion(hass: HomeAssistant): Promise<VersionResponse>
 export async function getDashboardSummary(
   hass: HomeAssistant
 ): Promise<DashboardSummary> {
-  return hass.callWS<DashboardSummary>({ type: WS_DASHBOARD_SUMMARY })
+  const wire = await hass.callWS<DashboardSummaryColumnar>({
+    type: WS_DASHBOARD_SUMMARY,
+    format: WIRE_FORMAT_COLUMNAR
+  })
+  return decodeDashboardSummary(wire)
 }
 
 export async function getBackfillStatus(
   hass: HomeAssistant
 ): Promise<BackfillStatusResponse> {
-  return hass.callWS<BackfillStatusResponse>({ type: WS_BACKFILL_STATUS })
+  const wire = await hass.callWS<BackfillStatusResponseColumnar>({
+    type: WS_BACKFILL_STATUS,
+    format: WIRE_FORMAT_COLUMNAR
+  })
+  return decodeBackfillStatusResponse(wire)
 }
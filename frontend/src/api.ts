@@ -4,6 +4,8 @@
  * Zero-argument commands are generated from the Python schemas.
  * Parameterized commands (those accepting request arguments) have their
  * response interfaces generated but require hand-written wrapper functions.
+ * All wrappers request the columnar wire format and decode it with the
+ * generated `decode*` helpers, so callers always receive row objects.
  *
  * Source of truth: custom_components/eon_next/schemas.py
  * Regenerate:      python scripts/generate_ts_api.py
@@ -22,12 +24,33 @@ export type {
   ConsumptionHistoryResponse,
   EvScheduleSlot,
   EvScheduleResponse,
+  TariffRateWindow,
+  TariffDetailsResponse,
   BackfillMeterProgress,
-  BackfillStatusResponse
+  BackfillStatusResponse,
+  CostTrackerSummary,
+  CostTrackerPeriod,
+  CostTrackerHistoryResponse
 } from './api.generated'
 
 import type { HomeAssistant } from './types'
-import type { ConsumptionHistoryResponse, EvScheduleResponse } from './api.generated'
+import {
+  WIRE_FORMAT_COLUMNAR,
+  decodeConsumptionHistoryResponse,
+  decodeCostTrackerHistoryResponse,
+  decodeEvScheduleResponse,
+  decodeTariffDetailsResponse
+} from './api.generated'
+import type {
+  ConsumptionHistoryResponse,
+  ConsumptionHistoryResponseColumnar,
+  CostTrackerHistoryResponse,
+  CostTrackerHistoryResponseColumnar,
+  EvScheduleResponse,
+  EvScheduleResponseColumnar,
+  TariffDetailsResponse,
+  TariffDetailsResponseColumnar
+} from './api.generated'
 
 // --- Consumption history (parameterized command) -------------------------
 
@@ -36,11 +59,13 @@ export async function getConsumptionHistory(
   meterSerial: string,
   days = 7
 ): Promise<ConsumptionHistoryResponse> {
-  return hass.callWS<ConsumptionHistoryResponse>({
+  const wire = await hass.callWS<ConsumptionHistoryResponseColumnar>({
     type: 'eon_next/consumption_history',
     meter_serial: meterSerial,
-    days
+    days,
+    format: WIRE_FORMAT_COLUMNAR
   })
+  return decodeConsumptionHistoryResponse(wire)
 }
 
 // --- EV schedule (parameterized command) ---------------------------------
@@ -49,8 +74,41 @@ export async function getEvSchedule(
   hass: HomeAssistant,
   deviceId: string
 ): Promise<EvScheduleResponse> {
-  return hass.callWS<EvScheduleResponse>({
+  const wire = await hass.callWS<EvScheduleResponseColumnar>({
     type: 'eon_next/ev_schedule',
-    device_id: deviceId
+    device_id: deviceId,
+    format: WIRE_FORMAT_COLUMNAR
+  })
+  return decodeEvScheduleResponse(wire)
+}
+
+// --- Tariff details (parameterized command) ------------------------------
+
+export async function getTariffDetails(
+  hass: HomeAssistant,
+  meterSerial: string
+): Promise<TariffDetailsResponse> {
+  const wire = await hass.callWS<TariffDetailsResponseColumnar>({
+    type: 'eon_next/tariff_details',
+    meter_serial: meterSerial,
+    format: WIRE_FORMAT_COLUMNAR
+  })
+  return decodeTariffDetailsResponse(wire)
+}
+
+// --- Cost tracker history (parameterized command) ------------------------
+
+export async function getCostTrackerHistory(
+  hass: HomeAssistant,
+  days = 30,
+  trackerId?: string
+): Promise<CostTrackerHistoryResponse> {
+  const wire = await hass.callWS<CostTrackerHistoryResponseColumnar>({
+    type: 'eon_next/cost_tracker_history',
+    // Omitted from the message when undefined: all trackers.
+    tracker_id: trackerId,
+    days,
+    format: WIRE_FORMAT_COLUMNAR
   })
+  return decodeCostTrackerHistoryResponse(wire)
 }
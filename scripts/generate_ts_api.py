@@ -5,9 +5,9 @@ Run from the repository root::
 
     python scripts/generate_ts_api.py
 
-The generated file contains TypeScript interfaces, WS command constants, and
-typed API wrapper functions - all derived from the dataclasses defined in
-``custom_components/eon_next/schemas.py``.
+The generated file contains TypeScript interfaces, WS command constants,
+columnar wire-format decoders, and typed API wrapper functions - all derived
+from the dataclasses defined in ``custom_components/eon_next/schemas.py``.
 """
 
 from __future__ import annotations
@@ -44,6 +44,7 @@ def _load_schemas():
 _schemas = _load_schemas()
 WS_COMMANDS = _schemas.WS_COMMANDS
 WS_EXTRA_RESPONSE_TYPES: list[type] = getattr(_schemas, "WS_EXTRA_RESPONSE_TYPES", [])
+WIRE_FORMAT_COLUMNAR: str = _schemas.WIRE_FORMAT_COLUMNAR
 
 # ---------------------------------------------------------------------------
 # Python → TypeScript type mapping
@@ -133,6 +134,47 @@ def _generate_interface(cls: type) -> str:
     return "\n".join(lines)
 
 
+def _columnar_fields(cls: type) -> list[tuple[str, type]]:
+    """Return ``(name, row_class)`` for each ``list[Dataclass]`` field of *cls*.
+
+    These are the fields ``schemas.encode_response`` transposes into
+    column objects in columnar mode.
+    """
+    hints = get_type_hints(cls)
+    columnar: list[tuple[str, type]] = []
+    for field in dataclasses.fields(cls):
+        hint = hints[field.name]
+        if get_origin(hint) is list:
+            (inner,) = get_args(hint)
+            if dataclasses.is_dataclass(inner):
+                columnar.append((field.name, inner))
+    return columnar
+
+
+def _generate_columnar_decoder(cls: type) -> str:
+    """Generate the columnar wire interface and decoder for a response."""
+    hints = get_type_hints(cls)
+    columnar = dict(_columnar_fields(cls))
+    name = cls.__name__
+    lines = [f"export interface {name}Columnar {{"]
+    for field in dataclasses.fields(cls):
+        if field.name in columnar:
+            ts_type = f"Columns<{columnar[field.name].__name__}>"
+        else:
+            ts_type = _py_type_to_ts(hints[field.name])
+        lines.append(f"  {field.name}: {ts_type};")
+    lines.append("}")
+    lines.append("")
+    lines.append(f"export function decode{name}(wire: {name}Columnar): {name} {{")
+    lines.append("  return {")
+    lines.append("    ...wire,")
+    for field_name in columnar:
+        lines.append(f"    {field_name}: fromColumns(wire.{field_name}),")
+    lines.append("  };")
+    lines.append("}")
+    return "\n".join(lines)
+
+
 def _command_const_name(cmd: str) -> str:
     """Derive a TypeScript constant name from a WS command string.
 
@@ -186,6 +228,35 @@ def generate() -> str:
         sections.append(_generate_interface(cls))
         sections.append("")
 
+    # Columnar wire format
+    columnar_classes = [cls for cls in response_classes if _columnar_fields(cls)]
+    sections.append("// --- Columnar wire format ---\n")
+    sections.append(
+        f'export const WIRE_FORMAT_COLUMNAR = "{WIRE_FORMAT_COLUMNAR}" as const;'
+    )
+    sections.append("")
+    sections.append(
+        textwrap.dedent("""\
+        /** One array per field of `T`; row `i` is the `i`-th element of each. */
+        export type Columns<T> = { [K in keyof T]: T[K][] };
+
+        export function fromColumns<T>(columns: Columns<T>): T[] {
+          const keys = Object.keys(columns) as (keyof T)[];
+          const length = keys.length > 0 ? columns[keys[0]].length : 0;
+          const rows: T[] = new Array(length);
+          for (let i = 0; i < length; i++) {
+            const row = {} as T;
+            for (const key of keys) row[key] = columns[key][i];
+            rows[i] = row;
+          }
+          return rows;
+        }
+        """)
+    )
+    for cls in columnar_classes:
+        sections.append(_generate_columnar_decoder(cls))
+        sections.append("")
+
     # Command constants
     sections.append("// --- WebSocket command constants ---\n")
     for cmd in WS_COMMANDS:
@@ -202,7 +273,16 @@ def generate() -> str:
             f"export async function {fn}(hass: HomeAssistant): "
             f"Promise<{cls.__name__}> {{"
         )
-        sections.append(f"  return hass.callWS<{cls.__name__}>({{ type: {const} }});")
+        if cls in columnar_classes:
+            sections.append(
+                f"  const wire = await hass.callWS<{cls.__name__}Columnar>({{"
+                f" type: {const}, format: WIRE_FORMAT_COLUMNAR }});"
+            )
+            sections.append(f"  return decode{cls.__name__}(wire);")
+        else:
+            sections.append(
+                f"  return hass.callWS<{cls.__name__}>({{ type: {const} }});"
+            )
         sections.append("}")
         sections.append("")
 
@@ -0,0 +1,244 @@
+"""Benchmark harness: timing, machine calibration and baseline checks.
+
+The benchmarks are skipped unless pytest runs with ``--bench``; run them on
+their own and without xdist so timings are not skewed by parallel workers::
+
+    pytest tests/benchmarks --bench -p no:xdist
+
+Each benchmark is timed as the best of several rounds after a warm-up run;
+a round repeats a fast call until it lasts ``_MIN_ROUND_SECONDS`` so
+sub-millisecond helpers are not lost in timer noise, and the garbage
+collector is paused while timing, as ``timeit`` does.
+Its *score* is that time divided by the time of a fixed calibration
+workload measured right after it, so baselines recorded on one machine
+carry over roughly to another, and a machine that slows down mid-run skews
+the scores less.  ``--bench-save`` records the scores in ``baselines.json``;
+otherwise a benchmark scoring more than ``--bench-threshold`` times its
+baseline fails.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import gc
+import json
+from pathlib import Path
+import time
+from typing import Any
+
+import pytest
+
+BASELINES = Path(__file__).with_name("baselines.json")
+
+_ROUNDS = 5
+_CALIBRATION_ROUNDS = 3
+_MIN_ROUND_SECONDS = 0.02
+_ATTEMPTS = 3
+
+
+@dataclass(slots=True)
+class BenchResult:
+    """One benchmark's measurement."""
+
+    name: str
+    seconds: float
+    score: float
+    baseline: float | None
+
+
+@dataclass(slots=True)
+class _BenchSession:
+    baselines: dict[str, float]
+    threshold: float
+    save: bool
+    results: list[BenchResult] = field(default_factory=list)
+
+
+_SESSION = pytest.StashKey[_BenchSession]()
+
+
+def _calibration_workload() -> None:
+    """A fixed pure-Python workload: the unit benchmark scores are given in."""
+    values = [(i * 7919) % 10007 for i in range(200_000)]
+    values.sort()
+    sum(value * 0.5 for value in values)
+
+
+def _best_of(rounds: int, func: Callable[[], Any], loops: int = 1) -> float:
+    """Return the best per-call time of *rounds* rounds of *loops* calls."""
+    best = float("inf")
+    with _gc_paused():
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(loops):
+                func()
+            best = min(best, time.perf_counter() - started)
+    return best / loops
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _loops_for(seconds: float) -> int:
+    """Calls per round for a call taking *seconds*."""
+    return max(1, min(1000, int(_MIN_ROUND_SECONDS / max(seconds, 1e-7)) + 1))
+
+
+class Bench:
+    """Time a callable and check it against its recorded baseline.
+
+    A benchmark over its threshold is measured again (up to ``_ATTEMPTS``
+    times in all) before failing, so one noisy measurement is not reported
+    as a regression.
+    """
+
+    def __init__(self, session: _BenchSession) -> None:
+        self._session = session
+
+    def __call__(
+        self, name: str, func: Callable[..., Any], *args: Any, rounds: int = _ROUNDS
+    ) -> Any:
+        """Benchmark ``func(*args)`` under *name*; return its result."""
+        started = time.perf_counter()
+        result = func(*args)  # warm-up, and the value returned
+        loops = _loops_for(time.perf_counter() - started)
+        for _ in range(_ATTEMPTS):
+            seconds = _best_of(rounds, lambda: func(*args), loops)
+            score = self._score(seconds)
+            if not self._regressed(name, score):
+                break
+        self._finish(name, seconds, score)
+        return result
+
+    async def run_async(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        rounds: int = _ROUNDS,
+    ) -> Any:
+        """Benchmark ``await func(*args)`` under *name*; return its result."""
+        result = await func(*args)
+        for _ in range(_ATTEMPTS):
+            seconds = float("inf")
+            with _gc_paused():
+                for _ in range(rounds):
+                    started = time.perf_counter()
+                    await func(*args)
+                    seconds = min(seconds, time.perf_counter() - started)
+            score = self._score(seconds)
+            if not self._regressed(name, score):
+                break
+        self._finish(name, seconds, score)
+        return result
+
+    def measure(
+        self, name: str, func: Callable[[], float], *, rounds: int = _ROUNDS
+    ) -> float:
+        """Benchmark a duration *func* measures and returns itself.
+
+        For timings taken outside this process (e.g. an import in a fresh
+        interpreter); the best of *rounds* calls is scored.
+        """
+        for _ in range(_ATTEMPTS):
+            seconds = min(func() for _ in range(rounds))
+            score = self._score(seconds)
+            if not self._regressed(name, score):
+                break
+        self._finish(name, seconds, score)
+        return seconds
+
+    @staticmethod
+    def _score(seconds: float) -> float:
+        return round(seconds / _best_of(_CALIBRATION_ROUNDS, _calibration_workload), 4)
+
+    def _regressed(self, name: str, score: float) -> bool:
+        session = self._session
+        baseline = session.baselines.get(name)
+        return (
+            not session.save
+            and baseline is not None
+            and score > baseline * session.threshold
+        )
+
+    def _finish(self, name: str, seconds: float, score: float) -> None:
+        session = self._session
+        baseline = session.baselines.get(name)
+        session.results.append(BenchResult(name, seconds, score, baseline))
+        if session.save:
+            session.baselines[name] = score
+        elif self._regressed(name, score):
+            pytest.fail(
+                f"{name} regressed: score {score} > {session.threshold} x "
+                f"baseline {baseline} ({seconds * 1000:.1f} ms)"
+            )
+
+
+@pytest.fixture(scope="session")
+def _bench_session(pytestconfig: pytest.Config) -> Iterator[_BenchSession]:
+    baselines: dict[str, float] = {}
+    if BASELINES.exists():
+        baselines = json.loads(BASELINES.read_text(encoding="utf-8"))
+    session = _BenchSession(
+        baselines=baselines,
+        threshold=pytestconfig.getoption("--bench-threshold"),
+        save=pytestconfig.getoption("--bench-save"),
+    )
+    pytestconfig.stash[_SESSION] = session
+    yield session
+    if session.save and session.results:
+        BASELINES.write_text(
+            json.dumps(dict(sorted(session.baselines.items())), indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+
+@pytest.fixture
+def _no_recorder(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the statistics import's own work but skip the recorder I/O."""
+
+    async def _last(*_args: Any) -> tuple[None, float]:
+        return None, 0.0
+
+    import homeassistant.components.recorder.statistics as recorder_statistics
+
+    import custom_components.eon_next.statistics as statistics_module
+
+    monkeypatch.setattr(statistics_module, "_get_last_stat", _last)
+    monkeypatch.setattr(
+        recorder_statistics, "async_add_external_statistics", lambda *_args: None
+    )
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Bench:
+    """Return the benchmark timer; skips unless ``--bench`` was given."""
+    if not request.config.getoption("--bench"):
+        pytest.skip("benchmarks run only with --bench")
+    return Bench(request.getfixturevalue("_bench_session"))
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """Print one line per benchmark: time, score and baseline."""
+    session = config.stash.get(_SESSION, None)
+    if session is None or not session.results:
+        return
+    terminalreporter.section("eon_next benchmarks")
+    for result in session.results:
+        baseline = "-" if result.baseline is None else f"{result.baseline:.4f}"
+        terminalreporter.write_line(
+            f"{result.name:<56} {result.seconds * 1000:>10.2f} ms "
+            f"score {result.score:>10.4f}  baseline {baseline}"
+        )
+
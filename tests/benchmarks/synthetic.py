@@ -0,0 +1,78 @@
+"""Deterministic synthetic tariffs and consumption for the benchmarks.
+
+Everything is laid out around the current hour (see :func:`anchor`) so the
+rate helpers, which read the clock, resolve against the generated data.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+
+def anchor() -> datetime:
+    """Return the current UTC hour, the reference point of all data."""
+    return datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def agile_schedule(windows: int) -> list[dict[str, Any]]:
+    """Return *windows* consecutive half-hour rate windows (pence/kWh).
+
+    Shaped like an Agile tariff - cheap overnight, a 16:00-19:00 peak and a
+    deterministic wobble so neighbouring windows rarely share a rate - and
+    centred on :func:`anchor`.
+    """
+    first = anchor() - timedelta(minutes=30 * (windows // 2))
+    schedule = []
+    for index in range(windows):
+        slot = first + timedelta(minutes=30 * index)
+        base = 8.0 if slot.hour < 6 else 34.0 if 16 <= slot.hour < 19 else 21.0
+        schedule.append(
+            {
+                "value": round(base + (index * 37 % 11) / 10, 2),
+                "validFrom": slot.isoformat(),
+                "validTo": (slot + timedelta(minutes=30)).isoformat(),
+            }
+        )
+    return schedule
+
+
+def agile_tariff(windows: int) -> dict[str, Any]:
+    """Return a parsed agreement (pence values) carrying an Agile schedule."""
+    return {
+        "tariff_name": "Next Agile",
+        "tariff_code": "E-1R-NEXT-AGILE-01",
+        "tariff_type": "HalfHourlyTariff",
+        "unit_rate": 21.5,
+        "standing_charge": 48.2,
+        "valid_from": (anchor() - timedelta(days=400)).isoformat(),
+        "valid_to": None,
+        "unit_rates_schedule": agile_schedule(windows),
+        "tariff_is_tou": True,
+    }
+
+
+def meter_data(windows: int) -> dict[str, Any]:
+    """Return Agile tariff meter data under the ``tariff_*`` keys (pounds)."""
+    tariff = agile_tariff(windows)
+    return {
+        "tariff_name": tariff["tariff_name"],
+        "tariff_code": tariff["tariff_code"],
+        "tariff_unit_rate": tariff["unit_rate"] / 100,
+        "tariff_standing_charge": tariff["standing_charge"] / 100,
+        "tariff_rates_schedule": tariff["unit_rates_schedule"],
+        "tariff_is_tou": True,
+    }
+
+
+def half_hourly_history(days: int) -> list[dict[str, Any]]:
+    """Return *days* of half-hourly consumption entries up to :func:`anchor`."""
+    first = anchor() - timedelta(days=days)
+    return [
+        {
+            "interval_start": (first + timedelta(minutes=30 * i)).isoformat(),
+            "interval_end": (first + timedelta(minutes=30 * (i + 1))).isoformat(),
+            "consumption": round(0.05 + (i * 7 % 13) / 20, 3),
+        }
+        for i in range(days * 48)
+    ]
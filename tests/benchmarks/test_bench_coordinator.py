@@ -0,0 +1,88 @@
+"""Benchmarks for a full coordinator refresh over synthetic accounts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from synthetic import agile_tariff, half_hourly_history
+
+from custom_components.eon_next.coordinator import EonNextCoordinator
+from homeassistant.core import HomeAssistant
+
+
+@dataclass(slots=True)
+class FakeMeter:
+    """Electricity meter shape the coordinator reads."""
+
+    serial: str
+    supply_point_id: str
+    type: str = "electricity"
+    meter_id: str = "meter-id"
+    latest_reading: float | None = 12345.6
+    latest_reading_date: str | None = None
+
+    async def _update(self) -> None:
+        return None
+
+
+@dataclass(slots=True)
+class FakeAccount:
+    """Account holding *meters*."""
+
+    account_number: str
+    meters: list[FakeMeter] = field(default_factory=list)
+    ev_chargers: list[Any] = field(default_factory=list)
+    balance: float | None = None
+
+
+class FakeApi:
+    """In-process stand-in for ``EonNext`` serving synthetic responses."""
+
+    def __init__(self, meters: int, windows: int) -> None:
+        self.accounts = [
+            FakeAccount(
+                account_number="A-BENCH",
+                meters=[
+                    FakeMeter(serial=f"meter-{i}", supply_point_id=f"mpan-{i}")
+                    for i in range(meters)
+                ],
+            )
+        ]
+        tariff = agile_tariff(windows)
+        self._tariffs = {
+            meter.supply_point_id: {**tariff, "agreements": [tariff]}
+            for meter in self.accounts[0].meters
+        }
+        # The coordinator asks for the latest 100 half-hours.
+        self._consumption = {"results": half_hourly_history(3)[-100:]}
+
+    async def async_get_account_balances(self) -> dict[str, float]:
+        return {"A-BENCH": -1234.0}
+
+    async def async_get_tariff_data(self, account_number: str) -> dict[str, Any]:
+        return self._tariffs
+
+    async def async_get_consumption(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        return self._consumption
+
+
+@pytest.mark.usefixtures("_no_recorder")
+@pytest.mark.parametrize(
+    ("meters", "windows"), [(1, 48), (10, 48), (50, 48), (10, 1000), (50, 1000)]
+)
+async def test_refresh(
+    bench, hass: HomeAssistant, meters: int, windows: int
+) -> None:
+    """Steady-state ``_async_update_data``: every meter priced and imported."""
+    coordinator = EonNextCoordinator(hass, FakeApi(meters, windows))  # type: ignore[arg-type]
+
+    async def _refresh() -> dict[str, Any]:
+        coordinator.data = await coordinator._async_update_data()
+        return coordinator.data
+
+    data = await bench.run_async(
+        f"coordinator.refresh[{meters}m-{windows}w]", _refresh
+    )
+    assert len(data) == meters + 1
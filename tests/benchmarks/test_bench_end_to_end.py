@@ -0,0 +1,120 @@
+"""End-to-end benchmarks: the real client over HTTP against the fake Kraken."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from unittest.mock import patch
+
+from fake_kraken import FakeKraken, generate_accounts
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.eon_next.const import (
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_SHOW_CARD,
+    CONF_SHOW_PANEL,
+    DOMAIN,
+)
+from custom_components.eon_next.coordinator import EonNextCoordinator
+from custom_components.eon_next.eonnext import EonNext
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import recorder as recorder_helper
+from homeassistant.setup import async_setup_component
+
+
+async def _logged_in(server: FakeKraken, accounts: int) -> EonNext:
+    server.use_accounts(generate_accounts(accounts, ev_every=2))
+    api = EonNext()
+    assert await api.login_with_username_and_password(server.email, server.password)
+    return api
+
+
+@pytest.mark.usefixtures("_no_recorder")
+@pytest.mark.parametrize("accounts", [1, 10])
+async def test_refresh_over_http(
+    bench, hass: HomeAssistant, fake_kraken: FakeKraken, accounts: int
+) -> None:
+    """A coordinator refresh: balances, readings, tariffs and consumption."""
+    api = await _logged_in(fake_kraken, accounts)
+    coordinator = EonNextCoordinator(hass, api)
+
+    async def _refresh() -> dict[str, Any]:
+        coordinator.data = await coordinator._async_update_data()
+        return coordinator.data
+
+    try:
+        data = await bench.run_async(f"e2e.refresh[{accounts}a]", _refresh)
+    finally:
+        await api.async_close()
+    assert len(data) >= accounts * 3  # an account and two meters each
+
+
+@pytest.mark.parametrize("days", [30, 365])
+async def test_daily_history_over_http(
+    bench, fake_kraken: FakeKraken, days: int
+) -> None:
+    """Daily history for every meter at once, as the panel and backfill ask."""
+    api = await _logged_in(fake_kraken, 5)
+    meters = [meter for account in api.accounts for meter in account.meters]
+    period_to = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)
+    period_from = (period_to - timedelta(days=days)).isoformat()
+
+    async def _fetch() -> list[Any]:
+        # A fresh client cache each round, so every page is served and parsed.
+        api._consumption_validators.clear()
+        return await asyncio.gather(
+            *(
+                api.async_get_consumption(
+                    meter.get_type(),
+                    meter.supply_point_id,
+                    meter.serial,
+                    group_by="day",
+                    page_size=days,
+                    period_from=period_from,
+                    period_to=period_to.isoformat(),
+                )
+                for meter in meters
+            )
+        )
+
+    try:
+        results = await bench.run_async(f"e2e.daily_history[{days}d]", _fetch)
+    finally:
+        await api.async_close()
+    assert all(len(result["results"]) >= days - 1 for result in results)
+
+
+@pytest.mark.usefixtures("_no_recorder", "enable_custom_integrations")
+async def test_setup_entry_over_http(
+    bench, hass: HomeAssistant, fake_kraken: FakeKraken
+) -> None:
+    """Set up and unload one entry, with backfill, panel and card off.
+
+    The first round logs in and blocks on a live refresh; later rounds start
+    from the persisted topology and snapshot, as a restart does.
+    """
+    fake_kraken.use_accounts(generate_accounts(1))
+    recorder_helper.async_initialize_recorder(hass)
+    with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True):
+        assert await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": "sqlite://"}}
+        )
+    await hass.async_block_till_done()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_EMAIL: fake_kraken.email, CONF_PASSWORD: fake_kraken.password},
+        options={CONF_SHOW_PANEL: False, CONF_SHOW_CARD: False},
+    )
+    entry.add_to_hass(hass)
+
+    async def _setup_and_unload() -> None:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    await bench.run_async("e2e.setup_entry[1a]", _setup_and_unload)
@@ -0,0 +1,22 @@
+"""Startup benchmark: the package import, in a fresh interpreter."""
+
+from __future__ import annotations
+
+from importtime import (
+    PRELOADED,
+    own_import_seconds,
+    package_import_times,
+    run_importtime,
+)
+
+
+def test_package_import(bench) -> None:
+    """Self time of the package's own modules (third-party imports excluded)."""
+    preloaded = run_importtime("; ".join(f"import {module}" for module in PRELOADED))
+
+    seconds = bench.measure(
+        "startup.package_import",
+        lambda: own_import_seconds(package_import_times(preloaded)),
+        rounds=3,
+    )
+    assert seconds > 0
@@ -0,0 +1,91 @@
+"""Benchmarks for hourly bucketing and the backfill splice-and-rebase."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from synthetic import half_hourly_history, meter_data
+
+from custom_components.eon_next.cost_engine import compile_consumption_timeline
+from custom_components.eon_next.statistics import (
+    _group_by_hour,
+    _group_consumption_by_hour,
+    _merge_and_recompute_series,
+)
+from custom_components.eon_next.tariff_timeline import TariffTimeline
+
+YEARS = [1, 3]
+
+
+@pytest.mark.parametrize("years", YEARS)
+def test_group_consumption_by_hour(bench, years: int) -> None:
+    """Bucketing multi-year half-hourly history (the backfill's input size)."""
+    entries = half_hourly_history(365 * years)
+
+    hourly = bench(
+        f"statistics.group_consumption_by_hour[{years}y]",
+        _group_consumption_by_hour,
+        entries,
+    )
+    assert len(hourly) == 365 * years * 24
+
+
+def test_group_by_hour_with_cost(bench) -> None:
+    """The same bucketing pass with every interval priced for the cost stat."""
+    entries = half_hourly_history(365)
+    rates = compile_consumption_timeline(
+        TariffTimeline(), None, entries, meter_data(336)
+    )
+
+    hourly, hourly_cost = bench(
+        "statistics.group_by_hour_with_cost[1y]", _group_by_hour, entries, rates
+    )
+    assert len(hourly_cost) == len(hourly)
+
+
+def _existing_series(years: int) -> tuple[list, dict]:
+    hourly = _group_consumption_by_hour(half_hourly_history(365 * years))
+    existing = []
+    running = 0.0
+    for hour in sorted(hourly):
+        running = round(running + hourly[hour], 3)
+        existing.append((hour, running))
+    return existing, hourly
+
+
+@pytest.mark.parametrize("years", YEARS)
+def test_merge_splices_a_month_into_history(bench, years: int) -> None:
+    """Re-basing every later row after splicing 30 days in at the start."""
+    existing, hourly = _existing_series(years)
+    first = existing[0][0]
+    new = {
+        hour: value * 2
+        for hour, value in hourly.items()
+        if hour < first + timedelta(days=30)
+    }
+
+    series = bench(
+        f"statistics.merge_and_recompute_hourly[{years}y]",
+        _merge_and_recompute_series,
+        0.0,
+        existing,
+        new,
+    )
+    assert len(series) == len(existing)
+
+
+@pytest.mark.parametrize("years", YEARS)
+def test_merge_daily_chunk_over_hourly_history(bench, years: int) -> None:
+    """A daily backfill chunk checked against finer rows it must not clobber."""
+    existing, _ = _existing_series(years)
+    first = existing[0][0]
+    new = {first + timedelta(days=day): 12.0 for day in range(30)}
+
+    def _merge() -> list:
+        return _merge_and_recompute_series(
+            0.0, existing, new, daily_granularity=True
+        )
+
+    series = bench(f"statistics.merge_and_recompute_daily[{years}y]", _merge)
+    assert len(series) == len(existing)
@@ -0,0 +1,69 @@
+"""Benchmarks for the tariff rate helpers across schedule lengths."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from synthetic import anchor, half_hourly_history, meter_data
+
+from custom_components.eon_next.tariff_helpers import (
+    build_day_rates,
+    cost_consumption_entries,
+    get_current_rate,
+    get_next_rate,
+    get_previous_rate,
+    is_off_peak,
+    rate_for_timestamp,
+)
+
+# Agile publishes a day ahead (48-96 windows); a retained week is ~336 and a
+# long-lived schedule can reach ~1000.
+WINDOWS = [48, 336, 1000]
+
+
+@pytest.mark.parametrize("windows", WINDOWS)
+def test_rate_lookups(bench, windows: int) -> None:
+    """The per-refresh sensor lookups: current, next, previous, off-peak."""
+    data = meter_data(windows)
+
+    for func in (get_current_rate, get_next_rate, get_previous_rate, is_off_peak):
+        result = bench(f"tariff.{func.__name__}[{windows}]", func, data)
+        assert result is not None
+
+
+@pytest.mark.parametrize("windows", WINDOWS)
+def test_build_day_rates(bench, windows: int) -> None:
+    """The dashboard's rate bars for today."""
+    rates = bench(f"tariff.build_day_rates[{windows}]", build_day_rates, meter_data(windows))
+    assert rates
+
+
+@pytest.mark.parametrize("windows", WINDOWS)
+def test_rate_for_every_half_hour_of_a_day(bench, windows: int) -> None:
+    """Per-instant resolution, as used to price a day interval by interval."""
+    data = meter_data(windows)
+    day = [anchor() - timedelta(minutes=30 * i) for i in range(48)]
+
+    def _resolve() -> list[float | None]:
+        return [rate_for_timestamp(data, when) for when in day]
+
+    assert all(
+        rate is not None
+        for rate in bench(f"tariff.rate_for_timestamp_x48[{windows}]", _resolve)
+    )
+
+
+@pytest.mark.parametrize("days", [7, 365])
+def test_cost_consumption_entries(bench, days: int) -> None:
+    """Pricing a consumption range against an Agile tariff."""
+    data = meter_data(336)
+    entries = half_hourly_history(days)
+
+    cost = bench(
+        f"tariff.cost_consumption_entries[{days}d]",
+        cost_consumption_entries,
+        data,
+        entries,
+    )
+    assert cost is not None
@@ -53,7 +53,10 @@ def _manager(
         async_create_background_task=Mock(),
     )
     api = SimpleNamespace(accounts=[SimpleNamespace(meters=meters)])
-    coordinator = SimpleNamespace(set_statistics_import_enabled=Mock())
+    coordinator = SimpleNamespace(
+        set_statistics_import_enabled=Mock(),
+        statistics_rates=Mock(return_value=None),
+    )
     return EonNextBackfillManager(hass, entry, api, coordinator)
 
 
@@ -64,6 +67,7 @@ def test_get_status_disabled_by_default() -> None:
         "initialized": False,
         "rebuild_done": False,
         "lookback_days": 0,
+        "cost_backfilled": False,
         "meters": {},
     }
 
@@ -80,6 +84,7 @@ def test_get_status_running_and_completed() -> None:
         "initialized": True,
         "rebuild_done": True,
         "lookback_days": 3650,
+        "cost_backfilled": True,
         "meters": {
             "m1": {"next_start": _REF_NEXT_ISO, "done": False},
             "m2": {"next_start": _REF_DATE_ISO, "done": True},
@@ -112,6 +117,7 @@ def test_get_status_tolerates_incomplete_meter_state() -> None:
         "initialized": True,
         "rebuild_done": True,
         "lookback_days": 3650,
+        "cost_backfilled": True,
         "meters": {
             # Entry present but missing both "done" and "next_start".
             "m1": {},
@@ -139,6 +145,7 @@ async def test_initialize_or_reset_progress_uses_lookback(monkeypatch) -> None:
         "initialized": False,
         "rebuild_done": False,
         "lookback_days": 0,
+        "cost_backfilled": False,
         "meters": {},
     }
     manager._save_state = AsyncMock()  # type: ignore[method-assign]
@@ -156,6 +163,41 @@ async def test_initialize_or_reset_progress_uses_lookback(monkeypatch) -> None:
     assert manager._state["meters"]["m2"]["next_start"] == _LOOKBACK_START_ISO
 
 
+@pytest.mark.asyncio
+async def test_finished_backfill_without_cost_walks_the_window_again(
+    monkeypatch,
+) -> None:
+    """Progress stored before cost was backfilled is replayed once for cost."""
+    manager = _manager(
+        {CONF_BACKFILL_ENABLED: True, CONF_BACKFILL_LOOKBACK_DAYS: 10},
+        [_meter("m1")],
+    )
+    manager._state = {
+        "initialized": True,
+        "rebuild_done": True,
+        "lookback_days": 10,
+        "cost_backfilled": False,
+        "meters": {"m1": {"next_start": _REF_DATE_ISO, "done": True}},
+    }
+    manager._save_state = AsyncMock()  # type: ignore[method-assign]
+    monkeypatch.setattr(backfill_module.dt_util, "now", lambda: _REF_DT)
+
+    await manager._initialize_or_reset_progress(manager._eligible_meters())
+
+    assert manager._state["cost_backfilled"] is True
+    assert manager._state["meters"]["m1"] == {
+        "next_start": _LOOKBACK_START_ISO,
+        "done": False,
+    }
+    manager._save_state.assert_awaited_once()
+
+    # The replay happens once: a second pass leaves the cursor alone.
+    manager._state["meters"]["m1"] = {"next_start": _REF_DATE_ISO, "done": True}
+    await manager._initialize_or_reset_progress(manager._eligible_meters())
+
+    assert manager._state["meters"]["m1"]["done"] is True
+
+
 @pytest.mark.asyncio
 async def test_clear_existing_statistics_without_rebuild_marks_done() -> None:
     """Without rebuild enabled, manager should skip clearing and mark rebuild done."""
@@ -170,6 +212,7 @@ async def test_clear_existing_statistics_without_rebuild_marks_done() -> None:
         "initialized": True,
         "rebuild_done": False,
         "lookback_days": 3650,
+        "cost_backfilled": True,
         "meters": {"m1": {"next_start": _REF_DATE_ISO, "done": False}},
     }
     manager._save_state = AsyncMock()  # type: ignore[method-assign]
@@ -199,6 +242,7 @@ async def test_run_backfill_cycle_advances_cursor_and_imports(monkeypatch) -> No
         "initialized": True,
         "rebuild_done": True,
         "lookback_days": 3650,
+        "cost_backfilled": True,
         "meters": {"m1": {"next_start": _REF_PREV_ISO, "done": False}},
     }
     manager._save_state = AsyncMock()  # type: ignore[method-assign]
@@ -247,6 +291,7 @@ async def test_run_backfill_cycle_leaves_cursor_on_api_error(monkeypatch) -> Non
         "initialized": True,
         "rebuild_done": True,
         "lookback_days": 3650,
+        "cost_backfilled": True,
         "meters": {"m1": {"next_start": _REF_PREV_ISO, "done": False}},
     }
     manager._save_state = AsyncMock()  # type: ignore[method-assign]
@@ -292,6 +337,7 @@ def test_meters_progress_all_done(monkeypatch) -> None:
         "initialized": True,
         "rebuild_done": True,
         "lookback_days": 10,
+        "cost_backfilled": True,
         "meters": {
             "m1": {"next_start": _REF_NEXT_ISO, "done": True},
         },
@@ -323,6 +369,7 @@ def test_meters_progress_partial(monkeypatch) -> None:
         "initialized": True,
         "rebuild_done": True,
         "lookback_days": 10,
+        "cost_backfilled": True,
         "meters": {
             "m1": {"next_start": halfway, "done": False},
         },
@@ -351,6 +398,7 @@ def test_meters_progress_missing_meter_state(monkeypatch) -> None:
         "initialized": True,
         "rebuild_done": True,
         "lookback_days": 10,
+        "cost_backfilled": True,
         "meters": {
             "m1": {"next_start": _REF_DATE_ISO, "done": True},
             # m2 intentionally missing from state
@@ -378,6 +426,7 @@ def test_meters_progress_invalid_next_start(monkeypatch) -> None:
         "initialized": True,
         "rebuild_done": True,
         "lookback_days": 10,
+        "cost_backfilled": True,
         "meters": {
             "m1": {"next_start": "not-a-date", "done": False},
         },
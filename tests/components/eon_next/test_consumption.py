@@ -0,0 +1,111 @@
+"""Tests for the streaming consumption page decoder."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from custom_components.eon_next.consumption import (
+    ConsumptionInterval,
+    ConsumptionSeries,
+    async_decode_consumption_page,
+)
+
+_PAGE = {
+    "count": 3,
+    "next": "https://api.example/consumption/?page=2&results=1",
+    "previous": None,
+    "results": [
+        {
+            "consumption": 0.123,
+            "interval_start": "2026-10-18T00:00:00+01:00",
+            "interval_end": "2026-10-18T00:30:00+01:00",
+        },
+        {
+            "consumption": 12345,
+            "interval_start": "2026-10-18T00:30:00+01:00",
+            "interval_end": "2026-10-18T01:00:00+01:00",
+        },
+        {"consumption": None, "interval_start": "2026-10-18T01:00:00+01:00"},
+    ],
+}
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 1 << 16])
+async def test_page_decodes_identically_for_any_chunking(chunk_size: int) -> None:
+    body = json.dumps(_PAGE, indent=1).encode()
+
+    page = await async_decode_consumption_page(_chunks(body, chunk_size))
+
+    assert {key: page[key] for key in ("count", "next", "previous")} == {
+        "count": 3,
+        "next": _PAGE["next"],
+        "previous": None,
+    }
+    series = page["results"]
+    assert isinstance(series, ConsumptionSeries)
+    assert [dict(item) for item in series] == [
+        {"interval_end": None, **entry} for entry in _PAGE["results"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_numbers_split_at_every_offset_decode_whole() -> None:
+    # Written by hand: json.dumps would not produce exponents to split.
+    body = b'{"count": -1e-3, "results": [{"consumption": 0.125}, {"consumption": 2E+10}]}'
+
+    for offset in range(1, len(body)):
+
+        async def split(offset: int = offset) -> AsyncIterator[bytes]:
+            yield body[:offset]
+            yield body[offset:]
+
+        decoded = await async_decode_consumption_page(split())
+
+        assert decoded["count"] == -1e-3, offset
+        assert [dict(item)["consumption"] for item in decoded["results"]] == [
+            0.125,
+            2e10,
+        ], offset
+
+
+@pytest.mark.asyncio
+async def test_multibyte_characters_split_across_chunks() -> None:
+    body = json.dumps({"detail": "café", "results": []}, ensure_ascii=False).encode()
+
+    page = await async_decode_consumption_page(_chunks(body, 1))
+
+    assert page["detail"] == "café"
+    assert len(page["results"]) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body", [b"", b"[]", b'{"results": [{"consumption": 1}', b'{"results" 1}']
+)
+async def test_malformed_body_raises_value_error(body: bytes) -> None:
+    with pytest.raises(ValueError):
+        await async_decode_consumption_page(_chunks(body, 4))
+
+
+def test_series_items_are_mappings_over_api_keys() -> None:
+    series = ConsumptionSeries.from_entries(
+        [{"consumption": "0.5", "interval_start": "a"}, {"consumption": "bad"}]
+    )
+
+    first = series[0]
+    assert isinstance(first, ConsumptionInterval)
+    assert first.get("consumption") == 0.5
+    assert first["interval_start"] == "a"
+    assert first.get("missing") is None
+    assert series[-1].consumption is None
+    assert [item.interval_start for item in series[:1]] == ["a"]
+    assert len(series) == 2
@@ -7,6 +7,7 @@ so that date-dependent logic is deterministic.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from typing import Any
@@ -15,6 +16,13 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from custom_components.eon_next.coordinator import EonNextCoordinator
+from custom_components.eon_next.tariff_timeline import TariffTimeline
+from custom_components.eon_next.meter_snapshot import (
+    NO_TARIFF,
+    CostSnapshot,
+    MeterSnapshot,
+    TariffSnapshot,
+)
 
 # Fixed reference time: 2025-06-15 14:00 UTC.  All tests derive
 # "yesterday" / "today" from this constant so they never become flaky
@@ -201,61 +209,112 @@ class TestAggregateDailyConsumption:
         assert result["last_reset"] == f"{_TODAY}T08:00:00+00:00"
 
 
-class TestCostFallbackToTariff:
-    """Tests that unit_rate and standing_charge fall back to tariff values.
+class TestChangedKeys:
+    """Per-key diff used to skip redundant entity state writes."""
 
-    These exercise the tariff-fallback guards that live in
-    ``_async_update_data``.  The logic is simple conditional assignment
-    so we replicate the guard here rather than spinning up a full
-    coordinator update cycle.
-    """
+    def test_identical_rows_are_unchanged(self) -> None:
+        row = MeterSnapshot(type="electricity", serial="m1")
+        previous = {"m1": row, "account::A": {"balance": 1.0}}
+        current = {"m1": row, "account::A": {"balance": 1.0}}
+        assert EonNextCoordinator._changed_keys(previous, current) == frozenset()
 
-    @staticmethod
-    def _apply_tariff_fallback(meter_data: dict[str, Any]) -> None:
-        """Replicate the tariff-fallback guards from _async_update_data."""
-        if (
-            meter_data.get("unit_rate") is None
-            and meter_data.get("tariff_unit_rate") is not None
-        ):
-            meter_data["unit_rate"] = meter_data["tariff_unit_rate"]
-        if (
-            meter_data.get("standing_charge") is None
-            and meter_data.get("tariff_standing_charge") is not None
-        ):
-            meter_data["standing_charge"] = meter_data["tariff_standing_charge"]
-
-    def test_unit_rate_falls_back_to_tariff(self) -> None:
-        meter_data: dict[str, Any] = {
-            "unit_rate": None,
-            "standing_charge": None,
-            "tariff_unit_rate": 0.2236,
-            "tariff_standing_charge": 0.5335,
+    def test_changed_added_and_removed_keys(self) -> None:
+        previous = {
+            "m1": MeterSnapshot(type="electricity", serial="m1", latest_reading=1.0),
+            "gone": {"type": "ev_charger"},
         }
-        self._apply_tariff_fallback(meter_data)
-        assert meter_data["unit_rate"] == pytest.approx(0.2236)
-        assert meter_data["standing_charge"] == pytest.approx(0.5335)
-
-    def test_cost_endpoint_values_not_overridden(self) -> None:
-        meter_data: dict[str, Any] = {
-            "unit_rate": 0.25,
-            "standing_charge": 0.50,
-            "tariff_unit_rate": 0.2236,
-            "tariff_standing_charge": 0.5335,
+        current = {
+            "m1": MeterSnapshot(type="electricity", serial="m1", latest_reading=2.0),
+            "new": {"type": "ev_charger"},
         }
-        self._apply_tariff_fallback(meter_data)
-        assert meter_data["unit_rate"] == pytest.approx(0.25)
-        assert meter_data["standing_charge"] == pytest.approx(0.50)
+        assert EonNextCoordinator._changed_keys(previous, current) == frozenset(
+            {"m1", "gone", "new"}
+        )
+
+
+class TestDeriveCost:
+    """Cost fields come from the tariff, falling back to the previous refresh."""
+
+    @staticmethod
+    def _coordinator() -> EonNextCoordinator:
+        # Bypass the HA DataUpdateCoordinator base init: _derive_cost only
+        # depends on the warning-dedup set.
+        coord = EonNextCoordinator.__new__(EonNextCoordinator)
+        coord._cost_warning_logged = set()
+        coord.tariff_timeline = TariffTimeline()
+        return coord
+
+    @staticmethod
+    def _snapshot(tariff: TariffSnapshot = NO_TARIFF) -> MeterSnapshot:
+        return MeterSnapshot(type="electricity", serial="m1", tariff=tariff)
+
+    def test_unit_rate_and_standing_charge_come_from_tariff(self) -> None:
+        snapshot = self._snapshot(
+            TariffSnapshot(name="Flex", unit_rate=0.2236, standing_charge=0.5335)
+        )
+        cost = self._coordinator()._derive_cost(snapshot, None, None)
+        assert cost.unit_rate == pytest.approx(0.2236)
+        assert cost.standing_charge == pytest.approx(0.5335)
+        assert cost.previous_day_cost is None
+
+    def test_missing_fields_are_retained_from_previous(self) -> None:
+        previous = replace(
+            self._snapshot(),
+            cost=CostSnapshot(
+                standing_charge=0.5,
+                previous_day_cost=3.0,
+                cost_period="2025-06-14",
+                unit_rate=0.25,
+            ),
+        )
+        cost = self._coordinator()._derive_cost(self._snapshot(), None, previous)
+        # Nothing new could be derived, so the previous object is reused.
+        assert cost is previous.cost
+
+    def test_new_values_win_over_previous(self) -> None:
+        previous = replace(
+            self._snapshot(), cost=CostSnapshot(previous_day_cost=3.0, unit_rate=0.25)
+        )
+        snapshot = self._snapshot(TariffSnapshot(name="Flex", unit_rate=0.30))
+        cost = self._coordinator()._derive_cost(snapshot, None, previous)
+        assert cost.unit_rate == pytest.approx(0.30)
+        assert cost.previous_day_cost == pytest.approx(3.0)
 
     def test_no_fallback_when_tariff_missing(self) -> None:
-        meter_data: dict[str, Any] = {
-            "unit_rate": None,
-            "standing_charge": None,
-            "tariff_unit_rate": None,
-            "tariff_standing_charge": None,
-        }
-        self._apply_tariff_fallback(meter_data)
-        assert meter_data["unit_rate"] is None
-        assert meter_data["standing_charge"] is None
+        cost = self._coordinator()._derive_cost(self._snapshot(), None, None)
+        assert cost.is_empty
+
+    def test_yesterday_is_priced_at_the_agreement_in_force_then(self) -> None:
+        old = TariffSnapshot(
+            name="Old",
+            unit_rate=0.20,
+            standing_charge=0.50,
+            valid_from="2024-01-01T00:00:00+00:00",
+            valid_to=f"{_TODAY}T00:00:00+00:00",
+        )
+        current = TariffSnapshot(
+            name="New",
+            unit_rate=0.30,
+            standing_charge=0.60,
+            valid_from=f"{_TODAY}T00:00:00+00:00",
+        )
+        coord = self._coordinator()
+        coord.tariff_timeline.update("mpan-1", [old, current])
+        snapshot = replace(
+            self._snapshot(current), supply_point_id="mpan-1"
+        )
+        consumption = [
+            _make_entry(f"{_YESTERDAY}T{h:02d}:{m:02d}:00+00:00", 0.5)
+            for h in range(24)
+            for m in (0, 30)
+        ]
+
+        with _patch_now():
+            cost = coord._derive_cost(snapshot, consumption, None)
+
+        # 24 kWh * 0.20 + 0.50, not today's 24 * 0.30 + 0.60.
+        assert cost.previous_day_cost == pytest.approx(5.30)
+        assert cost.unit_rate == pytest.approx(0.30)
 
 
 class TestPreviousDayCostComputation:
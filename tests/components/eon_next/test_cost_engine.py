@@ -0,0 +1,115 @@
+"""Tests for the bulk cost engine."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+import custom_components.eon_next.cost_engine as cost_engine
+from custom_components.eon_next.consumption import ConsumptionSeries
+from custom_components.eon_next.cost_engine import (
+    compile_rate_timeline,
+    price_consumption,
+)
+from custom_components.eon_next.tariff_helpers import rate_for_timestamp
+from homeassistant.util import dt as dt_util
+
+_START = datetime(2026, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "python":
+        monkeypatch.setattr(cost_engine, "_np", None)
+    return request.param
+
+
+def _half_hours(days: int) -> list[datetime]:
+    return [_START + timedelta(minutes=30 * i) for i in range(48 * days)]
+
+
+def _tou_meter_data() -> dict[str, Any]:
+    """Drive tariff: a schedule for the first day only, the pattern after."""
+    schedule = [
+        {
+            "value": 7.0 if slot.hour < 5 else 25.0,
+            "validFrom": slot.isoformat(),
+            "validTo": (slot + timedelta(minutes=30)).isoformat(),
+        }
+        for slot in _half_hours(1)
+    ]
+    return {
+        "tariff_unit_rate": 0.16,
+        "tariff_standing_charge": 0.5,
+        "tariff_is_tou": True,
+        "tariff_code": "E-1R-NEXT-DRIVE-01",
+        "tariff_rates_schedule": schedule,
+    }
+
+
+def test_timeline_matches_per_instant_resolution() -> None:
+    data = _tou_meter_data()
+    slots = _half_hours(4)
+    timeline = compile_rate_timeline(data, slots[0], slots[-1] + timedelta(minutes=30))
+
+    for slot in slots:
+        for offset in (0, 17):
+            when = slot + timedelta(minutes=offset)
+            assert timeline.rate_at(when) == rate_for_timestamp(data, when), when
+    # Far fewer breakpoints than half-hours: only actual rate changes.
+    assert len(timeline.breaks) < len(slots) / 4
+
+
+def test_uniform_rate_is_none_across_a_rate_change() -> None:
+    day = timedelta(days=1)
+    tou = compile_rate_timeline(_tou_meter_data(), _START, _START + 2 * day)
+    flat_data = {**_tou_meter_data(), "tariff_is_tou": False}
+    flat_data.pop("tariff_rates_schedule")
+    flat = compile_rate_timeline(flat_data, _START, _START + 2 * day)
+
+    assert tou.uniform_rate(_START, _START + day) is None
+    assert tou.uniform_rate(_START, _START + timedelta(minutes=30)) == 0.07
+    assert flat.uniform_rate(_START, _START + day) == 0.16
+
+
+def test_per_day_totals_match_per_entry_pricing(engine_backend: str) -> None:
+    data = _tou_meter_data()
+    entries = [
+        {"interval_start": slot.isoformat(), "consumption": 0.1 + (i % 5) / 10}
+        for i, slot in enumerate(_half_hours(4))
+    ]
+
+    cost = price_consumption(data, ConsumptionSeries.from_entries(entries))
+
+    assert cost.priced
+    expected: dict[Any, float] = {}
+    for entry in entries:
+        when = datetime.fromisoformat(entry["interval_start"])
+        day = dt_util.as_local(when).date()
+        rate = rate_for_timestamp(data, when)
+        assert rate is not None
+        expected[day] = expected.get(day, 0.0) + entry["consumption"] * rate
+    assert [day.day for day in cost.days] == sorted(expected)
+    for day in cost.days:
+        assert day.energy_cost == pytest.approx(expected[day.day], abs=1e-4)
+        assert day.standing_charge == 0.5
+    assert cost.standing_charge == pytest.approx(0.5 * len(cost.days))
+    assert cost.energy_cost == pytest.approx(sum(expected.values()), abs=1e-3)
+
+
+def test_skips_unusable_entries_and_reports_unpriced(engine_backend: str) -> None:
+    entries = [
+        {"interval_start": None, "consumption": 5},
+        {"interval_start": _START.isoformat(), "consumption": "bad"},
+        {"interval_start": _START.isoformat(), "consumption": 2.0},
+    ]
+
+    flat = price_consumption({"tariff_unit_rate": 0.2}, entries)
+    unpriced = price_consumption({}, entries)
+
+    assert flat.energy_cost == pytest.approx(0.4)
+    assert sum(day.consumption_kwh for day in flat.days) == pytest.approx(2.0)
+    assert unpriced.priced is False
+    assert price_consumption({}, []).days == []
@@ -0,0 +1,77 @@
+"""Tests for the compact cost-tracker daily/monthly rollups."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from custom_components.eon_next.cost_tracker_history import (
+    HISTORY_DAYS,
+    HISTORY_MONTHS,
+    CostTrackerHistory,
+)
+
+
+def test_record_fills_gaps_and_aggregates_months() -> None:
+    history = CostTrackerHistory()
+    history.record(date(2026, 9, 29), 1.0, 0.2)
+    history.record(date(2026, 10, 2), 2.0, 0.5)
+    history.record(date(2026, 10, 2), 0.5, 0.1)
+
+    assert list(history.days()) == [
+        (date(2026, 9, 29), 1.0, 0.2),
+        (date(2026, 9, 30), 0.0, 0.0),
+        (date(2026, 10, 1), 0.0, 0.0),
+        (date(2026, 10, 2), 2.5, 0.6),
+    ]
+    assert history.months == {"2026-09": [1.0, 0.2], "2026-10": [2.5, 0.6]}
+    # 2026-09-28 is the Monday of that ISO week.
+    assert history.weeks() == [(date(2026, 9, 28), 3.5, 0.8)]
+    assert list(history.days(since=date(2026, 10, 1)))[0][0] == date(2026, 10, 1)
+
+
+def test_weeks_since_midweek_start_from_that_monday() -> None:
+    history = CostTrackerHistory()
+    for offset in range(14):
+        history.record(date(2026, 9, 28) + timedelta(days=offset), 1.0, 0.5)
+
+    # Thursday 2026-10-08: its week still counts all seven days.
+    assert history.weeks(since=date(2026, 10, 8)) == [(date(2026, 10, 5), 7.0, 3.5)]
+
+
+def test_daily_window_is_fixed_size() -> None:
+    history = CostTrackerHistory()
+    start = date(2025, 1, 1)
+    history.record(start, 1.0, 1.0)
+    last = start + timedelta(days=HISTORY_DAYS + 9)
+    history.record(last, 2.0, 2.0)
+
+    assert len(history.kwh) == HISTORY_DAYS
+    assert history.last_day == last
+    assert history.first_day == last - timedelta(days=HISTORY_DAYS - 1)
+    # Out of the daily window, but still counted in its month.
+    history.record(start, 1.0, 1.0)
+    assert len(history.kwh) == HISTORY_DAYS
+    assert history.months["2025-01"] == [2.0, 2.0]
+
+
+def test_months_are_capped() -> None:
+    history = CostTrackerHistory()
+    for offset in range(HISTORY_MONTHS + 2):
+        year, month = divmod(offset, 12)
+        history.record(date(2010 + year, month + 1, 1), 1.0, 1.0)
+
+    assert len(history.months) == HISTORY_MONTHS
+    assert "2010-01" not in history.months
+
+
+def test_round_trips_through_storage_form() -> None:
+    history = CostTrackerHistory()
+    history.record(date(2026, 10, 1), 1.25, 0.3)
+    history.record(date(2026, 10, 3), 2.0, 0.4)
+
+    restored = CostTrackerHistory.from_dict(history.as_dict())
+
+    assert list(restored.days()) == list(history.days())
+    assert restored.months == history.months
+    assert list(CostTrackerHistory.from_dict({"kwh": "bad"}).days()) == []
+    assert CostTrackerHistory.from_dict(None).last_day is None
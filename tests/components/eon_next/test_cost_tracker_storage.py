@@ -1,11 +1,15 @@
-"""Regression tests: cost-tracker storage writes are debounced (spec 05, 5.1)."""
+"""Regression tests: cost-tracker storage writes are debounced (spec 05, 5.1)
+and scale with the trackers that changed."""
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, Mock
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
+from custom_components.eon_next.const import DOMAIN
 from custom_components.eon_next.cost_tracker import (
     _SAVE_DELAY_SECONDS,
     CostTrackerConfig,
@@ -13,6 +17,14 @@ from custom_components.eon_next.cost_tracker import (
     CostTrackerState,
     EonNextCostTrackerManager,
 )
+from homeassistant.util import dt as dt_util
+
+
+def _state_store() -> Mock:
+    store = Mock()
+    store.async_save = AsyncMock()
+    store.async_delay_save = Mock()
+    return store
 
 
 def _manager_with_mock_store(trackers=None) -> EonNextCostTrackerManager:
@@ -21,18 +33,21 @@ def _manager_with_mock_store(trackers=None) -> EonNextCostTrackerManager:
     mgr._store.async_save = AsyncMock()
     mgr._store.async_delay_save = Mock()
     mgr._trackers = trackers or {}
+    mgr._state_stores = {tracker_id: _state_store() for tracker_id in mgr._trackers}
+    mgr._history_stores = {}
+    mgr._dirty = set()
     mgr._shutdown = False
     mgr._unsub_midnight = None
-    mgr._pending_tasks = set()
+    mgr._unsub_flush = None
     mgr._remove_listeners = []
     mgr._state_listeners = {}
     return mgr
 
 
-def _runtime() -> CostTrackerRuntime:
+def _runtime(tracker_id: str = "t1") -> CostTrackerRuntime:
     return CostTrackerRuntime(
         config=CostTrackerConfig(
-            id="t1",
+            id=tracker_id,
             name="Washer",
             tracked_entity_id="sensor.washer_energy",
             meter_serial="m1",
@@ -42,36 +57,43 @@ def _runtime() -> CostTrackerRuntime:
     )
 
 
-def test_delay_save_debounces_via_store() -> None:
-    """The hot path schedules a delayed save rather than writing immediately."""
-    mgr = _manager_with_mock_store()
-    mgr._delay_save()
+def test_delay_save_debounces_only_the_changed_tracker() -> None:
+    """The hot path schedules a delayed save of one tracker's totals."""
+    mgr = _manager_with_mock_store({"t1": _runtime("t1"), "t2": _runtime("t2")})
+    mgr._delay_save("t1")
 
-    mgr._store.async_delay_save.assert_called_once_with(
-        mgr._snapshot, _SAVE_DELAY_SECONDS
-    )
+    t1_store = mgr._state_stores["t1"]
+    t1_store.async_delay_save.assert_called_once()
+    data_func, delay = t1_store.async_delay_save.call_args.args
+    assert delay == _SAVE_DELAY_SECONDS
+    assert data_func()["today_cost"] == 0.3
+    assert mgr._dirty == set()
+    mgr._state_stores["t2"].async_delay_save.assert_not_called()
     mgr._store.async_save.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_save_writes_immediately() -> None:
-    """Structural/shutdown saves persist immediately with the full snapshot."""
+async def test_save_writes_configuration_only() -> None:
+    """Structural saves persist the configuration without running totals."""
     mgr = _manager_with_mock_store({"t1": _runtime()})
     await mgr._save()
 
     mgr._store.async_save.assert_awaited_once()
     payload = mgr._store.async_save.await_args.args[0]
     assert payload["trackers"][0]["id"] == "t1"
-    assert payload["trackers"][0]["today_cost"] == 0.3
+    assert "today_cost" not in payload["trackers"][0]
 
 
 @pytest.mark.asyncio
 async def test_shutdown_flushes_pending_state() -> None:
-    """async_shutdown flushes immediately so a pending delayed write isn't lost."""
-    mgr = _manager_with_mock_store({"t1": _runtime()})
+    """async_shutdown writes pending delayed saves so they aren't lost."""
+    mgr = _manager_with_mock_store({"t1": _runtime("t1"), "t2": _runtime("t2")})
+    mgr._delay_save("t1")
+
     await mgr.async_shutdown()
 
-    mgr._store.async_save.assert_awaited_once()
+    mgr._state_stores["t1"].async_save.assert_awaited_once()
+    mgr._state_stores["t2"].async_save.assert_not_called()
 
 
 def test_snapshot_is_json_serializable_shape() -> None:
@@ -81,3 +103,170 @@ def test_snapshot_is_json_serializable_shape() -> None:
     entry = snap["trackers"][0]
     assert entry["tracked_entity_id"] == "sensor.washer_energy"
     assert entry["enabled"] is True
+
+
+@pytest.mark.asyncio
+async def test_inline_totals_from_older_releases_move_to_tracker_stores(
+    hass, hass_storage: dict[str, Any]
+) -> None:
+    config_key = f"{DOMAIN}_entry-1_cost_trackers"
+    hass_storage[config_key] = {
+        "version": 1,
+        "key": config_key,
+        "data": {
+            "trackers": [
+                {
+                    "id": "washer",
+                    "name": "Washer",
+                    "tracked_entity_id": "sensor.washer_energy",
+                    "meter_serial": "m1",
+                    "enabled": True,
+                    "today_consumption_kwh": 1.5,
+                    "today_cost": 0.3,
+                    "last_reset": None,
+                    "last_energy_value": 12.0,
+                    "last_energy_unit": "kWh",
+                }
+            ]
+        },
+    }
+    mgr = EonNextCostTrackerManager(hass, "entry-1", MagicMock(data={}))
+
+    await mgr.async_initialize()
+    await mgr.async_shutdown()
+
+    state = mgr.get_state("washer")
+    assert state is not None and state.last_energy_value == 12.0
+    tracker_data = hass_storage[f"{DOMAIN}_entry-1_cost_tracker_washer"]["data"]
+    assert tracker_data["last_energy_value"] == 12.0
+    assert "last_energy_value" not in hass_storage[config_key]["data"]["trackers"][0]
+
+
+@pytest.mark.asyncio
+async def test_rollover_records_the_closed_day_in_tracker_history(
+    hass, hass_storage: dict[str, Any]
+) -> None:
+    yesterday = dt_util.now() - timedelta(days=1)
+    hass_storage[f"{DOMAIN}_entry-1_cost_trackers"] = {
+        "version": 1,
+        "key": f"{DOMAIN}_entry-1_cost_trackers",
+        "data": {
+            "trackers": [
+                {
+                    "id": "washer",
+                    "name": "Washer",
+                    "tracked_entity_id": "sensor.washer_energy",
+                    "meter_serial": "m1",
+                    "today_consumption_kwh": 1.5,
+                    "today_cost": 0.3,
+                    "last_reset": yesterday.isoformat(),
+                }
+            ]
+        },
+    }
+    mgr = EonNextCostTrackerManager(hass, "entry-1", MagicMock(data={}))
+
+    await mgr.async_initialize()
+    await hass.async_block_till_done()
+    await mgr.async_shutdown()
+
+    state = mgr.get_state("washer")
+    assert state is not None and state.today_cost == 0.0
+    history = mgr.get_history("washer")
+    assert history is not None
+    assert list(history.days()) == [(yesterday.date(), 1.5, 0.3)]
+    stored = hass_storage[f"{DOMAIN}_entry-1_cost_tracker_history_washer"]["data"]
+    assert stored["kwh"] == [1.5]
+    assert stored["months"] == {yesterday.strftime("%Y-%m"): [1.5, 0.3]}
+
+
+@pytest.mark.asyncio
+async def test_restarts_after_a_rollover_do_not_record_the_day_again(
+    hass, hass_storage: dict[str, Any]
+) -> None:
+    """An idle tracker rolled over at startup persists its reset totals, and
+    a day the history already holds is never recorded twice."""
+    yesterday = dt_util.now() - timedelta(days=1)
+    hass_storage[f"{DOMAIN}_entry-1_cost_trackers"] = {
+        "version": 1,
+        "key": f"{DOMAIN}_entry-1_cost_trackers",
+        "data": {
+            "trackers": [
+                {
+                    "id": "washer",
+                    "name": "Washer",
+                    "tracked_entity_id": "sensor.washer_energy",
+                    "meter_serial": "m1",
+                }
+            ]
+        },
+    }
+    hass_storage[f"{DOMAIN}_entry-1_cost_tracker_washer"] = {
+        "version": 1,
+        "key": f"{DOMAIN}_entry-1_cost_tracker_washer",
+        "data": {
+            "today_consumption_kwh": 1.5,
+            "today_cost": 0.3,
+            "last_reset": yesterday.isoformat(),
+        },
+    }
+
+    for _ in range(3):
+        mgr = EonNextCostTrackerManager(hass, "entry-1", MagicMock(data={}))
+        await mgr.async_initialize()
+        await hass.async_block_till_done()
+        await mgr.async_shutdown()
+
+    state = hass_storage[f"{DOMAIN}_entry-1_cost_tracker_washer"]["data"]
+    assert state["today_consumption_kwh"] == 0.0
+    assert state["today_cost"] == 0.0
+    stored = hass_storage[f"{DOMAIN}_entry-1_cost_tracker_history_washer"]["data"]
+    assert stored["kwh"] == [1.5]
+    assert stored["cost"] == [0.3]
+    assert stored["months"] == {yesterday.strftime("%Y-%m"): [1.5, 0.3]}
+
+
+@pytest.mark.asyncio
+async def test_rollover_skips_a_day_already_in_history(
+    hass, hass_storage: dict[str, Any]
+) -> None:
+    """History saved but reset totals lost (restart between the two writes)."""
+    yesterday = dt_util.now() - timedelta(days=1)
+    hass_storage[f"{DOMAIN}_entry-1_cost_trackers"] = {
+        "version": 1,
+        "key": f"{DOMAIN}_entry-1_cost_trackers",
+        "data": {
+            "trackers": [
+                {
+                    "id": "washer",
+                    "name": "Washer",
+                    "tracked_entity_id": "sensor.washer_energy",
+                    "meter_serial": "m1",
+                    "today_consumption_kwh": 1.5,
+                    "today_cost": 0.3,
+                    "last_reset": yesterday.isoformat(),
+                }
+            ]
+        },
+    }
+    hass_storage[f"{DOMAIN}_entry-1_cost_tracker_history_washer"] = {
+        "version": 1,
+        "key": f"{DOMAIN}_entry-1_cost_tracker_history_washer",
+        "data": {
+            "first_day": yesterday.date().isoformat(),
+            "kwh": [1.5],
+            "cost": [0.3],
+            "months": {yesterday.strftime("%Y-%m"): [1.5, 0.3]},
+        },
+    }
+    mgr = EonNextCostTrackerManager(hass, "entry-1", MagicMock(data={}))
+
+    await mgr.async_initialize()
+    await hass.async_block_till_done()
+    await mgr.async_shutdown()
+
+    history = mgr.get_history("washer")
+    assert history is not None
+    assert list(history.days()) == [(yesterday.date(), 1.5, 0.3)]
+    state = mgr.get_state("washer")
+    assert state is not None and state.today_consumption_kwh == 0.0
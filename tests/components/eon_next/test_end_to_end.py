@@ -0,0 +1,147 @@
+"""End-to-end tests: the real API client against the fake Kraken server."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+from fake_kraken import FakeKraken, generate_accounts
+import pytest
+
+from custom_components.eon_next.eonnext import (
+    METER_TYPE_ELECTRIC,
+    METER_TYPE_GAS,
+    EonNext,
+    EonNextTransientError,
+)
+
+
+@pytest.fixture
+async def api(fake_kraken: FakeKraken) -> AsyncIterator[EonNext]:
+    client = EonNext()
+    client._sleep = AsyncMock()  # skip retry back-off
+    yield client
+    await client.async_close()
+
+
+async def test_login_discovers_accounts_meters_and_tariffs(
+    fake_kraken: FakeKraken, api: EonNext
+) -> None:
+    fake_kraken.use_accounts(generate_accounts(2, agile_every=1, ev_every=1))
+
+    assert await api.login_with_username_and_password("user@example.com", "secret")
+
+    assert [a.account_number for a in api.accounts] == ["A-00000001", "A-00000002"]
+    account = api.accounts[0]
+    assert sorted(meter.get_type() for meter in account.meters) == [
+        METER_TYPE_ELECTRIC,
+        METER_TYPE_GAS,
+    ]
+    assert [charger.device_id for charger in account.ev_chargers] == ["device-1"]
+
+    tariffs = await api.async_get_tariff_data(account.account_number)
+    assert tariffs is not None
+    electric = next(m for m in account.meters if m.get_type() == METER_TYPE_ELECTRIC)
+    agile = tariffs[electric.supply_point_id]
+    assert agile["tariff_is_tou"] is True
+    assert len(agile["unit_rates_schedule"]) == 96
+    assert len(agile["agreements"]) == 2
+
+
+async def test_wrong_password_is_rejected(api: EonNext) -> None:
+    assert not await api.login_with_username_and_password("user@example.com", "nope")
+
+
+async def test_consumption_pages_newest_first_and_revalidates(
+    fake_kraken: FakeKraken, api: EonNext
+) -> None:
+    assert await api.login_with_username_and_password("user@example.com", "secret")
+    meter = api.accounts[0].meters[0]
+
+    first = await api.async_get_consumption(
+        meter.get_type(), meter.supply_point_id, meter.serial, "half_hour", 100
+    )
+    again = await api.async_get_consumption(
+        meter.get_type(), meter.supply_point_id, meter.serial, "half_hour", 100
+    )
+
+    assert first is not None
+    assert first["count"] > 100
+    assert "page=2" in first["next"]
+    starts = [entry["interval_start"] for entry in first["results"]]
+    assert len(starts) == 100
+    assert starts == sorted(starts, reverse=True)
+    # The unchanged page comes back as a 304 and the cached body is reused.
+    assert again == first
+    assert fake_kraken.requests[("consumption", 304)] == 1
+
+
+async def test_daily_consumption_covers_the_requested_days(api: EonNext) -> None:
+    assert await api.login_with_username_and_password("user@example.com", "secret")
+    meter = api.accounts[0].meters[0]
+    period_to = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)
+
+    result = await api.async_get_consumption(
+        meter.get_type(),
+        meter.supply_point_id,
+        meter.serial,
+        group_by="day",
+        page_size=30,
+        period_from=(period_to - timedelta(days=30)).isoformat(),
+        period_to=period_to.isoformat(),
+    )
+
+    assert result is not None
+    assert len(result["results"]) in (29, 30)  # DST may shift a local midnight
+    assert all(entry["consumption"] > 0 for entry in result["results"])
+
+
+async def test_rate_limits_and_server_errors_are_retried(
+    fake_kraken: FakeKraken, api: EonNext
+) -> None:
+    assert await api.login_with_username_and_password("user@example.com", "secret")
+    meter = api.accounts[0].meters[0]
+    fake_kraken.fail_next(1, 429, route="consumption", retry_after=2)
+    fake_kraken.fail_next(1, 503, route="consumption")
+
+    result = await api.async_get_consumption(
+        meter.get_type(), meter.supply_point_id, meter.serial, "half_hour", 10
+    )
+
+    assert result is not None
+    assert api.retry_stats["consumption"]["recovered"] == 1
+    assert api.retry_stats["consumption"]["retries"] == 2
+    # The 429's Retry-After is honoured.
+    assert api._sleep.await_args_list[0].args == (2.0,)  # type: ignore[attr-defined]
+
+
+async def test_persistent_outage_exhausts_retries(
+    fake_kraken: FakeKraken, api: EonNext
+) -> None:
+    assert await api.login_with_username_and_password("user@example.com", "secret")
+    meter = api.accounts[0].meters[0]
+    fake_kraken.faults.error_rate = 1.0
+
+    with pytest.raises(EonNextTransientError):
+        await api.async_get_consumption(
+            meter.get_type(), meter.supply_point_id, meter.serial, "half_hour", 10
+        )
+
+    assert api.retry_stats["consumption"]["exhausted"] == 1
+
+
+async def test_expired_token_is_refreshed_transparently(
+    fake_kraken: FakeKraken, api: EonNext
+) -> None:
+    assert await api.login_with_username_and_password("user@example.com", "secret")
+    meter = api.accounts[0].meters[0]
+    fake_kraken.expire_tokens()
+
+    result = await api.async_get_consumption(
+        meter.get_type(), meter.supply_point_id, meter.serial, "half_hour", 10
+    )
+
+    assert result is not None
+    assert fake_kraken.requests[("consumption", 401)] == 1
+    assert fake_kraken.requests[("refreshToken", 200)] == 1
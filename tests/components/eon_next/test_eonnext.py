@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 from unittest.mock import AsyncMock
 
+import aiohttp
 import pytest
 
 from datetime import datetime, timedelta, timezone
 
+from custom_components.eon_next import eonnext as eonnext_module
+from custom_components.eon_next.api_metrics import LatencyHistogram
 from custom_components.eon_next.eonnext import (
     EnergyAccount,
     EonNext,
     EonNextApiError,
     EonNextAuthError,
+    EonNextCircuitOpenError,
     METER_TYPE_ELECTRIC,
+    RetryPolicy,
 )
 
 _PAST_ISO = (datetime.now(tz=timezone.utc) - timedelta(days=1)).isoformat()
@@ -32,12 +40,33 @@ def _seed_valid_auth(api: EonNext) -> int:
     return now
 
 
+class _FakeStream:
+    """Stand-in for ``response.content``; yields the body in small chunks."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def iter_chunked(self, _size: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._body), 7):
+            yield self._body[start : start + 7]
+
+
 class _FakeResponse:
     """Minimal async-context-manager stand-in for an aiohttp response."""
 
-    def __init__(self, status: int, json_data: Any = None) -> None:
+    def __init__(
+        self,
+        status: int,
+        json_data: Any = None,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+    ) -> None:
         self.status = status
-        self._json = json_data if json_data is not None else {}
+        self.headers = headers or {}
+        if body is None:
+            body = json.dumps(json_data if json_data is not None else {}).encode()
+        self._body = body
+        self.content = _FakeStream(self._body)
 
     async def __aenter__(self) -> "_FakeResponse":
         return self
@@ -45,11 +74,13 @@ class _FakeResponse:
     async def __aexit__(self, *_exc: Any) -> None:
         return None
 
-    async def json(self, *_args: Any, **_kwargs: Any) -> Any:
-        return self._json
+    async def read(self) -> bytes:
+        return self._body
 
-    async def text(self) -> str:
-        return ""
+
+def _readings(result: dict | None) -> list[float | None]:
+    assert result is not None
+    return [item["consumption"] for item in result["results"]]
 
 
 class _FakeSession:
@@ -156,6 +187,86 @@ async def test_force_token_refresh_obtains_new_token() -> None:
     assert api.auth["refresh"]["token"] == "new-refresh"
 
 
+def _token_payload(now: int, token: str = "new-jwt") -> dict:
+    return {
+        "data": {
+            "obtainKrakenToken": {
+                "token": token,
+                "refreshToken": "new-refresh",
+                "refreshExpiresIn": 7200,
+                "payload": {"iat": now, "exp": now + 3600},
+            }
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_returned_without_taking_the_auth_lock() -> None:
+    """A valid token must not queue callers behind an in-progress refresh."""
+    api = EonNext()
+    _seed_valid_auth(api)
+
+    async with api._auth_lock:
+        token = await asyncio.wait_for(
+            api._EonNext__auth_token(),  # type: ignore[attr-defined]
+            timeout=1,
+        )
+
+    assert token == "jwt"
+
+
+def test_token_refresh_due_in_leads_expiry() -> None:
+    api = EonNext()
+    assert api.token_refresh_due_in() is None
+
+    now = _seed_valid_auth(api)
+    due_in = api.token_refresh_due_in()
+    assert due_in is not None
+    assert 3600 - eonnext_module.TOKEN_REFRESH_LEAD_SECONDS - 2 <= due_in
+    assert due_in <= 3600 - eonnext_module.TOKEN_REFRESH_LEAD_SECONDS
+
+    api.auth["token"]["expires"] = now + 10
+    assert api.token_refresh_due_in() == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_renews_without_dropping_current_token() -> None:
+    api = EonNext()
+    now = _seed_valid_auth(api)
+    api.auth["token"]["expires"] = now + 120  # inside the lead, still valid
+    seen_during_refresh: list[str | None] = []
+
+    async def _fake_post(*_args: Any, **_kwargs: Any) -> dict:
+        seen_during_refresh.append(api.auth["token"]["token"])
+        return _token_payload(now)
+
+    api._graphql_post = AsyncMock(side_effect=_fake_post)  # type: ignore[method-assign]
+
+    assert await api.async_refresh_token() is True
+    assert seen_during_refresh == ["jwt"]
+    assert api.auth["token"]["token"] == "new-jwt"
+
+    # Already fresh: a second (e.g. concurrent) call is a no-op.
+    assert await api.async_refresh_token() is True
+    assert api._graphql_post.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_falls_back_to_password_when_refresh_rejected() -> None:
+    api = EonNext()
+    now = _seed_valid_auth(api)
+    api.auth["token"]["expires"] = now + 120
+    api._graphql_post = AsyncMock(  # type: ignore[method-assign]
+        side_effect=[{"errors": [{"message": "expired"}]}, _token_payload(now)],
+    )
+
+    assert await api.async_refresh_token() is True
+    assert [call.args[0] for call in api._graphql_post.await_args_list] == [
+        "refreshToken",
+        "loginEmailAuthentication",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_consumption_retries_once_on_401_then_succeeds() -> None:
     """A single 401 triggers one refresh-and-retry rather than a re-auth."""
@@ -173,7 +284,7 @@ async def test_consumption_retries_once_on_401_then_succeeds() -> None:
         METER_TYPE_ELECTRIC, "sp-1", "m1", group_by="day", page_size=1
     )
 
-    assert result == {"results": [{"consumption": 1}]}
+    assert _readings(result) == [1]
     api._force_token_refresh.assert_awaited_once()
     assert len(session.headers_seen) == 2
 
@@ -215,6 +326,526 @@ async def test_graphql_retries_once_on_401_then_succeeds() -> None:
     assert len(session.headers_seen) == 2
 
 
+# --- request metrics ---
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_record_each_attempt_by_status() -> None:
+    """Each attempt is timed under its operation and status, with its bytes;
+    retry attempts are counted and timed apart from first attempts."""
+    api = EonNext()
+    _seed_valid_auth(api)
+    api._force_token_refresh = AsyncMock(return_value=True)  # type: ignore[method-assign]
+    api._sleep = AsyncMock()
+    body = {"results": [{"consumption": 1}]}
+    session = _FakeSession([
+        _FakeResponse(401),
+        _FakeResponse(200, {"data": {"ok": True}}),
+        _FakeResponse(503),
+        _FakeResponse(200, body),
+    ])
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    await api._graphql_post("op", "query {}", {})
+    await api.async_get_consumption(
+        METER_TYPE_ELECTRIC, "sp-1", "m1", group_by="day", page_size=1
+    )
+
+    metrics = api.request_metrics
+    graphql = metrics["operations"]["op"]
+    assert graphql["requests"] == 2
+    assert set(graphql["by_status"]) == {"200", "401"}
+    assert graphql["bytes_out"] > 0
+    # Only bodies actually read count: not the 401's or the 503's.
+    assert graphql["bytes_in"] == len(json.dumps({"data": {"ok": True}}))
+    consumption = metrics["operations"]["consumption"]
+    assert {s: h["count"] for s, h in consumption["by_status"].items()} == {
+        "503": 1,
+    }
+    assert consumption["retries"] == 1
+    assert consumption["retry_latency"]["count"] == 1
+    assert graphql["retries"] == 0
+    assert consumption["bytes_in"] == len(json.dumps(body))
+    assert consumption["in_flight"] == 0
+    assert consumption["peak_in_flight"] == 1
+    assert metrics["requests"]["count"] == 3
+    assert metrics["retries"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_non_json_graphql_body_is_an_api_error_and_counts_its_bytes() -> None:
+    """A body that is not JSON (e.g. a proxy page sent without Content-Length)
+    is an API error, and the bytes actually read are recorded."""
+    api = EonNext()
+    _seed_valid_auth(api)
+    page = b"<html>Service temporarily unavailable</html>"
+    session = _FakeSession([_FakeResponse(200, body=page)])
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    with pytest.raises(EonNextApiError, match="Invalid API response"):
+        await api._graphql_post("op", "query {}", {})
+
+    assert api.request_metrics["operations"]["op"]["bytes_in"] == len(page)
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_label_transport_failures() -> None:
+    api = EonNext()
+    _seed_valid_auth(api)
+    api.retry_policy = RetryPolicy(max_attempts=1)
+
+    class _BrokenSession:
+        def post(self, *_args: Any, **_kwargs: Any) -> Any:
+            raise aiohttp.ClientConnectionError("reset")
+
+    api._get_session = AsyncMock(return_value=_BrokenSession())  # type: ignore[method-assign]
+
+    with pytest.raises(EonNextApiError):
+        await api._graphql_post("op", "query {}", {})
+
+    assert list(api.request_metrics["operations"]["op"]["by_status"]) == ["error"]
+
+
+def test_latency_histogram_quantiles() -> None:
+    histogram = LatencyHistogram()
+    for seconds in (0.01, 0.02, 0.2, 0.3, 40.0):
+        histogram.observe(seconds)
+
+    summary = histogram.as_dict()
+
+    assert summary["count"] == 5
+    assert summary["p50_ms"] == 250.0
+    assert summary["p95_ms"] == 40000.0  # past the last bound: the maximum
+    assert summary["buckets"]["le_50ms"] == 2
+    assert summary["buckets"]["inf"] == 1
+    assert LatencyHistogram().as_dict()["p95_ms"] is None
+
+
+# --- single-flight request coalescing ---
+
+
+class _GatedSession(_FakeSession):
+    """A session whose responses are held until ``release`` is set."""
+
+    def __init__(self, responses: list[_FakeResponse]) -> None:
+        super().__init__(responses)
+        self.release = asyncio.Event()
+
+    def get(self, _url: str, params=None, headers=None) -> _FakeResponse:
+        response = super().get(_url, params=params, headers=headers)
+        release = self.release
+
+        class _Held(_FakeResponse):
+            async def __aenter__(self) -> "_FakeResponse":
+                await release.wait()
+                return response
+
+        return _Held(response.status, headers=response.headers)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_consumption_calls_share_one_request() -> None:
+    api = EonNext()
+    _seed_valid_auth(api)
+    session = _GatedSession([_FakeResponse(200, {"results": [{"consumption": 2}]})])
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    calls = [
+        asyncio.create_task(
+            api.async_get_consumption(
+                METER_TYPE_ELECTRIC, "sp-1", "m1", group_by="day", page_size=7
+            )
+        )
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    session.release.set()
+    results = await asyncio.gather(*calls)
+
+    assert _readings(results[0]) == [2]
+    assert all(result is results[0] for result in results)
+    assert len(session.headers_seen) == 1
+    assert api.single_flight_stats == {"consumption": {"requests": 1, "shared": 2}}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_does_not_merge_different_params() -> None:
+    api = EonNext()
+    _seed_valid_auth(api)
+    session = _GatedSession([
+        _FakeResponse(200, {"results": [{"consumption": 1}]}),
+        _FakeResponse(200, {"results": [{"consumption": 2}]}),
+    ])
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    first = asyncio.create_task(
+        api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1", page_size=1)
+    )
+    second = asyncio.create_task(
+        api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1", page_size=2)
+    )
+    await asyncio.sleep(0)
+    session.release.set()
+    await asyncio.gather(first, second)
+
+    assert len(session.headers_seen) == 2
+    assert api.single_flight_stats["consumption"] == {"requests": 2, "shared": 0}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_errors_and_then_forgets_the_key() -> None:
+    api = EonNext()
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def _failing() -> None:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await release.wait()
+        raise EonNextApiError("boom")
+
+    leader = asyncio.create_task(api._single_flight("op", "k", _failing))
+    await started.wait()
+    follower = asyncio.create_task(api._single_flight("op", "k", _failing))
+    await asyncio.sleep(0)
+    release.set()
+
+    for task in (leader, follower):
+        with pytest.raises(EonNextApiError, match="boom"):
+            await task
+    assert calls == 1
+
+    # Completed flights are not cached: the next call starts a new request.
+    release.clear()
+    started.clear()
+    retry = asyncio.create_task(api._single_flight("op", "k", _failing))
+    await started.wait()
+    release.set()
+    with pytest.raises(EonNextApiError):
+        await retry
+    assert calls == 2
+
+
+# --- response cache and conditional consumption requests ---
+
+
+@pytest.mark.asyncio
+async def test_cacheable_graphql_operation_is_served_from_cache() -> None:
+    api = EonNext()
+    _seed_valid_auth(api)
+    session = _FakeSession([_FakeResponse(200, {"data": {"properties": []}})])
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    variables = {"accountNumber": "A-1"}
+    first = await api._graphql_post("getAccountAgreements", "query {}", variables)
+    second = await api._graphql_post("getAccountAgreements", "query {}", variables)
+
+    assert first == second == {"data": {"properties": []}}
+    assert len(session.headers_seen) == 1
+    assert api.response_cache_stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_graphql_errors_and_uncached_operations_are_not_cached() -> None:
+    api = EonNext()
+    _seed_valid_auth(api)
+    session = _FakeSession([
+        _FakeResponse(200, {"errors": [{"message": "boom"}]}),
+        _FakeResponse(200, {"data": {}}),
+        _FakeResponse(200, {"data": {}}),
+        _FakeResponse(200, {"data": {}}),
+    ])
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    await api._graphql_post("getAccountDevices", "query {}", {"accountNumber": "A"})
+    await api._graphql_post("getAccountDevices", "query {}", {"accountNumber": "A"})
+    await api._graphql_post("getSmartChargingSchedule", "query {}", {"deviceId": "d"})
+    await api._graphql_post("getSmartChargingSchedule", "query {}", {"deviceId": "d"})
+
+    assert len(session.headers_seen) == 4
+
+
+def test_response_cache_expires_and_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(eonnext_module.time, "monotonic", lambda: now[0])
+    cache = eonnext_module._ResponseCache(max_entries=2)
+
+    cache.set("a", 1, ttl_seconds=10)
+    cache.set("b", 2, ttl_seconds=100)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.set("c", 3, ttl_seconds=100)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    now[0] += 11
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_auth_invalidates_response_cache() -> None:
+    api = EonNext()
+    _seed_valid_auth(api)
+    api._response_cache.set(("getAccountDevices", "{}"), {"data": {}}, 60)
+    api._graphql_post = AsyncMock(  # type: ignore[method-assign]
+        side_effect=EonNextAuthError("bad"),
+    )
+
+    assert await api.login_with_refresh_token("expired") is False
+    assert api.response_cache_stats["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_consumption_revalidates_with_etag_and_reuses_body_on_304() -> None:
+    api = EonNext()
+    _seed_valid_auth(api)
+    body = {"results": [{"consumption": 3}]}
+    session = _FakeSession([
+        _FakeResponse(200, body, headers={"ETag": 'W/"v1"'}),
+        _FakeResponse(304),
+    ])
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    first = await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1")
+    second = await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1")
+
+    assert _readings(first) == [3]
+    assert second is first
+    assert "If-None-Match" not in session.headers_seen[0]
+    assert session.headers_seen[1]["If-None-Match"] == 'W/"v1"'
+    assert api.response_cache_stats["consumption_not_modified"] == 1
+
+
+# --- circuit breaker ---
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_repeated_failures_and_fails_fast(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(eonnext_module.time, "monotonic", lambda: now[0])
+    api = EonNext()
+    _seed_valid_auth(api)
+    api.retry_policy = RetryPolicy(max_attempts=1)
+    session = _FakeSession(
+        [_FakeResponse(503) for _ in range(eonnext_module._CIRCUIT_FAILURE_THRESHOLD)]
+    )
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    for day in range(eonnext_module._CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(EonNextApiError):
+            await api.async_get_consumption(
+                METER_TYPE_ELECTRIC, "sp-1", "m1", period_from=f"2025-01-0{day + 1}"
+            )
+
+    assert api.circuit_open(eonnext_module.CIRCUIT_CONSUMPTION)
+    with pytest.raises(EonNextCircuitOpenError):
+        await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1")
+    # Rejected without a request; GraphQL is a separate family.
+    assert len(session.headers_seen) == eonnext_module._CIRCUIT_FAILURE_THRESHOLD
+    assert not api.circuit_open(eonnext_module.CIRCUIT_GRAPHQL)
+    stats = api.circuit_breaker_stats[eonnext_module.CIRCUIT_CONSUMPTION]
+    assert stats == {"state": "open", "trips": 1, "rejected": 1}
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_lets_one_probe_through(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(eonnext_module.time, "monotonic", lambda: now[0])
+    api = EonNext()
+    _seed_valid_auth(api)
+    api.retry_policy = RetryPolicy(max_attempts=1)
+    breaker = api._circuits[eonnext_module.CIRCUIT_GRAPHQL]
+    for _ in range(eonnext_module._CIRCUIT_FAILURE_THRESHOLD):
+        breaker.record_failure()
+    now[0] += eonnext_module._CIRCUIT_RESET_SECONDS
+
+    # A failed probe re-opens the circuit straight away.
+    api._get_session = AsyncMock(  # type: ignore[method-assign]
+        return_value=_FakeSession([_FakeResponse(502)])
+    )
+    with pytest.raises(EonNextApiError):
+        await api._graphql_post("op", "query {}", {})
+    assert breaker.state == "open"
+
+    # A successful probe closes it.
+    now[0] += eonnext_module._CIRCUIT_RESET_SECONDS
+    api._get_session = AsyncMock(  # type: ignore[method-assign]
+        return_value=_FakeSession([_FakeResponse(200, {"data": {"ok": True}})])
+    )
+    assert await api._graphql_post("op", "query {}", {}) == {"data": {"ok": True}}
+    assert breaker.state == "closed"
+    assert breaker.trips == 1
+
+
+@pytest.mark.asyncio
+async def test_non_transient_api_errors_do_not_trip_the_circuit() -> None:
+    """A 404 or a malformed body is an answer from a live endpoint."""
+    api = EonNext()
+    _seed_valid_auth(api)
+    threshold = eonnext_module._CIRCUIT_FAILURE_THRESHOLD
+    session = _FakeSession([_FakeResponse(404) for _ in range(threshold)])
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    for meter in range(threshold):
+        with pytest.raises(EonNextApiError):
+            await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", f"m{meter}")
+
+    assert not api.circuit_open(eonnext_module.CIRCUIT_CONSUMPTION)
+    assert api.circuit_breaker_stats[eonnext_module.CIRCUIT_CONSUMPTION]["trips"] == 0
+
+
+def test_half_open_circuit_rejects_calls_while_probe_is_running(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(eonnext_module.time, "monotonic", lambda: now[0])
+    breaker = eonnext_module._CircuitBreaker("graphql", 1, 60)
+    breaker.record_failure()
+    now[0] += 60
+
+    breaker.before_call()
+    with pytest.raises(EonNextCircuitOpenError):
+        breaker.before_call()
+    breaker.release_probe()
+    breaker.before_call()
+
+
+# --- retries ---
+
+
+def _retrying_api(responses: list[_FakeResponse]) -> tuple[EonNext, _FakeSession, AsyncMock]:
+    api = EonNext()
+    _seed_valid_auth(api)
+    session = _FakeSession(responses)
+    api._get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+    sleep = AsyncMock()
+    api._sleep = sleep
+    return api, session, sleep
+
+
+@pytest.mark.asyncio
+async def test_transient_status_is_retried_honouring_retry_after() -> None:
+    api, session, sleep = _retrying_api([
+        _FakeResponse(503, headers={"Retry-After": "2"}),
+        _FakeResponse(200, {"results": [{"consumption": 1}]}),
+    ])
+
+    result = await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1")
+
+    assert _readings(result) == [1]
+    assert len(session.headers_seen) == 2
+    (delay,), _ = sleep.await_args
+    assert 2 <= delay <= api.retry_policy.max_delay_seconds
+    assert api.retry_stats["consumption"] == {
+        "retries": 1,
+        "recovered": 1,
+        "exhausted": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_graphql_gives_up_after_max_attempts() -> None:
+    attempts = RetryPolicy().max_attempts
+    api, session, sleep = _retrying_api([_FakeResponse(500) for _ in range(attempts)])
+
+    with pytest.raises(EonNextApiError):
+        await api._graphql_post("op", "query {}", {})
+
+    assert len(session.headers_seen) == attempts
+    assert sleep.await_count == attempts - 1
+    assert api.retry_stats["graphql"] == {
+        "retries": attempts - 1,
+        "recovered": 0,
+        "exhausted": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_one_read_exhausting_its_retries_is_one_breaker_failure() -> None:
+    """Attempts within one read do not each count towards opening the circuit."""
+    attempts = RetryPolicy().max_attempts
+    assert attempts >= eonnext_module._CIRCUIT_FAILURE_THRESHOLD
+    api, session, _sleep = _retrying_api([_FakeResponse(503) for _ in range(attempts)])
+
+    with pytest.raises(EonNextApiError):
+        await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1")
+
+    assert len(session.headers_seen) == attempts
+    assert not api.circuit_open(eonnext_module.CIRCUIT_CONSUMPTION)
+    assert api.circuit_breaker_stats[eonnext_module.CIRCUIT_CONSUMPTION]["trips"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_recovering_from_a_blip_keep_the_circuit_closed() -> None:
+    threshold = eonnext_module._CIRCUIT_FAILURE_THRESHOLD
+    api, _session, _sleep = _retrying_api(
+        [_FakeResponse(503) for _ in range(threshold)]
+        + [_FakeResponse(200, {"results": []}) for _ in range(threshold)]
+    )
+    # Yield on back-off so each read sees one 503 before any retries.
+    api._sleep = lambda _delay: asyncio.sleep(0)
+
+    await asyncio.gather(
+        *(
+            api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", f"m{meter}")
+            for meter in range(threshold)
+        )
+    )
+
+    assert not api.circuit_open(eonnext_module.CIRCUIT_CONSUMPTION)
+    assert api.retry_stats["consumption"]["recovered"] == threshold
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried() -> None:
+    api, session, sleep = _retrying_api([_FakeResponse(404)])
+
+    with pytest.raises(EonNextApiError):
+        await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1")
+
+    assert len(session.headers_seen) == 1
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_no_retry_beyond_deadline_or_long_retry_after() -> None:
+    api, session, sleep = _retrying_api([
+        _FakeResponse(429, headers={"Retry-After": "3600"}),
+        _FakeResponse(503),
+    ])
+
+    with pytest.raises(EonNextApiError):
+        await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m1")
+    api.retry_policy = RetryPolicy(base_delay_seconds=5, deadline_seconds=0)
+    with pytest.raises(EonNextApiError):
+        await api.async_get_consumption(METER_TYPE_ELECTRIC, "sp-1", "m2")
+
+    assert len(session.headers_seen) == 2
+    sleep.assert_not_awaited()
+    assert api.retry_stats["consumption"]["exhausted"] == 2
+
+
+def test_retry_delay_uses_full_jitter_and_parses_http_dates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    policy = RetryPolicy(base_delay_seconds=1, max_delay_seconds=4)
+    monkeypatch.setattr(eonnext_module.random, "uniform", lambda low, high: high)
+
+    assert [policy.delay(attempt, None) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 4]
+    assert policy.delay(1, 3.0) == 3.0
+    assert policy.delay(1, 5.0) is None
+    assert eonnext_module._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert eonnext_module._parse_retry_after("soon") is None
+
+
 # --- #53: filter out inactive (replaced) meters ---
 
 
@@ -27,11 +27,21 @@ from custom_components.eon_next.const import (
     INTEGRATION_VERSION,
 )
 from custom_components.eon_next.coordinator import EonNextCoordinator
+from custom_components.eon_next.meter_snapshot import (
+    CostSnapshot,
+    MeterSnapshot,
+    TariffSnapshot,
+    UsageSnapshot,
+)
 from custom_components.eon_next.schemas import (
+    BackfillMeterProgress,
+    BackfillStatusResponse,
+    ConsumptionHistoryEntry,
     ConsumptionHistoryResponse,
     EvScheduleResponse,
     EvScheduleSlot,
     VersionResponse,
+    encode_response,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import recorder as recorder_helper
@@ -103,6 +113,9 @@ class FakeApi:
     async def async_get_consumption(self, *args: Any, **kwargs: Any) -> dict | None:
         return self._consumption_result
 
+    def token_refresh_due_in(self) -> float | None:
+        return None
+
     async def async_close(self) -> None:
         self.closed = True
 
@@ -155,21 +168,21 @@ async def _ensure_recorder(hass: HomeAssistant) -> None:
     await hass.data[recorder_helper.DATA_RECORDER].db_connected
 
 
-def _electricity_meter_data() -> dict[str, dict[str, Any]]:
+def _electricity_meter_data() -> dict[str, MeterSnapshot]:
     """Return coordinator data for a single electricity meter with dynamic dates."""
     return {
-        "meter-1": {
-            "type": "electricity",
-            "serial": "E123",
-            "supply_point_id": "mpxn-e123",
-            "latest_reading": 1234.5,
-            "latest_reading_date": _YESTERDAY_ISO,
-            "daily_consumption": 10.5,
-            "standing_charge": 0.25,
-            "previous_day_cost": 2.50,
-            "unit_rate": 0.24,
-            "tariff_name": "Standard",
-        },
+        "meter-1": MeterSnapshot(
+            type="electricity",
+            serial="E123",
+            supply_point_id="mpxn-e123",
+            latest_reading=1234.5,
+            latest_reading_date=_YESTERDAY,
+            usage=UsageSnapshot(daily_consumption=10.5),
+            tariff=TariffSnapshot(name="Standard"),
+            cost=CostSnapshot(
+                standing_charge=0.25, previous_day_cost=2.50, unit_rate=0.24
+            ),
+        ),
     }
 
 
@@ -700,6 +713,89 @@ class TestWsEvSchedule:
         )
 
 
+class TestWsTariffDetails:
+    """Tests for the eon_next/tariff_details WebSocket handler."""
+
+    @pytest.mark.asyncio
+    async def test_returns_agreement_and_rates_for_known_meter(
+        self,
+        hass: HomeAssistant,
+        enable_custom_integrations: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        del enable_custom_integrations
+        fake_api = FakeApi()
+        _patch_integration(monkeypatch, fake_api)
+        entry = _mock_entry()
+
+        await _setup_entry(hass, entry)
+
+        coordinator = entry.runtime_data.coordinator
+        coordinator.async_set_updated_data(
+            {
+                "E123": MeterSnapshot(
+                    type="electricity",
+                    serial="E123",
+                    tariff=TariffSnapshot(
+                        name="Standard",
+                        code="E-1R-STD",
+                        unit_rate=0.24,
+                        standing_charge=0.5,
+                        valid_from="2025-01-01T00:00:00+00:00",
+                    ),
+                )
+            }
+        )
+
+        from custom_components.eon_next.websocket import ws_tariff_details
+
+        mock_connection = MagicMock()
+        ws_tariff_details(
+            hass,
+            mock_connection,
+            {"id": 22, "type": "eon_next/tariff_details", "meter_serial": "E123"},
+        )
+
+        mock_connection.send_result.assert_called_once()
+        result = mock_connection.send_result.call_args[0][1]
+        assert result["tariff_name"] == "Standard"
+        assert result["tariff_code"] == "E-1R-STD"
+        assert result["standing_charge"] == 0.5
+        assert result["valid_from"] == "2025-01-01T00:00:00+00:00"
+        # Flat tariff: one window covering today.
+        assert len(result["rates"]) == 1
+        assert result["rates"][0]["rate"] == 0.24
+        assert result["rates"][0]["is_off_peak"] is False
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_for_unknown_meter(
+        self,
+        hass: HomeAssistant,
+        enable_custom_integrations: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        del enable_custom_integrations
+        fake_api = FakeApi()
+        _patch_integration(monkeypatch, fake_api)
+        entry = _mock_entry()
+
+        await _setup_entry(hass, entry)
+
+        from custom_components.eon_next.websocket import ws_tariff_details
+
+        mock_connection = MagicMock()
+        ws_tariff_details(
+            hass,
+            mock_connection,
+            {"id": 23, "type": "eon_next/tariff_details", "meter_serial": "nope"},
+        )
+
+        result = mock_connection.send_result.call_args[0][1]
+        assert result["serial"] == "nope"
+        assert result["tariff_name"] is None
+        assert result["rates"] == []
+
+
 class TestWsBackfillStatus:
     """Tests for the eon_next/backfill_status WebSocket handler."""
 
@@ -766,9 +862,201 @@ class TestWsBackfillStatus:
         ]
 
 
+class TestWsCostTrackerHistory:
+    """Tests for the eon_next/cost_tracker_history WebSocket handler."""
+
+    @pytest.mark.asyncio
+    async def test_returns_rollups_for_every_tracker(
+        self,
+        hass: HomeAssistant,
+        enable_custom_integrations: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        del enable_custom_integrations
+        fake_api = FakeApi()
+        _patch_integration(monkeypatch, fake_api)
+        entry = _mock_entry()
+
+        await _setup_entry(hass, entry)
+        manager = entry.runtime_data.cost_trackers
+        tracker = await manager.async_add_tracker(
+            name="Washer",
+            tracked_entity_id="sensor.washer_energy",
+            meter_serial="METER-1",
+        )
+        history = manager.get_history(tracker.id)
+        assert history is not None
+        today = dt_util.now().date()
+        history.record(today - datetime.timedelta(days=40), 2.0, 0.5)
+        history.record(today - datetime.timedelta(days=2), 1.0, 0.25)
+        history.record(today - datetime.timedelta(days=1), 3.0, 0.75)
+
+        from custom_components.eon_next.websocket import ws_cost_tracker_history
+
+        mock_connection = MagicMock()
+        ws_cost_tracker_history(
+            hass,
+            mock_connection,
+            {
+                "id": 32,
+                "type": "eon_next/cost_tracker_history",
+                "days": 7,
+                "format": "columnar",
+            },
+        )
+
+        result = mock_connection.send_result.call_args[0][1]
+        assert result["trackers"]["tracker_id"] == [tracker.id]
+        # The last 7 closed days, with days nothing was recorded for as zero.
+        assert result["days"]["period"] == [
+            (today - datetime.timedelta(days=offset)).isoformat()
+            for offset in range(7, 0, -1)
+        ]
+        assert result["days"]["cost"] == [0.0] * 5 + [0.25, 0.75]
+        assert sum(result["weeks"]["consumption_kwh"]) == pytest.approx(4.0)
+        assert sum(result["months"]["cost"]) == pytest.approx(1.5)
+
+        ws_cost_tracker_history(
+            hass,
+            mock_connection,
+            {
+                "id": 33,
+                "type": "eon_next/cost_tracker_history",
+                "tracker_id": "missing",
+                "days": 7,
+            },
+        )
+        result = mock_connection.send_result.call_args[0][1]
+        assert result == {"trackers": [], "days": [], "weeks": [], "months": []}
+
+
 # ── Panel registration tests ─────────────────────────────────────
 
 
+class TestColumnarWireFormat:
+    """Tests for the opt-in columnar response encoding."""
+
+    def test_row_encoding_matches_asdict(self) -> None:
+        response = BackfillStatusResponse(
+            state="running",
+            enabled=True,
+            total_meters=1,
+            completed_meters=0,
+            pending_meters=1,
+            lookback_days=30,
+            next_start_date=None,
+            meters=[
+                BackfillMeterProgress(
+                    serial="E1",
+                    done=False,
+                    next_start="2026-01-01",
+                    days_completed=3,
+                    days_remaining=27,
+                )
+            ],
+        )
+
+        assert encode_response(response) == dataclasses.asdict(response)
+
+    def test_columnar_transposes_list_fields(self) -> None:
+        response = ConsumptionHistoryResponse(
+            entries=[
+                ConsumptionHistoryEntry(date="2026-01-01", consumption=1.5),
+                ConsumptionHistoryEntry(
+                    date="2026-01-02", consumption=0.0, missing=True
+                ),
+            ]
+        )
+
+        assert encode_response(response, columnar=True) == {
+            "entries": {
+                "date": ["2026-01-01", "2026-01-02"],
+                "consumption": [1.5, 0.0],
+                "missing": [False, True],
+            }
+        }
+
+    def test_columnar_keeps_every_column_for_empty_lists(self) -> None:
+        response = EvScheduleResponse(
+            device_id="device-1", serial=None, status="unknown", slots=[]
+        )
+
+        assert encode_response(response, columnar=True) == {
+            "device_id": "device-1",
+            "serial": None,
+            "status": "unknown",
+            "slots": {"start": [], "end": []},
+        }
+
+    def test_schema_rejects_unknown_format(self) -> None:
+        from custom_components.eon_next.websocket import WS_CONSUMPTION_HISTORY_SCHEMA
+
+        schema = vol.Schema(WS_CONSUMPTION_HISTORY_SCHEMA)
+        validated = schema(
+            {"type": "eon_next/consumption_history", "meter_serial": "E123"}
+        )
+        assert validated["format"] == "rows"
+
+        with pytest.raises(vol.Invalid):
+            schema(
+                {
+                    "type": "eon_next/consumption_history",
+                    "meter_serial": "E123",
+                    "format": "csv",
+                }
+            )
+
+    @pytest.mark.asyncio
+    async def test_ws_ev_schedule_honours_columnar_format(
+        self,
+        hass: HomeAssistant,
+        enable_custom_integrations: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        del enable_custom_integrations
+        fake_api = FakeApi()
+        _patch_integration(monkeypatch, fake_api)
+        entry = _mock_entry()
+
+        await _setup_entry(hass, entry)
+
+        coordinator = entry.runtime_data.coordinator
+        coordinator.async_set_updated_data(
+            {
+                "ev::device-1": {
+                    "type": "ev_charger",
+                    "device_id": "device-1",
+                    "serial": "EV-001",
+                    "schedule": [
+                        {"start": "2026-01-01T01:00:00Z", "end": "2026-01-01T02:00:00Z"},
+                        {"start": "2026-01-01T03:00:00Z", "end": "2026-01-01T04:00:00Z"},
+                    ],
+                }
+            }
+        )
+
+        from custom_components.eon_next.websocket import ws_ev_schedule
+
+        mock_connection = MagicMock()
+        ws_ev_schedule(
+            hass,
+            mock_connection,
+            {
+                "id": 22,
+                "type": "eon_next/ev_schedule",
+                "device_id": "device-1",
+                "format": "columnar",
+            },
+        )
+
+        result = mock_connection.send_result.call_args[0][1]
+        assert result["slots"] == {
+            "start": ["2026-01-01T01:00:00Z", "2026-01-01T03:00:00Z"],
+            "end": ["2026-01-01T02:00:00Z", "2026-01-01T04:00:00Z"],
+        }
+        assert result["status"] == "scheduled"
+
+
 class TestPanelRegistration:
     """Tests for sidebar panel register/unregister."""
 
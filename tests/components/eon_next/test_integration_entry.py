@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import asyncio
+from collections.abc import Generator, Mapping
 from dataclasses import dataclass, field
 import datetime
 import logging
@@ -10,24 +11,34 @@ from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 import custom_components.eon_next as integration
 from custom_components.eon_next.backfill import EonNextBackfillManager
+from custom_components.eon_next.backfill_status import DisabledBackfill
 from custom_components.eon_next.const import (
     CONF_BACKFILL_ENABLED,
     CONF_EMAIL,
     CONF_PASSWORD,
     CONF_REFRESH_TOKEN,
+    CONF_SHOW_CARD,
+    CONF_SHOW_PANEL,
     DOMAIN,
 )
 from custom_components.eon_next.coordinator import EonNextCoordinator
+from custom_components.eon_next.diagnostics import async_get_config_entry_diagnostics
 from custom_components.eon_next.eonnext import EonNextApiError, EonNextAuthError
-from homeassistant.core import HomeAssistant
+from custom_components.eon_next.meter_snapshot import MeterSnapshot
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 
 @pytest.fixture(autouse=True)
@@ -64,6 +75,8 @@ class FakeAccount:
 
     meters: list[FakeMeter] = field(default_factory=list)
     ev_chargers: list[Any] = field(default_factory=list)
+    account_number: str = ""
+    balance: float | None = None
 
 
 class FakeApi:
@@ -103,6 +116,10 @@ class FakeApi:
         self.password_login_calls.append((username, password))
         return self.password_login_result
 
+    def token_refresh_due_in(self) -> float | None:
+        """No token to keep fresh."""
+        return None
+
     async def async_close(self) -> None:
         """Track API close on unload."""
         self.closed = True
@@ -230,6 +247,373 @@ async def test_setup_falls_back_to_username_password_when_refresh_fails(
     assert fake_api.password_login_calls == [("user@example.com", "secret")]
 
 
+def _topology_storage(entry: MockConfigEntry, serial: str) -> dict[str, Any]:
+    return {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}_{entry.entry_id}_topology",
+        "data": {
+            "accounts": [
+                {
+                    "account_number": "A-1",
+                    "meters": [
+                        {
+                            "type": "electricity",
+                            "meter_id": "meter-id-9",
+                            "serial": serial,
+                            "supply_point_id": "mpxn-9",
+                            "is_export": False,
+                        }
+                    ],
+                    "ev_chargers": [],
+                }
+            ]
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_setup_persists_discovered_topology(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+    hass_storage: dict[str, Any],
+) -> None:
+    """A cold setup stores the topology found at login for the next start."""
+    del enable_custom_integrations
+    fake_api = FakeApi(refresh_login_result=True)
+    _patch_integration(monkeypatch, fake_api)
+    entry = _mock_entry()
+
+    await _setup_entry(hass, entry)
+
+    stored = hass_storage[f"{DOMAIN}_{entry.entry_id}_topology"]["data"]
+    assert [m["serial"] for m in stored["accounts"][0]["meters"]] == [
+        "electric-meter-1"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_setup_restores_cached_topology_and_reloads_on_change(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+    hass_storage: dict[str, Any],
+) -> None:
+    """A cached topology seeds setup; background discovery reconciles it."""
+    del enable_custom_integrations
+    fake_api = FakeApi(refresh_login_result=True)
+    discovered = [FakeAccount(meters=[FakeMeter(serial="new-meter")])]
+    fake_api.async_discover_accounts = AsyncMock(  # type: ignore[attr-defined]
+        return_value=discovered
+    )
+    _patch_integration(monkeypatch, fake_api)
+    entry = _mock_entry()
+    hass_storage[f"{DOMAIN}_{entry.entry_id}_topology"] = _topology_storage(
+        entry, "cached-meter"
+    )
+    reloads: list[str] = []
+    monkeypatch.setattr(
+        hass.config_entries, "async_schedule_reload", reloads.append
+    )
+
+    await _setup_entry(hass, entry)
+
+    # Entities come up from the cached topology, not the login-time default.
+    assert [m.serial for m in fake_api.accounts[0].meters] == ["cached-meter"]
+    assert fake_api.accounts[0].account_number == "A-1"
+    fake_api.async_discover_accounts.assert_awaited_once()
+    assert reloads == [entry.entry_id]
+    stored = hass_storage[f"{DOMAIN}_{entry.entry_id}_topology"]["data"]
+    assert stored["accounts"][0]["meters"][0]["serial"] == "new-meter"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_topology_does_not_reload(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+    hass_storage: dict[str, Any],
+) -> None:
+    del enable_custom_integrations
+    fake_api = FakeApi(refresh_login_result=True)
+    entry = _mock_entry()
+    hass_storage[f"{DOMAIN}_{entry.entry_id}_topology"] = _topology_storage(
+        entry, "cached-meter"
+    )
+
+    async def _discover() -> list[Any]:
+        return fake_api.accounts
+
+    fake_api.async_discover_accounts = _discover  # type: ignore[attr-defined]
+    _patch_integration(monkeypatch, fake_api)
+    reloads: list[str] = []
+    monkeypatch.setattr(
+        hass.config_entries, "async_schedule_reload", reloads.append
+    )
+
+    await _setup_entry(hass, entry)
+
+    assert reloads == []
+
+
+def _entity_id_for_unique_id(
+    hass: HomeAssistant, entry: MockConfigEntry, unique_id: str
+) -> str:
+    registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if registry_entry.unique_id == unique_id:
+            return registry_entry.entity_id
+    raise AssertionError(f"Missing entity {unique_id}")
+
+
+@pytest.mark.asyncio
+async def test_setup_publishes_snapshot_then_refreshes_in_background(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Restored values are published immediately and flagged until refreshed."""
+    del enable_custom_integrations
+    fake_api = FakeApi(refresh_login_result=True)
+    _patch_integration(monkeypatch, fake_api)
+    entry = _mock_entry()
+    hass_storage[f"{DOMAIN}_{entry.entry_id}_coordinator"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}_{entry.entry_id}_coordinator",
+        "data": {
+            "saved_at": "2026-01-01T00:00:00+00:00",
+            "data": {
+                "electric-meter-1": {
+                    "type": "electricity",
+                    "serial": "electric-meter-1",
+                    "latest_reading": 100.0,
+                }
+            },
+        },
+    }
+    fake_api.accounts[0].meters[0].latest_reading = 123.0
+    fake_api.async_get_account_balances = AsyncMock(  # type: ignore[attr-defined]
+        return_value=None
+    )
+    fake_api.async_get_tariff_data = AsyncMock(  # type: ignore[attr-defined]
+        return_value=None
+    )
+    fake_api.async_get_consumption = AsyncMock(  # type: ignore[attr-defined]
+        return_value=None
+    )
+    release = asyncio.Event()
+    live_update = EonNextCoordinator._async_update_data
+
+    async def _slow_update(self: EonNextCoordinator) -> dict[str, Any]:
+        await release.wait()
+        return await live_update(self)
+
+    monkeypatch.setattr(EonNextCoordinator, "_async_update_data", _slow_update)
+
+    await _ensure_recorder(hass)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    entity_id = _entity_id_for_unique_id(
+        hass, entry, "electric-meter-1__electricity_kwh"
+    )
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "100.0"
+    assert state.attributes["assumed_state"] is True
+
+    release.set()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "123.0"
+    assert "assumed_state" not in state.attributes
+
+    # The refreshed data is what gets persisted (on a debounce).
+    coordinator = entry.runtime_data.coordinator
+    assert isinstance(coordinator.data["electric-meter-1"], MeterSnapshot)
+    assert coordinator._snapshot_store is not None
+    await coordinator._snapshot_store.async_save(coordinator._snapshot())
+    stored = hass_storage[f"{DOMAIN}_{entry.entry_id}_coordinator"]["data"]
+    assert stored["data"]["electric-meter-1"]["latest_reading"] == 123.0
+    assert stored["saved_at"] != "2026-01-01T00:00:00+00:00"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_refresh_skips_entity_state_writes(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Only entities whose coordinator row changed write state."""
+    del enable_custom_integrations
+    fake_api = FakeApi(refresh_login_result=True)
+    _patch_integration(monkeypatch, fake_api)
+    fake_api.accounts[0].meters[0].latest_reading = 123.0
+    fake_api.async_get_account_balances = AsyncMock(  # type: ignore[attr-defined]
+        return_value=None
+    )
+    fake_api.async_get_tariff_data = AsyncMock(  # type: ignore[attr-defined]
+        return_value=None
+    )
+    fake_api.async_get_consumption = AsyncMock(  # type: ignore[attr-defined]
+        return_value=None
+    )
+    entry = _mock_entry()
+    await _setup_entry(hass, entry)
+    coordinator = entry.runtime_data.coordinator
+    entity_id = _entity_id_for_unique_id(
+        hass, entry, "electric-meter-1__electricity_kwh"
+    )
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    first = hass.states.get(entity_id)
+    assert first is not None
+    assert first.state == "123.0"
+
+    writes: list[Event] = []
+
+    @callback
+    def _is_entity(event_data: Mapping[str, Any]) -> bool:
+        return event_data["entity_id"] == entity_id
+
+    for event_type in (EVENT_STATE_CHANGED, EVENT_STATE_REPORTED):
+        hass.bus.async_listen(event_type, writes.append, event_filter=_is_entity)
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.changed_keys == frozenset()
+    assert writes == []
+
+    fake_api.accounts[0].meters[0].latest_reading = 124.0
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.changed_keys == frozenset({"electric-meter-1"})
+    changed = hass.states.get(entity_id)
+    assert changed is not None
+    assert changed.state == "124.0"
+    assert len(writes) == 1
+
+
+@pytest.mark.asyncio
+async def test_setup_skips_disabled_optional_subsystems(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Backfill off and panel/card off start nothing for those features.
+
+    How long setup takes is timed by the ``e2e.setup_entry`` benchmark.
+    """
+    del enable_custom_integrations
+    fake_api = FakeApi(refresh_login_result=True)
+    _patch_integration(monkeypatch, fake_api)
+    entry = _mock_entry(options={CONF_SHOW_PANEL: False, CONF_SHOW_CARD: False})
+    await _ensure_recorder(hass)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert isinstance(entry.runtime_data.backfill, DisabledBackfill)
+    assert DOMAIN not in hass.data.get("frontend_panels", {})
+    state = hass.states.get(_status_entity_id(hass, entry))
+    assert state is not None
+    assert state.state == "disabled"
+
+
+@pytest.mark.asyncio
+async def test_disabled_backfill_reports_persisted_progress(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+    hass_storage: dict[str, Any],
+) -> None:
+    """With backfill switched off, the status still shows an earlier run's
+    progress, read from its Store without loading the backfill manager."""
+    del enable_custom_integrations
+    fake_api = FakeApi(refresh_login_result=True)
+    _patch_integration(monkeypatch, fake_api)
+    entry = _mock_entry()
+    hass_storage[f"{DOMAIN}_{entry.entry_id}_backfill"] = {
+        "version": 1,
+        "key": f"{DOMAIN}_{entry.entry_id}_backfill",
+        "data": {
+            "initialized": True,
+            "rebuild_done": True,
+            "lookback_days": 30,
+            "meters": {"electric-meter-1": {"next_start": "2025-01-01", "done": True}},
+        },
+    }
+    await _ensure_recorder(hass)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert isinstance(entry.runtime_data.backfill, DisabledBackfill)
+    state = hass.states.get(_status_entity_id(hass, entry))
+    assert state is not None
+    assert state.state == "disabled"
+    assert state.attributes["initialized"] is True
+    assert state.attributes["completed_meters"] == 1
+    assert state.attributes["pending_meters"] == 0
+    assert state.attributes["lookback_days"] == 30
+
+
+@pytest.mark.asyncio
+async def test_removing_the_entry_deletes_its_stores(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Every Store an entry wrote is deleted with it; other entries' stay."""
+    del enable_custom_integrations
+    fake_api = FakeApi(refresh_login_result=True)
+    _patch_integration(monkeypatch, fake_api)
+    entry = _mock_entry()
+    prefix = f"{DOMAIN}_{entry.entry_id}_"
+
+    def _seed(key: str, data: dict[str, Any]) -> None:
+        hass_storage[key] = {"version": 1, "key": key, "data": data}
+
+    _seed(
+        f"{prefix}cost_trackers",
+        {
+            "trackers": [
+                {
+                    "id": "washer",
+                    "name": "Washer",
+                    "tracked_entity_id": "sensor.washer_energy",
+                    "meter_serial": "electric-meter-1",
+                }
+            ]
+        },
+    )
+    _seed(f"{prefix}cost_tracker_washer", {"today_consumption_kwh": 1.0})
+    _seed(f"{prefix}cost_tracker_history_washer", {"first_day": None})
+    _seed(f"{prefix}tariff_timeline", {"points": {}})
+    _seed(f"{prefix}backfill", {"initialized": True, "meters": {}})
+    _seed(f"{DOMAIN}_other-entry_topology", {"accounts": []})
+    await _setup_entry(hass, entry)
+    # Left pending by setup; must not land after the removal.
+    entry.runtime_data.coordinator._schedule_snapshot_save()  # noqa: SLF001
+    assert f"{prefix}topology" in hass_storage
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(minutes=5))
+    await hass.async_block_till_done()
+
+    assert [key for key in hass_storage if key.startswith(prefix)] == []
+    assert f"{DOMAIN}_other-entry_topology" in hass_storage
+
+
 @pytest.mark.asyncio
 async def test_status_sensor_updates_when_backfill_state_changes(
     hass: HomeAssistant,
@@ -607,3 +991,54 @@ async def test_setup_auth_failed_when_password_login_returns_false(
 
     assert entry.state is ConfigEntryState.SETUP_ERROR
     assert fake_api.closed is True
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_report_request_metrics_and_redact_credentials(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+    fake_kraken: Any,
+) -> None:
+    """Diagnostics carry the real client's request metrics, without secrets."""
+    del enable_custom_integrations
+    monkeypatch.setattr(
+        EonNextCoordinator, "async_config_entry_first_refresh", _fake_first_refresh
+    )
+    monkeypatch.setattr(EonNextBackfillManager, "_async_run", _fake_backfill_run)
+    entry = _mock_entry()
+
+    await _setup_entry(hass, entry)
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    registry = er.async_get(hass)
+    metric_sensors = [
+        registry_entry
+        for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if registry_entry.unique_id.startswith(f"{entry.entry_id}__api_")
+    ]
+    await hass.config_entries.async_unload(entry.entry_id)
+
+    assert diagnostics["entry"]["data"] == {
+        CONF_EMAIL: "**REDACTED**",
+        CONF_PASSWORD: "**REDACTED**",
+        CONF_REFRESH_TOKEN: "**REDACTED**",
+    }
+    assert diagnostics["topology"] == {"accounts": 1, "meters": 2, "ev_chargers": 0}
+    operations = diagnostics["api"]["requests"]["operations"]
+    # The stored refresh token is unknown to the server: password fallback.
+    assert set(operations) >= {
+        "refreshToken",
+        "loginEmailAuthentication",
+        "headerGetLoggedInUser",
+        "getAccountMeterSelector",
+    }
+    assert operations["headerGetLoggedInUser"]["by_status"]["200"]["count"] == 1
+    assert operations["headerGetLoggedInUser"]["bytes_in"] > 0
+    assert operations["headerGetLoggedInUser"]["retries"] == 0
+    assert diagnostics["api"]["retries"]["graphql"]["exhausted"] == 0
+    # The metric sensors are opt-in.
+    assert len(metric_sensors) == 2
+    assert all(
+        sensor.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+        for sensor in metric_sensors
+    )
@@ -0,0 +1,86 @@
+"""Unit tests for the typed per-meter coordinator data."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from custom_components.eon_next.meter_snapshot import (
+    NO_TARIFF,
+    CostSnapshot,
+    MeterSnapshot,
+    TariffSnapshot,
+    UsageSnapshot,
+    merge_missing,
+    share,
+)
+
+
+def _snapshot() -> MeterSnapshot:
+    return MeterSnapshot(
+        type="electricity",
+        serial="E1",
+        supply_point_id="mpan-1",
+        latest_reading=12.5,
+        usage=UsageSnapshot(daily_consumption=3.0, previous_day_consumption=9.0),
+        tariff=TariffSnapshot(name="Flex", code="E-1R-FLEX", unit_rate=0.25),
+        cost=CostSnapshot(standing_charge=0.5, unit_rate=0.25),
+    )
+
+
+def test_flat_key_view_matches_typed_fields() -> None:
+    snapshot = _snapshot()
+
+    assert snapshot["tariff_name"] == "Flex"
+    assert snapshot.get("tariff_is_tou") is False
+    assert snapshot.get("daily_consumption") == 3.0
+    assert snapshot.get("unit_rate") == 0.25
+    assert snapshot.get("unknown_key") is None
+    assert "tariff_code" in snapshot
+    assert "unknown_key" not in snapshot
+
+
+def test_flat_form_round_trips() -> None:
+    snapshot = _snapshot()
+
+    assert MeterSnapshot.from_mapping(dict(snapshot)) == snapshot
+
+
+def test_from_mapping_shares_empty_parts() -> None:
+    snapshot = MeterSnapshot.from_mapping({"type": "gas", "serial": "G1"})
+
+    assert snapshot.tariff is NO_TARIFF
+    assert snapshot.usage.previous_day_consumption_entry_count == 0
+
+
+def test_merge_missing_fills_only_none_fields() -> None:
+    current = CostSnapshot(unit_rate=0.3)
+    previous = CostSnapshot(standing_charge=0.5, unit_rate=0.25)
+
+    merged = merge_missing(current, previous)
+
+    assert merged == CostSnapshot(standing_charge=0.5, unit_rate=0.3)
+    assert merge_missing(previous, CostSnapshot()) is previous
+
+
+def test_share_reuses_equal_previous_object() -> None:
+    previous = TariffSnapshot(name="Flex", rates_schedule=[{"rate": 1}])
+    current = TariffSnapshot(name="Flex", rates_schedule=[{"rate": 1}])
+
+    assert share(current, previous) is previous
+    assert share(TariffSnapshot(name="Other"), previous).name == "Other"
+
+
+def test_previous_day_only_drops_today() -> None:
+    usage = _snapshot().usage.previous_day_only()
+
+    assert usage.daily_consumption is None
+    assert usage.previous_day_consumption == 9.0
+    assert usage.previous_day_only() is usage
+
+
+def test_persisted_reading_date_is_parsed() -> None:
+    snapshot = MeterSnapshot.from_mapping(
+        {"type": "gas", "serial": "G1", "latest_reading_date": "2025-06-14"}
+    )
+
+    assert snapshot.latest_reading_date == date(2025, 6, 14)
@@ -14,6 +14,7 @@ import pytest
 
 from custom_components.eon_next.binary_sensor import OffPeakBinarySensor
 from custom_components.eon_next.event import CurrentDayRatesEvent
+from custom_components.eon_next.meter_snapshot import MeterSnapshot
 from custom_components.eon_next.sensor import (
     ExportDailyConsumptionSensor,
     ExportUnitRateSensor,
@@ -51,7 +52,16 @@ def _patch_now(local: datetime | None = None):
 
 def _make_coordinator(data: dict[str, Any] | None = None) -> MagicMock:
     coord = MagicMock()
-    coord.data = data
+    coord.data = (
+        {
+            serial: MeterSnapshot.from_mapping(
+                {"type": "electricity", "serial": serial, **row}
+            )
+            for serial, row in data.items()
+        }
+        if data is not None
+        else None
+    )
     coord.last_update_success = True
     return coord
 
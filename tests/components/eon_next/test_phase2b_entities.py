@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from custom_components.eon_next.cost_tracker import EonNextCostTrackerManager
+from custom_components.eon_next.meter_snapshot import MeterSnapshot, UsageSnapshot
 from custom_components.eon_next.sensor import (
     AccountBalanceSensor,
     PreviousDayConsumptionSensor,
@@ -43,12 +44,16 @@ def test_previous_day_consumption_sensor() -> None:
     meter = _make_meter()
     coordinator = _make_coordinator(
         {
-            meter.serial: {
-                "previous_day_consumption": 12.345,
-                "previous_day_consumption_entry_count": 46,
-                "previous_day_consumption_data_complete": True,
-                "previous_day_consumption_last_reset": _YESTERDAY_MIDNIGHT,
-            }
+            meter.serial: MeterSnapshot(
+                type="electricity",
+                serial=meter.serial,
+                usage=UsageSnapshot(
+                    previous_day_consumption=12.345,
+                    previous_day_consumption_entry_count=46,
+                    previous_day_consumption_data_complete=True,
+                    previous_day_consumption_last_reset=_YESTERDAY_MIDNIGHT,
+                ),
+            )
         }
     )
     sensor = PreviousDayConsumptionSensor(coordinator, meter)
@@ -102,16 +107,81 @@ async def test_cost_tracker_updates_from_energy_state_changes(hass) -> None:
         last_updated=_REF_UTC.replace(hour=9, minute=30),
     )
 
-    await manager._async_handle_state_change(  # noqa: SLF001
+    manager._handle_state_change(  # noqa: SLF001
         tracker_id,
         Event("state_changed", {"old_state": None, "new_state": first}),
     )
-    await manager._async_handle_state_change(  # noqa: SLF001
+    manager._handle_state_change(  # noqa: SLF001
         tracker_id,
         Event("state_changed", {"old_state": first, "new_state": second}),
     )
+    manager._async_handle_flush_interval(None)  # noqa: SLF001
 
     state = manager.get_state(tracker_id)
     assert state is not None
     assert state.today_consumption_kwh == pytest.approx(0.6)
     assert state.today_cost == pytest.approx(0.15)
+
+
+@pytest.mark.asyncio
+async def test_cost_tracker_ledger_splits_samples_at_rate_boundaries(hass) -> None:
+    """Samples are buffered until a flush and priced per rate window."""
+
+    def _at(hour: int, minute: int) -> str:
+        return _REF_UTC.replace(hour=hour, minute=minute).isoformat()
+
+    coordinator = _make_coordinator(
+        {
+            "meter-1": {
+                "unit_rate": 0.2,
+                "tariff_unit_rate": 0.2,
+                "tariff_is_tou": True,
+                "tariff_rates_schedule": [
+                    {"value": 10.0, "validFrom": _at(9, 0), "validTo": _at(9, 30)},
+                    {"value": 30.0, "validFrom": _at(9, 30), "validTo": _at(10, 0)},
+                ],
+            }
+        }
+    )
+    manager = EonNextCostTrackerManager(hass, "entry-1", coordinator)
+    manager._store.async_load = AsyncMock(return_value={"trackers": []})  # noqa: SLF001
+    manager._store.async_save = AsyncMock()  # noqa: SLF001
+    await manager.async_initialize()
+    tracker = await manager.async_add_tracker(
+        name="Dishwasher",
+        tracked_entity_id="sensor.dishwasher_energy",
+        meter_serial="meter-1",
+    )
+    notified: list[None] = []
+    manager.async_add_state_listener(tracker.id, lambda: notified.append(None))
+
+    previous: State | None = None
+    for minute, reading in ((10, "1.0"), (20, "1.5"), (25, "1.6"), (40, "2.0")):
+        current = State(
+            "sensor.dishwasher_energy",
+            reading,
+            {"unit_of_measurement": "kWh"},
+            last_updated=_REF_UTC.replace(hour=9, minute=minute),
+        )
+        manager._handle_state_change(  # noqa: SLF001
+            tracker.id,
+            Event("state_changed", {"old_state": previous, "new_state": current}),
+        )
+        previous = current
+
+    state = manager.get_state(tracker.id)
+    assert state is not None
+    assert state.today_consumption_kwh == 0
+    assert notified == []
+
+    manager._async_handle_flush_interval(None)  # noqa: SLF001
+
+    # 0.6 kWh at 10p before 09:25; the 0.4 kWh used 09:25-09:40 straddles
+    # the 09:30 boundary, so a third of it is at 10p and the rest at 30p.
+    assert state.today_consumption_kwh == pytest.approx(1.0)
+    assert state.today_cost == pytest.approx(
+        0.06 + 0.4 / 3 * 0.10 + 0.8 / 3 * 0.30, abs=1e-4
+    )
+    assert len(notified) == 1
+
+    await manager.async_shutdown()
@@ -0,0 +1,161 @@
+"""Unit tests for the adaptive coordinator refresh interval."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.eon_next.polling import (
+    ARRIVAL_POLL_INTERVAL,
+    MAX_BACKOFF_FACTOR,
+    MIN_INTERVAL,
+    AdaptivePollScheduler,
+)
+
+_BASE = timedelta(minutes=30)
+_T0 = datetime(2025, 6, 15, 0, 0, tzinfo=timezone.utc)
+
+
+def _slots(last_end: datetime, count: int = 4) -> list[dict[str, str]]:
+    return [
+        {
+            "interval_start": (last_end - timedelta(minutes=30 * (i + 1))).isoformat(),
+            "interval_end": (last_end - timedelta(minutes=30 * i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def _learned(delay: timedelta) -> AdaptivePollScheduler:
+    """Return a scheduler that has seen two bursts arrive *delay* late.
+
+    The second burst is picked up by a poll two minutes after it arrived,
+    following one two minutes before, so its midpoint estimate is exact.
+    """
+    scheduler = AdaptivePollScheduler(_BASE)
+    scheduler.record("E1", _slots(_T0), _T0 + delay)
+    later = _T0 + timedelta(hours=2)
+    assert not scheduler.record("E1", _slots(_T0), later + delay - timedelta(minutes=2))
+    assert scheduler.record("E1", _slots(later), later + delay + timedelta(minutes=2))
+    return scheduler
+
+
+def test_first_observation_only_sets_baseline() -> None:
+    scheduler = AdaptivePollScheduler(_BASE)
+
+    assert scheduler.record("E1", _slots(_T0), _T0 + timedelta(hours=5))
+    assert scheduler.typical_delay("E1") is None
+    # Re-fetching the same readings is not new data.
+    assert not scheduler.record("E1", _slots(_T0), _T0 + timedelta(hours=6))
+
+
+def test_learns_median_publication_delay() -> None:
+    scheduler = _learned(timedelta(hours=3))
+
+    assert scheduler.typical_delay("E1") == timedelta(hours=3)
+    assert scheduler.expected_arrival() == (
+        _T0 + timedelta(hours=2) + timedelta(minutes=30) + timedelta(hours=3)
+    )
+
+
+def test_backs_off_exponentially_without_new_data() -> None:
+    scheduler = AdaptivePollScheduler(_BASE)
+
+    intervals = [
+        scheduler.next_interval(_T0, new_data=False) for _ in range(4)
+    ]
+
+    assert intervals == [_BASE * 2, _BASE * 4, _BASE * 4, _BASE * 4]
+    assert max(intervals) == _BASE * MAX_BACKOFF_FACTOR
+    assert scheduler.next_interval(_T0, new_data=True) == _BASE
+
+
+def test_backoff_can_be_disabled() -> None:
+    scheduler = AdaptivePollScheduler(_BASE)
+
+    for _ in range(3):
+        assert scheduler.next_interval(_T0, new_data=False, allow_backoff=False) == _BASE
+
+
+def test_polls_at_expected_arrival() -> None:
+    scheduler = _learned(timedelta(hours=3))
+    expected = scheduler.expected_arrival()
+    assert expected is not None
+
+    # Backed off, but the next burst is due in 20 minutes.
+    for _ in range(3):
+        scheduler.next_interval(expected - timedelta(hours=2), new_data=False)
+    now = expected - timedelta(minutes=20)
+    assert scheduler.next_interval(now, new_data=False) == timedelta(minutes=20)
+
+    # Overdue: poll at the arrival rate for a while, never below the floor.
+    assert (
+        scheduler.next_interval(expected + timedelta(minutes=5), new_data=False)
+        == ARRIVAL_POLL_INTERVAL
+    )
+    assert (
+        scheduler.next_interval(expected - timedelta(minutes=1), new_data=False)
+        == MIN_INTERVAL
+    )
+    # Long overdue, with no gap between bursts learned to project the next
+    # one: no back-off past the base interval.
+    assert (
+        scheduler.next_interval(expected + timedelta(hours=2), new_data=False)
+        == _BASE
+    )
+
+
+def test_delay_sample_is_the_midpoint_since_the_previous_poll() -> None:
+    """A backed-off poll does not inflate the delay by its whole interval."""
+    scheduler = AdaptivePollScheduler(_BASE)
+    scheduler.record("E1", _slots(_T0), _T0 + timedelta(hours=1))
+    later = _T0 + timedelta(hours=2)
+    # Not there at +3h; picked up two hours later.
+    scheduler.record("E1", _slots(_T0), later + timedelta(hours=1))
+    assert scheduler.record("E1", _slots(later), later + timedelta(hours=3))
+
+    assert scheduler.typical_delay("E1") == timedelta(hours=2)
+
+
+def test_daily_bursts_are_picked_up_within_the_base_interval() -> None:
+    """A whole day published at once each morning.
+
+    The slot after each burst is not due until the next morning, so the
+    delay-based prediction goes stale within hours; the scheduler projects
+    the next burst from the gap between bursts instead of backing off to
+    ``MAX_BACKOFF_FACTOR`` times the base interval.
+    """
+    burst = timedelta(hours=6)
+    scheduler = AdaptivePollScheduler(_BASE)
+    now = _T0 + timedelta(hours=1, minutes=7)
+    published: datetime | None = None
+    latencies: list[timedelta] = []
+    polls = 0
+    while now < _T0 + timedelta(days=14):
+        day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        latest = day if now >= day + burst else day - timedelta(days=1)
+        new_data = scheduler.record("E1", _slots(latest, 48), now)
+        if new_data and published is not None:
+            latencies.append(now - (latest + burst))
+        published = latest
+        polls += 1
+        now += scheduler.next_interval(now, new_data=new_data)
+
+    # Once a couple of bursts have been seen, none waits longer than a fixed
+    # poll at the base interval would leave it, with fewer polls than one.
+    assert len(latencies) == 14
+    assert max(latencies[3:]) <= _BASE
+    assert polls < 14 * timedelta(days=1) / _BASE
+
+
+def test_learned_state_round_trips() -> None:
+    scheduler = _learned(timedelta(hours=3))
+
+    restored = AdaptivePollScheduler(_BASE)
+    restored.restore(scheduler.as_dict())
+
+    assert restored.typical_delay("E1") == timedelta(hours=3)
+    assert restored.expected_arrival() == scheduler.expected_arrival()
+    now = _T0 + timedelta(days=2)
+    assert restored.expected_arrival(now) == scheduler.expected_arrival(now)
+    restored.restore("garbage")
+    assert restored.as_dict() == scheduler.as_dict()
@@ -0,0 +1,110 @@
+"""Unit tests for the domain-wide meter/device lookup registry."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.eon_next.registry import EonNextLookupRegistry
+
+
+@dataclass(slots=True)
+class _FakeMeter:
+    serial: str
+    type: str = "electricity"
+    supply_point_id: str = "mpan-1"
+
+
+@dataclass(slots=True)
+class _FakeAccount:
+    meters: list[_FakeMeter] = field(default_factory=list)
+
+
+class _FakeCoordinator:
+    def __init__(self, data: dict[str, dict[str, Any]] | None = None) -> None:
+        self.data = data
+        self.api = object()
+        self.listeners: list[Any] = []
+
+    def async_add_listener(self, update_callback: Any) -> Any:
+        self.listeners.append(update_callback)
+        return lambda: self.listeners.remove(update_callback)
+
+    def async_set_updated_data(self, data: dict[str, dict[str, Any]]) -> None:
+        self.data = data
+        for listener in list(self.listeners):
+            listener()
+
+
+def _entry(entry_id: str, serials: list[str], coordinator: _FakeCoordinator) -> Any:
+    return SimpleNamespace(
+        entry_id=entry_id,
+        runtime_data=SimpleNamespace(
+            api=SimpleNamespace(
+                accounts=[_FakeAccount(meters=[_FakeMeter(s) for s in serials])]
+            ),
+            coordinator=coordinator,
+        ),
+    )
+
+
+def test_meter_lookup_covers_topology_and_coordinator_rows() -> None:
+    registry = EonNextLookupRegistry()
+    coordinator = _FakeCoordinator(
+        {"G1": {"type": "gas", "serial": "G1", "supply_point_id": "mprn-1"}}
+    )
+    entry = _entry("entry-a", ["E1"], coordinator)
+
+    registry.async_add_entry(entry)
+
+    electricity = registry.meter("E1")
+    gas = registry.meter("G1")
+    assert electricity is not None and electricity.entry is entry
+    assert electricity.supply_point_id == "mpan-1"
+    assert gas is not None and gas.type == "gas"
+    assert gas.coordinator is coordinator
+    assert registry.entry("entry-a") is entry
+    assert registry.entry_has_meter("entry-a", "E1")
+    assert registry.meter("missing") is None
+
+
+def test_ev_lookup_follows_coordinator_refreshes() -> None:
+    registry = EonNextLookupRegistry()
+    coordinator = _FakeCoordinator({})
+    registry.async_add_entry(_entry("entry-a", [], coordinator))
+    assert registry.ev_charger("device-1") is None
+
+    coordinator.async_set_updated_data(
+        {
+            "ev::device-1": {
+                "type": "ev_charger",
+                "device_id": "device-1",
+                "schedule": [],
+            }
+        }
+    )
+    ev_data = registry.ev_charger("device-1")
+    assert ev_data is not None and ev_data["device_id"] == "device-1"
+
+    coordinator.async_set_updated_data({})
+    assert registry.ev_charger("device-1") is None
+
+
+def test_remove_entry_hands_shared_serial_to_survivor() -> None:
+    registry = EonNextLookupRegistry()
+    entry_a = _entry("entry-a", ["E1"], _FakeCoordinator())
+    entry_b = _entry("entry-b", ["E1", "E2"], _FakeCoordinator())
+    remove_a = registry.async_add_entry(entry_a)
+    registry.async_add_entry(entry_b)
+
+    location = registry.meter("E1")
+    assert location is not None and location.entry is entry_a
+    assert registry.entry_has_meter("entry-b", "E1")
+
+    remove_a()
+
+    location = registry.meter("E1")
+    assert location is not None and location.entry is entry_b
+    assert registry.entry("entry-a") is None
+    assert entry_a.runtime_data.coordinator.listeners == []
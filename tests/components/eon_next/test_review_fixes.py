@@ -167,7 +167,7 @@ async def test_disabled_tracker_advances_energy_baseline(hass) -> None:
         old=_state("sensor.ev_energy", "5", "kWh", now),
         new=_state("sensor.ev_energy", "8", "kWh", now),
     )
-    await mgr._async_handle_state_change("t1", event)
+    mgr._handle_state_change("t1", event)
 
     # Baseline advanced to 8 while disabled; no cost accrued.
     assert runtime.state.last_energy_value == 8.0
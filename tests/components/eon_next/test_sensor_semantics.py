@@ -16,7 +16,10 @@ import pytest
 from homeassistant.components.sensor import SensorDeviceClass
 
 from custom_components.eon_next.eonnext import ElectricityMeter
+from custom_components.eon_next.api_metrics import ApiMetrics
 from custom_components.eon_next.sensor import (
+    ApiLatencySensor,
+    ApiRequestsSensor,
     CurrentUnitRateSensor,
     ExportUnitRateSensor,
     NextUnitRateSensor,
@@ -124,3 +127,49 @@ async def test_standard_meter_keeps_generic_sensors() -> None:
     assert "E10STD__current_unit_rate" in uids
     assert "E10STD__export_unit_rate" not in uids
     assert "E10STD__export_daily_consumption" not in uids
+
+
+# --- API metrics diagnostic sensors ---
+
+
+def test_api_latency_sensor_snapshots_metrics_once_per_write() -> None:
+    """State and attributes come from one metrics snapshot per update, and
+    the per-operation breakdown is kept out of the recorder."""
+    metrics = ApiMetrics()
+    with metrics.request("getAccountBalance") as record:
+        record.finish(200)
+    api = MagicMock()
+    type(api).request_metrics = property(lambda _self: metrics.as_dict())
+    snapshots = MagicMock(wraps=metrics.as_dict)
+    metrics.as_dict = snapshots
+
+    sensor = ApiLatencySensor(_coord(), api, "entry")
+    sensor.async_write_ha_state = MagicMock()
+    sensor._handle_coordinator_update()  # noqa: SLF001
+
+    assert snapshots.call_count == 1
+    assert sensor.native_value is not None
+    assert "getAccountBalance" in sensor.extra_state_attributes["operations"]
+    assert snapshots.call_count == 1
+    assert "operations" in ApiLatencySensor._unrecorded_attributes  # noqa: SLF001
+
+
+def test_api_requests_sensor_counts_retries_per_operation() -> None:
+    """Retry attempts are reported apart from requests, per operation."""
+    metrics = ApiMetrics()
+    with metrics.request("consumption") as record:
+        record.finish(503)
+    with metrics.request("consumption", retry=True) as record:
+        record.finish(200)
+    with metrics.request("getAccountBalance") as record:
+        record.finish(200)
+    api = MagicMock()
+    type(api).request_metrics = property(lambda _self: metrics.as_dict())
+
+    sensor = ApiRequestsSensor(_coord(), api, "entry")
+    sensor.async_write_ha_state = MagicMock()
+    sensor._handle_coordinator_update()  # noqa: SLF001
+
+    assert sensor.native_value == 2
+    assert sensor.extra_state_attributes["retries"] == 1
+    assert sensor.extra_state_attributes["retries_by_operation"] == {"consumption": 1}
@@ -10,6 +10,7 @@ import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.eon_next.const import DOMAIN
+from custom_components.eon_next.registry import async_get_registry
 from custom_components.eon_next.services import async_register_services
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import entity_registry as er
@@ -34,9 +35,11 @@ def _make_entry(hass, *, serial: str) -> tuple[MockConfigEntry, AsyncMock, str]:
     manager.async_set_enabled = AsyncMock()
     runtime_data = SimpleNamespace(
         api=SimpleNamespace(accounts=[_FakeAccount(meters=[_FakeMeter(serial=serial)])]),
+        coordinator=SimpleNamespace(data=None),
         cost_trackers=manager,
     )
     entry.runtime_data = runtime_data
+    async_get_registry(hass).async_index_entry(entry)
     return entry, manager, serial
 
 
@@ -170,3 +173,31 @@ async def test_reset_and_update_cost_tracker_target_entities(hass) -> None:
         blocking=True,
     )
     manager.async_set_enabled.assert_awaited_once_with("washer", False)
+
+
+@pytest.mark.asyncio
+async def test_add_cost_tracker_rejects_meter_from_other_entry(hass) -> None:
+    """An explicit entry_id must own the requested meter."""
+    entry_a, manager_a, _ = _make_entry(hass, serial="meter-a")
+    _make_entry(hass, serial="meter-b")
+    await async_register_services(hass)
+
+    hass.states.async_set(
+        "sensor.kettle_energy",
+        "0",
+        {"unit_of_measurement": "kWh", "device_class": "energy"},
+    )
+
+    with pytest.raises(ServiceValidationError, match="has no meter"):
+        await hass.services.async_call(
+            DOMAIN,
+            "add_cost_tracker",
+            {
+                "name": "Kettle",
+                "tracked_entity_id": "sensor.kettle_energy",
+                "meter_serial": "meter-b",
+                "entry_id": entry_a.entry_id,
+            },
+            blocking=True,
+        )
+    manager_a.async_add_tracker.assert_not_called()
@@ -0,0 +1,30 @@
+"""Import-time guards for the integration package.
+
+Importing ``custom_components.eon_next`` happens on every Home Assistant
+start, before any config entry is set up.  These tests run the import in a
+fresh interpreter (see ``tests/importtime.py``) and fail if an optional
+subsystem starts loading eagerly again.  The import's cost is timed by the
+``startup.package_import`` benchmark instead, against a calibrated baseline.
+"""
+
+from __future__ import annotations
+
+from importtime import PACKAGE, package_import_times
+
+# Modules the package must only load when the feature is actually used.
+_DEFERRED_MODULES = (
+    "custom_components.eon_next.backfill",
+    "custom_components.eon_next.panel",
+    "custom_components.eon_next.websocket",
+    "custom_components.eon_next.schemas",
+    "homeassistant.components.http",
+    "homeassistant.components.recorder",
+)
+
+
+def test_package_import_defers_optional_subsystems() -> None:
+    times = package_import_times()
+
+    assert PACKAGE in times
+    for module in _DEFERRED_MODULES:
+        assert module not in times, f"{module} is imported eagerly"
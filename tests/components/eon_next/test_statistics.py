@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from array import array
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
 import pytest
 
 import custom_components.eon_next.statistics as stats_module
+from custom_components.eon_next.cost_engine import RateTimeline
 from custom_components.eon_next.statistics import (
     StatisticsLookupError,
+    _group_by_hour,
     _group_consumption_by_hour,
     _merge_and_recompute_series,
     async_import_consumption_statistics,
+    async_import_cost_tracker_statistics,
+    cost_statistic_id_for_meter,
     statistic_id_for_meter,
+    statistic_ids_for_cost_tracker,
 )
 
 
@@ -63,6 +69,92 @@ def test_group_consumption_by_hour_handles_mixed_timestamps() -> None:
     }
 
 
+def _rates(*steps: tuple[datetime, float]) -> RateTimeline:
+    return RateTimeline(
+        breaks=array("d", (when.timestamp() for when, _ in steps)),
+        rates=array("d", (rate for _, rate in steps)),
+        standing_breaks=array("d", [0.0]),
+        standing_charges=array("d", [0.5]),
+    )
+
+
+def test_daily_bucket_on_a_time_of_use_tariff_is_left_unpriced() -> None:
+    """A daily bucket spanning several rates cannot be priced correctly."""
+    rates = _rates((_h(0), 0.1), (_h(6), 0.3), (_h(12), 0.1))
+    entries = [
+        {
+            "interval_start": _h(0).isoformat(),
+            "interval_end": (_h(0) + timedelta(days=1)).isoformat(),
+            "consumption": 10.0,
+        }
+    ]
+
+    hourly, hourly_cost = _group_by_hour(entries, rates)
+
+    assert hourly == {_h(0): 10.0}
+    # Not the 0.15 time-weighted mean: a gap, not a wrong sum.
+    assert hourly_cost == {}
+
+
+def test_daily_bucket_on_a_flat_tariff_is_priced() -> None:
+    """Breakpoints that keep the same rate (e.g. agreement edges) still price."""
+    rates = _rates((_h(0), 0.2), (_h(6), 0.2))
+    entries = [
+        {
+            "interval_start": _h(0).isoformat(),
+            "interval_end": (_h(0) + timedelta(days=1)).isoformat(),
+            "consumption": 10.0,
+        }
+    ]
+
+    assert _group_by_hour(entries, rates)[1] == {_h(0): pytest.approx(2.0)}
+    assert _group_by_hour(entries)[1] == {}
+
+
+@pytest.mark.asyncio
+async def test_cost_statistic_is_imported_alongside_consumption(monkeypatch) -> None:
+    """Each half-hour is priced at its own rate into the cost statistic."""
+
+    async def _last(*_args, **_kwargs):
+        return None, 0.0
+
+    monkeypatch.setattr(stats_module, "_get_last_stat", _last)
+
+    import homeassistant.components.recorder.statistics as recorder_stats
+
+    add_mock = MagicMock()
+    monkeypatch.setattr(recorder_stats, "async_add_external_statistics", add_mock)
+
+    entries = [
+        {
+            "interval_start": (_h(0) + timedelta(minutes=30 * i)).isoformat(),
+            "interval_end": (_h(0) + timedelta(minutes=30 * (i + 1))).isoformat(),
+            "consumption": 1.0,
+        }
+        for i in range(3)
+    ]
+    await async_import_consumption_statistics(
+        MagicMock(),
+        "ABC-123",
+        "electricity",
+        entries,
+        _rates((_h(0), 0.1), (_h(1), 0.3)),
+    )
+
+    cost_id = cost_statistic_id_for_meter("ABC-123", "electricity")
+    assert cost_id == "eon_next:electricity_abc_123_cost"
+    imported = {
+        call.args[1].get("statistic_id"): (call.args[1], call.args[2])
+        for call in add_mock.call_args_list
+    }
+    _, consumption_rows = imported["eon_next:electricity_abc_123_consumption"]
+    assert [row["sum"] for row in consumption_rows] == [2.0, 3.0]
+    metadata, cost_rows = imported[cost_id]
+    assert metadata.get("unit_of_measurement") == "GBP"
+    assert [row["start"] for row in cost_rows] == [_h(0), _h(1)]
+    assert [row["sum"] for row in cost_rows] == [0.2, 0.5]
+
+
 @pytest.mark.asyncio
 async def test_import_skips_when_last_stat_lookup_fails(monkeypatch) -> None:
     """A recorder lookup failure must skip the import entirely (spec 02, 2.1).
@@ -89,6 +181,53 @@ async def test_import_skips_when_last_stat_lookup_fails(monkeypatch) -> None:
     add_mock.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_cost_tracker_days_append_after_last_imported_day(monkeypatch) -> None:
+    """Tracker rollups import one row per new day into both statistics."""
+    day_two_start = stats_module._hour_start(
+        stats_module.dt_util.as_utc(
+            stats_module.dt_util.start_of_local_day(date(2026, 10, 2))
+        )
+    )
+
+    async def _last(_hass, statistic_id, _before):
+        # Day one is already imported into both statistics.
+        base = 1.0 if statistic_id.endswith("_consumption") else 0.2
+        return day_two_start - timedelta(days=1), base
+
+    monkeypatch.setattr(stats_module, "_get_last_stat", _last)
+
+    import homeassistant.components.recorder.statistics as recorder_stats
+
+    add_mock = MagicMock()
+    monkeypatch.setattr(recorder_stats, "async_add_external_statistics", add_mock)
+
+    await async_import_cost_tracker_statistics(
+        MagicMock(),
+        "ABC-123",
+        "washer",
+        "Washer",
+        [
+            (date(2026, 10, 1), 1.0, 0.2),
+            (date(2026, 10, 2), 2.0, 0.5),
+            (date(2026, 10, 3), 0.5, 0.1),
+        ],
+    )
+
+    consumption_id, cost_id = statistic_ids_for_cost_tracker("ABC-123", "washer")
+    assert consumption_id == "eon_next:cost_tracker_abc_123_washer_consumption"
+    imported = {
+        call.args[1].get("statistic_id"): call.args[2]
+        for call in add_mock.call_args_list
+    }
+    assert [row["start"] for row in imported[consumption_id]] == [
+        day_two_start,
+        day_two_start + timedelta(days=1),
+    ]
+    assert [row["sum"] for row in imported[consumption_id]] == [3.0, 3.5]
+    assert [row["sum"] for row in imported[cost_id]] == [0.7, 0.8]
+
+
 # --- 2.4/2.5: recompute-forward historical splice ---
 
 
@@ -239,3 +239,14 @@ def test_merge_hourly_granularity_never_skips() -> None:
     # The new value replaced hour 0 (0.5 -> 2.0), so the whole series shifts +1.5.
     assert series[0][1] == 2.0
     assert len(series) == 24
+
+
+def test_merge_cost_series_keeps_pence_precision() -> None:
+    """The cost series is spliced the same way, at four decimals."""
+    existing = [(_MIDNIGHT + timedelta(hours=2), 1.1234)]
+
+    series = _merge_and_recompute_series(
+        1.0, existing, {_MIDNIGHT: 0.0567}, precision=4
+    )
+
+    assert series == [(_MIDNIGHT, 1.0567), (_MIDNIGHT + timedelta(hours=2), 1.1801)]
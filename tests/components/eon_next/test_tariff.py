@@ -297,6 +297,10 @@ async def test_async_get_tariff_data_maps_by_supply_point() -> None:
     assert "9876543210" in result
     assert result["9876543210"]["tariff_name"] == "Next Flex Gas"
     assert result["9876543210"]["unit_rate"] == "6.20"
+    # Every agreement of the point rides along for the tariff timeline.
+    assert [a["tariff_code"] for a in result["1234567890"]["agreements"]] == [
+        "ELEC-01"
+    ]
 
 
 @pytest.mark.asyncio
@@ -17,6 +17,7 @@ from custom_components.eon_next.tariff_helpers import (
     get_previous_rate,
     is_off_peak,
     rate_for_timestamp,
+    rate_window_for_timestamp,
 )
 
 # Dynamic reference time: today at 03:00 UTC - inside a typical off-peak
@@ -435,6 +436,25 @@ class TestRateForTimestamp:
         assert rate == pytest.approx(0.25)
 
 
+class TestRateWindowForTimestamp:
+    def test_schedule_window_bounds(self) -> None:
+        start, end, rate = rate_window_for_timestamp(
+            _tou_meter_data_with_schedule(), _REF_DATE.replace(hour=3, minute=10)
+        )
+        assert (start, end) == (_REF_DATE.replace(hour=2), _REF_DATE.replace(hour=5))
+        assert rate == pytest.approx(0.07)
+
+    def test_half_hour_slot_without_schedule_window(self) -> None:
+        start, end, rate = rate_window_for_timestamp(
+            _flat_meter_data(0.22), _REF_DATE.replace(minute=47, second=5)
+        )
+        assert (start, end) == (
+            _REF_DATE.replace(minute=30),
+            _REF_DATE.replace(hour=4, minute=0),
+        )
+        assert rate == pytest.approx(0.22)
+
+
 class TestCostConsumptionEntries:
     def test_prices_each_entry_against_its_window(self) -> None:
         data = _tou_meter_data_with_schedule()
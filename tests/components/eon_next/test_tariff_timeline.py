@@ -0,0 +1,79 @@
+"""Tests for the persisted, indexed tariff agreement timeline."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from custom_components.eon_next.cost_engine import compile_agreement_timeline
+from custom_components.eon_next.meter_snapshot import TariffSnapshot
+from custom_components.eon_next.tariff_timeline import TariffTimeline
+
+
+def _at(month: int, day: int = 1) -> datetime:
+    return datetime(2026, month, day, tzinfo=timezone.utc)
+
+
+def _agreement(code: str, start: datetime, end: datetime | None, rate: float) -> TariffSnapshot:
+    return TariffSnapshot(
+        code=code,
+        unit_rate=rate,
+        standing_charge=rate * 2,
+        valid_from=start.isoformat(),
+        valid_to=end.isoformat() if end else None,
+    )
+
+
+def _timeline() -> TariffTimeline:
+    timeline = TariffTimeline()
+    timeline.update(
+        "mpan",
+        [
+            _agreement("C", _at(6), None, 0.30),
+            _agreement("A", _at(1), _at(3), 0.10),
+            _agreement("B", _at(3), _at(6), 0.20),
+        ],
+    )
+    return timeline
+
+
+def test_agreement_lookup_by_instant() -> None:
+    timeline = _timeline()
+
+    assert timeline.agreement_at("mpan", _at(2)).code == "A"  # type: ignore[union-attr]
+    assert timeline.agreement_at("mpan", _at(3)).code == "B"  # type: ignore[union-attr]
+    assert timeline.agreement_at("mpan", _at(12)).code == "C"  # type: ignore[union-attr]
+    assert timeline.agreement_at("mpan", datetime(2025, 1, 1, tzinfo=timezone.utc)) is None
+    assert timeline.agreement_at("other", _at(2)) is None
+
+
+def test_update_keeps_agreements_the_api_no_longer_lists() -> None:
+    timeline = _timeline()
+
+    assert timeline.update("mpan", [_agreement("C", _at(6), None, 0.30)]) is False
+    assert timeline.update("mpan", [_agreement("C", _at(6), None, 0.35)]) is True
+    assert [a.code for a in timeline.agreements("mpan")] == ["A", "B", "C"]
+    assert timeline.agreement_at("mpan", _at(7)).unit_rate == 0.35  # type: ignore[union-attr]
+
+
+def test_round_trips_through_storage_form() -> None:
+    timeline = _timeline()
+
+    restored = TariffTimeline.from_dict(timeline.as_dict())
+
+    assert restored.agreements("mpan") == timeline.agreements("mpan")
+    assert TariffTimeline.from_dict("bad").agreements("mpan") == []
+
+
+def test_compiled_range_switches_rates_and_standing_at_agreement_bounds() -> None:
+    fallback = {"tariff_unit_rate": 0.99, "tariff_standing_charge": 9.9}
+
+    compiled = compile_agreement_timeline(
+        _timeline(), "mpan", datetime(2025, 12, 1, tzinfo=timezone.utc), _at(7), fallback
+    )
+
+    # Before the first known agreement the current tariff is assumed.
+    assert compiled.rate_at(datetime(2025, 12, 15, tzinfo=timezone.utc)) == 0.99
+    assert compiled.rate_at(_at(2, 15)) == 0.10
+    assert compiled.rate_at(_at(3)) == 0.20
+    assert compiled.rate_at(_at(6, 2)) == 0.30
+    assert compiled.standing_charge_at(_at(4)) == 0.40
@@ -0,0 +1,95 @@
+"""Tests for the background access-token refresher."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.eon_next.const import DOMAIN
+from custom_components.eon_next.eonnext import EonNextApiError
+from custom_components.eon_next.token_refresh import (
+    _IDLE_RECHECK_SECONDS,
+    _RETRY_SECONDS,
+    EonNextTokenRefresher,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+
+def _api(due_in: list[float | None], refresh: AsyncMock) -> MagicMock:
+    api = MagicMock()
+    api.token_refresh_due_in = MagicMock(side_effect=due_in)
+    api.async_refresh_token = refresh
+    return api
+
+
+def _start(hass: HomeAssistant, api: MagicMock) -> EonNextTokenRefresher:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    refresher = EonNextTokenRefresher(hass, entry, api)  # type: ignore[arg-type]
+    refresher.async_start()
+    return refresher
+
+
+async def _advance(hass: HomeAssistant, seconds: float) -> None:
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_refreshes_when_due_and_reschedules_from_new_expiry(
+    hass: HomeAssistant,
+) -> None:
+    # start -> due in 100s; on fire -> due now; after refresh -> due in 3000s.
+    refresh = AsyncMock(return_value=True)
+    api = _api([100, 0, 3000], refresh)
+    refresher = _start(hass, api)
+
+    await _advance(hass, 50)
+    refresh.assert_not_awaited()
+
+    await _advance(hass, 101)
+    refresh.assert_awaited_once()
+    assert refresher._unsub is not None
+
+    refresher.async_stop()
+    assert refresher._unsub is None
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_retried_later_without_raising(
+    hass: HomeAssistant,
+) -> None:
+    refresh = AsyncMock(side_effect=[EonNextApiError("down"), True])
+    # start, fire, retry delay (still overdue), fire, after success.
+    api = _api([0, 0, 0, 0, 3000], refresh)
+    refresher = _start(hass, api)
+
+    await _advance(hass, 1)
+    assert refresh.await_count == 1
+
+    await _advance(hass, _RETRY_SECONDS / 2)
+    assert refresh.await_count == 1
+
+    await _advance(hass, _RETRY_SECONDS + 1)
+    assert refresh.await_count == 2
+    refresher.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_without_a_token_only_rechecks(hass: HomeAssistant) -> None:
+    refresh = AsyncMock(return_value=True)
+    api = _api([None, None, None], refresh)
+    refresher = _start(hass, api)
+
+    await _advance(hass, _IDLE_RECHECK_SECONDS + 1)
+
+    refresh.assert_not_awaited()
+    assert refresher._unsub is not None
+    refresher.async_stop()
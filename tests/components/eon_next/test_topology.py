@@ -0,0 +1,51 @@
+"""Unit tests for the persisted account topology."""
+
+from __future__ import annotations
+
+from custom_components.eon_next.eonnext import (
+    ElectricityMeter,
+    EnergyAccount,
+    EonNext,
+    GasMeter,
+    SmartChargingDevice,
+)
+from custom_components.eon_next.topology import (
+    _is_valid,
+    restore_topology,
+    serialize_topology,
+)
+
+
+def _account(api: EonNext) -> EnergyAccount:
+    account = EnergyAccount(api, "A-1")
+    account.meters = [
+        ElectricityMeter(account, "e1", "E-SERIAL", "mpan-1"),
+        ElectricityMeter(account, "e2", "EXPORT", "mpan-2", is_export=True),
+        GasMeter(account, "g1", "G-SERIAL", "mprn-1"),
+    ]
+    account.ev_chargers = [SmartChargingDevice(device_id="dev-1", serial="Zappi")]
+    return account
+
+
+def test_topology_round_trips_through_serialization() -> None:
+    api = EonNext()
+    data = serialize_topology([_account(api)])
+
+    restored = restore_topology(api, data)
+
+    assert serialize_topology(restored) == data
+    meters = restored[0].meters
+    assert isinstance(meters[0], ElectricityMeter) and not meters[0].is_export
+    assert isinstance(meters[1], ElectricityMeter) and meters[1].is_export
+    assert isinstance(meters[2], GasMeter)
+    assert meters[2].api is api
+    assert restored[0].ev_chargers == [
+        SmartChargingDevice(device_id="dev-1", serial="Zappi")
+    ]
+
+
+def test_malformed_or_empty_topology_is_rejected() -> None:
+    assert _is_valid(serialize_topology([_account(EonNext())]))
+    assert not _is_valid({"accounts": []})
+    assert not _is_valid({"accounts": [{"account_number": "A-1"}]})
+    assert not _is_valid([])
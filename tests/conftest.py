@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
+import pytest
+
+if TYPE_CHECKING:
+    from fake_kraken import FakeKraken
+
 # ── Mock hass_frontend ────────────────────────────────────────────────
 # The HA "frontend" component does ``import hass_frontend`` which is a
 # compiled JS package only present in full HA installs, not in
@@ -19,3 +26,44 @@ sys.modules.setdefault("hass_frontend", _mock_frontend)
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+def pytest_addoption(parser) -> None:
+    """Register the benchmark suite options (see tests/benchmarks)."""
+    group = parser.getgroup("eon_next benchmarks")
+    group.addoption(
+        "--bench",
+        action="store_true",
+        default=False,
+        help="Run the benchmarks in tests/benchmarks (skipped otherwise).",
+    )
+    group.addoption(
+        "--bench-save",
+        action="store_true",
+        default=False,
+        help="Record the measured benchmark scores as the new baselines.",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=1.5,
+        help="Fail a benchmark slower than this multiple of its baseline.",
+    )
+
+
+@pytest.fixture
+async def fake_kraken(
+    socket_enabled: None, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[FakeKraken]:
+    """A running fake Kraken API with ``EonNext`` pointed at it.
+
+    Log in as ``user@example.com`` / ``secret``; set ``faults`` or call
+    ``fail_next`` on the server to inject failures (see tests/fake_kraken.py).
+    """
+    from fake_kraken import FakeKraken
+
+    from custom_components.eon_next import eonnext
+
+    async with FakeKraken() as server:
+        monkeypatch.setattr(eonnext, "API_BASE_URL", server.base_url)
+        yield server
@@ -0,0 +1,76 @@
+"""Measure the integration package's import in a fresh interpreter.
+
+The import runs under ``-X importtime`` in a new process, so earlier tests
+cannot have pre-loaded anything.  Used by the import-deferral tests and the
+startup benchmark.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "custom_components.eon_next"
+
+# Imported first so their cost is not charged to the package: Home Assistant
+# has always loaded these before any custom integration.
+PRELOADED = (
+    "homeassistant.core",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+)
+
+
+def run_importtime(code: str) -> dict[str, int]:
+    """Return ``{module: self_time_us}`` for running *code* in a new interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return _parse(result.stderr)
+
+
+def package_import_times(preloaded: dict[str, int] | None = None) -> dict[str, int]:
+    """Return self times of modules first loaded by the package import.
+
+    Pass a previous ``run_importtime`` of the preload to skip re-running it.
+    """
+    preload = "; ".join(f"import {module}" for module in PRELOADED)
+    if preloaded is None:
+        preloaded = run_importtime(preload)
+    times = run_importtime(f"{preload}; import {PACKAGE}")
+    return {
+        module: self_us
+        for module, self_us in times.items()
+        if module not in preloaded
+    }
+
+
+def own_import_seconds(times: dict[str, int]) -> float:
+    """Return the summed self time of the package's own modules."""
+    return (
+        sum(
+            self_us
+            for module, self_us in times.items()
+            if module == PACKAGE or module.startswith(f"{PACKAGE}.")
+        )
+        / 1_000_000
+    )
+
+
+def _parse(stderr: str) -> dict[str, int]:
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        times[fields[2].strip()] = int(fields[0])
+    return times